@@ -0,0 +1,251 @@
+"""
+Mergeable streaming histograms for joint and conditional distributions.
+
+A Histogram counts one or two integer variables into fixed bins (values past
+the last bin land in it) with optional weights, and keeps running power sums
+— total weight, sums and cross-products of the raw values — for exact means,
+variances and correlations. Adding a batch costs one bincount, and merging
+two histograms adds their arrays, so merging is associative and a stream of
+any length fits in memory proportional to the bins.
+
+A set of named histograms packs into a flat dict of arrays (pack/unpack):
+the form shards.run_sharded sums and cache.ResultCache stores, so shard
+tasks, worker processes and history.py's chunked readers all feed the same
+type.
+
+component_histograms() streams the enumeration through one such set: every
+show-score component, every pair of components (fifteens x runs, pairs x
+flush, ...), and each component and the total by starter rank. It holds a
+few thousand bins however many rows are scored.
+
+Usage:
+    python docs/stats/accumulators.py [--crib] [--workers N]
+"""
+
+import argparse
+from itertools import combinations
+
+import numpy as np
+
+from cache import ResultCache
+from cards import RANKS, card_rank
+from enumeration import CHUNK_ROWS, combination_rows
+from scoring import COMPONENTS, MAX_SCORE, score_batch
+from shards import DEFAULT_SHARDS, run_sharded
+
+# Highest points each component can score (a hand, or a crib with its starter)
+COMPONENT_MAX = {"Fifteens": 16, "Pairs": 12, "Runs": 12, "Flush": 5, "Nobs": 1}
+N_RANKS = 13
+
+
+# ─── Histograms ─────────────────────────────────────────────────────────────
+class Histogram:
+    """Weighted histogram of one or two integer variables, with running moments."""
+
+    def __init__(self, bins: tuple[int, ...], dtype=np.int64):
+        if len(bins) not in (1, 2):
+            raise ValueError("a histogram has one or two variables")
+        self.counts = np.zeros(bins, dtype=dtype)
+        self.weight = np.zeros((), dtype=dtype)
+        self.sums = np.zeros(len(bins), dtype=dtype)
+        self.products = np.zeros((len(bins), len(bins)), dtype=dtype)
+
+    def add(self, *values: np.ndarray, weights: np.ndarray | None = None) -> None:
+        """Count one batch: an array per variable, and optional per-row weights."""
+        shape = self.counts.shape
+        columns = np.stack([np.asarray(v, dtype=np.int64) for v in values])
+        clipped = np.clip(columns, 0, np.array(shape)[:, None] - 1)
+        cells = np.ravel_multi_index(tuple(clipped), shape)
+        dtype = self.counts.dtype
+        if weights is None:
+            weights = np.ones(columns.shape[1], dtype=dtype)
+        weights = np.asarray(weights).astype(dtype)
+        counts = np.bincount(cells, weights=weights, minlength=self.counts.size)
+        self.counts += counts.astype(dtype).reshape(shape)
+        self.weight += weights.sum()
+        self.sums += columns.astype(dtype) @ weights
+        self.products += (columns * weights).astype(dtype) @ columns.T.astype(dtype)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        """Fold another histogram of the same bins into this one."""
+        if other.counts.shape != self.counts.shape:
+            raise ValueError(
+                f"bins differ: {other.counts.shape} != {self.counts.shape}"
+            )
+        self.counts += other.counts
+        self.weight += other.weight
+        self.sums += other.sums
+        self.products += other.products
+        return self
+
+    # ─── Summaries
+    def mean(self) -> np.ndarray:
+        """Mean of each variable, from the raw (unclipped) values."""
+        return self.sums / self.weight
+
+    def covariance(self) -> np.ndarray:
+        mean = self.mean()
+        return self.products / self.weight - np.outer(mean, mean)
+
+    def correlation(self) -> float:
+        """Pearson correlation of the two variables."""
+        covariance = self.covariance()
+        return float(covariance[0, 1] / np.sqrt(covariance[0, 0] * covariance[1, 1]))
+
+    def shares(self) -> np.ndarray:
+        """The counts as a joint probability table."""
+        return self.counts / self.counts.sum()
+
+    def conditional(self) -> np.ndarray:
+        """P(second variable | first variable): rows normalized to 1."""
+        totals = self.counts.sum(axis=1, keepdims=True)
+        return np.divide(
+            self.counts, totals, out=np.zeros(self.counts.shape), where=totals > 0
+        )
+
+    def conditional_mean(self) -> np.ndarray:
+        """E[second variable | first variable], from the binned values."""
+        return self.conditional() @ np.arange(self.counts.shape[1])
+
+    # ─── Serialization
+    def arrays(self) -> dict[str, np.ndarray]:
+        return {
+            "counts": self.counts,
+            "weight": self.weight,
+            "sums": self.sums,
+            "products": self.products,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: dict) -> "Histogram":
+        histogram = cls(arrays["counts"].shape, arrays["counts"].dtype)
+        for key, value in arrays.items():
+            setattr(histogram, key, np.array(value))
+        return histogram
+
+
+def pack(histograms: dict[str, Histogram]) -> dict[str, np.ndarray]:
+    """Flatten named histograms into {"name.field": array} for merging and caching."""
+    return {
+        f"{name}.{key}": value
+        for name, histogram in histograms.items()
+        for key, value in histogram.arrays().items()
+    }
+
+
+def unpack(arrays: dict) -> dict[str, Histogram]:
+    """Inverse of pack()."""
+    fields: dict[str, dict] = {}
+    for key, value in arrays.items():
+        name, field = key.rsplit(".", 1)
+        fields.setdefault(name, {})[field] = value
+    return {name: Histogram.from_arrays(f) for name, f in fields.items()}
+
+
+# ─── Show-Score Components ──────────────────────────────────────────────────
+def _bins(component: str) -> int:
+    return COMPONENT_MAX[component] + 1
+
+
+def component_accumulators() -> dict[str, Histogram]:
+    """Empty histograms for component_histograms(), keyed by lowercase name."""
+    histograms = {"total": Histogram((MAX_SCORE + 1,))}
+    histograms["starter_total"] = Histogram((N_RANKS, MAX_SCORE + 1))
+    for name in COMPONENTS:
+        histograms[name.lower()] = Histogram((_bins(name),))
+        histograms[f"starter_{name.lower()}"] = Histogram((N_RANKS, _bins(name)))
+    for first, second in combinations(COMPONENTS, 2):
+        key = f"{first.lower()}_{second.lower()}"
+        histograms[key] = Histogram((_bins(first), _bins(second)))
+    return histograms
+
+
+def add_components(
+    histograms: dict[str, Histogram],
+    points: np.ndarray,
+    starters: np.ndarray,
+    weights: np.ndarray | None = None,
+) -> None:
+    """Fold (N, COMPONENTS) points and their starters into component_accumulators()."""
+    total = points.sum(axis=1)
+    rank = card_rank(starters)
+    histograms["total"].add(total, weights=weights)
+    histograms["starter_total"].add(rank, total, weights=weights)
+    column = {name.lower(): points[:, i] for i, name in enumerate(COMPONENTS)}
+    for name, values in column.items():
+        histograms[name].add(values, weights=weights)
+        histograms[f"starter_{name}"].add(rank, values, weights=weights)
+    for first, second in combinations(column, 2):
+        histograms[f"{first}_{second}"].add(
+            column[first], column[second], weights=weights
+        )
+
+
+def component_shard(start: int, stop: int, is_crib: bool, canonical: bool) -> dict:
+    """Shard task: packed component histograms for rows [start, stop)."""
+    hands, starters, weights = combination_rows(canonical)
+    histograms = component_accumulators()
+    for lo in range(start, stop, CHUNK_ROWS):
+        chunk = slice(lo, min(lo + CHUNK_ROWS, stop))
+        points = score_batch(hands[chunk], starters[chunk], is_crib)
+        add_components(histograms, points, starters[chunk], weights[chunk])
+    return pack(histograms)
+
+
+def component_histograms(
+    is_crib: bool = False,
+    cache: ResultCache | None = None,
+    workers: int | None = 1,
+    canonical: bool = True,
+) -> dict[str, Histogram]:
+    """
+    Component histograms over the full enumeration (see component_accumulators),
+    from suit-canonical rows weighted by orbit size unless canonical=False.
+    """
+
+    def compute() -> dict:
+        return run_sharded(
+            component_shard,
+            len(combination_rows(canonical)[0]),
+            args=(is_crib, canonical),
+            n_shards=DEFAULT_SHARDS,
+            workers=workers,
+        )
+
+    if cache is None:
+        return unpack(compute())
+    return unpack(cache.fetch("component_histograms", {"is_crib": is_crib}, compute))
+
+
+if __name__ == "__main__":
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--crib", action="store_true", help="score as the crib")
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    histograms = component_histograms(args.crib, ResultCache(), args.workers)
+    elapsed = time.perf_counter() - start
+    n_bins = sum(h.counts.size for h in histograms.values())
+    print(f"\n{len(histograms)} histograms, {n_bins:,} bins, {elapsed:.1f}s\n")
+
+    print(f"  {'Component':<9} {'Mean':>7} {'SD':>7}")
+    for name in COMPONENTS:
+        histogram = histograms[name.lower()]
+        sd = np.sqrt(histogram.covariance()[0, 0])
+        print(f"  {name:<9} {histogram.mean()[0]:>7.4f} {sd:>7.4f}")
+
+    print("\n  Correlations")
+    for first, second in combinations(COMPONENTS, 2):
+        histogram = histograms[f"{first.lower()}_{second.lower()}"]
+        print(f"    {first:<9} x {second:<9} {histogram.correlation():>+7.3f}")
+
+    print("\n  Mean points by starter rank")
+    print("       " + "".join(f"{name[:7]:>9}" for name in ("Total", *COMPONENTS)))
+    means = [histograms["starter_total"].conditional_mean()]
+    means += [histograms[f"starter_{n.lower()}"].conditional_mean() for n in COMPONENTS]
+    for rank, label in enumerate(RANKS):
+        print(f"    {label:<3}" + "".join(f"{m[rank]:>9.3f}" for m in means))
+    print()
@@ -0,0 +1,246 @@
+"""
+Benchmark and regression suite for the statistics engine.
+
+Times each stage of the tooling in a fresh process — full enumeration,
+canonical enumeration, the batched scoring lookup path and chart rendering —
+recording wall time, peak RSS and throughput. Chart rendering measures the
+charts alone: a warm-up process first fills the result cache, and the
+measured process only reads cached results and the generated win-probability
+and percentile tables back. Each run is appended to a JSON history file, and
+a case fails when it is slower or larger than the median of its recent runs
+on the same machine by more than the threshold.
+
+Every case also checks correctness: enumerations must reproduce the rubl.com
+reference in generate_charts.py (all 26 achievable scores in DISTRIBUTION
+and COMPONENT_AVERAGES), and the lookup path must agree with the direct
+rank scorers.
+
+Usage:
+    python docs/stats/benchmark.py [CASE ...] [--repeat N] [--threshold 0.25]
+                                   [--history PATH] [--no-record]
+
+Exits non-zero on any correctness failure or regression.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from scoring import CACHE_DIR
+
+HISTORY_PATH = CACHE_DIR / "benchmark_history.json"
+DEFAULT_THRESHOLD = 0.25
+BASELINE_WINDOW = 5
+SCORING_SAMPLE = 1 << 21
+
+
+# ─── Cases ──────────────────────────────────────────────────────────────────
+# Each case does its setup and returns a run() closure; only run() is timed.
+# run() returns (items processed, list of correctness problems).
+def _enumeration_case(canonical: bool):
+    from enumeration import enumerate_scores, summarize
+    from generate_charts import check_reference
+
+    def run():
+        result = enumerate_scores(canonical=canonical)
+        distribution, averages, avg = summarize(result)
+        stats = {
+            "total": result["total"],
+            "distribution": distribution,
+            "component_averages": averages,
+            "avg_score": avg,
+        }
+        return result["total"], check_reference(stats)
+
+    return run
+
+
+def full_enumeration():
+    return _enumeration_case(canonical=False)
+
+
+def canonical_enumeration():
+    return _enumeration_case(canonical=True)
+
+
+def scoring_lookup():
+    from cards import all_hands, card_rank, starters_for
+    from scoring import (
+        RANK_COMPONENTS,
+        rank_table,
+        score_batch,
+        score_fifteens,
+        score_pairs,
+        score_runs,
+    )
+
+    rng = np.random.default_rng(0)
+    hands = all_hands()
+    picks = rng.integers(0, len(hands), SCORING_SAMPLE)
+    starters = starters_for(hands[picks])[
+        np.arange(SCORING_SAMPLE), rng.integers(0, 48, SCORING_SAMPLE)
+    ]
+    hands = hands[picks]
+    rank_table()
+
+    def run():
+        points = score_batch(hands, starters)
+        sample = slice(0, 1 << 14)
+        ranks = card_rank(np.concatenate([hands[sample], starters[sample, None]], 1))
+        direct = np.stack(
+            [score_fifteens(ranks), score_pairs(ranks), score_runs(ranks)], 1
+        )
+        problems = []
+        mismatches = int((points[sample, :RANK_COMPONENTS] != direct).any(axis=1).sum())
+        if mismatches:
+            problems.append(f"{mismatches} lookup rows differ from direct scoring")
+        return len(hands), problems
+
+    return run
+
+
+def chart_rendering():
+    from cache import ResultCache
+    from generate_charts import CHARTS, compute_stats
+
+    stats = compute_stats(ResultCache())
+
+    def run():
+        for _, func, _ in CHARTS:
+            func(stats).to_html(include_plotlyjs="cdn")
+        return len(CHARTS), []
+
+    return run
+
+
+CASES = {
+    "full_enumeration": full_enumeration,
+    "canonical_enumeration": canonical_enumeration,
+    "scoring_lookup": scoring_lookup,
+    "chart_rendering": chart_rendering,
+}
+
+
+# Untimed setup run once in its own process before a case is measured, so
+# the measured process reads finished results from the result cache
+def warm_chart_stats() -> None:
+    from cache import ResultCache
+    from generate_charts import compute_stats
+
+    compute_stats(ResultCache())
+
+
+WARMUPS = {"chart_rendering": warm_chart_stats}
+
+
+# ─── Runner ─────────────────────────────────────────────────────────────────
+def measure(case: str) -> dict:
+    """Run one case in the current process; called in a fresh worker."""
+    run = CASES[case]()
+    start = time.perf_counter()
+    items, problems = run()
+    wall = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    return {
+        "wall_s": wall,
+        "peak_rss_mb": peak / 1e6,
+        "throughput": items / wall,
+        "items": items,
+        "problems": problems,
+    }
+
+
+def run_case(case: str, repeat: int) -> dict:
+    """Best of `repeat` runs, each in its own process so RSS and caches start cold."""
+    context = multiprocessing.get_context("spawn")
+    if case in WARMUPS:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            pool.submit(WARMUPS[case]).result()
+    runs = []
+    for _ in range(repeat):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            runs.append(pool.submit(measure, case).result())
+    best = min(runs, key=lambda r: r["wall_s"])
+    best["problems"] = sorted({p for r in runs for p in r["problems"]})
+    return best
+
+
+def machine_id() -> str:
+    return f"{platform.node()}/{platform.machine()}/{os.cpu_count()}cpu"
+
+
+def load_history(path: Path) -> list[dict]:
+    return json.loads(path.read_text()) if path.exists() else []
+
+
+def regressions(record: dict, history: list[dict], threshold: float) -> list[str]:
+    """Metrics where `record` is worse than its recent baseline by > threshold."""
+    previous = [
+        r
+        for r in history
+        if r["case"] == record["case"] and r["machine"] == record["machine"]
+    ][-BASELINE_WINDOW:]
+    if not previous:
+        return []
+    found = []
+    for metric in ("wall_s", "peak_rss_mb"):
+        baseline = statistics.median(r[metric] for r in previous)
+        if record[metric] > baseline * (1 + threshold):
+            found.append(
+                f"{metric} {record[metric]:.3f} vs baseline {baseline:.3f} "
+                f"(+{record[metric] / baseline - 1:.0%})"
+            )
+    return found
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cases", nargs="*", metavar="CASE", help=", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    parser.add_argument("--no-record", action="store_true")
+    args = parser.parse_args()
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    history = load_history(args.history)
+    failed = False
+    print(f"\n  {'Case':<24} {'Wall':>8} {'Peak RSS':>10} {'Throughput':>14}  Status")
+    for case in args.cases or CASES:
+        result = run_case(case, args.repeat)
+        record = {
+            "case": case,
+            "machine": machine_id(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **{k: v for k, v in result.items() if k != "problems"},
+        }
+        problems = result["problems"] + regressions(record, history, args.threshold)
+        failed |= bool(problems)
+        print(
+            f"  {case:<24} {record['wall_s']:>7.2f}s {record['peak_rss_mb']:>7.0f} MB "
+            f"{record['throughput']:>12,.0f}/s  {'FAIL' if problems else 'ok'}"
+        )
+        for problem in problems:
+            print(f"      {problem}")
+        if not args.no_record:
+            history.append(record)
+
+    if not args.no_record:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        args.history.write_text(json.dumps(history, indent=2) + "\n")
+    print()
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,252 @@
+"""
+Content-hashed on-disk cache for enumeration results.
+
+Each result is a dict of NumPy arrays stored as one .npy file per array in
+its own entry directory under docs/stats/.cache/results/. The entry key is a
+SHA-256 of the result name, its parameters, the scoring rules
+(scoring.SCORING_RULES) and the engine fingerprint of that result —
+ENGINE_VERSION plus a digest of the sources and data it is computed from
+(RESULT_SOURCES) — so changing a rule or the code behind a result makes its
+old entries unreachable instead of stale, while entries that do not depend
+on the change stay valid. Entries load with mmap_mode="r", so reading a
+cached result copies nothing.
+
+Old entries are evicted least-recently-used first once the cache grows past
+max_bytes; invalidate() drops entries explicitly.
+
+Usage:
+    python docs/stats/cache.py                 # list entries
+    python docs/stats/cache.py --clear [NAME]  # drop all entries (or one result)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from scoring import CACHE_DIR, SCORING_RULES, source_digest
+
+# Bump when a result changes meaning without any engine source changing
+ENGINE_VERSION = 1
+_SCORING = ("cards.py", "scoring.py", "shards.py")
+_DISCARDS = _SCORING + (
+    "canonical.py",
+    "crib_ev.py",
+    "discard_table.py",
+    "crib_ev_exact.json",
+)
+_CRIBS = _DISCARDS + ("crib_policy.py",)
+_PEGGING = ("cards.py", "shards.py", "pegging_sim.py")
+
+# Sources and data each cached result or memmapped table (artifact_path) is
+# computed from, by result name
+RESULT_SOURCES = {
+    "scores": _CRIBS + ("enumeration.py",),
+    "discard_pairs": _CRIBS,
+    "component_histograms": _SCORING
+    + ("canonical.py", "enumeration.py", "accumulators.py"),
+    "kept_hands": _DISCARDS + ("keep_matrix.py", "win_prob.py"),
+    "pegging_joint": _DISCARDS + _PEGGING + ("win_prob.py",),
+    "variant": _CRIBS + ("variants.py",),
+    "peg_risk": ("cards.py", "pegging_sim.py", "peg_risk.py"),
+    "sample": _CRIBS + _PEGGING + ("enumeration.py", "game_sim.py", "sampling.py"),
+    "score_index": _SCORING + ("query.py",),
+    "keep_matrix": _SCORING + ("keep_matrix.py",),
+    "discard_table": _DISCARDS,
+}
+# Every engine source; results missing from RESULT_SOURCES depend on all of them
+ENGINE_SOURCES = tuple(sorted({f for files in RESULT_SOURCES.values() for f in files}))
+
+RESULTS_DIR = CACHE_DIR / "results"
+DEFAULT_MAX_BYTES = 1 << 30
+ENTRY_FILE = "entry.json"
+
+
+@lru_cache(maxsize=None)
+def engine_fingerprint(name: str | None = None) -> str:
+    """
+    ENGINE_VERSION plus a digest of the sources and data files one result
+    depends on (every engine source when name is None or not listed).
+    """
+    return f"{ENGINE_VERSION}-{source_digest(RESULT_SOURCES.get(name, ENGINE_SOURCES))}"
+
+
+def artifact_path(name: str, suffix: str) -> Path:
+    """
+    File under CACHE_DIR for an engine table kept outside ResultCache (a
+    memmapped file), named by the engine fingerprint of its sources so that a
+    source change builds a new file instead of reading the old one.
+    """
+    return CACHE_DIR / f"{name}-{engine_fingerprint(name)}{suffix}"
+
+
+def prune_artifacts(name: str, suffix: str) -> int:
+    """Delete older builds of an artifact_path file; returns the count."""
+    current = artifact_path(name, suffix)
+    removed = 0
+    for path in CACHE_DIR.glob(f"{name}-*{suffix}"):
+        if path != current:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def cache_key(name: str, params: dict) -> str:
+    """Content hash identifying one result under the current rules and engine."""
+    payload = {
+        "name": name,
+        "params": params,
+        "rules": SCORING_RULES,
+        "engine": engine_fingerprint(name),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _entry_bytes(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir())
+
+
+class ResultCache:
+    """Directory of content-keyed array results with LRU eviction."""
+
+    def __init__(
+        self,
+        root: Path | str = RESULTS_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits: list[str] = []
+        self.misses: list[str] = []
+
+    def __repr__(self) -> str:
+        # Stable across processes: part of shards.run_sharded checkpoint signatures
+        return f"ResultCache({str(self.root)!r}, enabled={self.enabled})"
+
+    def _path(self, name: str, params: dict) -> Path:
+        return self.root / f"{name}-{cache_key(name, params)[:16]}"
+
+    def load(self, name: str, params: dict) -> dict | None:
+        """Memory-mapped arrays of a cached result, or None if absent."""
+        path = self._path(name, params)
+        if not self.enabled or not (path / ENTRY_FILE).exists():
+            return None
+        entry = json.loads((path / ENTRY_FILE).read_text())
+        os.utime(path)  # mark as recently used
+        return {
+            key: np.load(path / f"{key}.npy", mmap_mode="r") for key in entry["arrays"]
+        }
+
+    def store(self, name: str, params: dict, arrays: dict) -> None:
+        """Write a result atomically, then evict old entries over the size bound."""
+        if not self.enabled:
+            return
+        path = self._path(name, params)
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        for key, value in arrays.items():
+            np.save(tmp / f"{key}.npy", np.asarray(value))
+        entry = {
+            "name": name,
+            "params": params,
+            "key": cache_key(name, params),
+            "engine": engine_fingerprint(name),
+            "arrays": list(arrays),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        (tmp / ENTRY_FILE).write_text(json.dumps(entry, indent=2, default=str))
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+        self.evict(keep=path)
+
+    def fetch(self, name: str, params: dict, compute: Callable[[], dict]) -> dict:
+        """Cached result for (name, params), computing and storing it on a miss."""
+        cached = self.load(name, params)
+        if cached is not None:
+            self.hits.append(name)
+            return cached
+        self.misses.append(name)
+        arrays = compute()
+        self.store(name, params, arrays)
+        return arrays
+
+    def entries(self) -> list[dict]:
+        """Every stored entry with its size and last use, most recent first."""
+        if not self.root.exists():
+            return []
+        found = []
+        for path in self.root.iterdir():
+            if not (path / ENTRY_FILE).exists():
+                continue
+            entry = json.loads((path / ENTRY_FILE).read_text())
+            entry.update(
+                path=path, bytes=_entry_bytes(path), last_used=path.stat().st_mtime
+            )
+            found.append(entry)
+        return sorted(found, key=lambda e: -e["last_used"])
+
+    def invalidate(self, name: str | None = None) -> int:
+        """Remove every entry (or every entry for one result name); returns the count."""
+        removed = 0
+        for entry in self.entries():
+            if name is None or entry["name"] == name:
+                shutil.rmtree(entry["path"])
+                removed += 1
+        return removed
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Drop least-recently-used entries until the cache fits max_bytes."""
+        entries = self.entries()
+        total = sum(e["bytes"] for e in entries)
+        removed = 0
+        for entry in reversed(entries):
+            if total <= self.max_bytes:
+                break
+            if entry["path"] == keep:
+                continue
+            shutil.rmtree(entry["path"])
+            total -= entry["bytes"]
+            removed += 1
+        return removed
+
+    def report(self) -> str:
+        """One-line hit/miss summary for this session."""
+        if not self.enabled:
+            return "Cache: disabled"
+        entries = self.entries()
+        size = sum(e["bytes"] for e in entries) / 1e6
+        parts = [f"{len(self.hits)} hit", f"{len(self.misses)} miss"]
+        if self.misses:
+            parts[-1] += f" ({', '.join(self.misses)})"
+        return f"Cache: {', '.join(parts)} — {len(entries)} entries, {size:.1f} MB"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clear", nargs="?", const="", default=None, metavar="NAME")
+    args = parser.parse_args()
+
+    cache = ResultCache()
+    if args.clear is not None:
+        removed = cache.invalidate(args.clear or None)
+        print(f"\nRemoved {removed} cache entries\n")
+    else:
+        print(f"\nEngine {engine_fingerprint()} — {cache.root}\n")
+        for entry in cache.entries():
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["last_used"]))
+            print(
+                f"  {entry['path'].name:<32} {entry['bytes'] / 1e3:>9.1f} KB  "
+                f"{used}  {entry['params']}"
+            )
+        print()
@@ -0,0 +1,149 @@
+"""
+Suit-isomorphism canonicalization for (hand, starter) combinations.
+
+Relabeling suits never changes a cribbage score, so the 12,994,800
+combinations fall into orbits under the 24 suit permutations. Each orbit is
+represented by one canonical combination plus an integer multiplicity (the
+orbit size), and weighted histograms over the canonical set are exact.
+
+A suit's signature is (rank bitmask of hand cards in that suit) << 1, plus 1
+if the starter is in that suit. The canonical relabeling orders suits by
+descending signature; suits with equal signatures hold identical cards, so
+the choice between them does not matter.
+"""
+
+import numpy as np
+
+from cards import DECK_SIZE, HAND_SIZE, all_hands, card_rank, card_suit, starters_for
+
+SUIT_PERMUTATIONS = 24
+
+
+def hand_suit_masks(hands: np.ndarray) -> np.ndarray:
+    """(N, 4) int32 rank bitmask of the hand cards held in each suit."""
+    bits = np.left_shift(1, card_rank(hands).astype(np.int32))
+    suits = card_suit(hands)
+    return np.stack([(bits * (suits == s)).sum(axis=1) for s in range(4)], axis=1)
+
+
+def suit_signatures(hands: np.ndarray, starters: np.ndarray) -> np.ndarray:
+    """(N, 4) per-suit signatures; suits with equal signatures are interchangeable."""
+    starter_flag = card_suit(starters)[:, None] == np.arange(4)
+    return (hand_suit_masks(hands) << 1) | starter_flag
+
+
+def _stabilizer_order(sorted_keys: np.ndarray) -> np.ndarray:
+    """Permutations fixing a row of sorted keys: product of (tie group size)!."""
+    order = np.ones(len(sorted_keys), dtype=np.int64)
+    run = np.ones(len(sorted_keys), dtype=np.int64)
+    for s in range(1, sorted_keys.shape[1]):
+        tied = sorted_keys[:, s] == sorted_keys[:, s - 1]
+        run = np.where(tied, run + 1, 1)
+        order *= run
+    return order
+
+
+def multiplicity(hands: np.ndarray, starters: np.ndarray) -> np.ndarray:
+    """Number of distinct combinations in each combination's suit orbit."""
+    keys = -np.sort(-suit_signatures(hands, starters), axis=1)
+    return SUIT_PERMUTATIONS // _stabilizer_order(keys)
+
+
+def suit_relabeling(
+    hands: np.ndarray, starters: np.ndarray | None = None
+) -> np.ndarray:
+    """(N, 4) new suit for each old suit, ordering suits by descending signature."""
+    if starters is None:
+        signatures = hand_suit_masks(hands)
+    else:
+        signatures = suit_signatures(hands, starters)
+    order = np.argsort(-signatures, axis=1, kind="stable")
+    return np.argsort(order, axis=1).astype(np.uint8)
+
+
+def canonicalize(
+    hands: np.ndarray, starters: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Map each (hand, starter) to its canonical representative.
+
+    Returns (hands, starters) with suits relabeled by descending signature and
+    hand cards sorted ascending, so every member of an orbit maps to the same
+    pair of arrays that canonical_combinations() generates. Without starters,
+    hands map to the representatives canonical_hands() generates.
+    """
+    relabel = suit_relabeling(hands, starters)
+    new_hands = np.take_along_axis(relabel, card_suit(hands).astype(np.intp), axis=1)
+    new_hands = np.sort(new_hands * 13 + card_rank(hands), axis=1).astype(np.uint8)
+    if starters is None:
+        return new_hands, None
+    new_starters = relabel[np.arange(len(starters)), card_suit(starters)] * 13
+    return new_hands, (new_starters + card_rank(starters)).astype(np.uint8)
+
+
+def canonical_hands(
+    size: int = HAND_SIZE, chunk: int = 1 << 21
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    One representative per suit orbit of size-card hands (no starter).
+
+    A hand is canonical when its suit masks are non-increasing. Returns
+    (hands (K, size) uint8, weights (K,) int64) with weights summing to
+    C(52, size).
+    """
+    every = all_hands(size)
+    hands, weights = [], []
+    for lo in range(0, len(every), chunk):
+        block = every[lo : lo + chunk]
+        masks = hand_suit_masks(block)
+        keep = (masks[:, :-1] >= masks[:, 1:]).all(axis=1)
+        hands.append(block[keep])
+        weights.append(SUIT_PERMUTATIONS // _stabilizer_order(masks[keep]))
+    return np.concatenate(hands), np.concatenate(weights)
+
+
+def canonical_combinations() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One representative per suit orbit of (hand, starter).
+
+    Hands are kept when their suit masks are non-increasing; for such a hand
+    the starter is kept only in the first suit of its tie group. The weight is
+    the orbit size, 24 / |hand stabilizer| * (tie group size of starter suit).
+
+    Returns:
+        (hands (K, 4) uint8, starters (K,) uint8, weights (K,) int64),
+        with weights summing to C(52, 4) * 48.
+    """
+    hands, hand_orbit = canonical_hands(HAND_SIZE)
+    masks = hand_suit_masks(hands)
+
+    # Tie group of each suit position: size and whether it is the group leader
+    same = masks[:, :, None] == masks[:, None, :]
+    group_size = same.sum(axis=2)
+    leader = np.ones_like(same[:, :, 0])
+    leader[:, 1:] = masks[:, 1:] != masks[:, :-1]
+
+    starters = starters_for(hands)
+    rows = np.arange(len(hands))[:, None]
+    starter_suit = card_suit(starters).astype(np.intp)
+    selected = leader[rows, starter_suit]
+    weights = hand_orbit[:, None] * group_size[rows, starter_suit]
+
+    counts = selected.sum(axis=1)
+    return (
+        np.repeat(hands, counts, axis=0),
+        starters[selected],
+        weights[selected].astype(np.int64),
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    hands, starters, weights = canonical_combinations()
+    elapsed = time.perf_counter() - start
+    full = int(weights.sum())
+    print(f"\n{len(hands):,} canonical combinations cover {full:,} in {elapsed:.1f}s")
+    print(f"Scoring work reduced {full / len(hands):.1f}x\n")
+    assert full == 270_725 * (DECK_SIZE - 4)
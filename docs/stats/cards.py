@@ -0,0 +1,84 @@
+"""
+Card encoding shared by the statistics tooling.
+
+Matches createDeck() in src/engine/deck.ts: card id 0-51 is suit * 13 + rank,
+where suits are H, D, S, C and ranks run A (0) .. K (12).
+"""
+
+from math import comb
+
+import numpy as np
+
+RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+SUITS = ["H", "D", "S", "C"]
+JACK = 10
+DECK_SIZE = 52
+HAND_SIZE = 4
+
+# Pip value per rank: A=1 .. 10, face cards 10
+PIP_VALUES = np.minimum(np.arange(1, 14), 10).astype(np.int8)
+
+
+def card_rank(cards: np.ndarray) -> np.ndarray:
+    return cards % 13
+
+
+def card_suit(cards: np.ndarray) -> np.ndarray:
+    return cards // 13
+
+
+def card_label(card: int) -> str:
+    return f"{RANKS[card % 13]}{SUITS[card // 13]}"
+
+
+# Set bits in each byte value, for bit_count on NumPy < 2
+_BYTE_BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def bit_count(words: np.ndarray) -> np.ndarray:
+    """Set bits in each integer (np.bitwise_count, which needs NumPy >= 2)."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words)
+    words = np.ascontiguousarray(words)
+    as_bytes = words.view(np.uint8).reshape(*words.shape, words.itemsize)
+    return _BYTE_BITS[as_bytes].sum(axis=-1, dtype=np.uint8)
+
+
+def all_hands(size: int = HAND_SIZE) -> np.ndarray:
+    """All C(52, size) hands as a (N, size) uint8 array, lexicographic."""
+    combos = np.arange(DECK_SIZE, dtype=np.uint8)[:, None]
+    for _ in range(size - 1):
+        # Extend every partial hand by each card above its current last card
+        last = combos[:, -1].astype(np.int64)
+        counts = DECK_SIZE - 1 - last
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        following = np.repeat(last + 1, counts) + np.arange(counts.sum()) - starts
+        combos = np.hstack(
+            [np.repeat(combos, counts, axis=0), following[:, None].astype(np.uint8)]
+        )
+    return combos
+
+
+# _BINOMIAL[n, k] = C(n, k), for ranking card combinations
+_BINOMIAL = np.array([[comb(n, k) for k in range(8)] for n in range(DECK_SIZE + 1)])
+
+
+def combination_index(hands: np.ndarray) -> np.ndarray:
+    """
+    Colexicographic rank of each hand among all C(52, k) k-card hands.
+
+    For sorted cards c_1 < .. < c_k the rank is sum(C(c_i, i)), a dense index
+    in [0, C(52, k)) suitable for flat lookup tables.
+    """
+    ordered = np.sort(hands, axis=1).astype(np.intp)
+    return _BINOMIAL[ordered, np.arange(1, hands.shape[1] + 1)].sum(axis=1)
+
+
+def starters_for(hands: np.ndarray) -> np.ndarray:
+    """The cards not in each hand, as a (N, 52 - hand size) uint8 array."""
+    deck = np.broadcast_to(
+        np.arange(DECK_SIZE, dtype=np.uint8), (len(hands), DECK_SIZE)
+    )
+    in_hand = np.zeros((len(hands), DECK_SIZE), dtype=bool)
+    np.put_along_axis(in_hand, hands.astype(np.intp), True, axis=1)
+    return deck[~in_hand].reshape(len(hands), DECK_SIZE - hands.shape[1])
@@ -0,0 +1,173 @@
+"""
+Exact crib expected-value table for every discard rank pair.
+
+For each of the 91 rank pairs, averages the crib score over every opponent
+two-card contribution (C(50,2) = 1,225) and every starter (48), applying the
+crib-only 5-card flush rule. Suits matter only through flush and nobs, so
+each pair is solved for one suited and one off-suit representative and the
+two are mixed 4:12, the share of the 16 suit combinations each covers.
+Pocket pairs are always off-suit.
+
+Outputs a JSON table with the mean, variance and delta against the Schell
+values in src/engine/crib-ev.ts, plus a TypeScript module the engine can
+import.
+
+Usage:
+    python docs/stats/crib_ev.py [--workers N]
+"""
+
+import argparse
+import json
+import re
+from itertools import combinations
+from pathlib import Path
+
+import numpy as np
+
+from cards import DECK_SIZE, RANKS
+from scoring import MAX_SCORE, score_totals
+from shards import run_sharded
+
+ROOT = Path(__file__).resolve().parents[2]
+SCHELL_SOURCE = ROOT / "src" / "engine" / "crib-ev.ts"
+JSON_OUTPUT = Path(__file__).resolve().parent / "crib_ev_exact.json"
+TS_OUTPUT = ROOT / "src" / "engine" / "crib-ev-exact.ts"
+
+SUITED_SHARE = 4 / 16
+
+_OPPONENT_PAIRS = np.array(list(combinations(range(DECK_SIZE), 2)), dtype=np.uint8)
+
+
+def rank_pair_key(r1: int, r2: int) -> str:
+    """Same key format as sortedRankPair() in crib-ev.ts."""
+    lo, hi = sorted((r1, r2))
+    return f"{RANKS[lo]}-{RANKS[hi]}"
+
+
+def discard_configs() -> list[tuple[int, int, int, int, float]]:
+    """(rank1, rank2, card1, card2, mixture weight) for every representative discard."""
+    configs = []
+    for r1, r2 in combinations(range(13), 2):
+        configs.append((r1, r2, r1, r2, SUITED_SHARE))
+        configs.append((r1, r2, r1, 13 + r2, 1 - SUITED_SHARE))
+    for r in range(13):
+        configs.append((r, r, r, 13 + r, 1.0))
+    return sorted(configs)
+
+
+def crib_histogram(card1: int, card2: int) -> np.ndarray:
+    """Crib score histogram over every opponent pair and starter for one discard."""
+    pairs = _OPPONENT_PAIRS[
+        (_OPPONENT_PAIRS != card1).all(axis=1) & (_OPPONENT_PAIRS != card2).all(axis=1)
+    ]
+    deck = np.arange(DECK_SIZE, dtype=np.uint8)
+    used = np.zeros((len(pairs), DECK_SIZE), dtype=bool)
+    used[:, [card1, card2]] = True
+    np.put_along_axis(used, pairs.astype(np.intp), True, axis=1)
+    starters = np.broadcast_to(deck, used.shape)[~used].reshape(len(pairs), -1)
+
+    per_pair = starters.shape[1]
+    cribs = np.empty((len(pairs) * per_pair, 4), dtype=np.uint8)
+    cribs[:, 0] = card1
+    cribs[:, 1] = card2
+    cribs[:, 2:] = np.repeat(pairs, per_pair, axis=0)
+    totals = score_totals(cribs, starters.ravel(), is_crib=True)
+    return np.bincount(totals, minlength=MAX_SCORE + 1).astype(np.int64)
+
+
+def crib_shard(start: int, stop: int) -> dict:
+    """Shard task: crib histograms for discard configs [start, stop)."""
+    configs = discard_configs()
+    histograms = np.zeros((len(configs), MAX_SCORE + 1), dtype=np.int64)
+    for i in range(start, stop):
+        _, _, card1, card2, _ = configs[i]
+        histograms[i] = crib_histogram(card1, card2)
+    return {"histograms": histograms}
+
+
+def read_schell_table(path: Path = SCHELL_SOURCE) -> dict[str, float]:
+    """Parse the CRIB_EV_TABLE literal out of crib-ev.ts."""
+    source = path.read_text()
+    body = source[source.index("CRIB_EV_TABLE") :]
+    body = body[: body.index("};")]
+    return {
+        key: float(value) for key, value in re.findall(r"'([^']+)':\s*([\d.]+)", body)
+    }
+
+
+def exact_crib_table(workers: int | None = None, run_dir=None) -> dict[str, dict]:
+    """
+    Solve every rank pair.
+
+    Returns {key: {"ev", "variance", "schell", "delta"}} keyed like the
+    Schell table; delta is exact minus Schell (None where Schell has no entry).
+    """
+    configs = discard_configs()
+    histograms = run_sharded(
+        crib_shard,
+        len(configs),
+        n_shards=len(configs),
+        workers=workers,
+        run_dir=run_dir,
+    )["histograms"]
+    scores = np.arange(MAX_SCORE + 1)
+    schell = read_schell_table()
+
+    moments: dict[str, list[float]] = {}
+    for (r1, r2, _, _, weight), hist in zip(configs, histograms):
+        probs = hist / hist.sum()
+        first, second = moments.setdefault(rank_pair_key(r1, r2), [0.0, 0.0])
+        moments[rank_pair_key(r1, r2)] = [
+            first + weight * float(probs @ scores),
+            second + weight * float(probs @ scores**2),
+        ]
+
+    table = {}
+    for key, (mean, second) in moments.items():
+        reference = schell.get(key)
+        table[key] = {
+            "ev": round(mean, 4),
+            "variance": round(second - mean**2, 4),
+            "schell": reference,
+            "delta": None if reference is None else round(mean - reference, 4),
+        }
+    return table
+
+
+def write_typescript(table: dict[str, dict], path: Path = TS_OUTPUT) -> None:
+    rows = [f"  '{key}': {entry['ev']:.4f}," for key, entry in table.items()]
+    path.write_text(
+        "// Generated by docs/stats/crib_ev.py — do not edit by hand.\n"
+        "\n"
+        "/**\n"
+        " * Exact expected crib score for each discard rank pair (91 entries),\n"
+        " * averaged over every opponent two-card contribution and every starter\n"
+        " * with the crib-only 5-card flush rule. Opponent discards are uniform,\n"
+        " * unlike the Schell table, which assumes strategic opponents.\n"
+        " */\n"
+        "export const EXACT_CRIB_EV_TABLE: Readonly<Record<string, number>> = {\n"
+        + "\n".join(rows)
+        + "\n};\n"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--run-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    print("\nSolving exact crib EV for 91 rank pairs...")
+    table = exact_crib_table(workers=args.workers, run_dir=args.run_dir)
+    JSON_OUTPUT.write_text(json.dumps(table, indent=2) + "\n")
+    write_typescript(table)
+
+    print(f"\n  {'Pair':<6} {'Exact':>6} {'Var':>6} {'Schell':>6} {'Delta':>6}")
+    for key, entry in sorted(table.items(), key=lambda kv: -kv[1]["ev"]):
+        schell = f"{entry['schell']:.2f}" if entry["schell"] is not None else "—"
+        delta = f"{entry['delta']:+.2f}" if entry["delta"] is not None else "—"
+        print(
+            f"  {key:<6} {entry['ev']:>6.2f} {entry['variance']:>6.2f} "
+            f"{schell:>6} {delta:>6}"
+        )
+    print(f"\nSaved {JSON_OUTPUT.name} and {TS_OUTPUT.relative_to(ROOT)}\n")
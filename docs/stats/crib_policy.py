@@ -0,0 +1,156 @@
+"""
+Approximate crib composition under a discard policy.
+
+A crib is two cards from the dealer's discard and two from the pone's. For
+a discard policy (optimal: hand EV plus the exact crib table, as in
+discard_table.py; schell: the same with the Schell values in crib-ev.ts),
+every six-card deal is solved once per seat, over the 962,988 canonical
+deals weighted by orbit size, to get the exact probability that the policy
+discards each specific card pair. A four-card crib {a, b, c, d} is then
+weighted by its three pair splits,
+
+    w = sum over splits (x, y) of D(x) P(y) + P(x) D(y)
+
+with D and P the dealer and pone discard probabilities. This treats the two
+discards as independent, ignoring that the players' hands share one deck, so
+the crib it gives is an approximation rather than the exact crib: under
+optimal discards it averages 4.56 points, where dealing both hands from one
+deck (sampling.py's dealer analysis) gives 4.76. It is kept for comparing
+policies; the engine tables take the crib from the sample. Under random
+discards the weight is constant and the crib is uniform (and exact).
+
+Usage:
+    python docs/stats/crib_policy.py [--policy optimal|schell] [--workers N]
+"""
+
+import argparse
+from functools import lru_cache
+from math import comb
+
+import numpy as np
+
+from cache import ResultCache
+from cards import DECK_SIZE, all_hands, card_rank, card_suit, combination_index
+from crib_ev import read_schell_table, rank_pair_key
+from discard_table import DEAL_SIZE, OPTIONS, canonical_deals, option_values
+from shards import DEFAULT_SHARDS, run_sharded
+
+POLICIES = ("optimal", "schell")
+PAIR_CLASSES = 2 * 13 * 13  # (suited, low rank, high rank)
+
+# Crib pair splits: positions (x, y) of the three ways to halve four cards
+CRIB_SPLITS = np.array([[(0, 1), (2, 3)], [(0, 2), (1, 3)], [(0, 3), (1, 2)]])
+
+
+def pair_class(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Suit-free class of each card pair: suited * 169 + low rank * 13 + high rank."""
+    r1, r2 = card_rank(first).astype(np.intp), card_rank(second).astype(np.intp)
+    suited = card_suit(first) == card_suit(second)
+    return suited * 169 + np.minimum(r1, r2) * 13 + np.maximum(r1, r2)
+
+
+def class_sizes() -> np.ndarray:
+    """Number of specific card pairs in each pair class."""
+    sizes = np.zeros(PAIR_CLASSES)
+    ranks = np.arange(13)
+    low, high = np.meshgrid(ranks, ranks, indexing="ij")
+    distinct = low < high
+    sizes[: 13 * 13][(low * 13 + high)[distinct]] = 12
+    sizes[169:][(low * 13 + high)[distinct]] = 4
+    sizes[ranks * 14] = 6  # pocket pairs are never suited
+    return sizes
+
+
+@lru_cache(maxsize=2)
+def policy_crib_matrix(policy: str) -> np.ndarray | None:
+    """13x13 crib EV the policy discards by (None: the exact table)."""
+    if policy == "optimal":
+        return None
+    if policy == "schell":
+        table = read_schell_table()
+        return np.array(
+            [[table[rank_pair_key(r1, r2)] for r2 in range(13)] for r1 in range(13)]
+        )
+    raise ValueError(f"unknown discard policy: {policy}")
+
+
+def discard_shard(start: int, stop: int, policy: str) -> dict:
+    """Shard task: orbit-weighted pair-class counts of each seat's discards."""
+    deals, weights = canonical_deals()
+    deals, weights = deals[start:stop], weights[start:stop]
+    hand_ev, crib_ev = option_values(deals, policy_crib_matrix(policy))
+    counts = np.zeros((2, PAIR_CLASSES), dtype=np.int64)
+    rows = np.arange(len(deals))
+    for seat, sign in enumerate((-1, 1)):  # pone gives the crib away, dealer keeps it
+        best = OPTIONS[(hand_ev + sign * crib_ev).argmax(axis=1)]
+        classes = pair_class(deals[rows, best[:, 0]], deals[rows, best[:, 1]])
+        counts[seat] = np.bincount(classes, weights=weights, minlength=PAIR_CLASSES)
+    return {"counts": counts}
+
+
+def discard_frequencies(
+    policy: str, workers: int | None = None, cache: ResultCache | None = None
+) -> np.ndarray:
+    """
+    (2, PAIR_CLASSES) probability that pone (row 0) and dealer (row 1) discard
+    one specific card pair of each class.
+    """
+
+    def compute() -> dict:
+        deals, _ = canonical_deals()
+        return run_sharded(
+            discard_shard,
+            len(deals),
+            args=(policy,),
+            n_shards=DEFAULT_SHARDS,
+            workers=workers,
+        )
+
+    if cache is None:
+        counts = compute()["counts"]
+    else:
+        counts = cache.fetch("discard_pairs", {"policy": policy}, compute)["counts"]
+    sizes = class_sizes()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        per_pair = np.where(sizes > 0, counts / sizes, 0.0)
+    return per_pair / comb(DECK_SIZE, DEAL_SIZE)
+
+
+@lru_cache(maxsize=4)
+def crib_weights(policy: str, cache: ResultCache | None = None) -> np.ndarray:
+    """
+    Relative likelihood of each 4-card crib under the policy, with the two
+    discards independent, indexed by the crib's colex rank and normalized to
+    mean 1. The discard frequencies are
+    read from (or saved to) the cache when one is given.
+    """
+    pone, dealer = discard_frequencies(policy, cache=cache)
+    cribs = all_hands(4)
+    weights = np.zeros(len(cribs))
+    for (x1, x2), (y1, y2) in CRIB_SPLITS:
+        x = pair_class(cribs[:, x1], cribs[:, x2])
+        y = pair_class(cribs[:, y1], cribs[:, y2])
+        weights += dealer[x] * pone[y] + pone[x] * dealer[y]
+    table = np.empty_like(weights)
+    table[combination_index(cribs)] = weights / weights.mean()
+    return table
+
+
+if __name__ == "__main__":
+    from cards import RANKS
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--policy", choices=POLICIES, default="optimal")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    frequencies = discard_frequencies(args.policy, args.workers, ResultCache())
+    sizes = class_sizes()
+    print(f"\nMost discarded pair classes under the {args.policy} policy:\n")
+    print(f"  {'Pair':<10} {'Pone':>7} {'Dealer':>7}")
+    shares = frequencies * sizes
+    for cls in np.argsort(-shares.sum(axis=0))[:15]:
+        suited, low, high = cls // 169, cls % 169 // 13, cls % 13
+        label = f"{RANKS[low]}-{RANKS[high]}{' s' if suited else ''}"
+        print(f"  {label:<10} {shares[0, cls]:>6.2%} {shares[1, cls]:>7.2%}")
+    print()
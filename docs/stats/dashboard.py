@@ -0,0 +1,103 @@
+"""
+Offline plotly.js bundle and single-page dashboard for the statistics charts.
+
+The dashboard is one HTML page holding an empty slot per chart. When a slot
+scrolls near the viewport, an IntersectionObserver injects that chart's
+figure script (figures/<chart>.js: the figure JSON wrapped in one function
+call), so only visible charts are parsed and drawn. Figures load through
+script tags rather than fetch() so the page also works opened from disk.
+"""
+
+import json
+from pathlib import Path
+
+BUNDLE_NAME = "plotly.min.js"
+FIGURES_DIR = "figures"
+DASHBOARD_NAME = "dashboard.html"
+
+
+def plotly_cdn_url() -> str:
+    from plotly.offline import get_plotlyjs_version
+
+    return f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+
+
+def write_plotly_bundle(output_dir: Path) -> Path:
+    """Write plotly.min.js into output_dir unless an identical copy is there."""
+    from plotly.offline import get_plotlyjs
+
+    path = output_dir / BUNDLE_NAME
+    bundle = get_plotlyjs()
+    if not path.exists() or path.read_text(encoding="utf-8") != bundle:
+        path.write_text(bundle, encoding="utf-8")
+    return path
+
+
+def figure_script_path(output_dir: Path, filename: str) -> Path:
+    return output_dir / FIGURES_DIR / f"{Path(filename).stem}.js"
+
+
+def write_figure_script(fig, output_dir: Path, filename: str) -> Path:
+    """Write a chart's figure JSON as a script the dashboard can lazy-load."""
+    path = figure_script_path(output_dir, filename)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    name = json.dumps(Path(filename).stem)
+    path.write_text(f"window.showFigure({name}, {fig.to_json()});\n", encoding="utf-8")
+    return path
+
+
+_DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>SKUNK'D Scoring Statistics</title>
+<script src="{plotly_src}"></script>
+<style>
+  body {{ margin: 0; padding: 24px; background: {background}; }}
+  .chart {{ min-height: 560px; margin: 0 auto 32px; max-width: 1200px; }}
+</style>
+</head>
+<body>
+{slots}
+<script>
+  window.showFigure = function (name, figure) {{
+    const slot = document.querySelector('[data-figure="' + name + '"]');
+    Plotly.newPlot(slot, figure.data, figure.layout, {{ responsive: true }});
+  }};
+  const observer = new IntersectionObserver(function (entries) {{
+    for (const entry of entries) {{
+      if (!entry.isIntersecting) continue;
+      observer.unobserve(entry.target);
+      const script = document.createElement("script");
+      script.src = "{figures_dir}/" + entry.target.dataset.figure + ".js";
+      document.body.appendChild(script);
+    }}
+  }}, {{ rootMargin: "300px" }});
+  document.querySelectorAll(".chart").forEach(function (slot) {{
+    observer.observe(slot);
+  }});
+</script>
+</body>
+</html>
+"""
+
+
+def write_dashboard(
+    output_dir: Path, filenames: list[str], plotly_src: str, background: str
+) -> Path:
+    """Write dashboard.html with one lazily loaded slot per chart, in order."""
+    slots = "\n".join(
+        f'<div class="chart" data-figure="{Path(filename).stem}"></div>'
+        for filename in filenames
+    )
+    path = output_dir / DASHBOARD_NAME
+    path.write_text(
+        _DASHBOARD_TEMPLATE.format(
+            plotly_src=plotly_src,
+            background=background,
+            slots=slots,
+            figures_dir=FIGURES_DIR,
+        ),
+        encoding="utf-8",
+    )
+    return path
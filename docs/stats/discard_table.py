@@ -0,0 +1,271 @@
+"""
+Precomputed optimal-discard table for every six-card deal.
+
+Solves all C(52,6) = 20,358,520 deals, reduced by suit isomorphism to
+962,988 canonical deals, for both dealer and pone. For each canonical deal
+it stores the best discard and the expected value of all 15 options in a
+fixed-width binary file that tooling opens with numpy.memmap and indexes in
+O(1) through the colexicographic rank of the deal.
+
+Expected value follows optimalDiscard() in src/engine/optimal.ts: the kept
+hand's average score over the 46 unseen starters, plus (dealer) or minus
+(pone) the expected crib value of the discarded pair, here taken from the
+exact rank-pair table produced by crib_ev.py.
+
+File layout (all little-endian), written to docs/stats/.cache/ under the
+engine fingerprint of the scoring, crib EV and table sources
+(cache.artifact_path), so changing any of them rebuilds both files:
+
+    discard_table-<fp>.records  RECORD_DTYPE x 962,988, one 64-byte record
+                                per canonical deal, ordered by the deal's
+                                colex rank:
+                                  u1       best_dealer   option index 0-14
+                                  u1       best_pone     option index 0-14
+                                  i2[15]   dealer_ev     milli-points
+                                  i2[15]   pone_ev       milli-points
+                                  u1[2]    (padding)
+    discard_table-<fp>.index    u4 x C(52,6) = 20,358,520, indexed by the
+                                colex rank of a canonical deal (sum of
+                                C(c_i, i) over its sorted cards c_1 < .. <
+                                c_6), holding its record slot; 0xFFFFFFFF
+                                for non-canonical ranks.
+
+Option k is the k-th pair (i, j), i < j, of positions in the sorted
+canonical deal — the same order as the nested loops in optimalDiscard().
+To look up any deal, relabel suits by descending suit rank-mask (ties keep
+suit order H, D, S, C), sort the cards, take the colex rank, then read
+index[rank] and records[slot]; option positions refer to the sorted
+canonical cards.
+
+Usage:
+    python docs/stats/discard_table.py [--workers N]
+"""
+
+import argparse
+import json
+import time
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from cache import artifact_path, prune_artifacts
+from canonical import canonical_hands, suit_relabeling
+from cards import (
+    DECK_SIZE,
+    all_hands,
+    card_label,
+    card_rank,
+    card_suit,
+    combination_index,
+    starters_for,
+)
+from crib_ev import JSON_OUTPUT as CRIB_EV_JSON
+from crib_ev import exact_crib_table, rank_pair_key
+from scoring import CACHE_DIR, score_totals
+from shards import DEFAULT_SHARDS, concatenate, run_sharded
+
+RECORDS_PATH = artifact_path("discard_table", ".records")
+INDEX_PATH = artifact_path("discard_table", ".index")
+
+DEAL_SIZE = 6
+OPTIONS = np.array(list(combinations(range(DEAL_SIZE), 2)), dtype=np.intp)
+KEEPS = np.array(
+    [[p for p in range(DEAL_SIZE) if p not in pair] for pair in OPTIONS], dtype=np.intp
+)
+EMPTY_SLOT = 0xFFFFFFFF
+MILLI = 1000
+
+RECORD_DTYPE = np.dtype(
+    [
+        ("best_dealer", "u1"),
+        ("best_pone", "u1"),
+        ("dealer_ev", "<i2", (15,)),
+        ("pone_ev", "<i2", (15,)),
+        ("pad", "u1", (2,)),
+    ]
+)
+
+
+@lru_cache(maxsize=1)
+def starter_sums() -> np.ndarray:
+    """Total score of each 4-card hand summed over its 48 starters, by colex rank."""
+    hands = all_hands(4)
+    sums = np.empty(len(hands), dtype=np.int32)
+    block_size = 1 << 15
+    for lo in range(0, len(hands), block_size):
+        block = hands[lo : lo + block_size]
+        starters = starters_for(block)
+        rows = np.repeat(block, starters.shape[1], axis=0)
+        totals = score_totals(rows, starters.ravel())
+        sums[lo : lo + len(block)] = totals.reshape(len(block), -1).sum(axis=1)
+    table = np.empty_like(sums)
+    table[combination_index(hands)] = sums
+    return table
+
+
+@lru_cache(maxsize=1)
+def crib_ev_matrix() -> np.ndarray:
+    """13x13 exact crib EV by discard rank pair (see crib_ev.py)."""
+    if CRIB_EV_JSON.exists():
+        table = json.loads(CRIB_EV_JSON.read_text())
+    else:
+        table = exact_crib_table()
+    matrix = np.zeros((13, 13))
+    for r1 in range(13):
+        for r2 in range(13):
+            matrix[r1, r2] = table[rank_pair_key(r1, r2)]["ev"]
+    return matrix
+
+
+@lru_cache(maxsize=1)
+def canonical_deals() -> tuple[np.ndarray, np.ndarray]:
+    """Canonical six-card deals and their orbit sizes, sorted by colex rank."""
+    deals, weights = canonical_hands(DEAL_SIZE)
+    order = np.argsort(combination_index(deals))
+    return deals[order], weights[order]
+
+
+def option_values(
+    deals: np.ndarray, crib_matrix: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (hand EV, crib EV), each (N, 15), for every discard option of every deal.
+
+    crib_matrix is a 13x13 crib EV by discard ranks (default: the exact table).
+    """
+    keeps = deals[:, KEEPS].reshape(-1, 4)
+    discards = deals[:, OPTIONS]
+    total = starter_sums()[combination_index(keeps)].astype(np.int64)
+    for side in range(2):
+        total -= score_totals(keeps, discards[:, :, side].ravel())
+    hand_ev = total.reshape(len(deals), -1) / (DECK_SIZE - DEAL_SIZE)
+    ranks = card_rank(discards)
+    if crib_matrix is None:
+        crib_matrix = crib_ev_matrix()
+    return hand_ev, crib_matrix[ranks[:, :, 0], ranks[:, :, 1]]
+
+
+def solve_shard(start: int, stop: int) -> dict:
+    """Shard task: records for canonical deals [start, stop) in colex order."""
+    hand_ev, crib_ev = option_values(canonical_deals()[0][start:stop])
+    dealer, pone = hand_ev + crib_ev, hand_ev - crib_ev
+    records = np.zeros(len(dealer), dtype=RECORD_DTYPE)
+    records["best_dealer"] = dealer.argmax(axis=1)
+    records["best_pone"] = pone.argmax(axis=1)
+    records["dealer_ev"] = np.rint(dealer * MILLI)
+    records["pone_ev"] = np.rint(pone * MILLI)
+    return {"records": records}
+
+
+def build_table(workers: int | None = None, run_dir=None) -> int:
+    """Solve every canonical deal and write the records and index files."""
+    deals, _ = canonical_deals()
+    records = run_sharded(
+        solve_shard,
+        len(deals),
+        n_shards=DEFAULT_SHARDS,
+        workers=workers,
+        run_dir=run_dir,
+        combine=concatenate,
+    )["records"]
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for suffix in (".records", ".index"):
+        prune_artifacts("discard_table", suffix)
+    records.astype(RECORD_DTYPE).tofile(RECORDS_PATH)
+    index = np.full(comb(DECK_SIZE, DEAL_SIZE), EMPTY_SLOT, dtype="<u4")
+    index[combination_index(deals)] = np.arange(len(deals), dtype=np.uint32)
+    index.tofile(INDEX_PATH)
+    return len(deals)
+
+
+class DiscardTable:
+    """Zero-copy reader for the on-disk discard table."""
+
+    def __init__(self):
+        self.records = np.memmap(RECORDS_PATH, dtype=RECORD_DTYPE, mode="r")
+        self.index = np.memmap(INDEX_PATH, dtype="<u4", mode="r")
+
+    def lookup(self, deal: list[int], is_dealer: bool) -> dict:
+        """
+        Best discard and all 15 option EVs for any six-card deal.
+
+        Returns {"discard", "keep", "expected_value", "options"} in the
+        caller's own card ids, with options sorted best first.
+        """
+        cards = np.array(sorted(deal), dtype=np.uint8)
+        relabel = suit_relabeling(cards[None, :])[0]
+        relabeled = relabel[card_suit(cards)] * 13 + card_rank(cards)
+        order = np.argsort(relabeled)
+        slot = self.index[combination_index(relabeled[None, :])[0]]
+        if slot == EMPTY_SLOT:
+            raise KeyError(f"no record for deal {[card_label(c) for c in deal]}")
+        record = self.records[slot]
+
+        # Canonical position p holds the caller's card cards[order[p]]
+        original = cards[order].tolist()
+        evs = record["dealer_ev" if is_dealer else "pone_ev"] / MILLI
+        options = [
+            {
+                "discard": [original[p] for p in OPTIONS[k]],
+                "keep": [original[p] for p in KEEPS[k]],
+                "expected_value": float(evs[k]),
+            }
+            for k in range(len(OPTIONS))
+        ]
+        options.sort(key=lambda option: -option["expected_value"])
+        return {**options[0], "options": options}
+
+    def best_keeps(self, deals: np.ndarray, is_dealer: bool) -> np.ndarray:
+        """Vectorized lookup: the optimal 4 kept cards of each (N, 6) deal."""
+        cards = np.sort(deals, axis=1)
+        rows = np.arange(len(cards))[:, None]
+        relabel = suit_relabeling(cards)
+        relabeled = relabel[rows, card_suit(cards)] * 13 + card_rank(cards)
+        order = np.argsort(relabeled, axis=1)
+        slots = self.index[combination_index(relabeled)]
+        if (slots == EMPTY_SLOT).any():
+            raise KeyError("deal without a record; rebuild the discard table")
+        field = "best_dealer" if is_dealer else "best_pone"
+        best = self.records[field][slots].astype(np.intp)
+        return cards[rows, np.take_along_axis(order, KEEPS[best], axis=1)]
+
+
+def discard_table(workers: int | None = None) -> DiscardTable:
+    """
+    Reader for the table, building the files first if they are missing or
+    were built from other sources.
+    """
+    if not (RECORDS_PATH.exists() and INDEX_PATH.exists()):
+        build_table(workers)
+    return DiscardTable()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--run-dir", default=None)
+    args = parser.parse_args()
+
+    print("\nSolving every six-card deal for dealer and pone...")
+    start = time.perf_counter()
+    count = build_table(workers=args.workers, run_dir=args.run_dir)
+    print(f"  {count:,} canonical deals in {time.perf_counter() - start:.1f}s")
+    print(
+        f"  {RECORDS_PATH.stat().st_size / 1e6:.1f} MB records, "
+        f"{INDEX_PATH.stat().st_size / 1e6:.1f} MB index\n"
+    )
+
+    table = DiscardTable()
+    example = [4, 17, 30, 10, 0, 25]  # 5H 5D 5S JH AH KD
+    for is_dealer in (True, False):
+        result = table.lookup(example, is_dealer)
+        role = "Dealer" if is_dealer else "Pone"
+        print(
+            f"  {role}: {' '.join(card_label(c) for c in example)} -> keep "
+            f"{' '.join(card_label(c) for c in result['keep'])} "
+            f"({result['expected_value']:.2f} pts)"
+        )
+    print()
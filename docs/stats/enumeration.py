@@ -0,0 +1,170 @@
+"""
+Vectorized exhaustive enumeration of cribbage show scores.
+
+Scores every (4-card hand, starter) combination — all 12,994,800 of them —
+with batched NumPy array operations (see scoring.py), following the rules
+in src/engine/scoring.ts exactly (fifteens, pairs, runs, flush, nobs).
+
+Only one representative per suit orbit is scored (see canonical.py); the
+histograms are rebuilt exactly from the orbit multiplicities.
+
+Crib mode applies the crib-only flush rule; cribs can be uniform (random
+discards) or weighted by a discard policy, which approximates the two
+players' discards as independent (see crib_policy.py).
+
+Usage:
+    python docs/stats/enumeration.py [--crib] [--policy optimal|schell]
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from cache import ResultCache
+from canonical import canonical_combinations
+from cards import all_hands, combination_index, starters_for
+from crib_policy import POLICIES, crib_weights
+from scoring import COMPONENTS, MAX_SCORE, score_batch
+from shards import DEFAULT_SHARDS, run_sharded
+
+# Rows scored per batch
+CHUNK_ROWS = 1 << 20
+
+
+# ─── Exhaustive Enumeration ─────────────────────────────────────────────────
+@lru_cache(maxsize=2)
+def combination_rows(canonical: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(hands, starters, weights) for every row of the enumeration space."""
+    if canonical:
+        return canonical_combinations()
+    hands = all_hands()
+    starters = starters_for(hands)
+    hands = np.repeat(hands, starters.shape[1], axis=0)
+    return hands, starters.ravel(), np.ones(len(hands), dtype=np.int64)
+
+
+def score_rows(
+    start: int,
+    stop: int,
+    is_crib: bool,
+    canonical: bool,
+    policy: str | None = None,
+    cache: ResultCache | None = None,
+) -> dict:
+    """
+    Shard task: weighted histogram and component totals for rows [start, stop),
+    with the policy's crib weights from the cache when one is given.
+    """
+    hands, starters, weights = combination_rows(canonical)
+    dtype = np.int64 if policy is None else np.float64
+    histogram = np.zeros(MAX_SCORE + 1, dtype=dtype)
+    component_totals = np.zeros(len(COMPONENTS), dtype=dtype)
+
+    for lo in range(start, stop, CHUNK_ROWS):
+        chunk = slice(lo, min(lo + CHUNK_ROWS, stop))
+        chunk_weights = weights[chunk]
+        if policy is not None:
+            cribs = combination_index(hands[chunk])
+            chunk_weights = chunk_weights * crib_weights(policy, cache)[cribs]
+        points = score_batch(hands[chunk], starters[chunk], is_crib)
+        histogram += np.bincount(
+            points.sum(axis=1), weights=chunk_weights, minlength=MAX_SCORE + 1
+        ).astype(dtype)
+        component_totals += chunk_weights @ points.astype(dtype)
+
+    return {"histogram": histogram, "component_totals": component_totals}
+
+
+def enumerate_scores(
+    is_crib: bool = False,
+    canonical: bool = True,
+    workers: int | None = 1,
+    n_shards: int = DEFAULT_SHARDS,
+    run_dir=None,
+    cache: ResultCache | None = None,
+    policy: str | None = None,
+) -> dict:
+    """
+    Score every (hand, starter) combination.
+
+    With canonical=True (the default) only suit-canonical combinations are
+    scored and weighted by orbit size; canonical=False scores all 12,994,800
+    rows directly and exists to cross-check the canonical path. workers,
+    n_shards and run_dir are passed to shards.run_sharded (workers=None uses
+    every core; run_dir enables checkpoint/resume). With a cache, the merged
+    histograms are read from (or saved to) it, keyed by is_crib alone since
+    both paths give identical results.
+
+    With is_crib and a discard policy (see crib_policy.py), each crib is
+    weighted by how likely the policy's discards are to form it, taken as
+    independent (an approximation), and counts become expected counts out of
+    the same 12,994,800.
+
+    Returns a dict with:
+        total:            number of combinations covered
+        distribution:     {score: count} for every achievable score
+        component_totals: {component: total points} across all combinations
+    """
+    if policy is not None and not is_crib:
+        raise ValueError("a discard policy only applies to crib scoring")
+
+    def compute() -> dict:
+        return run_sharded(
+            score_rows,
+            len(combination_rows(canonical)[0]),
+            args=(is_crib, canonical, policy, cache),
+            n_shards=n_shards,
+            workers=workers,
+            run_dir=run_dir,
+        )
+
+    if cache is None:
+        merged = compute()
+    else:
+        params = {"is_crib": is_crib, "policy": policy}
+        merged = cache.fetch("scores", params, compute)
+    histogram = merged["histogram"]
+    number = int if policy is None else float
+    return {
+        "total": round(float(histogram.sum())),
+        "distribution": {s: number(c) for s, c in enumerate(histogram) if c > 0},
+        "component_totals": dict(
+            zip(COMPONENTS, (number(t) for t in merged["component_totals"]))
+        ),
+    }
+
+
+def summarize(result: dict) -> tuple[dict, dict, float]:
+    """Derive (DISTRIBUTION, COMPONENT_AVERAGES, AVG_SCORE) from an enumeration result."""
+    total = result["total"]
+    averages = {name: pts / total for name, pts in result["component_totals"].items()}
+    avg_score = sum(s * c for s, c in result["distribution"].items()) / total
+    return result["distribution"], averages, avg_score
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--crib", action="store_true", help="score as the crib")
+    parser.add_argument("--policy", choices=POLICIES, default=None)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = enumerate_scores(
+        is_crib=args.crib or args.policy is not None,
+        workers=args.workers,
+        policy=args.policy,
+    )
+    elapsed = time.perf_counter() - start
+    distribution, averages, avg = summarize(result)
+
+    print(f"\nScored {result['total']:,} hand+starter combinations in {elapsed:.1f}s\n")
+    for score, count in distribution.items():
+        print(f"  {score:>2}: {count:>12,.0f}")
+    print()
+    for name, value in averages.items():
+        print(f"  {name:<9} {value:.4f}")
+    print(f"  {'Average':<9} {avg:.4f}\n")
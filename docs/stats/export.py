@@ -0,0 +1,188 @@
+"""
+Columnar export of the full show-score enumeration.
+
+Writes every one of the 12,994,800 (hand, starter) rows — in enumeration
+order: every 4-card hand, lexicographic, then each of its 48 starters — as
+eleven uint8 columns:
+
+    hand0..hand3   the hand's card ids, ascending (suit * 13 + rank)
+    starter        the starter's card id
+    total          the show score
+    fifteens, pairs, runs, flush, nobs
+                   its components (COMPONENTS in scoring.py)
+
+With pyarrow installed the table is one Parquet file, zstd-compressed in row
+groups of CHUNK_HANDS hands, so readers decode only the columns they ask
+for. Without it the fallback is a directory holding one .npy file per column
+plus schema.json; each column is memory-mapped on read, so selecting columns
+costs nothing until the rows are touched. read_rows() opens either layout.
+
+Usage:
+    python docs/stats/export.py [--out DIR] [--format auto|parquet|npy] [--crib]
+                                [--columns hand0 total ...]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cards import DECK_SIZE, HAND_SIZE, all_hands, starters_for
+from scoring import CACHE_DIR, COMPONENTS, score_batch
+
+EXPORT_VERSION = 1
+EXPORT_DIR = CACHE_DIR / "export"
+STARTERS_PER_HAND = DECK_SIZE - HAND_SIZE
+COLUMNS = (
+    *(f"hand{i}" for i in range(HAND_SIZE)),
+    "starter",
+    "total",
+    *(name.lower() for name in COMPONENTS),
+)
+FORMATS = ("auto", "parquet", "npy")
+
+# Hands per chunk (x 48 rows): one Parquet row group
+CHUNK_HANDS = 1 << 14
+
+
+# ─── Rows ───────────────────────────────────────────────────────────────────
+def row_chunks(is_crib: bool = False):
+    """Yield {column: uint8 array} for consecutive chunks of the enumeration."""
+    hands = all_hands()
+    for lo in range(0, len(hands), CHUNK_HANDS):
+        chunk = hands[lo : lo + CHUNK_HANDS]
+        starters = starters_for(chunk).ravel()
+        chunk = np.repeat(chunk, STARTERS_PER_HAND, axis=0)
+        points = score_batch(chunk, starters, is_crib)
+        columns = {f"hand{i}": chunk[:, i] for i in range(HAND_SIZE)}
+        columns["starter"] = starters
+        columns["total"] = points.sum(axis=1).astype(np.uint8)
+        for i, name in enumerate(COMPONENTS):
+            columns[name.lower()] = points[:, i].astype(np.uint8)
+        yield columns
+
+
+def export_name(is_crib: bool) -> str:
+    return f"{'cribs' if is_crib else 'hands'}_v{EXPORT_VERSION}"
+
+
+def _metadata(is_crib: bool) -> dict:
+    n_rows = len(all_hands()) * STARTERS_PER_HAND
+    return {"version": EXPORT_VERSION, "is_crib": is_crib, "rows": n_rows}
+
+
+# ─── Writers ────────────────────────────────────────────────────────────────
+def write_parquet(path: Path, is_crib: bool = False) -> Path:
+    """Write the table as one zstd-compressed Parquet file (needs pyarrow)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Parquet export needs `pip install pyarrow`") from exc
+
+    schema = pa.schema([(name, pa.uint8()) for name in COLUMNS]).with_metadata(
+        {"skunkd": json.dumps(_metadata(is_crib))}
+    )
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for columns in row_chunks(is_crib):
+            writer.write_table(pa.table(columns, schema=schema))
+    return path
+
+
+def write_npy(path: Path, is_crib: bool = False) -> Path:
+    """Write the table as a directory of per-column .npy files."""
+    metadata = _metadata(is_crib)
+    path.mkdir(parents=True, exist_ok=True)
+    arrays = {
+        name: np.lib.format.open_memmap(
+            path / f"{name}.npy", mode="w+", dtype=np.uint8, shape=(metadata["rows"],)
+        )
+        for name in COLUMNS
+    }
+    start = 0
+    for columns in row_chunks(is_crib):
+        stop = start + len(columns["total"])
+        for name, values in columns.items():
+            arrays[name][start:stop] = values
+        start = stop
+    for array in arrays.values():
+        array.flush()
+    metadata["columns"] = {name: "uint8" for name in COLUMNS}
+    (path / "schema.json").write_text(json.dumps(metadata, indent=2) + "\n")
+    return path
+
+
+def export_rows(
+    output_dir: Path = EXPORT_DIR, fmt: str = "auto", is_crib: bool = False
+) -> Path:
+    """
+    Write the full enumeration into output_dir as <name>.parquet or a <name>/
+    .npy directory; "auto" picks Parquet when pyarrow is installed.
+    """
+    if fmt == "auto":
+        try:
+            import pyarrow.parquet  # noqa: F401
+
+            fmt = "parquet"
+        except ImportError:
+            fmt = "npy"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    name = export_name(is_crib)
+    if fmt == "parquet":
+        return write_parquet(output_dir / f"{name}.parquet", is_crib)
+    return write_npy(output_dir / name, is_crib)
+
+
+# ─── Readers ────────────────────────────────────────────────────────────────
+def read_rows(path: Path | str, columns=None) -> dict[str, np.ndarray]:
+    """
+    {column: array} for the selected columns (all by default) of an export.
+
+    .npy columns come back memory-mapped; Parquet reads only the selected
+    columns' pages, through a memory-mapped file.
+    """
+    path = Path(path)
+    columns = list(columns or COLUMNS)
+    unknown = set(columns) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown columns: {', '.join(sorted(unknown))}")
+    if path.is_dir():
+        return {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in columns}
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("reading Parquet needs `pip install pyarrow`") from exc
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    return {name: table.column(name).to_numpy() for name in columns}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", type=Path, default=EXPORT_DIR)
+    parser.add_argument("--format", choices=FORMATS, default="auto")
+    parser.add_argument("--crib", action="store_true", help="score as the crib")
+    parser.add_argument(
+        "--columns", nargs="+", choices=COLUMNS, default=None, help="read back"
+    )
+    args = parser.parse_args()
+
+    print(f"\nExporting {export_name(args.crib)}...")
+    start = time.perf_counter()
+    path = export_rows(args.out, args.format, args.crib)
+    elapsed = time.perf_counter() - start
+    files = sorted(path.iterdir()) if path.is_dir() else [path]
+    size = sum(f.stat().st_size for f in files)
+    print(f"  {elapsed:.1f}s, {size / 1e6:.1f} MB — {path}")
+
+    start = time.perf_counter()
+    rows = read_rows(path, args.columns)
+    n_rows = len(next(iter(rows.values())))
+    print(
+        f"  read {len(rows)} columns x {n_rows:,} rows in "
+        f"{(time.perf_counter() - start) * 1e3:.1f} ms\n"
+    )
+    if "total" in rows:
+        counts = np.bincount(rows["total"])
+        print(f"  mean total {counts @ np.arange(len(counts)) / n_rows:.4f}\n")
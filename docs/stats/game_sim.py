@@ -0,0 +1,267 @@
+"""
+Batched full-game Monte Carlo simulator for comparing AI strategies.
+
+Plays thousands of two-player games to 121 in lockstep as NumPy arrays,
+following the hand flow of src/engine/gameState.ts: shuffle and deal six
+cards each, discard two to the dealer's crib, cut the starter (his heels
+pays the dealer 2), peg (pegging_sim.simulate), then count the pone's hand,
+the dealer's hand and the crib. The game ends the moment a player reaches
+121 — mid-pegging included — and the deal alternates between hands. The
+loser is skunked below 91 and double-skunked below 61.
+
+A strategy pairs a discard rule (DISCARDS) with a pegging policy
+(pegging_sim.POLICIES); see STRATEGIES. Games run in batches across a
+process pool, each batch with its own SeedSequence stream keyed by its
+position, so results depend only on the seed and game count, not on the
+worker count. Rates are reported with 95% Wilson intervals.
+
+Usage:
+    python docs/stats/game_sim.py [--games N] [--a optimal] [--b schell]
+                                  [--seed S] [--workers N] [--out PATH]
+"""
+
+import argparse
+import json
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cards import DECK_SIZE, JACK, card_rank
+from crib_policy import policy_crib_matrix
+from discard_table import DEAL_SIZE, KEEPS, OPTIONS, option_values
+from pegging_sim import DEALER, PONE, POLICIES, simulate
+from scoring import score_totals
+from shards import run_sharded
+
+WIN_SCORE = 121
+SKUNK_LINE = 91
+DOUBLE_SKUNK_LINE = 61
+HEELS_POINTS = 2
+BATCH_GAMES = 4096
+Z_95 = 1.959964
+
+
+# ─── Discard Rules ──────────────────────────────────────────────────────────
+# A discard rule maps (M, 6) deals to (M,) option indices into OPTIONS.
+def random_discard(deals: np.ndarray, is_dealer: bool, rng) -> np.ndarray:
+    """Any two cards, uniformly."""
+    return rng.integers(0, len(OPTIONS), len(deals))
+
+
+def _expected_value_discard(crib_matrix: np.ndarray | None):
+    def discard(deals: np.ndarray, is_dealer: bool, rng) -> np.ndarray:
+        hand_ev, crib_ev = option_values(deals, crib_matrix)
+        return (hand_ev + (crib_ev if is_dealer else -crib_ev)).argmax(axis=1)
+
+    return discard
+
+
+def optimal_discard(deals: np.ndarray, is_dealer: bool, rng) -> np.ndarray:
+    """Best hand EV plus (or minus) the exact crib EV, as optimalDiscard() does."""
+    return _expected_value_discard(None)(deals, is_dealer, rng)
+
+
+def schell_discard(deals: np.ndarray, is_dealer: bool, rng) -> np.ndarray:
+    """Best hand EV plus (or minus) the Schell crib EV, as aiSelectDiscard() does."""
+    return _expected_value_discard(policy_crib_matrix("schell"))(deals, is_dealer, rng)
+
+
+DISCARDS = {
+    "optimal": optimal_discard,
+    "schell": schell_discard,
+    "random": random_discard,
+}
+
+# Strategy name -> (discard rule, pegging policy)
+STRATEGIES = {
+    "optimal": ("optimal", "greedy"),
+    "schell": ("schell", "greedy"),
+    "random": ("random", "random"),
+}
+
+
+# ─── Hands ──────────────────────────────────────────────────────────────────
+def play_hand(
+    scores: np.ndarray, strategies: tuple[str, str], rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Play one hand of every game and return the new scores.
+
+    scores is (M, 2) in seat order (pone, dealer) and strategies names each
+    seat's strategy. Scoring stops for a game once either seat reaches 121.
+    """
+    n = len(scores)
+    rows = np.arange(n)[:, None]
+    deck = np.argsort(rng.random((n, DECK_SIZE)), axis=1).astype(np.uint8)
+    keeps = np.empty((n, 2, 4), dtype=np.uint8)
+    crib = np.empty((n, 4), dtype=np.uint8)
+    for seat, name in enumerate(strategies):
+        deal = deck[:, seat * DEAL_SIZE : (seat + 1) * DEAL_SIZE]
+        option = DISCARDS[STRATEGIES[name][0]](deal, seat == DEALER, rng)
+        keeps[:, seat] = deal[rows, KEEPS[option]]
+        crib[:, 2 * seat : 2 * seat + 2] = deal[rows, OPTIONS[option]]
+    starter = deck[:, 2 * DEAL_SIZE]
+
+    scores = scores.copy()
+    scores[:, DEALER] += HEELS_POINTS * (card_rank(starter) == JACK)
+    live = np.flatnonzero((scores < WIN_SCORE).all(axis=1))
+    policies = tuple(POLICIES[STRATEGIES[name][1]] for name in strategies)
+    scores[live] += simulate(
+        keeps[live], policies, rng, needed=WIN_SCORE - scores[live]
+    )
+
+    shows = [
+        (PONE, lambda i: score_totals(keeps[i, PONE], starter[i])),
+        (DEALER, lambda i: score_totals(keeps[i, DEALER], starter[i])),
+        (DEALER, lambda i: score_totals(crib[i], starter[i], is_crib=True)),
+    ]
+    for seat, show in shows:
+        live = np.flatnonzero((scores < WIN_SCORE).all(axis=1))
+        scores[live, seat] += show(live)
+    return scores
+
+
+# ─── Games ──────────────────────────────────────────────────────────────────
+def game_shard(start: int, stop: int, a: str, b: str, seed: int) -> dict:
+    """
+    Shard task: play games [start, stop) of player A against player B.
+
+    Even-numbered games start with A dealing. Returns per-player counts of
+    wins, skunks and double skunks inflicted, plus hands played.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(start,)))
+    strategies = (a, b)
+    n = stop - start
+    scores = np.zeros((n, 2), dtype=np.int64)
+    dealer = (start + np.arange(n)) % 2
+    live = np.ones(n, dtype=bool)
+    hands = 0
+    while live.any():
+        for d in (0, 1):
+            games = np.flatnonzero(live & (dealer == d))
+            if len(games) == 0:
+                continue
+            # Seat order is (pone, dealer): player 1 - d receives, player d deals
+            seated = play_hand(
+                scores[games][:, [1 - d, d]], (strategies[1 - d], strategies[d]), rng
+            )
+            scores[games, 1 - d] = seated[:, PONE]
+            scores[games, d] = seated[:, DEALER]
+        hands += int(live.sum())
+        live &= (scores < WIN_SCORE).all(axis=1)
+        dealer = 1 - dealer
+
+    winner = (scores[:, 1] >= WIN_SCORE).astype(np.intp)
+    loser_score = scores[np.arange(n), 1 - winner]
+    counts = np.zeros((3, 2), dtype=np.int64)
+    counts[0] = np.bincount(winner, minlength=2)
+    counts[1] = np.bincount(winner[loser_score < SKUNK_LINE], minlength=2)
+    counts[2] = np.bincount(winner[loser_score < DOUBLE_SKUNK_LINE], minlength=2)
+    return {"counts": counts, "hands": np.array(hands)}
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple:
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return (0.0, 1.0)
+    p = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    half = z * math.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denominator
+    return (center - half, center + half)
+
+
+def games_for_margin(margin: float, z: float = Z_95) -> int:
+    """Games needed for a +/- margin interval on a win rate near 50%."""
+    return math.ceil((z * 0.5 / margin) ** 2)
+
+
+def simulate_games(
+    n_games: int,
+    a: str = "optimal",
+    b: str = "schell",
+    seed: int = 0,
+    workers: int | None = None,
+) -> dict:
+    """
+    Play n_games of strategy `a` against strategy `b`, alternating first deal.
+
+    Returns {"games", "hands_per_game", "a", "b"} where each player's entry
+    holds rate and 95% interval for "win", "skunk" (skunks inflicted) and
+    "double_skunk", plus combined "skunk" and "double_skunk" rates for the
+    match.
+    """
+    for name in (a, b):
+        if name not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {name}")
+    merged = run_sharded(
+        game_shard,
+        n_games,
+        args=(a, b, seed),
+        n_shards=math.ceil(n_games / BATCH_GAMES),
+        workers=workers,
+    )
+    counts = merged["counts"]
+
+    def rate(successes: int) -> dict:
+        low, high = wilson_interval(int(successes), n_games)
+        return {"rate": int(successes) / n_games, "low": low, "high": high}
+
+    result = {
+        "games": n_games,
+        "hands_per_game": int(merged["hands"]) / n_games,
+        "skunk": rate(counts[1].sum()),
+        "double_skunk": rate(counts[2].sum()),
+    }
+    for player, name in enumerate(("a", "b")):
+        result[name] = {
+            "strategy": (a, b)[player],
+            "win": rate(counts[0, player]),
+            "skunk": rate(counts[1, player]),
+            "double_skunk": rate(counts[2, player]),
+        }
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=40_000)
+    parser.add_argument("--a", choices=STRATEGIES, default="optimal")
+    parser.add_argument("--b", choices=STRATEGIES, default="schell")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=None, help="write JSON here")
+    args = parser.parse_args()
+
+    print(f"\n{args.a} vs {args.b}: {args.games:,} games...")
+    start = time.perf_counter()
+    result = simulate_games(args.games, args.a, args.b, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    print(
+        f"  {elapsed:.1f}s, {args.games / elapsed:,.0f} games/s, "
+        f"{result['hands_per_game']:.2f} hands per game\n"
+    )
+
+    def show(label: str, entry: dict) -> None:
+        print(
+            f"  {label:<28} {entry['rate']:>7.2%}  "
+            f"[{entry['low']:.2%}, {entry['high']:.2%}]"
+        )
+
+    for player in ("a", "b"):
+        strategy = result[player]["strategy"]
+        show(f"{strategy} wins", result[player]["win"])
+        show(f"{strategy} skunks", result[player]["skunk"])
+        show(f"{strategy} double skunks", result[player]["double_skunk"])
+    show("Skunk rate (loser < 91)", result["skunk"])
+    show("Double skunk rate (< 61)", result["double_skunk"])
+    half = (result["a"]["win"]["high"] - result["a"]["win"]["low"]) / 2
+    print(
+        f"\n  Win rate resolved to +/-{half:.2%}; "
+        f"+/-0.5% needs {games_for_margin(0.005):,} games\n"
+    )
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"Saved {args.out}\n")
@@ -2,19 +2,88 @@
 Generate interactive Plotly visualizations for SKUNK'D cribbage scoring statistics.
 
 Data source: Exhaustive enumeration of ALL 12,994,800 possible (hand, starter)
-combinations by the SKUNK'D scoring engine, validated against rubl.com reference data.
+combinations, computed at run time by the vectorized engine in enumeration.py
+and checked against rubl.com reference data.
+
+Enumeration results are cached on disk (see cache.py), so regenerating the
+charts after the first run does no recomputation. The win-probability and
+percentile data are read from the tables win_prob.py and percentiles.py
+--write generate (src/engine/win-probability.ts, hand_percentiles.json)
+rather than solved again; rerun those scripts to refresh them.
+
+Charts build incrementally: a manifest (see manifest.py) records what each
+chart was drawn from, and only charts whose data, layout or code changed
+are rewritten.
+
+Stale charts render in a process pool. --offline writes plotly.min.js once
+next to the charts and has every page reference it instead of the CDN;
+--dashboard adds dashboard.html, one page that lazy-loads every chart.
+
+--profile times every stage (enumeration, aggregation, figure construction
+and write_html per chart) with wall time, CPU time and peak memory, prints
+the table and saves it as JSON (see profiling.py); --cprofile adds a
+cProfile dump of the main process.
+
+Subcommands select the stages to run: compute fills the caches and prints a
+summary, charts builds the HTML (--only a subset), query answers conditional
+questions (see query.py), and export writes the data tables as JSON or CSV
+without drawing anything; export --rows adds the full row-level enumeration
+in a columnar format (see export.py). Only the statistics the selected
+charts or tables read are computed, and Plotly is imported only when a
+chart is drawn. With no subcommand the charts are built, as before.
 
 Usage:
-    python docs/stats/generate_charts.py
-
-Outputs HTML files to docs/stats/
+    python docs/stats/generate_charts.py [charts] [--only NAME ...] [--force]
+                                         [--offline] [--dashboard] [--workers N]
+                                         [--output-dir DIR]
+    python docs/stats/generate_charts.py compute
+    python docs/stats/generate_charts.py query --hold 5 --hold J [--at-least 12]
+    python docs/stats/generate_charts.py export [--only TABLE ...]
+                                         [--format json|csv] [--output-dir DIR]
+                                         [--rows [DIR] [--rows-format FORMAT]]
+
+Every command but query also takes --no-cache, --clear-cache,
+--profile [--profile-out PATH] and --cprofile PATH.
+
+Outputs go next to this script (docs/stats/) unless --output-dir says otherwise.
 """
 
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-
-# ─── Complete Distribution Data ─────────────────────────────────────────────
-# Every value validated against rubl.com exhaustive enumeration
+import argparse
+import csv
+import json
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from accumulators import component_histograms
+from cache import ResultCache
+from cards import RANKS, card_label
+from dashboard import (
+    figure_script_path,
+    plotly_cdn_url,
+    write_dashboard,
+    write_figure_script,
+    write_plotly_bundle,
+)
+from enumeration import enumerate_scores, summarize
+from export import EXPORT_DIR, FORMATS, export_rows
+from keep_matrix import keep_matrix
+from manifest import BuildManifest, content_hash, dependency_hash, source_hash
+from percentiles import Percentiles
+from profiling import PROFILE_PATH, Profiler
+from scoring import COMPONENTS
+from sampling import ANALYSES, dealer_shows, estimate
+from query import add_query_arguments, run_query
+from shards import default_workers
+from variants import EV_BIN, variant_stats
+from win_prob import read_typescript
+
+# ─── Reference Distribution Data ────────────────────────────────────────────
+# Every value validated against rubl.com exhaustive enumeration. Charts read
+# the live enumeration; these literals only check it for drift.
 TOTAL = 12_994_800
 DISTRIBUTION = {
     0: 1_009_008,
@@ -57,6 +126,164 @@ COMPONENT_AVERAGES = {
 
 AVG_SCORE = 4.7692
 
+
+# Enumerated crib distributions charted next to the hand: label -> discard policy
+# (policies treat the two discards as independent; see crib_policy.py)
+CRIB_POLICIES = {"Random discards": None, "Optimal, independent approx.": "optimal"}
+# The optimal-discard crib dealt from one deck, sampled (sampling.dealer_shows)
+SAMPLED_CRIB = "Optimal, sampled"
+
+# Keeps charted at each end of the expected-value ranking
+KEEP_CHART_COUNT = 10
+
+# Component pairs charted as co-occurrence heatmaps (keys of component_histograms)
+COOCCURRENCE_PAIRS = ("fifteens_runs", "fifteens_pairs", "pairs_runs", "pairs_flush")
+
+# Samples per analysis for the sampled-estimates chart (fixed, so it caches)
+CHART_SAMPLES = 200_000
+
+# Stats beyond the hand distribution, computed only when a chart needs them
+OPTIONAL_STATS = (
+    "crib",
+    "keeps",
+    "win_probability",
+    "variants",
+    "percentiles",
+    "sampling",
+    "component_joint",
+)
+
+
+def compute_stats(
+    cache: ResultCache | None = None,
+    profiler: Profiler | None = None,
+    keys: set[str] | None = None,
+) -> dict:
+    """
+    Run (or load) the enumeration and package its output for the chart functions.
+
+    keys limits the optional parts (OPTIONAL_STATS) to those listed; the hand
+    distribution and its summaries are always included.
+    """
+    profiler = profiler or Profiler()
+    wanted = set(OPTIONAL_STATS) if keys is None else set(keys) & set(OPTIONAL_STATS)
+    with profiler.stage("enumeration"):
+        result = enumerate_scores(cache=cache)
+        crib_results = {}
+        if "crib" in wanted:
+            crib_results = {
+                label: enumerate_scores(is_crib=True, cache=cache, policy=policy)
+                for label, policy in CRIB_POLICIES.items()
+            }
+    with profiler.stage("aggregation"):
+        distribution, component_averages, avg_score = summarize(result)
+        stats = {
+            "total": result["total"],
+            "distribution": distribution,
+            "component_averages": component_averages,
+            "avg_score": avg_score,
+        }
+        if "crib" in wanted:
+            stats["crib"] = {}
+            for label, crib_result in crib_results.items():
+                crib_distribution, _, crib_avg = summarize(crib_result)
+                stats["crib"][label] = {
+                    "shares": {
+                        s: c / crib_result["total"]
+                        for s, c in crib_distribution.items()
+                    },
+                    "avg_score": crib_avg,
+                }
+            sampled = dealer_shows(cache)["crib"]
+            stats["crib"][SAMPLED_CRIB] = {
+                "shares": {s: float(p) for s, p in enumerate(sampled) if p > 0},
+                "avg_score": float(sampled @ np.arange(len(sampled))),
+            }
+    if "keeps" in wanted:
+        with profiler.stage("keep matrix"):
+            stats["keeps"] = keep_extremes()
+    if "win_probability" in wanted:
+        with profiler.stage("win probability"):
+            stats["win_probability"] = read_typescript().round(4).tolist()
+    if "percentiles" in wanted:
+        with profiler.stage("percentiles"):
+            stats["percentiles"] = Percentiles().tables
+    if "variants" in wanted:
+        with profiler.stage("rule variants"):
+            stats["variants"] = variant_stats(cache=cache)
+    if "component_joint" in wanted:
+        with profiler.stage("component histograms"):
+            stats["component_joint"] = component_joint(cache)
+    if "sampling" in wanted:
+        with profiler.stage("sampling"):
+            stats["sampling"] = {}
+            for name in ANALYSES:
+                result = estimate(name, max_samples=CHART_SAMPLES, cache=cache)
+                stats["sampling"][name] = {
+                    "samples": result["samples"],
+                    "values": result["values"],
+                }
+    return stats
+
+
+def component_joint(cache: ResultCache | None = None) -> dict:
+    """
+    Joint shares and correlations of COOCCURRENCE_PAIRS, and means by starter
+    rank.
+    """
+    histograms = component_histograms(cache=cache)
+    pairs = {}
+    for key in COOCCURRENCE_PAIRS:
+        shares = histograms[key].shares()
+        rows, cols = (np.flatnonzero(shares.any(axis=a)).max() + 1 for a in (1, 0))
+        pairs[key] = {
+            "shares": shares[:rows, :cols].round(8).tolist(),
+            "correlation": round(histograms[key].correlation(), 4),
+        }
+    names = ("total", *(name.lower() for name in COMPONENTS))
+    means = [histograms[f"starter_{name}"].conditional_mean() for name in names]
+    return {
+        "pairs": pairs,
+        "starter_means": np.round(np.stack(means, axis=1), 4).tolist(),
+    }
+
+
+def keep_extremes() -> dict:
+    """The best and worst keeps by expected score, labeled for chart_keeps."""
+    matrix = keep_matrix()
+    return {
+        side: [
+            {
+                "label": " ".join(card_label(c) for c in entry["keep"]),
+                "mean": entry["mean"],
+                "p10": entry["percentiles"][10],
+                "p90": entry["percentiles"][90],
+                "min": entry["min"],
+                "max": entry["max"],
+            }
+            for entry in matrix.ranked(KEEP_CHART_COUNT, worst=side == "Worst")
+        ]
+        for side in ("Best", "Worst")
+    }
+
+
+def check_reference(stats: dict) -> list[str]:
+    """List every way the computed statistics differ from the validated reference."""
+    problems = []
+    if stats["total"] != TOTAL:
+        problems.append(f"total {stats['total']:,} != {TOTAL:,}")
+    for score in sorted(set(DISTRIBUTION) | set(stats["distribution"])):
+        got = stats["distribution"].get(score, 0)
+        want = DISTRIBUTION.get(score, 0)
+        if got != want:
+            problems.append(f"score {score}: {got:,} != {want:,}")
+    for name, want in COMPONENT_AVERAGES.items():
+        got = stats["component_averages"].get(name, 0.0)
+        if round(got, 4) != want:
+            problems.append(f"{name} average {got:.4f} != {want:.4f}")
+    return problems
+
+
 # ─── Color Palette ──────────────────────────────────────────────────────────
 SKUNKD_DARK = "#1a1a2e"
 SKUNKD_PURPLE = "#6c3fc5"
@@ -106,10 +333,15 @@ def base_layout(**overrides) -> dict:
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 1: Main Score Distribution
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_main_distribution():
+def chart_main_distribution(stats: dict):
+    import plotly.graph_objects as go
+
+    distribution = stats["distribution"]
+    total = stats["total"]
+    avg_score = stats["avg_score"]
     scores = list(range(30))
-    counts = [DISTRIBUTION.get(s, 0) for s in scores]
-    pcts = [c / TOTAL * 100 for c in counts]
+    counts = [distribution.get(s, 0) for s in scores]
+    pcts = [c / total * 100 for c in counts]
     colors = [score_color(s) if counts[s] > 0 else "#2d333b" for s in scores]
 
     # Build custom hover text
@@ -118,7 +350,7 @@ def chart_main_distribution():
         if c == 0:
             hover.append(f"Score {s}: IMPOSSIBLE<br>Cannot be achieved in cribbage")
         elif c < 100:
-            odds = f"1 in {TOTAL // c:,}"
+            odds = f"1 in {total // c:,}"
             hover.append(f"Score {s}<br>{c:,} hands ({p:.4f}%)<br>Odds: {odds}")
         else:
             hover.append(f"Score {s}<br>{c:,} hands ({p:.2f}%)")
@@ -143,7 +375,7 @@ def chart_main_distribution():
         dict(
             x=0,
             y=pcts[0] + 1.5,
-            text="<b>'19' Hand</b><br>7.8% score zero",
+            text=f"<b>'19' Hand</b><br>{pcts[0]:.1f}% score zero",
             showarrow=True,
             arrowhead=2,
             ax=40,
@@ -153,7 +385,7 @@ def chart_main_distribution():
         dict(
             x=4,
             y=pcts[4] + 1.5,
-            text="<b>Most Common</b><br>22% of all hands",
+            text=f"<b>Most Common</b><br>{pcts[4]:.0f}% of all hands",
             showarrow=True,
             arrowhead=2,
             ax=0,
@@ -163,7 +395,7 @@ def chart_main_distribution():
         dict(
             x=29,
             y=0.8,
-            text="<b>Perfect 29</b><br>Only 4 possible<br>1 in 3,248,700",
+            text=f"<b>Perfect 29</b><br>Only {counts[29]} possible<br>1 in {total // counts[29]:,}",
             showarrow=True,
             arrowhead=2,
             ax=-50,
@@ -173,7 +405,7 @@ def chart_main_distribution():
     ]
 
     # Mark impossible scores
-    for imp in [19, 25, 26, 27]:
+    for imp in [s for s in scores if counts[s] == 0]:
         annotations.append(
             dict(
                 x=imp,
@@ -185,12 +417,12 @@ def chart_main_distribution():
         )
 
     # Average line
-    fig.add_vline(x=AVG_SCORE, line=dict(color=SKUNKD_GOLD, width=2, dash="dash"))
+    fig.add_vline(x=avg_score, line=dict(color=SKUNKD_GOLD, width=2, dash="dash"))
     annotations.append(
         dict(
-            x=AVG_SCORE,
+            x=avg_score,
             y=max(pcts) * 0.85,
-            text=f"<b>Average: {AVG_SCORE:.2f}</b>",
+            text=f"<b>Average: {avg_score:.2f}</b>",
             showarrow=False,
             font=dict(size=11, color=SKUNKD_GOLD),
             bgcolor="rgba(0,0,0,0.6)",
@@ -223,23 +455,30 @@ def chart_main_distribution():
         )
     )
 
-    fig.write_html("docs/stats/score_distribution.html", include_plotlyjs="cdn")
-    print("  [1/6] score_distribution.html")
+    return fig
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 2: Cumulative "Score X or Better"
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_cumulative():
-    scores = sorted(DISTRIBUTION.keys())
-    # Build cumulative from high to low: P(score >= X)
-    cum_data = []
-    for threshold in range(30):
-        count_gte = sum(c for s, c in DISTRIBUTION.items() if s >= threshold)
-        cum_data.append((threshold, count_gte / TOTAL * 100))
+CUMULATIVE_MILESTONES = (0, 2, 6, 8, 12, 16, 20, 24)
+
+
+def milestone_text(score: int, share: float) -> str:
+    """Plain-language note for P(score >= s), e.g. '1 in 150 hands score 16+'."""
+    if share >= 1:
+        return f"Every hand scores<br>at least {score}"
+    if share >= 0.1:
+        return f"{share:.0%} score {score}+"
+    return f"1 in {1 / share:,.0f} hands<br>score {score}+"
+
 
-    x_vals = [d[0] for d in cum_data]
-    y_vals = [d[1] for d in cum_data]
+def chart_cumulative(stats: dict):
+    import plotly.graph_objects as go
+
+    at_least = stats["percentiles"]["hand"]["at_least"]
+    x_vals = list(range(30))
+    y_vals = [(at_least[s] if s < len(at_least) else 0.0) * 100 for s in x_vals]
 
     fig = go.Figure()
 
@@ -256,26 +495,16 @@ def chart_cumulative():
         )
     )
 
-    # Key threshold annotations
-    milestones = [
-        (0, "100%", "Every hand scores\nat least 0"),
-        (2, None, "92.2% score 2+"),
-        (6, None, "~50% score 6+"),
-        (8, None, "~35% score 8+"),
-        (12, None, "~5% score 12+"),
-        (16, None, "~1% score 16+"),
-        (20, None, "0.1% score 20+"),
-        (24, None, "0.03% score 24+"),
-    ]
-
+    # Key threshold annotations, worded from the percentile table
     annotations = []
-    for score, _, text in milestones:
-        pct = sum(c for s, c in DISTRIBUTION.items() if s >= score) / TOTAL * 100
+    for score in CUMULATIVE_MILESTONES:
+        pct = y_vals[score]
+        text = milestone_text(score, pct / 100)
         annotations.append(
             dict(
                 x=score,
                 y=pct,
-                text=f"<b>{pct:.1f}%</b><br>{text}" if text else f"<b>{pct:.1f}%</b>",
+                text=f"<b>{pct:.1f}%</b><br>{text}",
                 showarrow=True,
                 arrowhead=2,
                 ax=30 if score < 15 else -40,
@@ -312,14 +541,18 @@ def chart_cumulative():
         )
     )
 
-    fig.write_html("docs/stats/cumulative_probability.html", include_plotlyjs="cdn")
-    print("  [2/6] cumulative_probability.html")
+    return fig
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 3: Score Tier Breakdown (Donut)
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_tiers():
+def chart_tiers(stats: dict):
+    import plotly.graph_objects as go
+
+    distribution = stats["distribution"]
+    total = stats["total"]
+    avg_score = stats["avg_score"]
     tiers = {
         "Zero ('19')": (0, 0),
         "Low (1-4)": (1, 4),
@@ -342,7 +575,7 @@ def chart_tiers():
     ]
 
     for i, (label, (lo, hi)) in enumerate(tiers.items()):
-        count = sum(c for s, c in DISTRIBUTION.items() if lo <= s <= hi)
+        count = sum(c for s, c in distribution.items() if lo <= s <= hi)
         labels.append(label)
         values.append(count)
         tier_colors.append(color_map[i])
@@ -359,7 +592,7 @@ def chart_tiers():
     ]
 
     hover_text = [
-        f"<b>{l}</b><br>{v:,} hands ({v / TOTAL * 100:.2f}%)<br>{c}"
+        f"<b>{l}</b><br>{v:,} hands ({v / total * 100:.2f}%)<br>{c}"
         for l, v, c in zip(labels, values, comparisons)
     ]
 
@@ -390,7 +623,7 @@ def chart_tiers():
             height=550,
             annotations=[
                 dict(
-                    text=f"<b>Avg<br>{AVG_SCORE:.1f}</b>",
+                    text=f"<b>Avg<br>{avg_score:.1f}</b>",
                     x=0.5,
                     y=0.5,
                     font=dict(size=20, color=TEXT_COLOR),
@@ -401,23 +634,26 @@ def chart_tiers():
         )
     )
 
-    fig.write_html("docs/stats/score_tiers.html", include_plotlyjs="cdn")
-    print("  [3/6] score_tiers.html")
+    return fig
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 4: Rarity Scale — Log Comparison
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_rarity():
+def chart_rarity(stats: dict):
+    import plotly.graph_objects as go
+
+    distribution = stats["distribution"]
+    total = stats["total"]
     rare_hands = [
-        ("Score 29 (perfect)", 4, "#9b59b6"),
-        ("Score 28", 76, "#9b59b6"),
-        ("Score 24", 3_680, "#e74c3c"),
-        ("Score 23", 356, "#e74c3c"),
-        ("Score 22", 444, "#e74c3c"),
-        ("Score 21", 2_496, "#e67e22"),
-        ("Score 20", 8_068, "#e67e22"),
-        ("Score 17+", sum(c for s, c in DISTRIBUTION.items() if s >= 17), "#f39c12"),
+        ("Score 29 (perfect)", distribution.get(29, 0), "#9b59b6"),
+        ("Score 28", distribution.get(28, 0), "#9b59b6"),
+        ("Score 24", distribution.get(24, 0), "#e74c3c"),
+        ("Score 23", distribution.get(23, 0), "#e74c3c"),
+        ("Score 22", distribution.get(22, 0), "#e74c3c"),
+        ("Score 21", distribution.get(21, 0), "#e67e22"),
+        ("Score 20", distribution.get(20, 0), "#e67e22"),
+        ("Score 17+", sum(c for s, c in distribution.items() if s >= 17), "#f39c12"),
     ]
 
     # Real-world comparisons
@@ -431,7 +667,7 @@ def chart_rarity():
     labels, odds, colors = [], [], []
 
     for name, count, color in rare_hands:
-        one_in = TOTAL / count if count > 0 else float("inf")
+        one_in = total / count if count > 0 else float("inf")
         labels.append(name)
         odds.append(one_in)
         colors.append(color)
@@ -486,18 +722,22 @@ def chart_rarity():
         )
     )
 
-    fig.write_html("docs/stats/rarity_scale.html", include_plotlyjs="cdn")
-    print("  [4/6] rarity_scale.html")
+    return fig
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 5: Where Do Points Come From? (Component Breakdown)
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_components():
-    components = list(COMPONENT_AVERAGES.keys())
-    values = list(COMPONENT_AVERAGES.values())
+def chart_components(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    component_averages = stats["component_averages"]
+    avg_score = stats["avg_score"]
+    components = list(component_averages.keys())
+    values = list(component_averages.values())
     colors = ["#e74c3c", "#3498db", "#2ecc71", "#f39c12", "#9b59b6"]
-    pcts = [v / AVG_SCORE * 100 for v in values]
+    pcts = [v / avg_score * 100 for v in values]
 
     descriptions = [
         "Card combos summing to 15 (2pts each)",
@@ -555,7 +795,7 @@ def chart_components():
         **base_layout(
             title=dict(
                 text="Where Do Cribbage Points Come From?<br>"
-                f"<sub>Breakdown of the average {AVG_SCORE:.2f}-point hand across all 12.99M combinations</sub>",
+                f"<sub>Breakdown of the average {avg_score:.2f}-point hand across all 12.99M combinations</sub>",
                 font=dict(size=18),
             ),
             height=450,
@@ -567,19 +807,23 @@ def chart_components():
     for ann in fig.layout.annotations:
         ann.font = dict(size=13, color=TEXT_COLOR)
 
-    fig.write_html("docs/stats/score_components.html", include_plotlyjs="cdn")
-    print("  [5/6] score_components.html")
+    return fig
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Chart 6: Even vs Odd — The Cribbage Quirk
 # ═══════════════════════════════════════════════════════════════════════════
-def chart_even_odd():
-    even_count = sum(c for s, c in DISTRIBUTION.items() if s % 2 == 0)
-    odd_count = sum(c for s, c in DISTRIBUTION.items() if s % 2 != 0)
+def chart_even_odd(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    distribution = stats["distribution"]
+    total = stats["total"]
+    even_count = sum(c for s, c in distribution.items() if s % 2 == 0)
+    odd_count = sum(c for s, c in distribution.items() if s % 2 != 0)
 
-    even_scores = sorted([s for s in DISTRIBUTION if s % 2 == 0])
-    odd_scores = sorted([s for s in DISTRIBUTION if s % 2 != 0])
+    even_scores = sorted([s for s in distribution if s % 2 == 0])
+    odd_scores = sorted([s for s in distribution if s % 2 != 0])
 
     fig = make_subplots(
         rows=1,
@@ -609,10 +853,10 @@ def chart_even_odd():
     # Grouped bar chart
     all_scores = list(range(30))
     even_vals = [
-        DISTRIBUTION.get(s, 0) / TOTAL * 100 if s % 2 == 0 else 0 for s in all_scores
+        distribution.get(s, 0) / total * 100 if s % 2 == 0 else 0 for s in all_scores
     ]
     odd_vals = [
-        DISTRIBUTION.get(s, 0) / TOTAL * 100 if s % 2 != 0 else 0 for s in all_scores
+        distribution.get(s, 0) / total * 100 if s % 2 != 0 else 0 for s in all_scores
     ]
 
     fig.add_trace(
@@ -663,23 +907,924 @@ def chart_even_odd():
     for ann in fig.layout.annotations:
         ann.font = dict(size=13, color=TEXT_COLOR)
 
-    fig.write_html("docs/stats/even_odd.html", include_plotlyjs="cdn")
-    print("  [6/6] even_odd.html")
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 7: Crib vs Hand Distribution
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_crib(stats: dict):
+    import plotly.graph_objects as go
+
+    distribution = stats["distribution"]
+    total = stats["total"]
+    scores = list(range(30))
+    series = [("Hand", [distribution.get(s, 0) / total * 100 for s in scores])]
+    for label, crib in stats["crib"].items():
+        series.append(
+            (
+                f"Crib — {label.lower()}",
+                [crib["shares"].get(s, 0) * 100 for s in scores],
+            )
+        )
+    colors = [SKUNKD_PURPLE, SKUNKD_TEAL, SKUNKD_PINK, SKUNKD_GOLD]
+
+    fig = go.Figure()
+    for (name, pcts), color in zip(series, colors):
+        fig.add_trace(
+            go.Bar(
+                x=scores,
+                y=pcts,
+                name=name,
+                marker_color=color,
+                hovertemplate=f"{name}<br>Score %{{x}}: %{{y:.2f}}%<extra></extra>",
+            )
+        )
+
+    averages = [f"hand {stats['avg_score']:.2f}"] + [
+        f"{label.lower()} {crib['avg_score']:.2f}"
+        for label, crib in stats["crib"].items()
+    ]
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Crib vs Hand Score Distribution<br>"
+                "<sub>Crib flush needs all 5 cards | Averages: "
+                f"{'; '.join(averages)}</sub>",
+                font=dict(size=18),
+            ),
+            xaxis=dict(
+                title="Score",
+                dtick=1,
+                gridcolor=GRID_COLOR,
+                zerolinecolor=GRID_COLOR,
+            ),
+            yaxis=dict(
+                title="Percentage (%)",
+                gridcolor=GRID_COLOR,
+                zerolinecolor=GRID_COLOR,
+            ),
+            barmode="group",
+            height=500,
+            legend=dict(x=0.7, y=0.95, bgcolor="rgba(0,0,0,0)"),
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 8: Best and Worst Keeps
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_keeps(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    sides = list(stats["keeps"].items())
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=[f"{side} {len(keeps)} Keeps" for side, keeps in sides],
+        horizontal_spacing=0.18,
+    )
+
+    for col, ((side, keeps), color) in enumerate(
+        zip(sides, [SKUNKD_GREEN, SKUNKD_PINK]), start=1
+    ):
+        keeps = keeps[::-1]  # highest-ranked at the top
+        means = [k["mean"] for k in keeps]
+        hover = [
+            f"<b>{k['label']}</b><br>Expected: {k['mean']:.2f} pts<br>"
+            f"Middle 80% of cuts: {k['p10']}-{k['p90']}<br>"
+            f"Range: {k['min']}-{k['max']}"
+            for k in keeps
+        ]
+        fig.add_trace(
+            go.Bar(
+                x=means,
+                y=[k["label"] for k in keeps],
+                orientation="h",
+                marker_color=color,
+                error_x=dict(
+                    type="data",
+                    symmetric=False,
+                    array=[k["p90"] - m for k, m in zip(keeps, means)],
+                    arrayminus=[m - k["p10"] for k, m in zip(keeps, means)],
+                    color=TEXT_COLOR,
+                    thickness=1,
+                ),
+                text=[f"{m:.2f}" for m in means],
+                textposition="inside",
+                textfont=dict(size=11, color="white"),
+                hovertext=hover,
+                hoverinfo="text",
+                showlegend=False,
+            ),
+            row=1,
+            col=col,
+        )
+        fig.update_xaxes(
+            title_text="Expected points", gridcolor=GRID_COLOR, row=1, col=col
+        )
+        fig.update_yaxes(gridcolor=GRID_COLOR, row=1, col=col)
+
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Best and Worst 4-Card Keeps<br>"
+                "<sub>Average over all 48 starters | whiskers span the middle 80% "
+                "of cuts</sub>",
+                font=dict(size=18),
+            ),
+            height=550,
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 9: Win Probability by Board Position
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_win_probability(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    table = stats["win_probability"]
+    scores = list(range(len(table[0])))
+    fig = make_subplots(
+        rows=1,
+        cols=2,
+        subplot_titles=("Your Deal", "Opponent's Deal"),
+        horizontal_spacing=0.08,
+    )
+
+    for col, view in enumerate((1, 0), start=1):
+        fig.add_trace(
+            go.Heatmap(
+                z=[[p * 100 for p in row] for row in table[view]],
+                x=scores,
+                y=scores,
+                zmin=0,
+                zmax=100,
+                colorscale=[[0, SKUNKD_PINK], [0.5, CARD_BG], [1, SKUNKD_GREEN]],
+                colorbar=dict(title="Win %", ticksuffix="%"),
+                showscale=col == 1,
+                hovertemplate="You %{y}, opponent %{x}<br>"
+                "Win probability: %{z:.1f}%<extra></extra>",
+            ),
+            row=1,
+            col=col,
+        )
+        fig.update_xaxes(title_text="Opponent score", dtick=20, row=1, col=col)
+        fig.update_yaxes(title_text="Your score", dtick=20, row=1, col=col)
+
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Win Probability by Board Position<br>"
+                f"<sub>Start of a hand | Dealing first at 0-0 wins "
+                f"{table[1][0][0]:.1%} of games</sub>",
+                font=dict(size=18),
+            ),
+            height=560,
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 10: Rule Variants
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_variants(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    variants = stats["variants"]
+    fig = make_subplots(
+        rows=1,
+        cols=3,
+        subplot_titles=("Kept Hand", "Crib", "Kept Hand EV per Deal"),
+        horizontal_spacing=0.07,
+    )
+    colors = [SKUNKD_PURPLE, SKUNKD_TEAL, SKUNKD_PINK, SKUNKD_GOLD]
+
+    for (name, variant), color in zip(variants.items(), colors):
+        label = variant["config"]["label"]
+        panels = [
+            ("hand", list(range(len(variant["hand"]))), "Score %{x}"),
+            ("crib", list(range(len(variant["crib"]))), "Score %{x}"),
+            ("ev", [i * EV_BIN for i in range(len(variant["ev"]))], "EV %{x:.1f}"),
+        ]
+        for col, (key, x, point) in enumerate(panels, start=1):
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=[share * 100 for share in variant[key]],
+                    mode="lines",
+                    name=f"{label} ({variant[f'{key}_mean']:.2f})",
+                    legendgroup=name,
+                    showlegend=col == 1,
+                    line=dict(
+                        color=color, width=2, shape="hv" if key == "ev" else "linear"
+                    ),
+                    hovertemplate=f"{label}<br>{point}: %{{y:.2f}}%<extra></extra>",
+                ),
+                row=1,
+                col=col,
+            )
+    for col, title in enumerate(("Score", "Score", "Expected points"), start=1):
+        fig.update_xaxes(title_text=title, gridcolor=GRID_COLOR, row=1, col=col)
+        fig.update_yaxes(gridcolor=GRID_COLOR, ticksuffix="%", row=1, col=col)
+    fig.update_xaxes(range=[0, 20], row=1, col=3)
+
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Rule Variants: Hand, Crib and Discard Value<br>"
+                "<sub>Discards maximize the kept hand's EV, plus or minus the crib "
+                "EV in 2-player games | legend shows each variant's means</sub>",
+                font=dict(size=18),
+            ),
+            height=520,
+            legend=dict(x=0.0, y=-0.2, orientation="h", bgcolor="rgba(0,0,0,0)"),
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 11: Sampled Estimates
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_sampling(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    sampling = stats["sampling"]
+    fig = make_subplots(
+        rows=1,
+        cols=3,
+        subplot_titles=(
+            "Hand: Sampled vs Exact",
+            "Crib, Optimal Discards from One Deck",
+            "Pegging Points",
+        ),
+        horizontal_spacing=0.07,
+    )
+    panels = [
+        (1, "hand", "hand", "Hand", SKUNKD_PURPLE),
+        (2, "dealer", "crib", "Crib", SKUNKD_TEAL),
+        (3, "pegging", "pone", "Pone", SKUNKD_PINK),
+        (3, "pegging", "dealer", "Dealer", SKUNKD_GOLD),
+    ]
+    for col, analysis, value, label, color in panels:
+        entry = sampling[analysis]["values"][value]
+        distribution = entry["distribution"]
+        shares = distribution["value"]
+        fig.add_trace(
+            go.Bar(
+                x=list(range(len(shares))),
+                y=[share * 100 for share in shares],
+                error_y=dict(
+                    type="data",
+                    symmetric=False,
+                    array=[(h - v) * 100 for h, v in zip(distribution["high"], shares)],
+                    arrayminus=[
+                        (v - lo) * 100 for v, lo in zip(shares, distribution["low"])
+                    ],
+                    color=TEXT_COLOR,
+                    thickness=1,
+                    width=2,
+                ),
+                name=f"{label} (mean {entry['mean']['value']:.2f})",
+                marker_color=color,
+                opacity=0.85,
+                hovertemplate=f"{label}<br>Score %{{x}}: %{{y:.2f}}%<extra></extra>",
+            ),
+            row=1,
+            col=col,
+        )
+
+    total = stats["total"]
+    exact = stats["distribution"]
+    fig.add_trace(
+        go.Scatter(
+            x=list(range(max(exact) + 1)),
+            y=[exact.get(score, 0) / total * 100 for score in range(max(exact) + 1)],
+            mode="markers",
+            name="Hand (exact)",
+            marker=dict(color=SKUNKD_GREEN, size=7, symbol="diamond"),
+            hovertemplate="Exact<br>Score %{x}: %{y:.2f}%<extra></extra>",
+        ),
+        row=1,
+        col=1,
+    )
+    for col, title in enumerate(("Score", "Score", "Points pegged"), start=1):
+        fig.update_xaxes(title_text=title, gridcolor=GRID_COLOR, row=1, col=col)
+        fig.update_yaxes(gridcolor=GRID_COLOR, ticksuffix="%", row=1, col=col)
+    fig.update_xaxes(range=[-0.5, 24.5], row=1, col=1)
+    fig.update_xaxes(range=[-0.5, 24.5], row=1, col=2)
+    fig.update_xaxes(range=[-0.5, 16.5], row=1, col=3)
+
+    samples = sampling["hand"]["samples"]
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Sampled Estimates with 95% Error Bars<br>"
+                f"<sub>{samples:,} stratified samples per panel | "
+                "strata: starter rank x hand rank profile</sub>",
+                font=dict(size=18),
+            ),
+            height=520,
+            barmode="group",
+            legend=dict(x=0.0, y=-0.2, orientation="h", bgcolor="rgba(0,0,0,0)"),
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Chart 12: Component Co-occurrence
+# ═══════════════════════════════════════════════════════════════════════════
+def chart_cooccurrence(stats: dict):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    joint = stats["component_joint"]
+    titles = [
+        " x ".join(part.title() for part in key.split("_"))
+        + f" (r = {joint['pairs'][key]['correlation']:+.3f})"
+        for key in COOCCURRENCE_PAIRS
+    ]
+    fig = make_subplots(
+        rows=2,
+        cols=3,
+        specs=[
+            [{}, {}, {}],
+            [{}, {"colspan": 2}, None],
+        ],
+        subplot_titles=(*titles, "Mean Points by Starter Rank"),
+        horizontal_spacing=0.08,
+        vertical_spacing=0.14,
+    )
+    cells = [(1, 1), (1, 2), (1, 3), (2, 1)]
+    for (row, col), key in zip(cells, COOCCURRENCE_PAIRS):
+        shares = joint["pairs"][key]["shares"]
+        first, second = (part.title() for part in key.split("_"))
+        # Color by log10 of the share so rare combinations stay visible
+        fig.add_trace(
+            go.Heatmap(
+                z=[[math.log10(p * 100) if p else None for p in r] for r in shares],
+                customdata=[[p * 100 for p in r] for r in shares],
+                x=list(range(len(shares[0]))),
+                y=list(range(len(shares))),
+                zmin=-5,
+                zmax=2,
+                colorscale=[[0, CARD_BG], [0.6, SKUNKD_PURPLE], [1, SKUNKD_GOLD]],
+                colorbar=dict(
+                    title="Share",
+                    tickvals=list(range(-5, 3)),
+                    ticktext=[
+                        "0.00001%",
+                        "0.0001%",
+                        "0.001%",
+                        "0.01%",
+                        "0.1%",
+                        "1%",
+                        "10%",
+                        "100%",
+                    ],
+                    len=0.45,
+                    y=0.78,
+                ),
+                showscale=(row, col) == (1, 1),
+                hovertemplate=f"{first} %{{y}}, {second} %{{x}}<br>"
+                "%{customdata:.4f}% of hands<extra></extra>",
+            ),
+            row=row,
+            col=col,
+        )
+        fig.update_xaxes(title_text=second, gridcolor=GRID_COLOR, row=row, col=col)
+        fig.update_yaxes(title_text=first, gridcolor=GRID_COLOR, row=row, col=col)
+
+    means = joint["starter_means"]
+    labels = ["Total", *COMPONENTS]
+    fig.add_trace(
+        go.Heatmap(
+            z=[list(column) for column in zip(*means)],
+            x=RANKS,
+            y=labels,
+            text=[[f"{m:.2f}" for m in column] for column in zip(*means)],
+            texttemplate="%{text}",
+            colorscale=[[0, CARD_BG], [1, SKUNKD_TEAL]],
+            showscale=False,
+            hovertemplate="Starter %{x}<br>%{y}: %{z:.3f} points<extra></extra>",
+        ),
+        row=2,
+        col=2,
+    )
+    fig.update_xaxes(title_text="Starter rank", row=2, col=2)
+
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="How Scoring Components Co-occur<br>"
+                "<sub>Joint share of all 12,994,800 hand + starter combinations | "
+                "r is the Pearson correlation</sub>",
+                font=dict(size=18),
+            ),
+            height=820,
+        )
+    )
+
+    return fig
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Incremental Build
+# ═══════════════════════════════════════════════════════════════════════════
+OUTPUT_DIR = Path(__file__).resolve().parent
+
+# (output file, chart function, stats keys it reads)
+CHARTS = [
+    (
+        "score_distribution.html",
+        chart_main_distribution,
+        ("distribution", "total", "avg_score"),
+    ),
+    ("cumulative_probability.html", chart_cumulative, ("percentiles",)),
+    ("score_tiers.html", chart_tiers, ("distribution", "total", "avg_score")),
+    ("rarity_scale.html", chart_rarity, ("distribution", "total")),
+    ("score_components.html", chart_components, ("component_averages", "avg_score")),
+    ("even_odd.html", chart_even_odd, ("distribution", "total")),
+    ("crib_distribution.html", chart_crib, ("distribution", "total", "crib")),
+    ("keep_values.html", chart_keeps, ("keeps",)),
+    ("win_probability.html", chart_win_probability, ("win_probability",)),
+    ("variants.html", chart_variants, ("variants",)),
+    ("sampled_estimates.html", chart_sampling, ("sampling", "distribution", "total")),
+    ("component_cooccurrence.html", chart_cooccurrence, ("component_joint",)),
+]
+CHART_FUNCTIONS = {filename: func for filename, func, _ in CHARTS}
+
+
+def layout_hash(plotlyjs: str) -> str:
+    """Hash of the shared theme: palette, base layout, helpers and plotly.js mode."""
+    palette = {
+        name: value
+        for name, value in globals().items()
+        if name.startswith("SKUNKD_") or name.endswith("_COLOR") or name == "CARD_BG"
+    }
+    return content_hash(
+        {
+            "palette": palette,
+            "base_layout": base_layout(),
+            "helpers": source_hash(score_color, base_layout),
+            "plotlyjs": plotlyjs,
+        }
+    )
+
+
+def chart_fingerprint(stats: dict, func, inputs: tuple[str, ...], plotlyjs: str):
+    return {
+        "data": content_hash({key: stats[key] for key in inputs}),
+        "layout": layout_hash(plotlyjs),
+        "source": dependency_hash(func),
+    }
+
+
+def chart_outputs(filename: str, dashboard: bool, output_dir: Path) -> list[Path]:
+    """Files one chart writes: its page, plus its figure script for the dashboard."""
+    outputs = [output_dir / filename]
+    if dashboard:
+        outputs.append(figure_script_path(output_dir, filename))
+    return outputs
+
+
+def select_charts(names: list[str] | None) -> list[tuple]:
+    """CHARTS entries matching chart file names or stems (all charts for None)."""
+    if not names:
+        return CHARTS
+    wanted = {Path(name).stem for name in names}
+    unknown = wanted - {Path(filename).stem for filename, _, _ in CHARTS}
+    if unknown:
+        raise ValueError(f"unknown charts: {', '.join(sorted(unknown))}")
+    return [chart for chart in CHARTS if Path(chart[0]).stem in wanted]
+
+
+def render_chart(
+    filename: str,
+    stats: dict,
+    plotlyjs: str,
+    dashboard: bool,
+    output_dir: Path,
+    profile: bool = False,
+) -> tuple[str, list[dict]]:
+    """Process-pool task: draw one chart and write its outputs."""
+    profiler = Profiler(enabled=profile)
+    with profiler.stage(f"figure: {filename}"):
+        fig = CHART_FUNCTIONS[filename](stats)
+    with profiler.stage(f"write_html: {filename}"):
+        fig.write_html(output_dir / filename, include_plotlyjs=plotlyjs)
+    if dashboard:
+        with profiler.stage(f"figure script: {filename}"):
+            write_figure_script(fig, output_dir, filename)
+    return filename, profiler.stages
+
+
+def build_charts(
+    stats: dict,
+    force: bool = False,
+    offline: bool = False,
+    dashboard: bool = False,
+    workers: int | None = None,
+    profiler: Profiler | None = None,
+    output_dir: Path = OUTPUT_DIR,
+    charts: list[tuple] | None = None,
+) -> tuple[int, int]:
+    """
+    Regenerate stale charts (every chart with force) in a process pool.
+
+    charts limits the build to some CHARTS entries (see select_charts); stats
+    need only the keys those charts read.
+
+    offline writes plotly.min.js once into the output directory and points
+    every page at it instead of the CDN; dashboard also writes a single page
+    that lazy-loads each selected chart's figure as it scrolls into view.
+    With an enabled profiler, each chart's stages are timed in the process
+    that renders it.
+
+    Returns (built, skipped).
+    """
+    profiler = profiler or Profiler()
+    charts = charts or CHARTS
+    output_dir.mkdir(parents=True, exist_ok=True)
+    plotlyjs = "cdn"
+    if offline:
+        plotlyjs = write_plotly_bundle(output_dir).name
+
+    manifest = BuildManifest()
+    fingerprints, stale = {}, {}
+    with profiler.stage("manifest check"):
+        for filename, func, inputs in charts:
+            fingerprints[filename] = chart_fingerprint(stats, func, inputs, plotlyjs)
+            reasons = set()
+            for output in chart_outputs(filename, dashboard, output_dir):
+                reasons.update(manifest.stale_reasons(output, fingerprints[filename]))
+            if force:
+                reasons = {"forced"}
+            if reasons:
+                stale[filename] = ", ".join(sorted(reasons))
+
+    numbers = {filename: i for i, (filename, _, _) in enumerate(charts, start=1)}
+    for filename, number in numbers.items():
+        if filename not in stale:
+            print(f"  [{number}/{len(charts)}] {filename} (up to date)")
+
+    def finish(rendered: tuple[str, list[dict]]) -> None:
+        filename, stages = rendered
+        profiler.add(stages)
+        for output in chart_outputs(filename, dashboard, output_dir):
+            manifest.record(output, fingerprints[filename])
+        manifest.save()
+        print(f"  [{numbers[filename]}/{len(charts)}] {filename} ({stale[filename]})")
+
+    workers = min(workers or default_workers(), len(stale))
+    task = (stats, plotlyjs, dashboard, output_dir, profiler.enabled)
+    with profiler.stage("chart rendering"):
+        if workers <= 1:
+            for filename in stale:
+                finish(render_chart(filename, *task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(render_chart, filename, *task) for filename in stale
+                ]
+                for future in as_completed(futures):
+                    finish(future.result())
+
+    if dashboard:
+        with profiler.stage("dashboard"):
+            plotly_src = plotlyjs if offline else plotly_cdn_url()
+            filenames = [filename for filename, _, _ in charts]
+            write_dashboard(output_dir, filenames, plotly_src, BG_COLOR)
+    return len(stale), len(charts) - len(stale)
+
+
+# ─── Data Export ────────────────────────────────────────────────────────────
+def export_distribution(stats: dict) -> list[dict]:
+    return [
+        {"score": score, "count": count, "share": count / stats["total"]}
+        for score, count in sorted(stats["distribution"].items())
+    ]
+
+
+def export_components(stats: dict) -> list[dict]:
+    return [
+        {"component": name, "average": average, "share": average / stats["avg_score"]}
+        for name, average in stats["component_averages"].items()
+    ]
+
+
+def export_crib(stats: dict) -> list[dict]:
+    return [
+        {"policy": policy, "score": score, "share": share}
+        for policy, entry in stats["crib"].items()
+        for score, share in sorted(entry["shares"].items())
+    ]
+
+
+def export_keeps(stats: dict) -> list[dict]:
+    return [
+        {"side": side, "rank": rank, **entry}
+        for side, entries in stats["keeps"].items()
+        for rank, entry in enumerate(entries, start=1)
+    ]
+
+
+def export_win_probability(stats: dict) -> list[dict]:
+    return [
+        {
+            "dealing": dealing,
+            "my_score": mine,
+            "opponent_score": theirs,
+            "probability": probability,
+        }
+        for dealing, grid in enumerate(stats["win_probability"])
+        for mine, row in enumerate(grid)
+        for theirs, probability in enumerate(row)
+    ]
+
+
+def export_percentiles(stats: dict) -> list[dict]:
+    return [
+        {"table": name, "score": score, "at_most": at_most, "at_least": at_least}
+        for name, table in stats["percentiles"].items()
+        for score, (at_most, at_least) in enumerate(
+            zip(table["at_most"], table["at_least"])
+        )
+    ]
+
+
+def export_sampling(stats: dict) -> list[dict]:
+    return [
+        {
+            "analysis": analysis,
+            "value": value,
+            "score": score,
+            "share": share,
+            "low": entry["distribution"]["low"][score],
+            "high": entry["distribution"]["high"][score],
+        }
+        for analysis, result in stats["sampling"].items()
+        for value, entry in result["values"].items()
+        for score, share in enumerate(entry["distribution"]["value"])
+    ]
+
+
+def export_component_joint(stats: dict) -> list[dict]:
+    return [
+        {"pair": key, "first": first, "second": second, "share": share}
+        for key, pair in stats["component_joint"]["pairs"].items()
+        for first, row in enumerate(pair["shares"])
+        for second, share in enumerate(row)
+    ]
+
+
+def export_variants(stats: dict) -> list[dict]:
+    return [
+        {
+            "variant": name,
+            "distribution": key,
+            "value": round(i * width, 1),
+            "share": share,
+        }
+        for name, variant in stats["variants"].items()
+        for key, width in (("hand", 1), ("crib", 1), ("ev", EV_BIN))
+        for i, share in enumerate(variant[key])
+        if share > 0
+    ]
+
+
+# Table name -> (row builder, columns of its rows, stats keys it reads)
+EXPORTS = {
+    "distribution": (
+        export_distribution,
+        ("score", "count", "share"),
+        ("distribution", "total"),
+    ),
+    "components": (
+        export_components,
+        ("component", "average", "share"),
+        ("component_averages", "avg_score"),
+    ),
+    "crib": (export_crib, ("policy", "score", "share"), ("crib",)),
+    "keeps": (
+        export_keeps,
+        ("side", "rank", "label", "mean", "p10", "p90", "min", "max"),
+        ("keeps",),
+    ),
+    "win_probability": (
+        export_win_probability,
+        ("dealing", "my_score", "opponent_score", "probability"),
+        ("win_probability",),
+    ),
+    "variants": (
+        export_variants,
+        ("variant", "distribution", "value", "share"),
+        ("variants",),
+    ),
+    "percentiles": (
+        export_percentiles,
+        ("table", "score", "at_most", "at_least"),
+        ("percentiles",),
+    ),
+    "sampling": (
+        export_sampling,
+        ("analysis", "value", "score", "share", "low", "high"),
+        ("sampling",),
+    ),
+    "component_joint": (
+        export_component_joint,
+        ("pair", "first", "second", "share"),
+        ("component_joint",),
+    ),
+}
+
+
+def write_export(
+    stats: dict, names: list[str], output_dir: Path, fmt: str = "json"
+) -> list[Path]:
+    """
+    Write each named table as <name>.json (a list of rows) or <name>.csv,
+    with the table's EXPORTS columns as the header even when it has no rows.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for name in names:
+        build_rows, columns, _ = EXPORTS[name]
+        rows = build_rows(stats)
+        path = output_dir / f"{name}.{fmt}"
+        if fmt == "json":
+            path.write_text(json.dumps(rows, indent=1) + "\n")
+        else:
+            with path.open("w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns)
+                writer.writeheader()
+                writer.writerows(rows)
+        paths.append(path)
+    return paths
 
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Main
 # ═══════════════════════════════════════════════════════════════════════════
+COMMANDS = ("compute", "charts", "query", "export")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--no-cache", action="store_true", help="always recompute")
+    common.add_argument(
+        "--clear-cache", action="store_true", help="drop cached results first"
+    )
+    common.add_argument("--profile", action="store_true", help="time every stage")
+    common.add_argument("--profile-out", type=Path, default=PROFILE_PATH)
+    common.add_argument(
+        "--cprofile", type=Path, default=None, help="also write a cProfile dump here"
+    )
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        "--output-dir", type=Path, default=OUTPUT_DIR, help="where to write files"
+    )
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "compute", parents=[common], help="run (or load) every statistic"
+    )
+
+    charts = commands.add_parser(
+        "charts", parents=[common, output], help="build the HTML charts"
+    )
+    charts.add_argument(
+        "--only", nargs="+", default=None, metavar="CHART", help="chart names"
+    )
+    charts.add_argument("--force", action="store_true", help="rebuild every chart")
+    charts.add_argument(
+        "--offline", action="store_true", help="reference a local plotly.min.js"
+    )
+    charts.add_argument(
+        "--dashboard", action="store_true", help="also write dashboard.html"
+    )
+    charts.add_argument("--workers", type=int, default=None)
+
+    add_query_arguments(
+        commands.add_parser("query", help="conditional score statistics")
+    )
+
+    export = commands.add_parser(
+        "export", parents=[common, output], help="write data tables, no charts"
+    )
+    export.add_argument(
+        "--only", nargs="+", choices=EXPORTS, default=None, metavar="TABLE"
+    )
+    export.add_argument("--format", choices=("json", "csv"), default="json")
+    export.add_argument(
+        "--rows",
+        type=Path,
+        nargs="?",
+        const=EXPORT_DIR,
+        default=None,
+        metavar="DIR",
+        help="also write every enumeration row (see export.py)",
+    )
+    export.add_argument("--rows-format", choices=FORMATS, default="auto")
+    return parser
+
+
+def parse_args(argv: list[str] | None = None) -> tuple[argparse.Namespace, object]:
+    """Parse argv, treating a bare option list as the charts command."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv.insert(0, "charts")
+    parser = build_parser()
+    return parser.parse_args(argv), parser
+
+
+def load_stats(args: argparse.Namespace, profiler: Profiler, keys=None) -> dict:
+    """compute_stats with the cache options, printing its summary."""
+    cache = ResultCache(enabled=not args.no_cache)
+    if args.clear_cache:
+        print(f"  Cleared {cache.invalidate()} cached results")
+    stats = compute_stats(cache, profiler, keys)
+    print(f"  {cache.report()}")
+    print(f"  Data: {stats['total']:,} hand+starter combinations")
+    for problem in check_reference(stats):
+        print(f"  WARNING: differs from rubl.com reference — {problem}")
+    return stats
+
+
 if __name__ == "__main__":
-    print("\nGenerating SKUNK'D scoring statistics charts...")
-    print(f"  Data: {TOTAL:,} hand+starter combinations\n")
-
-    chart_main_distribution()
-    chart_cumulative()
-    chart_tiers()
-    chart_rarity()
-    chart_components()
-    chart_even_odd()
-
-    print("\nAll charts saved to docs/stats/")
-    print("Open any .html file in a browser for interactive exploration.\n")
+    args, parser = parse_args()
+    if args.command == "query":
+        run_query(args, parser, ResultCache())
+        sys.exit()
+
+    profiler = Profiler(
+        enabled=args.profile or args.cprofile is not None,
+        cprofile=args.cprofile is not None,
+    )
+    if args.command == "compute":
+        print("\nComputing SKUNK'D scoring statistics...")
+        stats = load_stats(args, profiler)
+        print(f"  Average hand: {stats['avg_score']:.4f}")
+        for label, entry in stats["crib"].items():
+            print(f"  Average crib ({label.lower()}): {entry['avg_score']:.4f}")
+
+    elif args.command == "charts":
+        try:
+            charts = select_charts(args.only)
+        except ValueError as error:
+            parser.error(str(error))
+        print("\nGenerating SKUNK'D scoring statistics charts...")
+        keys = {key for _, _, inputs in charts for key in inputs}
+        stats = load_stats(args, profiler, keys)
+        print()
+        built, skipped = build_charts(
+            stats,
+            force=args.force,
+            offline=args.offline,
+            dashboard=args.dashboard,
+            workers=args.workers,
+            profiler=profiler,
+            output_dir=args.output_dir,
+            charts=charts,
+        )
+
+    else:
+        names = args.only or list(EXPORTS)
+        print("\nExporting SKUNK'D scoring statistics...")
+        keys = {key for name in names for key in EXPORTS[name][2]}
+        stats = load_stats(args, profiler, keys)
+        with profiler.stage("export"):
+            paths = write_export(stats, names, args.output_dir, args.format)
+        if args.rows is not None:
+            with profiler.stage("row export"):
+                paths.append(export_rows(args.rows, args.rows_format))
+        print()
+        for path in paths:
+            print(f"  Saved {path}")
+
+    if profiler.enabled:
+        profiler.save(args.profile_out, args.cprofile)
+        print(f"\n{profiler.report()}")
+        print(f"\n  Profile saved to {args.profile_out}")
+        if args.cprofile:
+            print(f"  cProfile stats saved to {args.cprofile}")
+    if args.command == "charts":
+        print(f"\n{built} charts saved to {args.output_dir} ({skipped} up to date)")
+        print("Open any .html file in a browser for interactive exploration.")
+    print()
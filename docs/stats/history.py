@@ -0,0 +1,426 @@
+"""
+Streaming analytics over exported game history: observed vs theoretical
+score distributions per player.
+
+Reads exports of the public.scores table (one row per score event: hand_id,
+user_id, source, points; see supabase/migrations/001_initial_schema.sql) in
+fixed-size chunks from CSV, JSONL, SQLite or Postgres, and folds each chunk
+into per-player histograms of hand, crib and pegging points per hand. Only
+the histograms and the rows of the hand still being read are kept, so
+memory stays flat however many hands the export holds.
+
+Pegging is recorded as one row per scoring play, so it is summed per hand
+and player; a player with a 'hand' row but no pegging rows pegged 0 that
+hand. This needs the export ordered by hand_id, e.g.
+
+    SELECT hand_id, user_id, source, points FROM scores ORDER BY hand_id
+
+and an out-of-order export is rejected rather than miscounted.
+
+Observed hand and crib histograms are compared with the exhaustive
+enumeration (uniform starters and, for cribs, uniform discards).
+
+Usage:
+    python docs/stats/history.py EXPORT [--chunk-rows N] [--out DIR] [--top N]
+    python docs/stats/history.py --sample PATH.sqlite [--sample-hands N]
+
+EXPORT is a .csv, .jsonl or .sqlite/.db file, or a postgresql:// DSN
+(needs psycopg).
+"""
+
+import argparse
+import csv
+import json
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from accumulators import Histogram
+from cache import ResultCache
+from cards import DECK_SIZE
+from enumeration import enumerate_scores
+from scoring import MAX_SCORE, score_totals
+
+COLUMNS = ("hand_id", "user_id", "source", "points")
+SOURCES = ("hand", "crib", "pegging")
+BINS = 64  # points per hand; higher totals land in the last bin
+CHUNK_ROWS = 100_000
+OUTPUT_DIR = Path(__file__).resolve().parent / "history"
+
+
+# ─── Export Readers ─────────────────────────────────────────────────────────
+# Each reader yields chunks: a dict of equal-length arrays keyed by COLUMNS.
+def _to_chunk(rows: list) -> dict:
+    if not rows:
+        return {}
+    hand_ids, user_ids, sources, points = zip(*rows)
+    return {
+        "hand_id": np.array(hand_ids, dtype=str),
+        "user_id": np.array(user_ids, dtype=str),
+        "source": np.array(sources, dtype=str),
+        "points": np.array(points, dtype=np.int64),
+    }
+
+
+def _chunked(rows: Iterable, chunk_rows: int) -> Iterator[dict]:
+    rows = iter(rows)
+    while batch := list(islice(rows, chunk_rows)):
+        yield _to_chunk(batch)
+
+
+def read_csv(path: Path, chunk_rows: int = CHUNK_ROWS) -> Iterator[dict]:
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        yield from _chunked(
+            (
+                (r["hand_id"], r["user_id"], r["source"], int(r["points"]))
+                for r in reader
+            ),
+            chunk_rows,
+        )
+
+
+def read_jsonl(path: Path, chunk_rows: int = CHUNK_ROWS) -> Iterator[dict]:
+    with open(path) as f:
+        records = (json.loads(line) for line in f if line.strip())
+        yield from _chunked(
+            (
+                (r["hand_id"], r["user_id"], r["source"], int(r["points"]))
+                for r in records
+            ),
+            chunk_rows,
+        )
+
+
+def read_sqlite(
+    path: Path, chunk_rows: int = CHUNK_ROWS, table: str = "scores"
+) -> Iterator[dict]:
+    connection = sqlite3.connect(path)
+    try:
+        cursor = connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM {table} ORDER BY hand_id"
+        )
+        while rows := cursor.fetchmany(chunk_rows):
+            yield _to_chunk(rows)
+    finally:
+        connection.close()
+
+
+def read_postgres(
+    dsn: str, chunk_rows: int = CHUNK_ROWS, table: str = "scores"
+) -> Iterator[dict]:
+    try:
+        import psycopg
+    except ImportError as exc:
+        raise ImportError("reading from Postgres needs `pip install psycopg`") from exc
+
+    with psycopg.connect(dsn) as connection:
+        # Named cursor: rows stream from the server instead of loading at once
+        with connection.cursor(name="history_export") as cursor:
+            cursor.execute(
+                f"SELECT hand_id::text, user_id::text, source, points "
+                f"FROM {table} ORDER BY hand_id"
+            )
+            while rows := cursor.fetchmany(chunk_rows):
+                yield _to_chunk(rows)
+
+
+def open_export(source: str, chunk_rows: int = CHUNK_ROWS) -> Iterator[dict]:
+    """Chunk reader for a file export or a postgresql:// DSN."""
+    if source.startswith(("postgres://", "postgresql://")):
+        return read_postgres(source, chunk_rows)
+    path = Path(source)
+    readers = {
+        ".csv": read_csv,
+        ".jsonl": read_jsonl,
+        ".sqlite": read_sqlite,
+        ".db": read_sqlite,
+    }
+    if path.suffix not in readers:
+        raise ValueError(f"unsupported export format: {path.suffix or source}")
+    return readers[path.suffix](path, chunk_rows)
+
+
+# ─── Aggregation ────────────────────────────────────────────────────────────
+class PlayerHistograms:
+    """
+    Per-player histograms of hand, crib and pegging points per hand, built
+    incrementally from hand_id-ordered chunks of score events.
+    """
+
+    def __init__(self):
+        self.players: dict[str, int] = {}
+        self.counts = np.zeros((16, len(SOURCES), BINS), dtype=np.int64)
+        self.rows = 0
+        # (hand show, pegging) points of every player-hand, across players
+        self.joint = Histogram((BINS, BINS))
+        self._pending: dict = {}  # rows of the last, possibly unfinished, hand
+
+    def _player_index(self, user_ids: np.ndarray) -> np.ndarray:
+        unique, inverse = np.unique(user_ids, return_inverse=True)
+        for user in unique:
+            self.players.setdefault(str(user), len(self.players))
+        if len(self.players) > len(self.counts):
+            grown = np.zeros((2 * len(self.players),) + self.counts.shape[1:], np.int64)
+            grown[: len(self.counts)] = self.counts
+            self.counts = grown
+        return np.array([self.players[str(u)] for u in unique])[inverse]
+
+    def add(self, chunk: dict) -> None:
+        """Fold one chunk in; its last hand waits for the next chunk."""
+        if not chunk:
+            return
+        self.rows += len(chunk["hand_id"])
+        if self._pending:
+            chunk = {k: np.concatenate([self._pending[k], chunk[k]]) for k in COLUMNS}
+        hand_ids = chunk["hand_id"]
+        if (hand_ids[1:] < hand_ids[:-1]).any():
+            raise ValueError("export must be ordered by hand_id")
+        finished = hand_ids != hand_ids[-1]
+        self._pending = {k: chunk[k][~finished] for k in COLUMNS}
+        self._fold({k: chunk[k][finished] for k in COLUMNS})
+
+    def finish(self) -> None:
+        """Fold the final hand once the export is exhausted."""
+        if self._pending:
+            self._fold(self._pending)
+            self._pending = {}
+
+    def _fold(self, rows: dict) -> None:
+        if not len(rows["hand_id"]):
+            return
+        source, points = rows["source"], rows["points"]
+        players = self._player_index(rows["user_id"])
+        clipped = np.clip(points, 0, BINS - 1)
+
+        # Hand and crib: one row is one observation
+        for index, name in enumerate(SOURCES[:2]):
+            mask = source == name
+            np.add.at(self.counts, (players[mask], index, clipped[mask]), 1)
+
+        # Pegging: sum the plays of each (hand, player) seen with a 'hand' row
+        keys = np.char.add(np.char.add(rows["hand_id"], "|"), rows["user_id"])
+        _, first, group = np.unique(keys, return_index=True, return_inverse=True)
+        pegged = np.bincount(group, weights=np.where(source == "pegging", points, 0))
+        shown = np.bincount(group, weights=np.where(source == "hand", points, 0))
+        played = np.bincount(group, weights=source == "hand") > 0
+        totals = np.clip(pegged[played].astype(np.int64), 0, BINS - 1)
+        np.add.at(self.counts, (players[first[played]], 2, totals), 1)
+        self.joint.add(shown[played], pegged[played])
+
+    def merge(self, other: "PlayerHistograms") -> "PlayerHistograms":
+        """Fold in another finished aggregate, e.g. of an export read in parallel."""
+        if other._pending:
+            raise ValueError("finish() an aggregate before merging it")
+        if other.players:
+            index = self._player_index(np.array(list(other.players)))
+            np.add.at(self.counts, index, other.counts[: len(other.players)])
+        self.rows += other.rows
+        self.joint.merge(other.joint)
+        return self
+
+    def histograms(self) -> dict[str, np.ndarray]:
+        """{user_id: (len(SOURCES), BINS) counts}."""
+        return {user: self.counts[i] for user, i in self.players.items()}
+
+
+def aggregate(chunks: Iterable[dict]) -> PlayerHistograms:
+    result = PlayerHistograms()
+    for chunk in chunks:
+        result.add(chunk)
+    result.finish()
+    return result
+
+
+# ─── Comparison ─────────────────────────────────────────────────────────────
+def theoretical_distributions(cache: ResultCache | None = None) -> dict:
+    """{"hand", "crib"}: (MAX_SCORE + 1,) probability of each score."""
+    theory = {}
+    for name, is_crib in (("hand", False), ("crib", True)):
+        result = enumerate_scores(is_crib=is_crib, cache=cache)
+        probs = np.zeros(MAX_SCORE + 1)
+        for score, count in result["distribution"].items():
+            probs[score] = count / result["total"]
+        theory[name] = probs
+    return theory
+
+
+def compare(counts: np.ndarray, theory: dict) -> dict:
+    """Observed vs theoretical summary for one player's (SOURCES, BINS) counts."""
+    summary = {}
+    for index, name in enumerate(SOURCES):
+        observed = counts[index]
+        n = int(observed.sum())
+        entry = {"hands": n}
+        if n:
+            entry["mean"] = float(observed @ np.arange(BINS) / n)
+        if n and name in theory:
+            expected = np.zeros(BINS)
+            expected[: MAX_SCORE + 1] = theory[name]
+            entry["expected_mean"] = float(expected @ np.arange(BINS))
+            # Total variation distance and Pearson chi-square over possible scores
+            entry["tvd"] = float(np.abs(observed / n - expected).sum() / 2)
+            possible = expected > 0
+            counts_expected = n * expected[possible]
+            entry["chi_square"] = float(
+                ((observed[possible] - counts_expected) ** 2 / counts_expected).sum()
+            )
+            entry["impossible_scores"] = int(observed[~possible].sum())
+        summary[name] = entry
+    return summary
+
+
+def chart_players(histograms: dict, theory: dict, top: int):
+    """Observed hand and crib distributions of the most active players vs theory."""
+    from plotly.subplots import make_subplots
+    import plotly.graph_objects as go
+
+    from generate_charts import SKUNKD_GOLD, SKUNKD_PURPLE, base_layout
+
+    ranked = sorted(histograms, key=lambda u: -histograms[u][0].sum())[:top]
+    fig = make_subplots(
+        rows=len(ranked),
+        cols=2,
+        subplot_titles=[
+            f"{user[:8]} — {name} ({int(histograms[user][i].sum()):,})"
+            for user in ranked
+            for i, name in enumerate(SOURCES[:2])
+        ],
+        vertical_spacing=0.3 / max(len(ranked), 1),
+    )
+    scores = np.arange(MAX_SCORE + 1)
+    for row, user in enumerate(ranked, start=1):
+        for col, name in enumerate(SOURCES[:2], start=1):
+            observed = histograms[user][col - 1][: MAX_SCORE + 1]
+            share = observed / max(observed.sum(), 1) * 100
+            fig.add_trace(
+                go.Bar(
+                    x=scores,
+                    y=share,
+                    marker_color=SKUNKD_PURPLE,
+                    name="Observed",
+                    showlegend=row == col == 1,
+                    hovertemplate="Score %{x}: %{y:.2f}%<extra>observed</extra>",
+                ),
+                row=row,
+                col=col,
+            )
+            fig.add_trace(
+                go.Scatter(
+                    x=scores,
+                    y=theory[name] * 100,
+                    mode="lines+markers",
+                    line=dict(color=SKUNKD_GOLD, width=2),
+                    name="Theoretical",
+                    showlegend=row == col == 1,
+                    hovertemplate="Score %{x}: %{y:.2f}%<extra>theory</extra>",
+                ),
+                row=row,
+                col=col,
+            )
+    fig.update_layout(
+        **base_layout(
+            title=dict(
+                text="Observed vs Theoretical Score Distributions by Player<br>"
+                "<sub>Hand and crib points per hand, most active players</sub>",
+                font=dict(size=18),
+            ),
+            height=320 * len(ranked) + 120,
+            barmode="overlay",
+        )
+    )
+    return fig
+
+
+# ─── Sample Export ──────────────────────────────────────────────────────────
+def write_sample_export(
+    path: Path, n_hands: int, n_players: int = 8, seed: int = 0
+) -> None:
+    """
+    Write a synthetic scores table to SQLite for trying the pipeline.
+
+    Hand and crib points are real scores of random deals; pegging plays are
+    random placeholders, not simulated pegging.
+    """
+    rng = np.random.default_rng(seed)
+    connection = sqlite3.connect(path)
+    connection.execute("DROP TABLE IF EXISTS scores")
+    connection.execute(
+        "CREATE TABLE scores (hand_id TEXT, user_id TEXT, source TEXT, points INT)"
+    )
+    players = [f"player-{i:03d}" for i in range(n_players)]
+    for lo in range(0, n_hands, CHUNK_ROWS):
+        size = min(CHUNK_ROWS, n_hands - lo)
+        deck = np.argsort(rng.random((size, DECK_SIZE)), axis=1).astype(np.uint8)
+        seats = np.argsort(rng.random((size, n_players)), axis=1)[:, :2]
+        starter = deck[:, 12]
+        pone = score_totals(deck[:, 0:4], starter)
+        dealer = score_totals(deck[:, 4:8], starter)
+        crib = score_totals(deck[:, 8:12], starter, is_crib=True)
+        plays = rng.poisson(1.5, (size, 2))
+        rows = []
+        for i in range(size):
+            hand_id = f"{lo + i:012d}"
+            pone_id, dealer_id = players[seats[i, 0]], players[seats[i, 1]]
+            rows += [
+                (hand_id, pone_id, "hand", int(pone[i])),
+                (hand_id, dealer_id, "hand", int(dealer[i])),
+                (hand_id, dealer_id, "crib", int(crib[i])),
+            ]
+            for seat, user in enumerate((pone_id, dealer_id)):
+                rows += [(hand_id, user, "pegging", 2)] * int(plays[i, seat])
+        connection.executemany("INSERT INTO scores VALUES (?, ?, ?, ?)", rows)
+    connection.execute("CREATE INDEX scores_hand ON scores (hand_id)")
+    connection.commit()
+    connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("export", nargs="?")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--out", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--top", type=int, default=6)
+    parser.add_argument("--sample", type=Path, help="write a synthetic SQLite export")
+    parser.add_argument("--sample-hands", type=int, default=100_000)
+    args = parser.parse_args()
+
+    if args.sample:
+        write_sample_export(args.sample, args.sample_hands)
+        print(f"\nWrote {args.sample_hands:,} synthetic hands to {args.sample}\n")
+        raise SystemExit
+    if not args.export:
+        parser.error("an export path or DSN is required")
+
+    print(f"\nReading {args.export} in chunks of {args.chunk_rows:,} rows...")
+    result = aggregate(open_export(args.export, args.chunk_rows))
+    histograms = result.histograms()
+    theory = theoretical_distributions(ResultCache())
+    summary = {user: compare(counts, theory) for user, counts in histograms.items()}
+    print(f"  {result.rows:,} score events, {len(histograms):,} players")
+    if result.joint.weight:
+        print(
+            f"  Hand show vs pegging points, per player-hand: "
+            f"r = {result.joint.correlation():+.3f}"
+        )
+    print()
+
+    print(f"  {'Player':<16} {'Hands':>8} {'Hand avg':>9} {'Theory':>7} {'TVD':>6}")
+    for user in sorted(summary, key=lambda u: -summary[u]["hand"]["hands"])[: args.top]:
+        hand = summary[user]["hand"]
+        if not hand["hands"]:
+            continue
+        print(
+            f"  {user[:16]:<16} {hand['hands']:>8,} {hand['mean']:>9.2f} "
+            f"{hand['expected_mean']:>7.2f} {hand['tvd']:>6.3f}"
+        )
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "player_summary.json").write_text(json.dumps(summary, indent=2) + "\n")
+    chart_players(histograms, theory, args.top).write_html(
+        args.out / "player_distributions.html", include_plotlyjs="cdn"
+    )
+    print(f"\nSaved player_summary.json and player_distributions.html to {args.out}\n")
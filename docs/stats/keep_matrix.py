@@ -0,0 +1,209 @@
+"""
+Memory-mapped 4-card keep x starter score matrix with per-keep statistics.
+
+Scores every 4-card keep against every starter once and stores the result as
+a fixed-width uint8 matrix — 270,725 keeps x 52 starter slots, about 14 MB —
+that tooling opens with numpy.memmap. A keep's row is its whole starter
+profile, read with zero copy through the colex rank of its cards. This is
+the "how does this keep score for each cut" table behind optimalDiscard()
+in src/engine/optimal.ts and the discard analysis in src/engine/coaching.ts.
+
+File layout, written to docs/stats/.cache/ under the engine fingerprint of
+the scoring sources (cache.artifact_path), so changing them rebuilds both
+files instead of reading stale ones:
+
+    keep_matrix-<fp>.scores  u1 x 270,725 x 52, row = colex rank of the
+                             keep (sum of C(c_i, i) over its sorted cards),
+                             column = starter card id; NOT_A_STARTER (255)
+                             where the starter is one of the kept cards.
+    keep_matrix-<fp>.stats   STATS_DTYPE x 270,725, one 16-byte record per
+                             keep in the same order, over its 48 possible
+                             starters:
+                               <f4      mean
+                               <f4      variance
+                               u1       min
+                               u1       max
+                               u1[5]    percentiles   PERCENTILES, inverted-CDF
+                               u1       (padding)
+
+Usage:
+    python docs/stats/keep_matrix.py [--workers N] [--top N]
+"""
+
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from cache import artifact_path, prune_artifacts
+from canonical import canonical_hands
+from cards import DECK_SIZE, HAND_SIZE, all_hands, card_label, combination_index
+from scoring import CACHE_DIR, score_totals
+from shards import DEFAULT_SHARDS, concatenate, run_sharded
+
+SCORES_PATH = artifact_path("keep_matrix", ".scores")
+STATS_PATH = artifact_path("keep_matrix", ".stats")
+
+NOT_A_STARTER = 255
+STARTERS_PER_KEEP = DECK_SIZE - HAND_SIZE
+PERCENTILES = (10, 25, 50, 75, 90)
+
+STATS_DTYPE = np.dtype(
+    [
+        ("mean", "<f4"),
+        ("variance", "<f4"),
+        ("min", "u1"),
+        ("max", "u1"),
+        ("percentiles", "u1", (len(PERCENTILES),)),
+        ("pad", "u1"),
+    ]
+)
+
+
+# ─── Construction ───────────────────────────────────────────────────────────
+@lru_cache(maxsize=1)
+def colex_hands() -> np.ndarray:
+    """Every 4-card keep, ordered by colex rank (row r holds the keep of rank r)."""
+    hands = all_hands(HAND_SIZE)
+    return hands[np.argsort(combination_index(hands))]
+
+
+def keep_stats(scores: np.ndarray) -> np.ndarray:
+    """STATS_DTYPE record for each (N, 52) row of starter scores."""
+    # NOT_A_STARTER sorts last, leaving the 48 real scores in the first columns
+    ordered = np.sort(scores, axis=1)[:, :STARTERS_PER_KEEP]
+    values = ordered.astype(np.float64)
+    stats = np.zeros(len(scores), dtype=STATS_DTYPE)
+    stats["mean"] = values.mean(axis=1)
+    stats["variance"] = values.var(axis=1)
+    stats["min"] = ordered[:, 0]
+    stats["max"] = ordered[:, -1]
+    # Inverted CDF: the smallest score with at least q% of starters at or below it
+    ranks = [-(-q * STARTERS_PER_KEEP // 100) - 1 for q in PERCENTILES]
+    stats["percentiles"] = ordered[:, ranks]
+    return stats
+
+
+def matrix_shard(start: int, stop: int) -> dict:
+    """Shard task: score rows and statistics for keeps of colex rank [start, stop)."""
+    keeps = colex_hands()[start:stop]
+    scores = np.full((len(keeps), DECK_SIZE), NOT_A_STARTER, dtype=np.uint8)
+    for starter in range(DECK_SIZE):
+        live = ~(keeps == starter).any(axis=1)
+        cut = np.full(live.sum(), starter, dtype=np.uint8)
+        scores[live, starter] = score_totals(keeps[live], cut)
+    return {"scores": scores, "stats": keep_stats(scores)}
+
+
+def build_matrix(workers: int | None = None) -> int:
+    """Score every keep against every starter and write the matrix and stats files."""
+    result = run_sharded(
+        matrix_shard,
+        len(colex_hands()),
+        n_shards=DEFAULT_SHARDS,
+        workers=workers,
+        combine=concatenate,
+    )
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for suffix in (".scores", ".stats"):
+        prune_artifacts("keep_matrix", suffix)
+    result["scores"].tofile(SCORES_PATH)
+    result["stats"].astype(STATS_DTYPE).tofile(STATS_PATH)
+    return len(result["scores"])
+
+
+# ─── Reader ─────────────────────────────────────────────────────────────────
+class KeepMatrix:
+    """Zero-copy reader for the on-disk keep matrix."""
+
+    def __init__(self):
+        self.stats = np.memmap(STATS_PATH, dtype=STATS_DTYPE, mode="r")
+        self.scores = np.memmap(
+            SCORES_PATH, dtype=np.uint8, mode="r", shape=(len(self.stats), DECK_SIZE)
+        )
+
+    def rows(self, keeps: np.ndarray) -> np.ndarray:
+        """Matrix rows of (N, 4) keeps."""
+        return combination_index(np.asarray(keeps).reshape(-1, HAND_SIZE))
+
+    def profile(self, keep: list[int]) -> np.ndarray:
+        """(52,) score for each starter card, a view into the mapped file."""
+        return self.scores[self.rows(keep)[0]]
+
+    def summary(self, keep: list[int]) -> dict:
+        """Mean, variance, min, max and percentiles over the keep's 48 starters."""
+        record = self.stats[self.rows(keep)[0]]
+        return {
+            "mean": float(record["mean"]),
+            "variance": float(record["variance"]),
+            "min": int(record["min"]),
+            "max": int(record["max"]),
+            "percentiles": dict(zip(PERCENTILES, record["percentiles"].tolist())),
+        }
+
+    def expected_values(self, keeps: np.ndarray, discards: np.ndarray) -> np.ndarray:
+        """
+        Average score of each (N, 4) keep over the starters left unseen by
+        its (N, 2) discards, as optimalDiscard() computes it.
+        """
+        discards = np.asarray(discards).reshape(-1, 2).astype(np.intp)
+        rows = self.rows(keeps)
+        seen = self.scores[rows[:, None], discards].astype(np.int64).sum(axis=1)
+        totals = self.stats["mean"][rows].astype(np.float64) * STARTERS_PER_KEEP
+        return (np.rint(totals) - seen) / (STARTERS_PER_KEEP - discards.shape[1])
+
+    def ranked(self, count: int, worst: bool = False) -> list[dict]:
+        """
+        The best (or worst) keeps by mean score over starters, one per rank
+        multiset and mean so suit variants that score alike appear once.
+        """
+        keeps, _ = canonical_hands(HAND_SIZE)
+        means = self.stats["mean"][self.rows(keeps)]
+        ranked, seen = [], set()
+        for i in np.argsort(means if worst else -means, kind="stable"):
+            key = (tuple(sorted(keeps[i] % 13)), float(means[i]))
+            if key in seen:
+                continue
+            seen.add(key)
+            ranked.append({"keep": keeps[i].tolist(), **self.summary(keeps[i])})
+            if len(ranked) == count:
+                break
+        return ranked
+
+
+def keep_matrix(workers: int | None = None) -> KeepMatrix:
+    """
+    Reader for the matrix, building the files first if they are missing or
+    were built from other sources.
+    """
+    if not (SCORES_PATH.exists() and STATS_PATH.exists()):
+        build_matrix(workers)
+    return KeepMatrix()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print("\nScoring every keep against every starter...")
+    start = time.perf_counter()
+    count = build_matrix(workers=args.workers)
+    print(f"  {count:,} keeps in {time.perf_counter() - start:.1f}s")
+    print(
+        f"  {SCORES_PATH.stat().st_size / 1e6:.1f} MB matrix, "
+        f"{STATS_PATH.stat().st_size / 1e6:.1f} MB stats\n"
+    )
+
+    matrix = KeepMatrix()
+    for worst in (False, True):
+        print(f"  {'Worst' if worst else 'Best'} keeps by expected score:")
+        for entry in matrix.ranked(args.top, worst):
+            cards = " ".join(card_label(c) for c in entry["keep"])
+            print(
+                f"    {cards:<16} mean {entry['mean']:>6.3f}  sd "
+                f"{entry['variance'] ** 0.5:>5.2f}  range {entry['min']}-{entry['max']}"
+            )
+        print()
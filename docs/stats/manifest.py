@@ -0,0 +1,124 @@
+"""
+Build manifest for incremental output generation.
+
+Records, for each output file, the hashes of everything it was built from
+(input data, layout parameters, the source of the function that drew it and
+of every helper and constant that function reaches).
+An output is stale when it is missing or any of those hashes changed; the
+manifest names which one did.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+from types import CodeType
+from typing import Callable
+
+import numpy as np
+
+from scoring import CACHE_DIR, STATS_DIR
+
+MANIFEST_PATH = CACHE_DIR / "build_manifest.json"
+
+
+def content_hash(value) -> str:
+    """Stable hash of any JSON-serializable value."""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def source_hash(*functions: Callable) -> str:
+    """Hash of the source code of the given functions."""
+    return content_hash([inspect.getsource(f) for f in functions])
+
+
+def _code_names(code: CodeType) -> set[str]:
+    """Global names a code object and its nested functions and lambdas read."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _constant(value):
+    """JSON-ready form of a plain data value, or None for anything else."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return [value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return [value.tolist()]
+    if isinstance(value, (list, tuple)):
+        items = [_constant(item) for item in value]
+        return None if None in items else [items]
+    if isinstance(value, (set, frozenset)):
+        items = [_constant(item) for item in value]
+        return None if None in items else [sorted(items, key=json.dumps)]
+    if isinstance(value, dict):
+        items = [(_constant(k), _constant(v)) for k, v in value.items()]
+        if any(None in pair for pair in items):
+            return None
+        return [sorted(items, key=json.dumps)]
+    return None
+
+
+def _is_local(function: Callable) -> bool:
+    try:
+        return Path(inspect.getsourcefile(function)).parent == STATS_DIR
+    except TypeError:
+        return False
+
+
+def dependency_hash(function: Callable) -> str:
+    """
+    Hash of a function's source, the source of every docs/stats function it
+    calls (transitively) and every module-level constant any of them reads,
+    so that changing a helper or constant changes the hash.
+    """
+    sources, constants = {}, {}
+    pending = [function]
+    while pending:
+        current = pending.pop()
+        key = f"{current.__module__}.{current.__qualname__}"
+        if key in sources:
+            continue
+        sources[key] = inspect.getsource(current)
+        for name in sorted(_code_names(current.__code__)):
+            if name not in current.__globals__:
+                continue
+            value = current.__globals__[name]
+            if inspect.isfunction(value):
+                if _is_local(value):
+                    pending.append(value)
+            elif (constant := _constant(value)) is not None:
+                constants[f"{current.__module__}.{name}"] = constant
+    return content_hash({"sources": sources, "constants": constants})
+
+
+class BuildManifest:
+    """Per-output fingerprints from the last successful build."""
+
+    def __init__(self, path: Path | str = MANIFEST_PATH):
+        self.path = Path(path)
+        self.records: dict[str, dict] = (
+            json.loads(self.path.read_text()) if self.path.exists() else {}
+        )
+
+    def stale_reasons(self, output: Path | str, fingerprint: dict) -> list[str]:
+        """Why `output` needs rebuilding (empty when it is up to date)."""
+        if not Path(output).exists():
+            return ["missing"]
+        recorded = self.records.get(str(output))
+        if recorded is None:
+            return ["not in manifest"]
+        return [key for key, value in fingerprint.items() if recorded.get(key) != value]
+
+    def record(self, output: Path | str, fingerprint: dict) -> None:
+        self.records[str(output)] = fingerprint
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.records, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp, self.path)
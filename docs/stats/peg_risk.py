@@ -0,0 +1,252 @@
+"""
+Exact pegging risk of any play: points gained and points conceded.
+
+For a play of one rank onto a pile, computes
+
+  - gained:   the points the play scores (pegging_sim.play_points)
+  - conceded: the expected points of the opponent's best immediate reply
+
+The opponent's hand is every equally likely set of cards from the unseen
+deck: the 52 cards less the pile, the card played and the cards the player
+knows — their own hand and the starter. The caller passes the number of
+cards the opponent still holds, n: the pile restarts after a Go or 31 and a
+player can play several cards in a row after a Go, so n does not follow from
+the pile. If r_x points are scored by replying with rank x, u_x unseen cards
+have that rank, and the opponent holds n of U unseen cards, the best reply is
+worth at least k points unless none of the s_k cards with r_x >= k was dealt
+to them:
+
+    E[best reply] = sum over k >= 1 of 1 - C(U - s_k, n) / C(U, n)
+
+with unplayable replies (count over 31) scoring 0. Making 31 resets the count,
+so nothing is conceded, and an opponent who has said Go (n = 0) cannot reply.
+
+Play points depend only on the pile's signature — the count, how many cards
+at the end of the pile share a rank and the ranks of the longest distinct run
+at its end — so the table has one row per signature over every pile a count
+can hold (3,132,275 piles of up to 7 cards, 588,077 signatures). Each row
+gives the points of playing each rank and the row of the pile the play
+leaves. PegRisk looks up gained directly and computes conceded from the
+child row and the caller's unseen counts, so no two piles are averaged
+together. src/engine/peg-risk.ts computes the same values for the AI with
+scorePeggingPlay rather than loading the table: the conceded value depends on
+the cards the player knows and the opponent's hand size, which a shipped table
+could only cover by averaging, and the 588,077 x 13 points table would add
+several megabytes to the bundle to save 13 scorePeggingPlay calls a play.
+
+Usage:
+    python docs/stats/peg_risk.py [--pile RANK ...] [--held N] [--known RANK ...]
+                                  [--no-cache]
+"""
+
+import argparse
+import time
+from typing import Sequence
+
+import numpy as np
+
+from cache import ResultCache
+from cards import PIP_VALUES, RANKS, bit_count
+from pegging_sim import MAX_COUNT, SEQUENCE_SLOTS, play_points
+
+MAX_PILE = SEQUENCE_SLOTS - 1  # cards on the pile before a play
+HAND_CARDS = 4
+CHUNK_PILES = 1 << 16
+
+
+# ─── Signatures ─────────────────────────────────────────────────────────────
+def pile_signatures(recent: np.ndarray, length: int, count: np.ndarray):
+    """
+    Key that determines the points of every play onto each pile: the count,
+    the trailing same-rank depth and the ranks of the longest distinct suffix.
+    """
+    recent = recent.astype(np.int64)
+    valid = np.arange(SEQUENCE_SLOTS) < length
+    bits = np.bitwise_or.accumulate(np.where(valid, 1 << recent, 0), axis=1)
+    distinct = bit_count(bits) == np.arange(1, SEQUENCE_SLOTS + 1)
+    suffix = np.cumprod(distinct & valid, axis=1).sum(axis=1)
+    depth = np.cumprod((recent == recent[:, :1]) & valid, axis=1).sum(axis=1)
+    key = count.astype(np.int64) | depth << 5 | suffix << 8
+    for i in range(MAX_PILE):
+        rank = np.where(i < suffix, recent[:, i], 0)
+        key |= rank.astype(np.int64) << (11 + 4 * i)
+    return key
+
+
+def _signature_rows(recent: np.ndarray, length: int, count: np.ndarray):
+    """
+    (signatures, points, children) for the distinct signatures of piles of
+    one length: points (M, 13) of each play (-1 over 31) and the signature
+    of the pile each play leaves (-1 where it makes 31 or fills the pile).
+    """
+    signatures, first = np.unique(
+        pile_signatures(recent, length, count), return_index=True
+    )
+    m = len(first)
+    ranks = np.tile(np.arange(13), m)
+    parent_recent = np.repeat(recent[first].astype(np.int64), 13, axis=0)
+    parent_count = np.repeat(count[first], 13)
+    new_count = parent_count + PIP_VALUES[ranks]
+    points = play_points(parent_recent, np.full(m * 13, length), parent_count, ranks)
+    points = np.where(new_count <= MAX_COUNT, points, -1)
+
+    children = np.full(m * 13, -1, dtype=np.int64)
+    if length < MAX_PILE:
+        child_recent = np.concatenate([ranks[:, None], parent_recent[:, :-1]], axis=1)
+        open_count = new_count < MAX_COUNT
+        children[open_count] = pile_signatures(
+            child_recent[open_count], length + 1, new_count[open_count]
+        )
+    return signatures, points.reshape(m, 13), children.reshape(m, 13)
+
+
+# ─── Tables ─────────────────────────────────────────────────────────────────
+def risk_tables() -> dict:
+    """
+    One row per pile signature over every pile a count can hold:
+    "signatures" (S,) sorted keys, "points" (S, 13) points scored by playing
+    each rank (-1 where the count would pass 31), and "child" (S, 13) the row
+    of the pile the play leaves (-1 where it makes 31 or fills the pile).
+    """
+    pips = PIP_VALUES.astype(np.int64)
+
+    # Piles are stored compactly: ranks most recent first (-1 pad), rank counts
+    recent = np.full((1, SEQUENCE_SLOTS), -1, dtype=np.int8)
+    seen = np.zeros((1, 13), dtype=np.int8)
+    count = np.zeros(1, dtype=np.int64)
+    levels = []
+    for length in range(MAX_PILE + 1):
+        levels.append(_signature_rows(recent, length, count))
+        if length == MAX_PILE:
+            break
+        children = []
+        for lo in range(0, len(count), CHUNK_PILES):
+            chunk = slice(lo, lo + CHUNK_PILES)
+            child_count = count[chunk, None] + pips
+            parent, rank = np.nonzero((seen[chunk] < 4) & (child_count < MAX_COUNT))
+            child_seen = seen[chunk][parent]
+            child_seen[np.arange(len(rank)), rank] += 1
+            child_recent = np.concatenate(
+                [rank[:, None].astype(np.int8), recent[chunk][parent, :-1]], axis=1
+            )
+            children.append((child_recent, child_seen, child_count[parent, rank]))
+        recent, seen, count = (np.concatenate(parts) for parts in zip(*children))
+
+    # A signature can recur at several pile lengths with the same row, except
+    # that a full pile leaves no children
+    signatures = np.unique(np.concatenate([level[0] for level in levels]))
+    points = np.zeros((len(signatures), 13), dtype=np.int8)
+    child = np.full((len(signatures), 13), -1, dtype=np.int32)
+    for level_signatures, level_points, level_children in levels:
+        rows = np.searchsorted(signatures, level_signatures)
+        points[rows] = level_points
+        found = np.searchsorted(signatures, level_children)
+        found = np.minimum(found, len(signatures) - 1)
+        # Skip children no real pile reaches (a fifth card of a rank)
+        valid = (level_children >= 0) & (signatures[found] == level_children)
+        np.maximum.at(child, rows, np.where(valid, found, -1).astype(np.int32))
+    return {"signatures": signatures, "points": points, "child": child}
+
+
+def peg_risk(cache: ResultCache | None = None) -> dict:
+    """risk_tables(), read from (or saved to) the result cache."""
+    if cache is None:
+        return risk_tables()
+    return cache.fetch("peg_risk", {}, risk_tables)
+
+
+def expected_best(points: np.ndarray, unseen: np.ndarray, held: int) -> np.ndarray:
+    """E[max points] of a held-card hand dealt from the unseen rank counts."""
+    total = unseen.sum(axis=1)
+    expected = np.zeros(len(points))
+    for k in range(1, int(points.max(initial=0)) + 1):
+        scoring = (unseen * (points >= k)).sum(axis=1)
+        missed = np.ones(len(points))
+        for i in range(held):
+            missed *= np.clip(total - scoring - i, 0, None) / (total - i)
+        expected += 1.0 - missed
+    return expected
+
+
+# ─── Lookup ─────────────────────────────────────────────────────────────────
+class PegRisk:
+    """Gained and conceded points of any play, from the signature table."""
+
+    def __init__(self, cache: ResultCache | None = None):
+        tables = peg_risk(cache)
+        self.signatures = tables["signatures"]
+        self.points = tables["points"]
+        self.child = tables["child"]
+
+    def row(self, pile: Sequence[int]) -> int:
+        """Table row of a pile, given as ranks (0-12) in the order played."""
+        if len(pile) > MAX_PILE:
+            raise ValueError(f"a pile holds at most {MAX_PILE} cards before a play")
+        recent = np.full((1, SEQUENCE_SLOTS), -1, dtype=np.int64)
+        recent[0, : len(pile)] = list(pile)[::-1]
+        count = PIP_VALUES[list(pile)].astype(np.int64).sum(keepdims=True)
+        if count[0] >= MAX_COUNT:
+            raise ValueError(f"count {count[0]} has no plays left")
+        key = pile_signatures(recent, len(pile), count)[0]
+        row = int(np.searchsorted(self.signatures, key))
+        if row == len(self.signatures) or self.signatures[row] != key:
+            raise ValueError(f"no count holds the pile {list(pile)}")
+        return row
+
+    def play(
+        self, pile: Sequence[int], rank: int, held: int, known: Sequence[int] = ()
+    ) -> tuple[float, float]:
+        """
+        (gained, conceded) for playing `rank` onto `pile` when the opponent
+        still holds `held` cards (0 once they have said Go), dealt from what
+        the pile, the card played and `known` (the rest of the player's hand
+        and the starter, as ranks) leave unseen.
+        """
+        if not 0 <= held <= HAND_CARDS:
+            raise ValueError(f"the opponent holds 0-{HAND_CARDS} cards, not {held}")
+        row = self.row(pile)
+        gained = int(self.points[row, rank])
+        if gained < 0:
+            raise ValueError(f"{RANKS[rank]} cannot be played onto {list(pile)}")
+        child = self.child[row, rank]
+        if held <= 0 or child < 0:
+            return float(gained), 0.0
+        unseen = 4 - np.bincount([*pile, rank, *known], minlength=13)
+        if unseen.min() < 0:
+            raise ValueError("more than four cards of a rank")
+        replies = np.maximum(self.points[child].astype(np.int64), 0)
+        conceded = expected_best(replies[None], unseen[None], held)[0]
+        return float(gained), float(conceded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pile", nargs="*", choices=RANKS, default=[])
+    parser.add_argument(
+        "--held", type=int, default=HAND_CARDS, help="cards the opponent holds"
+    )
+    parser.add_argument("--known", nargs="*", choices=RANKS, default=[])
+    parser.add_argument("--no-cache", action="store_true", help="always recompute")
+    args = parser.parse_args()
+
+    cache = ResultCache(enabled=not args.no_cache)
+    start = time.perf_counter()
+    risk = PegRisk(cache)
+    print(
+        f"\n{len(risk.signatures):,} pile signatures in "
+        f"{time.perf_counter() - start:.1f}s — {cache.report()}\n"
+    )
+
+    pile = [RANKS.index(rank) for rank in args.pile]
+    known = [RANKS.index(rank) for rank in args.known]
+    row = risk.row(pile)
+    print(
+        f"  Pile: {' '.join(args.pile) or 'empty'}  Opponent holds: {args.held}  "
+        f"Known: {' '.join(args.known)}"
+    )
+    print(f"  {'Play':>6} {'Gained':>8} {'Conceded':>9}")
+    for rank, label in enumerate(RANKS):
+        if risk.points[row, rank] >= 0 and (pile + known).count(rank) < 4:
+            gained, conceded = risk.play(pile, rank, args.held, known)
+            print(f"  {label:>6} {gained:>8.0f} {conceded:>9.3f}")
+    print()
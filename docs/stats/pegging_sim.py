@@ -0,0 +1,335 @@
+"""
+Vectorized Monte Carlo simulation of the two-player pegging phase.
+
+Plays millions of deals in lockstep as NumPy arrays, one play (or Go) per
+deal per step, following handlePlayCard/handleDeclareGo in
+src/engine/gameState.ts and scorePeggingPlay in src/engine/pegging.ts:
+
+  - pone leads; a card may be played only if the count stays <= 31
+  - 15 and 31 score 2; pairs, pair royal and double pair royal score 2/6/12
+    from the end of the current sequence; the longest run of 3+ distinct
+    consecutive ranks ending at the last card scores its length
+  - 31 resets the count and the other player leads; no Go point
+  - when neither player can play, the last player to play scores 1 (Go)
+    and the other player leads the next count
+  - the last card of the hand scores 1 unless it made 31
+
+Play policies are pluggable (see POLICIES): a policy receives the current
+player's view of every deal where it must play and returns a hand slot each.
+
+Usage:
+    python docs/stats/pegging_sim.py [--deals N] [--dealer-policy greedy]
+        [--pone-policy greedy] [--keep random|optimal] [--seed S] [--workers N]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from cards import DECK_SIZE, PIP_VALUES, card_rank
+from shards import DEFAULT_SHARDS, run_sharded
+
+MAX_COUNT = 31
+SEQUENCE_SLOTS = 8  # two 4-card hands: a sequence never exceeds 8 cards
+PONE, DEALER = 0, 1
+SEATS = ("pone", "dealer")
+PEG_BINS = 64  # pegging points per hand; higher totals land in the last bin
+
+# Counts that let the opponent score immediately (DANGEROUS_PEG_COUNTS in types.ts)
+DANGEROUS_COUNTS = np.array([5, 11, 21])
+DANGER_PENALTY = 1.5  # same penalty as evalCandidateEV() in optimal.ts
+
+# Points for k consecutive matching ranks ending at the played card: C(k, 2) * 2
+_PAIR_POINTS = np.array([0, 0, 2, 6, 12])
+
+
+# ─── Play Scoring ───────────────────────────────────────────────────────────
+def play_points(
+    recent: np.ndarray, length: np.ndarray, count: np.ndarray, ranks: np.ndarray
+) -> np.ndarray:
+    """
+    Points scored by playing `ranks` onto each sequence.
+
+    recent holds the sequence ranks most recent first (length valid entries);
+    all arguments broadcast over leading rows.
+    """
+    window = np.concatenate([ranks[:, None], recent[:, :-1]], axis=1)
+    size = length + 1
+    in_sequence = np.arange(SEQUENCE_SLOTS) < size[:, None]
+
+    matching = np.cumprod((window == ranks[:, None]) & in_sequence, axis=1).sum(axis=1)
+    # Unplayable candidates can repeat a rank already out; clip before lookup
+    points = _PAIR_POINTS[np.minimum(matching, 4)]
+
+    # The last n cards form a run iff their rank bits are n consecutive bits
+    bits = np.bitwise_or.accumulate(np.where(window >= 0, 1 << window, 0), axis=1)
+    runs = np.zeros(len(ranks), dtype=np.int64)
+    for n in range(SEQUENCE_SLOTS, 2, -1):
+        seen = bits[:, n - 1]
+        run = (seen == ((1 << n) - 1) * (seen & -seen)) & (size >= n) & (runs == 0)
+        runs[run] = n
+    points = points + runs
+
+    new_count = count + PIP_VALUES[ranks]
+    return points + 2 * ((new_count == 15) | (new_count == MAX_COUNT))
+
+
+# ─── Policies ───────────────────────────────────────────────────────────────
+# A policy is called with a dict describing the deals where it must play:
+#     ranks     (M, 4) ranks of the player's four card slots
+#     values    (M, 4) pip values of those slots
+#     playable  (M, 4) bool: slot still in hand and keeps the count <= 31
+#     points    (M, 4) points each slot would score now (-1 if unplayable)
+#     count     (M,)   current count
+#     recent    (M, 8) ranks of the current sequence, most recent first (-1 pad)
+#     rng       numpy Generator
+# and returns (M,) slot indices, each one playable.
+def random_policy(view: dict) -> np.ndarray:
+    """Any playable card, uniformly."""
+    noise = view["rng"].random(view["playable"].shape)
+    return np.where(view["playable"], noise, -1).argmax(axis=1)
+
+
+def greedy_policy(view: dict) -> np.ndarray:
+    """
+    Most immediate points, less the danger penalty for leaving 5, 11 or 21;
+    ties go to the lowest card.
+    """
+    new_count = view["count"][:, None] + view["values"]
+    danger = np.isin(new_count, DANGEROUS_COUNTS) * DANGER_PENALTY
+    # Scale so card value only breaks ties between equal scores
+    merit = (view["points"] - danger) * 100 - view["values"]
+    return np.where(view["playable"], merit, -np.inf).argmax(axis=1)
+
+
+POLICIES: dict[str, Callable[[dict], np.ndarray]] = {
+    "greedy": greedy_policy,
+    "random": random_policy,
+}
+
+
+# ─── Deals ──────────────────────────────────────────────────────────────────
+def deal_hands(n_deals: int, keep: str, rng: np.random.Generator) -> np.ndarray:
+    """(N, 2, 4) kept cards for pone and dealer from shuffled decks."""
+    deck = np.argsort(rng.random((n_deals, DECK_SIZE)), axis=1).astype(np.uint8)
+    if keep == "random":
+        return deck[:, :8].reshape(n_deals, 2, 4)
+    if keep == "optimal":
+        from discard_table import discard_table
+
+        table = discard_table()
+        return np.stack(
+            [
+                table.best_keeps(deck[:, 0:6], is_dealer=False),
+                table.best_keeps(deck[:, 6:12], is_dealer=True),
+            ],
+            axis=1,
+        )
+    raise ValueError(f"unknown keep strategy: {keep}")
+
+
+# ─── Simulation ─────────────────────────────────────────────────────────────
+def simulate(
+    hands: np.ndarray,
+    policies: tuple[Callable, Callable],
+    rng: np.random.Generator,
+    needed: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Peg out every deal.
+
+    Args:
+        hands: (N, 2, 4) card ids, seat 0 pone, seat 1 dealer
+        policies: (pone policy, dealer policy)
+        needed: optional (N, 2) points each seat needs to win the game; a
+            deal stops as soon as one seat reaches its target
+
+    Returns:
+        (N, 2) pegging points for pone and dealer.
+    """
+    n = len(hands)
+    rows = np.arange(n)
+    ranks = card_rank(hands).astype(np.int64)
+    values = PIP_VALUES[ranks].astype(np.int64)
+    played = np.zeros((n, 2, 4), dtype=bool)
+    count = np.zeros(n, dtype=np.int64)
+    recent = np.full((n, SEQUENCE_SLOTS), -1, dtype=np.int64)
+    length = np.zeros(n, dtype=np.int64)
+    turn = np.full(n, PONE)
+    last = np.full(n, -1)
+    score = np.zeros((n, 2), dtype=np.int64)
+    active = np.ones(n, dtype=bool)
+
+    def reset(index: np.ndarray) -> None:
+        count[index] = 0
+        length[index] = 0
+        recent[index] = -1
+
+    while active.any():
+        cur, other = turn, 1 - turn
+        fits = values + count[:, None, None] <= MAX_COUNT
+        open_cards = ~played & fits
+        playable = open_cards[rows, cur] & active[:, None]
+        can = playable.any(axis=1)
+        other_can = open_cards[rows, other].any(axis=1)
+
+        # ── Plays ──
+        p = np.flatnonzero(can)
+        c = cur[p]
+        my_ranks = ranks[p, c]
+        candidates = play_points(
+            np.repeat(recent[p], 4, axis=0),
+            np.repeat(length[p], 4),
+            np.repeat(count[p], 4),
+            my_ranks.ravel(),
+        ).reshape(-1, 4)
+        candidates = np.where(playable[p], candidates, -1)
+        choice = np.zeros(len(p), dtype=np.intp)
+        for seat, policy in enumerate(policies):
+            mine = c == seat
+            if mine.any():
+                choice[mine] = policy(
+                    {
+                        "ranks": my_ranks[mine],
+                        "values": values[p[mine], seat],
+                        "playable": playable[p[mine]],
+                        "points": candidates[mine],
+                        "count": count[p[mine]],
+                        "recent": recent[p[mine]],
+                        "rng": rng,
+                    }
+                )
+
+        score[p, c] += candidates[np.arange(len(p)), choice]
+        played[p, c, choice] = True
+        count[p] += values[p, c, choice]
+        recent[p] = np.concatenate(
+            [my_ranks[np.arange(len(p)), choice][:, None], recent[p, :-1]], axis=1
+        )
+        length[p] += 1
+        last[p] = c
+
+        hit31 = count[p] == MAX_COUNT
+        done = played[p].all(axis=(1, 2))
+        score[p[done & ~hit31], c[done & ~hit31]] += 1  # last card
+        active[p[done]] = False
+        reset(p[hit31])
+        turn[p[hit31]] = 1 - c[hit31]
+        going = ~done & ~hit31
+        q, qc = p[going], c[going]
+        others_open = (~played[q, 1 - qc]) & (
+            values[q, 1 - qc] + count[q, None] <= MAX_COUNT
+        )
+        out_of_cards = played[q, qc].all(axis=1)
+        turn[q] = np.where(others_open.any(axis=1) | out_of_cards, 1 - qc, qc)
+
+        # ── Go ──
+        g = np.flatnonzero(active & ~can)
+        passes = other_can[g]
+        turn[g[passes]] = other[g[passes]]
+        stuck = g[~passes]
+        score[stuck, last[stuck]] += 1
+        reset(stuck)
+        turn[stuck] = 1 - last[stuck]
+
+        if needed is not None:
+            active &= ~(score >= needed).any(axis=1)
+
+    return score
+
+
+def pegging_shard(
+    start: int, stop: int, pone: str, dealer: str, keep: str, seed: int
+) -> dict:
+    """Shard task: pegging-point histograms for deals [start, stop)."""
+    rng = np.random.default_rng([seed, start])
+    hands = deal_hands(stop - start, keep, rng)
+    score = simulate(hands, (POLICIES[pone], POLICIES[dealer]), rng)
+    clipped = np.minimum(score, PEG_BINS - 1)
+    histogram = np.zeros((2, PEG_BINS), dtype=np.int64)
+    for seat in (PONE, DEALER):
+        histogram[seat] = np.bincount(clipped[:, seat], minlength=PEG_BINS)
+    joint = np.bincount(
+        clipped[:, PONE] * PEG_BINS + clipped[:, DEALER], minlength=PEG_BINS**2
+    )
+    return {"histogram": histogram, "joint": joint.reshape(PEG_BINS, PEG_BINS)}
+
+
+def simulate_pegging(
+    n_deals: int,
+    pone: str = "greedy",
+    dealer: str = "greedy",
+    keep: str = "random",
+    seed: int = 0,
+    workers: int | None = 1,
+    n_shards: int = DEFAULT_SHARDS,
+) -> dict:
+    """
+    Pegging-point distributions for pone and dealer over n_deals deals.
+
+    Returns {seat: {"distribution": {points: deals}, "mean": float}} for
+    "pone" and "dealer", plus "deals" and "joint", the deal count for each
+    (pone points, dealer points) as a nested list.
+    """
+    merged = run_sharded(
+        pegging_shard,
+        n_deals,
+        args=(pone, dealer, keep, seed),
+        n_shards=n_shards,
+        workers=workers,
+    )
+    histogram, joint = merged["histogram"], merged["joint"]
+    top = np.flatnonzero(histogram.any(axis=0)).max() + 1
+    result = {"deals": n_deals, "joint": joint[:top, :top].tolist()}
+    for seat, name in enumerate(SEATS):
+        counts = histogram[seat]
+        result[name] = {
+            "distribution": {p: int(c) for p, c in enumerate(counts) if c},
+            "mean": float(counts @ np.arange(PEG_BINS) / counts.sum()),
+        }
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--deals", type=int, default=1_000_000)
+    parser.add_argument("--pone-policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--dealer-policy", choices=POLICIES, default="greedy")
+    parser.add_argument("--keep", choices=("random", "optimal"), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=None, help="write JSON here")
+    args = parser.parse_args()
+
+    print(f"\nPegging {args.deals:,} deals ({args.keep} keeps)...")
+    start = time.perf_counter()
+    result = simulate_pegging(
+        args.deals,
+        pone=args.pone_policy,
+        dealer=args.dealer_policy,
+        keep=args.keep,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"  {elapsed:.1f}s, {args.deals / elapsed * 60:,.0f} deals per minute\n")
+
+    print(f"  {'Points':>6} {'Pone':>8} {'Dealer':>8}")
+    points = sorted(
+        set(result["pone"]["distribution"]) | set(result["dealer"]["distribution"])
+    )
+    for p in points:
+        shares = [
+            result[seat]["distribution"].get(p, 0) / args.deals * 100 for seat in SEATS
+        ]
+        print(f"  {p:>6} {shares[0]:>7.2f}% {shares[1]:>7.2f}%")
+    print(
+        f"  {'Mean':>6} {result['pone']['mean']:>8.3f} {result['dealer']['mean']:>8.3f}\n"
+    )
+    if args.out:
+        args.out.write_text(json.dumps(result, indent=2) + "\n")
+        print(f"Saved {args.out}\n")
@@ -0,0 +1,201 @@
+"""
+Precomputed CDF and survival tables for show scores.
+
+Builds, for every score, P(score <= s) and P(score >= s) for:
+
+    hand          any 4-card hand with a random starter (the full enumeration)
+    crib          any crib, random discards
+    pone_hand     the hand the pone keeps under optimal discards
+    dealer_hand   the hand the dealer keeps under optimal discards
+    dealer_crib   the dealer's crib when both players discard optimally from
+                  one deck (sampled: sampling.dealer_shows)
+    dealer_total  the dealer's hand plus crib on the same starter, from the
+                  same sampled deals
+
+The pone's show is pone_hand, since the pone has no crib. The kept-hand
+distributions come from win_prob.py and the dealer's crib and total from
+sampling.py, so the tables inherit their caching. With --write the tables
+are saved to hand_percentiles.json and to src/engine/hand-percentiles.ts,
+so the show screen can say "this hand is in the top 3.2%" with one array
+read. Percentiles reads the JSON back for O(1) lookups, and the cumulative
+chart in generate_charts.py draws its curve and milestone notes from the
+same tables.
+
+Usage:
+    python docs/stats/percentiles.py [--score S] [--table NAME] [--write]
+"""
+
+import argparse
+import json
+import textwrap
+from pathlib import Path
+
+import numpy as np
+
+from cache import ResultCache
+from enumeration import enumerate_scores
+from pegging_sim import DEALER, PONE
+from sampling import dealer_shows
+from win_prob import kept_hands
+
+ROOT = Path(__file__).resolve().parents[2]
+JSON_OUTPUT = Path(__file__).resolve().parent / "hand_percentiles.json"
+TS_OUTPUT = ROOT / "src" / "engine" / "hand-percentiles.ts"
+
+TABLES = (
+    "hand",
+    "crib",
+    "pone_hand",
+    "dealer_hand",
+    "dealer_crib",
+    "dealer_total",
+)
+DECIMALS = 10  # the 4-in-12,994,800 chance of a 29 (3.1e-7) keeps 4 digits
+
+
+# ─── Tables ─────────────────────────────────────────────────────────────────
+def _shares(result: dict) -> np.ndarray:
+    shares = np.zeros(max(result["distribution"]) + 1)
+    for score, count in result["distribution"].items():
+        shares[score] = count / result["total"]
+    return shares
+
+
+def distributions(cache: ResultCache | None = None) -> dict[str, np.ndarray]:
+    """Probability of each score, by table name (see the module docstring)."""
+    kept = kept_hands(cache)
+    dealer = dealer_shows(cache)
+    return {
+        "hand": _shares(enumerate_scores(cache=cache)),
+        "crib": _shares(enumerate_scores(is_crib=True, cache=cache)),
+        "pone_hand": kept[PONE],
+        "dealer_hand": kept[DEALER],
+        "dealer_crib": dealer["crib"],
+        "dealer_total": dealer["total"],
+    }
+
+
+def percentile_tables(cache: ResultCache | None = None) -> dict[str, dict]:
+    """
+    {table: {"mean", "at_most", "at_least"}}: the mean score and, indexed by
+    score up to the highest possible, P(score <= s) and P(score >= s).
+    """
+    tables = {}
+    for name, shares in distributions(cache).items():
+        shares = np.trim_zeros(np.asarray(shares, dtype=float), "b")
+        shares = shares / shares.sum()
+        at_least = np.cumsum(shares[::-1])[::-1]
+        tables[name] = {
+            "mean": round(float(shares @ np.arange(len(shares))), 4),
+            "at_most": np.round(np.cumsum(shares), DECIMALS).tolist(),
+            "at_least": np.round(at_least, DECIMALS).tolist(),
+        }
+    return tables
+
+
+# ─── Lookup ─────────────────────────────────────────────────────────────────
+class Percentiles:
+    """
+    Constant-time score lookups in the tables saved to hand_percentiles.json,
+    or in tables from percentile_tables() when given.
+    """
+
+    def __init__(self, path: Path | str = JSON_OUTPUT, tables: dict | None = None):
+        self.tables = json.loads(Path(path).read_text()) if tables is None else tables
+
+    def at_least(self, score: int, table: str = "hand") -> float:
+        """P(score >= s): the share of shows that do at least this well."""
+        values = self.tables[table]["at_least"]
+        return 1.0 if score <= 0 else values[score] if score < len(values) else 0.0
+
+    def at_most(self, score: int, table: str = "hand") -> float:
+        """P(score <= s): the percentile rank of the score."""
+        values = self.tables[table]["at_most"]
+        return 0.0 if score < 0 else values[min(score, len(values) - 1)]
+
+    def top_percent(self, score: int, table: str = "hand") -> float:
+        """The "top X%" a score is in, as a percentage."""
+        return 100 * self.at_least(score, table)
+
+
+# ─── Outputs ────────────────────────────────────────────────────────────────
+def _camel(name: str) -> str:
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+def write_typescript(tables: dict[str, dict], path: Path = TS_OUTPUT) -> None:
+    rows = []
+    for name, table in tables.items():
+        values = ", ".join(f"{p:.6g}" for p in table["at_least"])
+        rows += [
+            f"  {_camel(name)}: [",
+            *textwrap.wrap(values, 96, initial_indent="    ", subsequent_indent="    "),
+            "  ],",
+        ]
+    path.write_text(
+        "// Generated by docs/stats/percentiles.py — do not edit by hand.\n"
+        "\n"
+        "/**\n"
+        " * P(score >= s) for every show score s: any hand or crib (random\n"
+        " * discards) and the hands pone and dealer keep under optimal discards,\n"
+        " * exact over every hand and starter; the dealer's crib and hand plus\n"
+        " * crib when both discard optimally from one deck, stratified-sampled.\n"
+        " */\n"
+        "export const SCORE_AT_LEAST = {\n" + "\n".join(rows) + "\n} as const;\n"
+        "\n"
+        "export type PercentileTable = keyof typeof SCORE_AT_LEAST;\n"
+        "\n"
+        "/** Share of shows in `table` scoring at least `score` (0-1). */\n"
+        "export function shareAtLeast(\n"
+        "  score: number,\n"
+        "  table: PercentileTable = 'hand',\n"
+        "): number {\n"
+        "  const values: readonly number[] = SCORE_AT_LEAST[table];\n"
+        "  if (score <= 0) return 1;\n"
+        "  return score < values.length ? values[score] : 0;\n"
+        "}\n"
+        "\n"
+        '/** The "top X%" a score is in: 3.2 means the top 3.2% of shows. */\n'
+        "export function topPercent(\n"
+        "  score: number,\n"
+        "  table: PercentileTable = 'hand',\n"
+        "): number {\n"
+        "  return 100 * shareAtLeast(score, table);\n"
+        "}\n"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--score", type=int, default=None)
+    parser.add_argument("--table", choices=TABLES, default="hand")
+    parser.add_argument(
+        "--write", action="store_true", help="save the JSON and TypeScript tables"
+    )
+    args = parser.parse_args()
+
+    tables = percentile_tables(ResultCache())
+    if args.write:
+        JSON_OUTPUT.write_text(json.dumps(tables, indent=1) + "\n")
+        write_typescript(tables)
+
+    print(f"\n  {'Table':<14} {'Mean':>6} {'Median':>7} {'Top 10%':>8} {'Top 1%':>7}")
+    for name, table in tables.items():
+        at_most, at_least = np.array(table["at_most"]), np.array(table["at_least"])
+        median = int(np.searchsorted(at_most, 0.5))
+        top = [int(np.flatnonzero(at_least >= p)[-1]) for p in (0.10, 0.01)]
+        print(
+            f"  {name:<14} {table['mean']:>6.2f} {median:>7} "
+            f"{top[0]:>7}+ {top[1]:>6}+"
+        )
+    if args.score is not None:
+        lookup = Percentiles(tables=tables)
+        print(
+            f"\n  {args.table} score {args.score}: top "
+            f"{lookup.top_percent(args.score, args.table):.2f}%, "
+            f"percentile {100 * lookup.at_most(args.score, args.table):.1f}"
+        )
+    if args.write:
+        print(f"\nSaved {JSON_OUTPUT.name} and {TS_OUTPUT.relative_to(ROOT)}")
+    print()
@@ -0,0 +1,115 @@
+"""
+Stage instrumentation for the stats pipeline.
+
+A Profiler times named stages of a run: wall time (time.perf_counter), CPU
+time (time.process_time) and peak traced memory (tracemalloc), and can
+also run cProfile over the whole run. Disabled — the default — stage()
+hands back one shared no-op context manager and tracemalloc never starts,
+so instrumented code pays nothing.
+
+Stages may nest; a parent's peak includes its children's. Stages measured
+in worker processes come back as plain records and are merged with add().
+
+    profiler = Profiler(enabled=True)
+    with profiler.stage("enumeration"):
+        ...
+    print(profiler.report())
+    profiler.save(PROFILE_PATH)
+"""
+
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+from scoring import CACHE_DIR
+
+PROFILE_PATH = CACHE_DIR / "profile.json"
+
+_DISABLED = nullcontext()
+
+# Peak-memory frames of the stages open in this process, across profilers
+_OPEN: list[dict] = []
+
+
+class Profiler:
+    """Named-stage timer; a disabled profiler's stage() does nothing."""
+
+    def __init__(self, enabled: bool = False, cprofile: bool = False):
+        self.enabled = enabled
+        self.stages: list[dict] = []
+        self._depth = 0
+        self._cprofile = cProfile.Profile() if enabled and cprofile else None
+        self._started = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+
+    def stage(self, name: str):
+        """Context manager measuring one stage (a shared no-op when disabled)."""
+        if not self.enabled:
+            return _DISABLED
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # Resetting the peak for this stage must not lose the parent's peak so far
+        if _OPEN:
+            _OPEN[-1]["peak"] = max(
+                _OPEN[-1]["peak"], tracemalloc.get_traced_memory()[1]
+            )
+        tracemalloc.reset_peak()
+        record = {"stage": name, "depth": self._depth, "pid": os.getpid()}
+        frame = {"peak": 0}
+        _OPEN.append(frame)
+        self._depth += 1
+        self.stages.append(record)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record["wall_s"] = time.perf_counter() - wall
+            record["cpu_s"] = time.process_time() - cpu
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            record["peak_mb"] = peak / 1e6
+            _OPEN.pop()
+            self._depth -= 1
+            if _OPEN:
+                _OPEN[-1]["peak"] = max(_OPEN[-1]["peak"], peak)
+
+    def add(self, records: list[dict]) -> None:
+        """Merge stage records measured by another profiler (e.g. in a worker)."""
+        self.stages.extend({**r, "depth": r["depth"] + self._depth} for r in records)
+
+    def report(self) -> str:
+        """Stage table for stdout."""
+        lines = [f"  {'Stage':<44} {'Wall':>8} {'CPU':>8} {'Peak mem':>10}"]
+        for record in self.stages:
+            label = "  " * record["depth"] + record["stage"]
+            if record["pid"] != os.getpid():
+                label += f" [pid {record['pid']}]"
+            lines.append(
+                f"  {label:<44} {record['wall_s']:>7.2f}s {record['cpu_s']:>7.2f}s "
+                f"{record['peak_mb']:>7.1f} MB"
+            )
+        total = time.perf_counter() - self._started
+        lines.append(f"  {'Total':<44} {total:>7.2f}s")
+        return "\n".join(lines)
+
+    def save(self, path: Path | str = PROFILE_PATH, cprofile_path=None) -> None:
+        """Write the stage records as JSON, and the cProfile stats if collected."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "total_s": time.perf_counter() - self._started,
+            "stages": self.stages,
+        }
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        if self._cprofile is not None and cprofile_path is not None:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(cprofile_path)
@@ -0,0 +1,263 @@
+"""
+Bitmask-indexed conditional queries over the full show-score enumeration.
+
+The index covers all 12,994,800 (hand, starter) rows in enumeration order
+(every 4-card hand, lexicographic, then each of its 48 starters). Each card
+has two packed bitsets over those rows, one marking the rows whose hand holds
+the card and one marking the rows where it is the starter, and each score has
+a bitset of the rows that total it. The index also keeps the per-row score
+vector. A query is a conjunction of card, rank or suit predicates, evaluated
+as bitwise ANDs of uint64 words. Its histogram is the popcount of the
+selection against each score bitset, restricted to the words the selection
+touches, so answering it takes milliseconds and never rescans a hand.
+
+The index is built once (sharded over hands) and kept in the result cache,
+where it loads memory-mapped.
+
+Usage:
+    python docs/stats/query.py --hold 5 --hold J [--starter 5] [--without H]
+                               [--at-least 12] [--crib]
+
+Predicates name a card (5H, 10S), a rank (5, J) or a suit (H). --hold 5
+--hold 5 means at least two fives.
+"""
+
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+
+from cache import ResultCache
+from cards import DECK_SIZE, RANKS, SUITS, all_hands, bit_count, starters_for
+from scoring import MAX_SCORE, score_totals
+from shards import DEFAULT_SHARDS, concatenate, run_sharded
+
+STARTERS_PER_HAND = DECK_SIZE - 4
+WORD_BITS = 64
+
+
+# ─── Predicates ─────────────────────────────────────────────────────────────
+def predicate_cards(token: str) -> list[int]:
+    """Card ids matched by a card (5H), rank (5) or suit (H) token."""
+    token = token.strip().upper()
+    if token in SUITS:
+        suit = SUITS.index(token)
+        return list(range(suit * 13, suit * 13 + 13))
+    if token in RANKS:
+        rank = RANKS.index(token)
+        return [suit * 13 + rank for suit in range(len(SUITS))]
+    rank, suit = token[:-1], token[-1:]
+    if rank in RANKS and suit in SUITS:
+        return [SUITS.index(suit) * 13 + RANKS.index(rank)]
+    raise ValueError(f"not a card, rank or suit: {token!r}")
+
+
+# ─── Index Construction ─────────────────────────────────────────────────────
+def _pack_rows(flags: np.ndarray) -> np.ndarray:
+    """(rows, k) bools -> (rows / 8, k) bytes, row i at bit i % 8 of byte i // 8."""
+    return np.packbits(flags, axis=0, bitorder="little")
+
+
+def index_shard(start: int, stop: int, is_crib: bool) -> dict:
+    """Shard task: packed bitsets and scores for the rows of hands [start, stop)."""
+    hands = all_hands()[start:stop]
+    starters = starters_for(hands)
+    in_hand = np.zeros((len(hands), DECK_SIZE), dtype=bool)
+    np.put_along_axis(in_hand, hands.astype(np.intp), True, axis=1)
+
+    rows = np.arange(starters.size)
+    starters = starters.ravel()
+    scores = score_totals(
+        np.repeat(hands, STARTERS_PER_HAND, axis=0), starters, is_crib
+    ).astype(np.uint8)
+    is_starter = np.zeros((len(rows), DECK_SIZE), dtype=bool)
+    is_starter[rows, starters] = True
+    has_score = np.zeros((len(rows), MAX_SCORE + 1), dtype=bool)
+    has_score[rows, scores] = True
+    # 48 rows per hand keeps every shard byte-aligned, so packed shards concatenate
+    return {
+        "hand_bits": _pack_rows(np.repeat(in_hand, STARTERS_PER_HAND, axis=0)),
+        "starter_bits": _pack_rows(is_starter),
+        "score_bits": _pack_rows(has_score),
+        "scores": scores,
+    }
+
+
+def _to_words(packed: np.ndarray) -> np.ndarray:
+    """(bytes, k) packed rows -> (k, words) uint64, zero-padded to a whole word."""
+    pad = -len(packed) % (WORD_BITS // 8)
+    padded = np.zeros((packed.shape[1], len(packed) + pad), dtype=np.uint8)
+    padded[:, : len(packed)] = packed.T
+    return padded.view(np.uint64)
+
+
+def build_index(is_crib: bool = False, workers: int | None = None) -> dict:
+    """Bitsets and score vector for every row of the full enumeration."""
+    n_hands = len(all_hands())
+    shards = run_sharded(
+        index_shard,
+        n_hands,
+        args=(is_crib,),
+        n_shards=DEFAULT_SHARDS,
+        workers=workers,
+        combine=concatenate,
+    )
+    return {
+        "hand_bits": _to_words(shards.pop("hand_bits")),
+        "starter_bits": _to_words(shards.pop("starter_bits")),
+        "score_bits": _to_words(shards.pop("score_bits")),
+        "scores": shards.pop("scores"),
+    }
+
+
+# ─── Queries ────────────────────────────────────────────────────────────────
+class ScoreIndex:
+    """
+    Packed row bitsets over the enumeration, combined into selections.
+
+    A selection is a (words,) uint64 array; combine selections with &, | and
+    ~. Bits past the last row may be set (by ~) and are ignored, since the
+    score bitsets are zero there.
+    """
+
+    def __init__(self, arrays: dict):
+        self.hand_bits = arrays["hand_bits"]
+        self.starter_bits = arrays["starter_bits"]
+        self.score_bits = arrays["score_bits"]
+        self.scores = arrays["scores"]
+        self.total = len(self.scores)
+
+    def everything(self) -> np.ndarray:
+        return np.full(self.hand_bits.shape[1], ~np.uint64(0))
+
+    def hand(self, token: str, at_least: int = 1) -> np.ndarray:
+        """Rows whose hand holds at least `at_least` cards matching the token."""
+        # reached[k]: rows holding at least k matching cards among those seen so far
+        reached = [self.everything()] + [
+            np.zeros_like(self.everything()) for _ in range(at_least)
+        ]
+        for card in predicate_cards(token):
+            bits = self.hand_bits[card]
+            for k in range(at_least, 0, -1):
+                reached[k] |= reached[k - 1] & bits
+        return reached[at_least]
+
+    def starter(self, token: str) -> np.ndarray:
+        """Rows whose starter matches the token."""
+        selection = np.zeros_like(self.everything())
+        for card in predicate_cards(token):
+            selection |= self.starter_bits[card]
+        return selection
+
+    def histogram(self, selection: np.ndarray) -> np.ndarray:
+        """(MAX_SCORE + 1,) row count per score among the selected rows."""
+        words = np.flatnonzero(selection)
+        overlap = self.score_bits[:, words] & selection[words]
+        return bit_count(overlap).sum(axis=1, dtype=np.int64)
+
+    def rows(self, selection: np.ndarray) -> np.ndarray:
+        """Enumeration row numbers of the selected rows."""
+        bits = np.unpackbits(selection.view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[: self.total])
+
+    def describe(self, selection: np.ndarray) -> dict:
+        """Count, share of all rows, mean, distribution and P(score >= s)."""
+        histogram = self.histogram(selection)
+        count = int(histogram.sum())
+        if count == 0:
+            return {"count": 0, "share": 0.0, "distribution": {}}
+        at_least = histogram[::-1].cumsum()[::-1] / count
+        return {
+            "count": count,
+            "share": count / self.total,
+            "mean": float(np.arange(MAX_SCORE + 1) @ histogram / count),
+            "distribution": {s: int(c) for s, c in enumerate(histogram) if c > 0},
+            "at_least": {s: float(p) for s, p in enumerate(at_least)},
+        }
+
+
+@lru_cache(maxsize=4)
+def score_index(is_crib: bool = False, cache: ResultCache | None = None) -> ScoreIndex:
+    """The index for hand (or crib) scoring, read from (or saved to) the cache."""
+    if cache is None:
+        return ScoreIndex(build_index(is_crib))
+    arrays = cache.fetch(
+        "score_index", {"is_crib": is_crib}, lambda: build_index(is_crib)
+    )
+    return ScoreIndex(arrays)
+
+
+def query(
+    hold: tuple[str, ...] = (),
+    starter: str | None = None,
+    without: tuple[str, ...] = (),
+    is_crib: bool = False,
+    cache: ResultCache | None = None,
+) -> dict:
+    """
+    Score statistics for the rows matching every predicate.
+
+    `hold` tokens must all be in the hand (a repeated token needs that many
+    matching cards), `starter` must match the starter and no hand card may
+    match a `without` token. See ScoreIndex.describe for the result.
+    """
+    index = score_index(is_crib, cache)
+    selection = index.everything()
+    for token in set(hold):
+        selection &= index.hand(token, at_least=hold.count(token))
+    if starter is not None:
+        selection &= index.starter(starter)
+    for token in without:
+        selection &= ~index.hand(token)
+    return index.describe(selection)
+
+
+# ─── Command Line ───────────────────────────────────────────────────────────
+def add_query_arguments(parser: argparse.ArgumentParser) -> None:
+    """Query options, shared with the generate_charts.py query subcommand."""
+    parser.add_argument("--hold", action="append", default=[], metavar="TOKEN")
+    parser.add_argument("--starter", default=None, metavar="TOKEN")
+    parser.add_argument("--without", action="append", default=[], metavar="TOKEN")
+    parser.add_argument("--at-least", type=int, default=None, metavar="SCORE")
+    parser.add_argument("--crib", action="store_true", help="score as the crib")
+
+
+def run_query(
+    args: argparse.Namespace,
+    parser: argparse.ArgumentParser,
+    cache: ResultCache | None = None,
+) -> None:
+    """Answer and print the query described by add_query_arguments options."""
+    for token in args.hold + args.without + [args.starter or "H"]:
+        try:
+            predicate_cards(token)
+        except ValueError as error:
+            parser.error(str(error))
+
+    score_index(args.crib, cache)
+    start = time.perf_counter()
+    result = query(
+        tuple(args.hold), args.starter, tuple(args.without), args.crib, cache
+    )
+    elapsed = time.perf_counter() - start
+
+    conditions = [f"hold {t}" for t in args.hold] + [f"no {t}" for t in args.without]
+    if args.starter:
+        conditions.append(f"starter {args.starter}")
+    print(f"\n{' and '.join(conditions) or 'All rows'}: {result['count']:,} rows")
+    if result["count"]:
+        print(f"  {result['share']:.2%} of all rows, mean {result['mean']:.3f}")
+        print(f"  answered in {elapsed * 1e3:.1f} ms\n")
+        for score, count in result["distribution"].items():
+            print(f"  {score:>2}: {count:>10,}  {count / result['count']:>7.2%}")
+        if args.at_least is not None:
+            p = result["at_least"].get(args.at_least, 0.0)
+            print(f"\n  P(score >= {args.at_least}) = {p:.2%}")
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_query_arguments(parser)
+    run_query(parser.parse_args(), parser, ResultCache())
@@ -0,0 +1,536 @@
+"""
+Stratified Monte Carlo estimates, with confidence intervals, for analyses
+too large to enumerate on every run.
+
+Each sample is a hand and a starter, stratified by the starter's rank and
+the hand's rank profile — how its ranks repeat, e.g. (2, 1, 1) for one
+pair — giving 13 x 5 strata for 4-card hands and 13 x 9 for 6-card deals.
+Within a stratum every (hand, starter) is equally likely: the ranks are
+drawn in proportion to their number of suit choices, then the suits
+uniformly. The stratum weights are exact, so the stratum means combine into
+an unbiased estimate.
+
+    hand     a 4-card hand and starter: the show score (exact: enumeration.py)
+    crib     a 4-card crib and starter under optimal discards, with the two
+             discards independent as in crib_policy.py: each sampled crib is
+             weighted by crib_weights("optimal") (exact: enumeration.py with
+             policy="optimal", so a preview and the exact run of the same
+             approximation go through one call)
+    dealer   the dealer's crib, and the dealer's hand plus crib on the same
+             starter, when both players discard optimally from one deck; the
+             dealer's 6 cards are the stratified hand, the pone's are dealt
+             from the rest of the deck. No enumeration covers this:
+             crib_policy.py treats the two discards as independent, which
+             runs about 0.2 points low, so the engine tables (win_prob.py,
+             percentiles.py) take the dealer's crib and total show from
+             dealer_shows(), a fixed 4,194,304-deal sample of this analysis
+    pegging  pegging points for pone and dealer on the same deals, keeping
+             optimally and pegging greedily (pegging_sim.simulate); a
+             simulation, so it has no exact counterpart
+
+Sampling runs in rounds, each sharded over a process pool with its own
+SeedSequence stream keyed by (seed, round, shard), so results depend on the
+seed and the stopping rule but not on the worker count. The first round
+allocates samples in proportion to stratum weight; later rounds double the
+sample with Neyman allocation on the within-stratum spread. Sampling stops
+once every mean's 95% interval is within `precision` points, the time
+budget runs out, or max_samples is reached. The mean and P(value = k) for
+each k are reported with 95% intervals.
+
+A weighted analysis accumulates weight x value, so each stratum mean stays
+unbiased for the weighted distribution.
+
+exact=True runs the enumeration behind an analysis instead, where one
+exists (hand and crib), and returns the same shape with zero-width
+intervals: a 60-second preview and the exact run go through the same call.
+
+Usage:
+    python docs/stats/sampling.py [ANALYSIS] [--seconds S] [--precision P]
+                                  [--max-samples N] [--exact] [--seed S]
+"""
+
+import argparse
+import math
+import time
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from cache import ResultCache
+from cards import DECK_SIZE, HAND_SIZE, combination_index
+from crib_policy import crib_weights
+from discard_table import DEAL_SIZE, KEEPS, OPTIONS, option_values
+from enumeration import enumerate_scores
+from pegging_sim import DEALER, PEG_BINS, PONE, POLICIES, SEATS, simulate
+from scoring import MAX_SCORE, score_totals
+from shards import run_sharded
+
+N_RANKS = 13
+Z_95 = 1.959964  # two-sided 95% normal quantile
+MIN_PER_STRATUM = 2  # enough for a within-stratum variance
+FIRST_ROUND = 1 << 14
+BATCH_SAMPLES = 1 << 13  # samples per shard
+ENGINE_SAMPLES = 1 << 22  # deals behind dealer_shows(), fixed so it caches
+
+_CHOOSE = np.array([[math.comb(a, m) for m in range(5)] for a in range(5)])
+
+
+# ─── Strata ─────────────────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def rank_profiles(size: int) -> tuple[tuple[int, ...], ...]:
+    """Every way size cards can repeat ranks, e.g. (2, 1, 1), in sorted order."""
+
+    def partitions(n: int, largest: int):
+        if n == 0:
+            yield ()
+        for part in range(min(n, largest), 0, -1):
+            for rest in partitions(n - part, part):
+                yield (part, *rest)
+
+    return tuple(sorted(partitions(size, 4)))
+
+
+@lru_cache(maxsize=None)
+def _profile_ranks(profile: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """(T, groups) distinct ranks of every hand shape with this profile."""
+    shapes = [()]
+    for multiplicity in sorted(set(profile), reverse=True):
+        count = profile.count(multiplicity)
+        shapes = [
+            (*shape, *chosen)
+            for shape in shapes
+            for chosen in combinations(
+                [r for r in range(N_RANKS) if r not in shape], count
+            )
+        ]
+    groups = np.array(sorted(profile, reverse=True))
+    return np.array(shapes, dtype=np.intp), groups
+
+
+@lru_cache(maxsize=None)
+def shape_weights(profile: tuple[int, ...]) -> np.ndarray:
+    """
+    (13, T) number of hands of each shape when the starter has rank r:
+    the product of C(cards left of the rank, its multiplicity).
+    """
+    ranks, groups = _profile_ranks(profile)
+    left = 4 - (ranks[None] == np.arange(N_RANKS)[:, None, None])
+    return _CHOOSE[left, groups].prod(axis=2)
+
+
+@lru_cache(maxsize=None)
+def strata(size: int) -> tuple[list, np.ndarray]:
+    """
+    ([(starter rank, profile)], weights): every stratum for size-card hands
+    and its exact probability.
+    """
+    profiles = rank_profiles(size)
+    labels = [(rank, profile) for rank in range(N_RANKS) for profile in profiles]
+    counts = np.array([shape_weights(p)[r].sum() for r, p in labels], dtype=float)
+    assert counts.sum() == N_RANKS * math.comb(DECK_SIZE - 1, size)
+    return labels, counts / counts.sum()
+
+
+# ─── Draws ──────────────────────────────────────────────────────────────────
+def draw_hands(
+    rng: np.random.Generator, labels: np.ndarray, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (hands (N, size), starters (N,)): one uniform draw from each sample's
+    stratum, given as indices into strata(size).
+    """
+    strata_labels, _ = strata(size)
+    n = len(labels)
+    rows = np.arange(n)
+    ranks = np.empty((n, size), dtype=np.intp)
+    starter_rank = np.empty(n, dtype=np.intp)
+    occurrence = np.empty((n, size), dtype=np.intp)
+    for label in np.unique(labels):
+        rank, profile = strata_labels[label]
+        chosen = np.flatnonzero(labels == label)
+        shapes, groups = _profile_ranks(profile)
+        weights = shape_weights(profile)[rank]
+        picks = rng.choice(len(shapes), size=len(chosen), p=weights / weights.sum())
+        ranks[chosen] = np.repeat(shapes[picks], groups, axis=1)
+        occurrence[chosen] = np.concatenate([np.arange(m) for m in groups])
+        starter_rank[chosen] = rank
+
+    # A random suit order per rank, with the starter's suit pushed last
+    starter_suit = rng.integers(0, 4, n)
+    keys = rng.random((n, N_RANKS, 4))
+    keys[rows, starter_rank, starter_suit] = 2
+    suits = np.argsort(keys, axis=2)[rows[:, None], ranks, occurrence]
+    hands = np.sort(suits * N_RANKS + ranks, axis=1).astype(np.uint8)
+    return hands, (starter_suit * N_RANKS + starter_rank).astype(np.uint8)
+
+
+def deal_rest(
+    rng: np.random.Generator, hands: np.ndarray, starters: np.ndarray, size: int
+) -> np.ndarray:
+    """(N, size) cards dealt uniformly from what the hand and starter leave."""
+    keys = rng.random((len(hands), DECK_SIZE))
+    np.put_along_axis(keys, hands.astype(np.intp), 2, axis=1)
+    np.put_along_axis(keys, starters[:, None].astype(np.intp), 2, axis=1)
+    return np.sort(np.argsort(keys, axis=1)[:, :size], axis=1).astype(np.uint8)
+
+
+# ─── Analyses ───────────────────────────────────────────────────────────────
+# An analysis maps sampled (hands, starters) to a (values, N) int array, and
+# optionally weights each sample by its likelihood relative to a uniform draw.
+def hand_sample(hands: np.ndarray, starters: np.ndarray, rng) -> np.ndarray:
+    return score_totals(hands, starters)[None]
+
+
+def crib_sample(hands: np.ndarray, starters: np.ndarray, rng) -> np.ndarray:
+    return score_totals(hands, starters, is_crib=True)[None]
+
+
+def crib_weight(hands: np.ndarray, cache: ResultCache | None = None) -> np.ndarray:
+    """Likelihood of each sampled crib under optimal discards (mean 1)."""
+    return crib_weights("optimal", cache)[combination_index(hands)]
+
+
+def _discard(deals: np.ndarray, is_dealer: bool):
+    """(keeps, discards) of the best option by hand EV plus (minus) crib EV."""
+    hand_ev, crib_ev = option_values(deals)
+    option = (hand_ev + (crib_ev if is_dealer else -crib_ev)).argmax(axis=1)
+    rows = np.arange(len(deals))[:, None]
+    return deals[rows, KEEPS[option]], deals[rows, OPTIONS[option]]
+
+
+def _optimal_deal(hands: np.ndarray, starters: np.ndarray, rng):
+    """((N, 2, 4) keeps by seat, (N, 4) crib) with `hands` as the dealer's deal."""
+    pone_keep, pone_crib = _discard(deal_rest(rng, hands, starters, DEAL_SIZE), False)
+    dealer_keep, dealer_crib = _discard(hands, True)
+    keeps = np.stack([pone_keep, dealer_keep], axis=1)
+    return keeps, np.concatenate([pone_crib, dealer_crib], axis=1)
+
+
+def dealer_sample(hands: np.ndarray, starters: np.ndarray, rng) -> np.ndarray:
+    keeps, crib = _optimal_deal(hands, starters, rng)
+    crib = score_totals(crib, starters, is_crib=True)
+    return np.stack([crib, score_totals(keeps[:, DEALER], starters) + crib])
+
+
+def pegging_sample(hands: np.ndarray, starters: np.ndarray, rng) -> np.ndarray:
+    keeps, _ = _optimal_deal(hands, starters, rng)
+    greedy = POLICIES["greedy"]
+    points = simulate(keeps, (greedy, greedy), rng)
+    return np.minimum(points, PEG_BINS - 1).T[[PONE, DEALER]]
+
+
+def exact_hand(cache: ResultCache | None = None) -> dict:
+    """{"hand": {score: count}} from the full enumeration."""
+    return {"hand": enumerate_scores(cache=cache)["distribution"]}
+
+
+def exact_crib(cache: ResultCache | None = None) -> dict:
+    """{"crib": {score: expected count}} from the optimal-policy enumeration."""
+    result = enumerate_scores(is_crib=True, policy="optimal", cache=cache)
+    return {"crib": result["distribution"]}
+
+
+ANALYSES = {
+    "hand": {
+        "size": HAND_SIZE,
+        "values": ("hand",),
+        "bins": MAX_SCORE + 1,
+        "sample": hand_sample,
+        "weight": None,
+        "exact": exact_hand,
+    },
+    "crib": {
+        "size": HAND_SIZE,
+        "values": ("crib",),
+        "bins": MAX_SCORE + 1,
+        "sample": crib_sample,
+        "weight": crib_weight,
+        "exact": exact_crib,
+    },
+    "dealer": {
+        "size": DEAL_SIZE,
+        "values": ("crib", "total"),
+        "bins": 2 * MAX_SCORE + 1,
+        "sample": dealer_sample,
+        "weight": None,
+        "exact": None,
+    },
+    "pegging": {
+        "size": DEAL_SIZE,
+        "values": SEATS,
+        "bins": PEG_BINS,
+        "sample": pegging_sample,
+        "weight": None,
+        "exact": None,
+    },
+}
+
+
+# ─── Accumulation ───────────────────────────────────────────────────────────
+def sample_shard(
+    start: int,
+    stop: int,
+    name: str,
+    allocation: np.ndarray,
+    seed: int,
+    round_: int,
+    cache: ResultCache | None = None,
+) -> dict:
+    """
+    Shard task: per-stratum sample counts, weighted value sums and squared
+    sums, and value histograms of the weights and squared weights for samples
+    [start, stop) of one round. Weights come from the cache when one is given.
+    """
+    analysis = ANALYSES[name]
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(round_, start)))
+    n_strata = len(allocation)
+    labels = np.repeat(np.arange(n_strata), allocation)[start:stop]
+    hands, starters = draw_hands(rng, labels, analysis["size"])
+    values = analysis["sample"](hands, starters, rng).astype(np.int64)
+    if analysis["weight"] is None:
+        weights = np.ones(len(labels))
+    else:
+        weights = analysis["weight"](hands, cache)
+    bins = analysis["bins"]
+    cells = labels * bins + values
+
+    def histogram(w: np.ndarray) -> np.ndarray:
+        counts = [np.bincount(c, w, n_strata * bins) for c in cells]
+        return np.stack(counts).reshape(len(values), n_strata, bins)
+
+    weighted = values * weights
+    return {
+        "n": np.bincount(labels, minlength=n_strata),
+        "sums": np.stack([np.bincount(labels, v, n_strata) for v in weighted]),
+        "squares": np.stack([np.bincount(labels, v * v, n_strata) for v in weighted]),
+        "histogram": histogram(weights),
+        "histogram_squares": histogram(weights**2),
+    }
+
+
+def _within_variance(totals: dict) -> np.ndarray:
+    """(values, strata) sample variance of each value inside each stratum."""
+    n = totals["n"]
+    mean = totals["sums"] / n
+    return (totals["squares"] - n * mean**2) / np.maximum(n - 1, 1)
+
+
+def summarize(name: str, totals: dict, weights: np.ndarray) -> dict:
+    """Stratified means and shares, each {"value", "low", "high"} at 95%."""
+    n = totals["n"]
+    result = {}
+    for i, value in enumerate(ANALYSES[name]["values"]):
+        mean = weights @ (totals["sums"][i] / n)
+        se = math.sqrt((weights**2) @ (_within_variance(totals)[i] / n))
+        shares = totals["histogram"][i] / n[:, None]
+        spread = np.maximum(totals["histogram_squares"][i] / n[:, None] - shares**2, 0)
+        share = weights @ shares
+        share_var = (weights**2 / np.maximum(n - 1, 1)) @ spread
+        top = np.flatnonzero(share).max() + 1
+        half = Z_95 * np.sqrt(share_var[:top])
+        result[value] = {
+            "mean": {
+                "value": float(mean),
+                "low": float(mean - Z_95 * se),
+                "high": float(mean + Z_95 * se),
+            },
+            "distribution": {
+                "value": share[:top].tolist(),
+                "low": np.maximum(share[:top] - half, 0).tolist(),
+                "high": np.minimum(share[:top] + half, 1).tolist(),
+            },
+        }
+    return result
+
+
+def _allocate(n_samples: int, weights: np.ndarray, spread: np.ndarray) -> np.ndarray:
+    """Samples per stratum: MIN_PER_STRATUM each, the rest by weight x spread."""
+    target = weights * spread
+    if target.sum() == 0:
+        target = weights
+    rest = max(n_samples - MIN_PER_STRATUM * len(weights), 0)
+    return MIN_PER_STRATUM + np.floor(rest * target / target.sum()).astype(np.int64)
+
+
+# ─── Estimation ─────────────────────────────────────────────────────────────
+def estimate(
+    name: str,
+    precision: float | None = None,
+    seconds: float | None = None,
+    max_samples: int | None = None,
+    seed: int = 0,
+    workers: int | None = None,
+    exact: bool = False,
+    cache: ResultCache | None = None,
+) -> dict:
+    """
+    Estimate an analysis (see ANALYSES) until the first stopping rule hits:
+    every mean's 95% half-width at most `precision`, `seconds` spent, or
+    `max_samples` drawn. exact=True enumerates instead.
+
+    Returns {"analysis", "exact", "samples", "rounds", "seconds", "values"},
+    where values maps each value name to its "mean" and "distribution"
+    (lists by score), each with "value", "low" and "high".
+    """
+    if name not in ANALYSES:
+        raise ValueError(f"unknown analysis: {name}")
+    analysis = ANALYSES[name]
+    started = time.perf_counter()
+    if exact:
+        if analysis["exact"] is None:
+            raise ValueError(f"{name} has no exact enumeration; give a precision")
+        values = {}
+        for value, distribution in analysis["exact"](cache).items():
+            total = sum(distribution.values())
+            shares = np.zeros(max(distribution) + 1)
+            for score, count in distribution.items():
+                shares[score] = count / total
+            mean = float(shares @ np.arange(len(shares)))
+            values[value] = {
+                "mean": {"value": mean, "low": mean, "high": mean},
+                "distribution": {
+                    key: shares.tolist() for key in ("value", "low", "high")
+                },
+            }
+        return {
+            "analysis": name,
+            "exact": True,
+            "samples": round(sum(distribution.values())),
+            "rounds": 0,
+            "seconds": time.perf_counter() - started,
+            "values": values,
+        }
+    if precision is None and seconds is None and max_samples is None:
+        raise ValueError("give a precision, a time budget or max_samples")
+
+    def compute() -> dict:
+        return _sample(name, precision, seconds, max_samples, seed, workers, cache)
+
+    if cache is None or seconds is not None:
+        totals = compute()
+    else:
+        params = {"analysis": name, "precision": precision, "max_samples": max_samples}
+        totals = cache.fetch("sample", {**params, "seed": seed}, compute)
+    _, weights = strata(analysis["size"])
+    return {
+        "analysis": name,
+        "exact": False,
+        "samples": int(np.sum(totals["n"])),
+        "rounds": int(totals["rounds"]),
+        "seconds": time.perf_counter() - started,
+        "values": summarize(name, totals, weights),
+    }
+
+
+def dealer_shows(cache: ResultCache | None = None) -> dict[str, np.ndarray]:
+    """
+    {"crib", "total"}: shares by score of the dealer's crib and of the
+    dealer's hand plus crib, from ENGINE_SAMPLES deals of the dealer analysis
+    (seed 0), for the engine tables; the 95% half-width of the crib mean is
+    about 0.003 points.
+    """
+    result = estimate("dealer", max_samples=ENGINE_SAMPLES, cache=cache)
+    shows = {}
+    for value, entry in result["values"].items():
+        shares = np.zeros(ANALYSES["dealer"]["bins"])
+        found = entry["distribution"]["value"]
+        shares[: len(found)] = found
+        shows[value] = shares
+    return shows
+
+
+def _sample(
+    name: str,
+    precision: float | None,
+    seconds: float | None,
+    max_samples: int | None,
+    seed: int,
+    workers: int | None,
+    cache: ResultCache | None = None,
+) -> dict:
+    """Run sampling rounds until a stopping rule hits; returns the merged totals."""
+    analysis = ANALYSES[name]
+    _, weights = strata(analysis["size"])
+    limit = max_samples or math.inf
+    allocation = _allocate(min(FIRST_ROUND, limit), weights, np.ones(len(weights)))
+    totals, round_, started = None, 0, time.perf_counter()
+    while True:
+        n_round = int(allocation.sum())
+        merged = run_sharded(
+            sample_shard,
+            n_round,
+            args=(name, allocation, seed, round_, cache),
+            n_shards=math.ceil(n_round / BATCH_SAMPLES),
+            workers=workers,
+        )
+        totals = (
+            merged if totals is None else {k: totals[k] + merged[k] for k in merged}
+        )
+        round_ += 1
+
+        n_total = int(totals["n"].sum())
+        spent = time.perf_counter() - started
+        spread = np.sqrt(_within_variance(totals))
+        n = totals["n"]
+        half = Z_95 * np.sqrt(((weights**2) * spread**2 / n).sum(axis=1))
+        if precision is not None and half.max() <= precision:
+            break
+        # Next round: double, but no more than the precision, time and sample
+        # budgets still need (a 1/sqrt(n) projection for the precision)
+        wanted = n_total
+        if precision is not None:
+            needed = n_total * (half.max() / precision) ** 2
+            wanted = min(wanted, math.ceil(1.1 * needed) - n_total)
+        if seconds is not None:
+            wanted = min(wanted, int((seconds - spent) * n_total / spent))
+        wanted = min(wanted, limit - n_total)
+        if wanted < MIN_PER_STRATUM * len(weights):
+            break
+        allocation = _allocate(wanted, weights, spread.mean(axis=0))
+    totals["rounds"] = np.array(round_)
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("analysis", nargs="?", choices=ANALYSES, default="hand")
+    parser.add_argument("--seconds", type=float, default=None, help="time budget")
+    parser.add_argument("--precision", type=float, default=None, help="95%% half-width")
+    parser.add_argument("--max-samples", type=int, default=None)
+    parser.add_argument("--exact", action="store_true", help="enumerate instead")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    if not (args.exact or args.precision or args.max_samples):
+        args.seconds = args.seconds or 60
+
+    result = estimate(
+        args.analysis,
+        precision=args.precision,
+        seconds=args.seconds,
+        max_samples=args.max_samples,
+        seed=args.seed,
+        workers=args.workers,
+        exact=args.exact,
+        cache=ResultCache(),
+    )
+    how = "exact" if result["exact"] else f"{result['rounds']} rounds"
+    print(
+        f"\n{args.analysis}: {result['samples']:,} samples ({how}) "
+        f"in {result['seconds']:.1f}s\n"
+    )
+    for value, entry in result["values"].items():
+        mean = entry["mean"]
+        print(
+            f"  {value:<8} mean {mean['value']:.4f}  "
+            f"[{mean['low']:.4f}, {mean['high']:.4f}]"
+        )
+        distribution = entry["distribution"]
+        for score, share in enumerate(distribution["value"]):
+            if share:
+                print(
+                    f"    {score:>3} {share:>8.3%}  [{distribution['low'][score]:.3%}, "
+                    f"{distribution['high'][score]:.3%}]"
+                )
+    print()
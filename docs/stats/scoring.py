@@ -0,0 +1,220 @@
+"""
+Batched cribbage hand scoring for the statistics tooling.
+
+Fifteens, pairs and runs depend only on the ranks of the 5 cards, and there
+are only 6,175 five-card rank multisets. They are scored once, with the
+direct array implementations below, into a lookup table keyed by a packed
+rank-multiset index and cached on disk under a digest of the scorer
+sources. score_batch() then scores any number
+of hands with one gather into that table plus a cheap suit-aware correction
+for flush and nobs. Rules follow src/engine/scoring.ts exactly.
+
+Hands of other sizes (the 3-card hands of five-card cribbage, see
+variants.py) skip the table and use the direct scorers, which take any
+number of cards; a hand flush then scores the hand size, plus one with the
+starter.
+"""
+
+import hashlib
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+from math import comb
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from cards import JACK, PIP_VALUES, card_rank, card_suit
+
+MAX_SCORE = 29
+COMPONENTS = ("Fifteens", "Pairs", "Runs", "Flush", "Nobs")
+RANK_COMPONENTS = 3  # fifteens, pairs, runs
+
+# The rules the scorers below implement; part of every cached result's key
+SCORING_RULES = {
+    "fifteen_points": 2,
+    "pair_points": 2,
+    "min_run": 3,
+    # Keyed by hand size: the 3-card hand of the five-card variant scores 3/4
+    "hand_flush": {4: [4, 5], 3: [3, 4]},
+    "crib_flush": [5],
+    "nobs_points": 1,
+}
+
+STATS_DIR = Path(__file__).resolve().parent
+CACHE_DIR = STATS_DIR / ".cache"
+# Sources the rank table is built from; its file is keyed by their digest
+RANK_TABLE_SOURCES = ("cards.py", "scoring.py")
+
+
+@lru_cache(maxsize=None)
+def _file_digest(sources: tuple[str, ...]) -> str:
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update((STATS_DIR / source).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def source_digest(sources: Iterable[str]) -> str:
+    """Digest of the named files under docs/stats, independent of their order."""
+    return _file_digest(tuple(sorted(set(sources))))
+
+
+@lru_cache(maxsize=None)
+def _subsets(n: int) -> np.ndarray:
+    """Every subset of n cards with at least 2 members, as an (n, k) 0/1 matrix."""
+    masks = [mask for mask in range(1 << n) if mask & (mask - 1)]
+    return np.array(
+        [[(mask >> i) & 1 for i in range(n)] for mask in masks], dtype=np.float32
+    ).T
+
+
+@lru_cache(maxsize=None)
+def _pair_index(n: int) -> np.ndarray:
+    return np.array(list(combinations(range(n), 2)), dtype=np.intp)
+
+
+# _BINOMIAL[n, k] = C(n, k), for ranking sorted rank multisets
+_BINOMIAL = np.array([[comb(n, k) for k in range(6)] for n in range(18)], np.int32)
+RANK_TABLE_SIZE = comb(13 + 5 - 1, 5)  # 6,188 slots; 13 five-of-a-kind stay 0
+
+
+# ─── Direct Rank Scoring ────────────────────────────────────────────────────
+def score_fifteens(ranks: np.ndarray) -> np.ndarray:
+    """2 points per subset of the cards summing to 15."""
+    values = PIP_VALUES[ranks].astype(np.float32)
+    sums = values @ _subsets(ranks.shape[1])
+    return (sums == 15).sum(axis=1, dtype=np.int16) * 2
+
+
+def score_pairs(ranks: np.ndarray) -> np.ndarray:
+    """2 points per pair of cards with matching rank."""
+    pairs = _pair_index(ranks.shape[1])
+    matches = ranks[:, pairs[:, 0]] == ranks[:, pairs[:, 1]]
+    return matches.sum(axis=1, dtype=np.int16) * 2
+
+
+def score_runs(ranks: np.ndarray) -> np.ndarray:
+    """
+    Longest maximal run of 3+ consecutive ranks times the product of the
+    multiplicities of its ranks (double/triple/double-double runs).
+    Five or fewer cards can hold at most one such run.
+    """
+    counts = (ranks[:, :, None] == np.arange(13, dtype=ranks.dtype)).sum(
+        axis=1, dtype=np.int16
+    )
+    present = counts > 0
+    padded = np.pad(present, ((0, 0), (1, 1)))
+    runs = np.zeros(len(ranks), dtype=np.int16)
+    for length in (5, 4, 3):
+        for start in range(13 - length + 1):
+            window = present[:, start : start + length].all(axis=1)
+            # Maximal: the ranks just outside the window are absent
+            window &= ~padded[:, start] & ~padded[:, start + length + 1]
+            if not window.any():
+                continue
+            multiplier = counts[window, start : start + length].prod(axis=1)
+            runs[window] = length * multiplier
+    return runs
+
+
+# ─── Suit-Aware Correction ──────────────────────────────────────────────────
+def score_flush(hands: np.ndarray, starters: np.ndarray, is_crib: bool) -> np.ndarray:
+    """
+    Hand: one point per card (4, or 5 with the starter; 3 or 4 for a 3-card
+    hand). Crib: only all 5 of one suit scores.
+    """
+    size = hands.shape[1]
+    suits = card_suit(hands)
+    hand_flush = (suits == suits[:, :1]).all(axis=1)
+    starter_match = card_suit(starters) == suits[:, 0]
+    if is_crib:
+        return np.where(hand_flush & starter_match, size + 1, 0).astype(np.int16)
+    flush = np.where(starter_match, size + 1, size)
+    return np.where(hand_flush, flush, 0).astype(np.int16)
+
+
+def score_nobs(hands: np.ndarray, starters: np.ndarray) -> np.ndarray:
+    """1 point for a Jack in hand matching the starter suit."""
+    nob = (card_rank(hands) == JACK) & (
+        card_suit(hands) == card_suit(starters)[:, None]
+    )
+    return nob.any(axis=1).astype(np.int16)
+
+
+# ─── Rank-Multiset Table ────────────────────────────────────────────────────
+def rank_index(ranks: np.ndarray) -> np.ndarray:
+    """
+    Packed index of each row's 5-rank multiset, in [0, RANK_TABLE_SIZE).
+
+    Sorted ranks r0 <= .. <= r4 become the strictly increasing r_i + i, whose
+    colexicographic rank sum(C(r_i + i, i + 1)) is a dense combination index.
+    """
+    ordered = np.sort(ranks, axis=1).astype(np.intp) + np.arange(5)
+    return _BINOMIAL[ordered, np.arange(1, 6)].sum(axis=1)
+
+
+def build_rank_table() -> np.ndarray:
+    """Score every 5-card rank multiset directly: (RANK_TABLE_SIZE, 3) uint8."""
+    multisets = np.array(
+        [m for m in combinations_with_replacement(range(13), 5) if len(set(m)) > 1],
+        dtype=np.uint8,
+    )
+    table = np.zeros((RANK_TABLE_SIZE, RANK_COMPONENTS), dtype=np.uint8)
+    table[rank_index(multisets)] = np.stack(
+        [score_fifteens(multisets), score_pairs(multisets), score_runs(multisets)],
+        axis=1,
+    )
+    return table
+
+
+@lru_cache(maxsize=1)
+def rank_table() -> np.ndarray:
+    """
+    The rank-multiset table, built on first use and cached to disk under a
+    digest of RANK_TABLE_SOURCES, so changing a scorer rebuilds it.
+    """
+    path = CACHE_DIR / f"rank_table-{source_digest(RANK_TABLE_SOURCES)}.npy"
+    if path.exists():
+        return np.load(path)
+    table = build_rank_table()
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for old in CACHE_DIR.glob("rank_table*.npy"):
+        old.unlink()
+    np.save(path, table)
+    return table
+
+
+# ─── Batched Scoring ────────────────────────────────────────────────────────
+def score_batch(
+    hands: np.ndarray, starters: np.ndarray, is_crib: bool = False
+) -> np.ndarray:
+    """
+    Score many hands at once.
+
+    Args:
+        hands: (M, 4) card ids (other hand sizes are scored directly)
+        starters: (M,) card ids
+        is_crib: apply the crib-only 5-card flush rule
+
+    Returns:
+        (M, 5) int16 array of component points in COMPONENTS order.
+    """
+    ranks = card_rank(np.concatenate([hands, starters[:, None]], axis=1))
+    points = np.empty((len(hands), len(COMPONENTS)), dtype=np.int16)
+    if ranks.shape[1] == 5:
+        points[:, :RANK_COMPONENTS] = rank_table()[rank_index(ranks)]
+    else:
+        points[:, 0] = score_fifteens(ranks)
+        points[:, 1] = score_pairs(ranks)
+        points[:, 2] = score_runs(ranks)
+    points[:, 3] = score_flush(hands, starters, is_crib)
+    points[:, 4] = score_nobs(hands, starters)
+    return points
+
+
+def score_totals(
+    hands: np.ndarray, starters: np.ndarray, is_crib: bool = False
+) -> np.ndarray:
+    """(M,) int16 total score of each hand."""
+    return score_batch(hands, starters, is_crib).sum(axis=1, dtype=np.int16)
@@ -0,0 +1,160 @@
+"""
+Multiprocess sharded enumeration with checkpoint/resume.
+
+The combination space [0, n_items) is split into deterministic contiguous
+shards. Each shard runs `task(start, stop, *args)` — a module-level function
+returning a dict of NumPy arrays (partial histograms, totals) — on a
+ProcessPoolExecutor sized to the machine. With a run directory, every
+finished shard is written to disk atomically, so an interrupted run resumes
+from the shards already completed; the run is identified by the task, its
+arguments and the engine code (cache.engine_fingerprint plus a digest of the
+task's own module), so shards left by older code are never resumed. Partial
+results are merged by summing (or concatenating) in shard order, which gives
+the same answer as a single-process run.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from cache import engine_fingerprint
+
+DEFAULT_SHARDS = 64
+
+
+def shard_bounds(n_items: int, n_shards: int) -> list[tuple[int, int]]:
+    """Split [0, n_items) into n_shards contiguous, near-equal ranges."""
+    n_shards = max(1, min(n_shards, n_items))
+    edges = np.linspace(0, n_items, n_shards + 1).astype(np.int64)
+    return [(int(lo), int(hi)) for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def _run_shard(task: Callable, index: int, start: int, stop: int, args: tuple):
+    return index, task(start, stop, *args)
+
+
+def _source_digest(task: Callable) -> str:
+    """Digest of the source file that defines the task."""
+    source = Path(inspect.getsourcefile(task)).read_bytes()
+    return hashlib.sha256(source).hexdigest()[:12]
+
+
+def _shard_path(run_dir: Path, index: int) -> Path:
+    return run_dir / f"shard_{index:05d}.npz"
+
+
+def _save_shard(run_dir: Path, index: int, result: dict) -> None:
+    path = _shard_path(run_dir, index)
+    tmp = path.with_suffix(".tmp.npz")
+    np.savez(tmp, **result)
+    os.replace(tmp, path)
+
+
+def _load_shard(run_dir: Path, index: int) -> dict:
+    with np.load(_shard_path(run_dir, index)) as data:
+        return {key: data[key] for key in data.files}
+
+
+def _prepare_run_dir(run_dir: Path, signature: dict) -> None:
+    """Create the run directory, or check an existing one belongs to this run."""
+    run_dir.mkdir(parents=True, exist_ok=True)
+    manifest = run_dir / "manifest.json"
+    if manifest.exists():
+        recorded = json.loads(manifest.read_text())
+        if recorded != signature:
+            raise ValueError(
+                f"{run_dir} holds shards from a different run: {recorded} != {signature}"
+            )
+        return
+    manifest.write_text(json.dumps(signature, indent=2))
+
+
+def merge(results: list[dict]) -> dict:
+    """Sum partial results key by key, in the order given."""
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            merged[key] = merged[key] + value if key in merged else value.copy()
+    return merged
+
+
+def concatenate(results: list[dict]) -> dict:
+    """Join per-shard row blocks key by key, in shard order."""
+    return {key: np.concatenate([r[key] for r in results]) for key in results[0]}
+
+
+def run_sharded(
+    task: Callable,
+    n_items: int,
+    args: tuple = (),
+    n_shards: int = DEFAULT_SHARDS,
+    workers: int | None = None,
+    run_dir: Path | str | None = None,
+    progress: bool = False,
+    combine: Callable[[list[dict]], dict] = merge,
+) -> dict:
+    """
+    Run `task` over [0, n_items) in shards and merge the partial results.
+
+    Args:
+        task: picklable module-level function (start, stop, *args) -> dict of arrays
+        n_items: size of the combination space
+        args: extra picklable arguments passed to every shard
+        n_shards: number of shards; fixed per run so checkpoints stay valid
+        workers: process count (default: os.cpu_count()); 1 runs in-process
+        run_dir: checkpoint directory; completed shards found there are reused
+        progress: print one line per completed shard
+        combine: how to join partial results (default: sum; see concatenate)
+    """
+    bounds = shard_bounds(n_items, n_shards)
+    workers = workers or default_workers()
+    results: dict[int, dict] = {}
+
+    if run_dir is not None:
+        run_dir = Path(run_dir)
+        signature = {
+            "task": f"{task.__module__}.{task.__qualname__}",
+            "n_items": n_items,
+            "n_shards": len(bounds),
+            "args": repr(args),
+            "engine": engine_fingerprint(),
+            "source": _source_digest(task),
+        }
+        _prepare_run_dir(run_dir, signature)
+        for index in range(len(bounds)):
+            if _shard_path(run_dir, index).exists():
+                results[index] = _load_shard(run_dir, index)
+        if progress and results:
+            print(f"  resuming: {len(results)}/{len(bounds)} shards already done")
+
+    pending = [i for i in range(len(bounds)) if i not in results]
+
+    def finish(index: int, result: dict) -> None:
+        results[index] = result
+        if run_dir is not None:
+            _save_shard(run_dir, index, result)
+        if progress:
+            print(f"  shard {index + 1}/{len(bounds)} done ({len(results)} total)")
+
+    if workers == 1 or len(pending) <= 1:
+        for index in pending:
+            finish(index, task(*bounds[index], *args))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = [
+                pool.submit(_run_shard, task, i, *bounds[i], args) for i in pending
+            ]
+            for future in as_completed(futures):
+                finish(*future.result())
+
+    return combine([results[i] for i in range(len(bounds))])
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from accumulators import Histogram, component_histograms, pack, unpack
+
+
+def _filled(seed: int, weighted: bool) -> Histogram:
+    rng = np.random.default_rng(seed)
+    histogram = Histogram((7, 5))
+    values = rng.integers(0, 9, (2, 500))  # some land past the last bin
+    weights = rng.integers(1, 20, 500) if weighted else None
+    histogram.add(*values, weights=weights)
+    return histogram
+
+
+def _assert_same(first: Histogram, second: Histogram) -> None:
+    for key, value in first.arrays().items():
+        np.testing.assert_array_equal(value, second.arrays()[key])
+
+
+@pytest.mark.parametrize("weighted", [False, True])
+def test_merge_is_associative_and_commutative(weighted):
+    # merge folds into the receiver, so each grouping starts from fresh copies
+    def part(seed: int) -> Histogram:
+        return _filled(seed, weighted)
+
+    left = part(0).merge(part(1)).merge(part(2))
+    _assert_same(left, part(0).merge(part(1).merge(part(2))))
+    _assert_same(left, part(2).merge(part(0)).merge(part(1)))
+
+
+def test_merge_equals_a_single_pass():
+    rng = np.random.default_rng(3)
+    values = rng.integers(0, 9, (2, 900))
+    whole = Histogram((7, 5))
+    whole.add(*values)
+    parts = [Histogram((7, 5)) for _ in range(3)]
+    for part, chunk in zip(parts, np.array_split(values, 3, axis=1)):
+        part.add(*chunk)
+    _assert_same(parts[0].merge(parts[1]).merge(parts[2]), whole)
+
+
+def test_merge_rejects_other_bins():
+    with pytest.raises(ValueError):
+        Histogram((3,)).merge(Histogram((4,)))
+
+
+def test_pack_round_trips():
+    histograms = {"first": _filled(0, False), "second": _filled(1, True)}
+    restored = unpack(pack(histograms))
+    for name, histogram in histograms.items():
+        _assert_same(restored[name], histogram)
+
+
+def test_canonical_matches_full_row_bins():
+    canonical = component_histograms(canonical=True)
+    full = component_histograms(canonical=False)
+    assert canonical.keys() == full.keys()
+    for name in canonical:
+        _assert_same(canonical[name], full[name])
@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pytest
+
+from cache import ResultCache, cache_key, engine_fingerprint
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResultCache:
+    return ResultCache(tmp_path, max_bytes=1 << 20)
+
+
+def _arrays(size: int) -> dict:
+    return {"values": np.arange(size, dtype=np.uint8)}
+
+
+def _age(cache: ResultCache, name: str, params: dict, seconds: float) -> None:
+    path = cache._path(name, params)
+    stamp = path.stat().st_mtime - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def test_fetch_computes_once_then_hits(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return _arrays(10)
+
+    first = cache.fetch("result", {"n": 1}, compute)
+    second = cache.fetch("result", {"n": 1}, compute)
+    assert len(calls) == 1
+    assert np.array_equal(first["values"], second["values"])
+    assert isinstance(second["values"], np.memmap)
+    assert cache.hits == ["result"] and cache.misses == ["result"]
+
+
+def test_keys_separate_names_and_params():
+    assert cache_key("a", {"n": 1}) != cache_key("a", {"n": 2})
+    assert cache_key("a", {"n": 1}) != cache_key("b", {"n": 1})
+    assert cache_key("a", {"n": 1, "m": 2}) == cache_key("a", {"m": 2, "n": 1})
+
+
+def test_fingerprints_follow_each_result_sources():
+    assert engine_fingerprint("peg_risk") != engine_fingerprint("scores")
+    assert engine_fingerprint("unlisted") == engine_fingerprint()
+
+
+def test_evicts_least_recently_used_first(cache):
+    for n, seconds in ((1, 300), (2, 200), (3, 100)):
+        cache.store("result", {"n": n}, _arrays(300_000))
+        _age(cache, "result", {"n": n}, seconds)
+    # Reading the oldest entry makes it the most recently used
+    assert cache.load("result", {"n": 1}) is not None
+    cache.store("result", {"n": 4}, _arrays(300_000))
+    kept = {entry["params"]["n"] for entry in cache.entries()}
+    assert kept == {1, 3, 4}
+    assert sum(entry["bytes"] for entry in cache.entries()) <= cache.max_bytes
+
+
+def test_keeps_the_new_entry_even_when_it_alone_is_too_big(cache):
+    cache.store("result", {"n": 1}, _arrays(10))
+    cache.store("result", {"n": 2}, _arrays(2 << 20))
+    assert [entry["params"]["n"] for entry in cache.entries()] == [2]
+
+
+def test_invalidate_by_name_and_all(cache):
+    cache.store("a", {"n": 1}, _arrays(10))
+    cache.store("a", {"n": 2}, _arrays(10))
+    cache.store("b", {"n": 1}, _arrays(10))
+    assert cache.invalidate("a") == 2
+    assert cache.load("a", {"n": 1}) is None
+    assert cache.load("b", {"n": 1}) is not None
+    assert cache.invalidate() == 1
+    assert cache.entries() == []
+
+
+def test_disabled_cache_always_computes(tmp_path):
+    cache = ResultCache(tmp_path, enabled=False)
+    cache.fetch("result", {}, lambda: _arrays(10))
+    assert cache.load("result", {}) is None
+    assert not any(tmp_path.iterdir())
@@ -0,0 +1,83 @@
+import csv
+import json
+
+import pytest
+
+from export import EXPORT_DIR, FORMATS
+from generate_charts import EXPORTS, OUTPUT_DIR, parse_args, write_export
+from percentiles import Percentiles
+from win_prob import read_typescript
+
+
+def test_bare_options_run_the_charts_command():
+    for argv in ([], ["--force"], ["--only", "rarity_scale", "--offline"]):
+        args, _ = parse_args(argv)
+        assert args.command == "charts"
+    args, _ = parse_args(["--only", "rarity_scale", "even_odd", "--workers", "2"])
+    assert args.only == ["rarity_scale", "even_odd"] and args.workers == 2
+    assert args.output_dir == OUTPUT_DIR and not args.dashboard
+
+
+def test_compute_takes_the_cache_and_profile_options():
+    args, _ = parse_args(["compute", "--no-cache", "--profile"])
+    assert (args.command, args.no_cache, args.profile) == ("compute", True, True)
+    assert args.cprofile is None
+
+
+def test_query_options():
+    argv = ["query", "--hold", "5", "--hold", "J", "--starter", "5", "--at-least", "12"]
+    args, _ = parse_args(argv)
+    assert args.hold == ["5", "J"] and args.starter == "5"
+    assert args.at_least == 12 and args.without == [] and not args.crib
+    with pytest.raises(SystemExit):
+        parse_args(["query", "--profile"])
+
+
+def test_export_options(tmp_path):
+    args, _ = parse_args(["export", "--only", "crib", "keeps", "--format", "csv"])
+    assert args.only == ["crib", "keeps"] and args.format == "csv"
+    assert args.rows is None
+    args, _ = parse_args(["export", "--rows"])
+    assert args.rows == EXPORT_DIR and args.only is None
+    args, _ = parse_args(
+        ["export", "--rows", str(tmp_path), "--rows-format", FORMATS[0]]
+    )
+    assert args.rows == tmp_path and args.rows_format == FORMATS[0]
+    for argv in (["export", "--only", "unknown"], ["export", "--format", "xml"]):
+        with pytest.raises(SystemExit):
+            parse_args(argv)
+
+
+@pytest.fixture(scope="module")
+def stats() -> dict:
+    return {
+        "distribution": {0: 3, 2: 1},
+        "total": 4,
+        "component_averages": {"Fifteens": 0.5},
+        "avg_score": 0.5,
+        "crib": {},
+        "percentiles": Percentiles().tables,
+        "win_probability": read_typescript().round(4).tolist(),
+    }
+
+
+@pytest.mark.parametrize("fmt", ["json", "csv"])
+def test_export_columns_match_the_rows(tmp_path, stats, fmt):
+    names = ["distribution", "components", "percentiles", "win_probability"]
+    for path, name in zip(write_export(stats, names, tmp_path, fmt), names):
+        columns = list(EXPORTS[name][1])
+        if fmt == "json":
+            rows = json.loads(path.read_text())
+            assert rows and all(list(row) == columns for row in rows)
+        else:
+            with path.open(newline="") as f:
+                reader = csv.DictReader(f)
+                assert reader.fieldnames == columns
+                assert len(list(reader)) == len(EXPORTS[name][0](stats))
+
+
+def test_empty_table_writes_a_header_only(tmp_path, stats):
+    (path,) = write_export(stats, ["crib"], tmp_path, "csv")
+    assert path.read_text().splitlines() == [",".join(EXPORTS["crib"][1])]
+    (path,) = write_export(stats, ["crib"], tmp_path, "json")
+    assert json.loads(path.read_text()) == []
@@ -0,0 +1,54 @@
+from itertools import combinations
+from math import comb
+
+import numpy as np
+import pytest
+
+from cards import DECK_SIZE, combination_index
+from crib_policy import class_sizes, crib_weights, discard_frequencies, pair_class
+from enumeration import enumerate_scores, summarize
+
+
+def test_pair_classes_count_every_card_pair():
+    pairs = np.array(list(combinations(range(DECK_SIZE), 2)))
+    classes = pair_class(pairs[:, 0], pairs[:, 1])
+    sizes = np.bincount(classes, minlength=len(class_sizes()))
+    assert np.array_equal(sizes, class_sizes())
+    assert class_sizes().sum() == comb(DECK_SIZE, 2)
+
+
+def test_discard_frequencies_are_probabilities():
+    frequencies = discard_frequencies("optimal")
+    assert (frequencies >= 0).all()
+    np.testing.assert_allclose((frequencies * class_sizes()).sum(axis=1), 1.0)
+
+
+def test_crib_weights_follow_the_pair_splits():
+    pone, dealer = discard_frequencies("optimal")
+    weights = crib_weights("optimal")
+    assert weights.mean() == pytest.approx(1.0)
+    rng = np.random.default_rng(13)
+    cribs = np.array([rng.choice(DECK_SIZE, 4, replace=False) for _ in range(50)])
+    direct = np.zeros(len(cribs))
+    for (a, b), (c, d) in [((0, 1), (2, 3)), ((0, 2), (1, 3)), ((0, 3), (1, 2))]:
+        x = pair_class(cribs[:, a], cribs[:, b])
+        y = pair_class(cribs[:, c], cribs[:, d])
+        direct += dealer[x] * pone[y] + pone[x] * dealer[y]
+    rows = combination_index(np.sort(cribs, axis=1))
+    ratio = weights[rows] / direct
+    np.testing.assert_allclose(ratio, ratio[0])
+
+
+def test_random_crib_differs_from_the_hand_only_in_flushes():
+    hand = enumerate_scores()["component_totals"]
+    crib = enumerate_scores(is_crib=True)["component_totals"]
+    assert {k: v for k, v in crib.items() if k != "Flush"} == {
+        k: v for k, v in hand.items() if k != "Flush"
+    }
+    # Only a crib matching the starter's suit scores: 4 suits x C(13, 4) x 9 x 5
+    assert crib["Flush"] == 4 * comb(13, 4) * 9 * 5
+
+
+def test_policy_crib_average():
+    _, _, average = summarize(enumerate_scores(is_crib=True, policy="optimal"))
+    assert average == pytest.approx(4.5613, abs=1e-4)
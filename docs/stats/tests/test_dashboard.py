@@ -0,0 +1,68 @@
+import json
+import re
+
+import pytest
+
+import generate_charts
+from dashboard import BUNDLE_NAME, DASHBOARD_NAME, figure_script_path
+from generate_charts import build_charts, select_charts
+from manifest import BuildManifest
+from percentiles import Percentiles
+from win_prob import read_typescript
+
+pytest.importorskip("plotly")
+
+CHARTS = ["cumulative_probability", "win_probability"]
+UUID = re.compile(r"[0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}")
+
+
+def _page(path) -> str:
+    """Chart page with plotly's random div ids blanked."""
+    return UUID.sub("", path.read_text())
+
+
+@pytest.fixture
+def stats() -> dict:
+    return {
+        "percentiles": Percentiles().tables,
+        "win_probability": read_typescript().round(4).tolist(),
+    }
+
+
+@pytest.fixture(autouse=True)
+def manifest(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    monkeypatch.setattr(generate_charts, "BuildManifest", lambda: BuildManifest(path))
+
+
+def test_dashboard_holds_only_the_selected_charts(tmp_path, stats):
+    output = tmp_path / "out"
+    charts = select_charts(CHARTS[:1])
+    build_charts(stats, dashboard=True, workers=1, output_dir=output, charts=charts)
+    page = (output / DASHBOARD_NAME).read_text()
+    assert 'data-figure="cumulative_probability"' in page
+    assert 'data-figure="win_probability"' not in page
+    script = figure_script_path(output, "cumulative_probability.html").read_text()
+    assert script.startswith('window.showFigure("cumulative_probability", ')
+    figure = json.loads(script[script.index(", ") + 2 : script.rindex(");")])
+    assert figure["data"]
+
+
+def test_offline_pages_share_one_bundle(tmp_path, stats):
+    output = tmp_path / "out"
+    charts = select_charts(CHARTS)
+    build_charts(stats, offline=True, workers=1, output_dir=output, charts=charts)
+    assert (output / BUNDLE_NAME).exists()
+    for name in CHARTS:
+        page = (output / f"{name}.html").read_text()
+        assert f'src="{BUNDLE_NAME}"' in page
+        assert "cdn.plot.ly" not in page
+
+
+def test_pool_renders_the_same_charts_as_one_process(tmp_path, stats):
+    charts = select_charts(CHARTS)
+    serial, pooled = tmp_path / "serial", tmp_path / "pooled"
+    assert build_charts(stats, workers=1, output_dir=serial, charts=charts) == (2, 0)
+    assert build_charts(stats, workers=2, output_dir=pooled, charts=charts) == (2, 0)
+    for name in CHARTS:
+        assert _page(serial / f"{name}.html") == _page(pooled / f"{name}.html")
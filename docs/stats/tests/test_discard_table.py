@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from cache import engine_fingerprint
+from discard_table import (
+    INDEX_PATH,
+    RECORDS_PATH,
+    DiscardTable,
+    discard_table,
+    option_values,
+)
+
+
+@pytest.fixture(scope="module")
+def table() -> DiscardTable:
+    return discard_table()
+
+
+def _random_deals(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((n, 52)), axis=1)[:, :6].astype(np.uint8)
+
+
+@pytest.mark.parametrize("is_dealer", [False, True])
+def test_best_keeps_matches_lookup(table, is_dealer):
+    deals = _random_deals(2000, seed=6)
+    keeps = table.best_keeps(deals, is_dealer)
+    for deal, keep in zip(deals, keeps):
+        result = table.lookup(deal.tolist(), is_dealer)
+        if sorted(result["keep"]) != sorted(keep.tolist()):
+            # Options within a milli-point of each other tie after rounding
+            values = {
+                tuple(sorted(o["keep"])): o["expected_value"] for o in result["options"]
+            }
+            assert values[tuple(sorted(keep.tolist()))] == result["expected_value"]
+
+
+@pytest.mark.parametrize("is_dealer", [False, True])
+def test_lookup_matches_direct_option_values(table, is_dealer):
+    deals = _random_deals(500, seed=7)
+    hand_ev, crib_ev = option_values(deals)
+    direct = hand_ev + crib_ev if is_dealer else hand_ev - crib_ev
+    for deal, values in zip(deals, direct):
+        result = table.lookup(deal.tolist(), is_dealer)
+        assert result["expected_value"] == pytest.approx(values.max(), abs=1e-3)
+        assert len(result["options"]) == 15
+
+
+def test_files_are_named_by_the_engine_fingerprint():
+    fingerprint = engine_fingerprint("discard_table")
+    assert RECORDS_PATH.name == f"discard_table-{fingerprint}.records"
+    assert INDEX_PATH.name == f"discard_table-{fingerprint}.index"
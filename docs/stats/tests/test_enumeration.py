@@ -0,0 +1,29 @@
+import pytest
+
+from enumeration import enumerate_scores
+from generate_charts import AVG_SCORE, COMPONENT_AVERAGES, DISTRIBUTION, TOTAL
+
+
+@pytest.mark.parametrize("is_crib", [False, True])
+def test_canonical_matches_full_enumeration(is_crib):
+    canonical = enumerate_scores(is_crib=is_crib, canonical=True)
+    full = enumerate_scores(is_crib=is_crib, canonical=False)
+    assert canonical == full
+
+
+def test_hand_enumeration_matches_reference():
+    result = enumerate_scores()
+    assert result["total"] == TOTAL
+    assert result["distribution"] == DISTRIBUTION
+    for name, average in COMPONENT_AVERAGES.items():
+        assert result["component_totals"][name] / TOTAL == pytest.approx(
+            average, abs=5e-5
+        )
+    mean = sum(result["component_totals"].values()) / TOTAL
+    assert mean == pytest.approx(AVG_SCORE, abs=5e-5)
+
+
+def test_policy_crib_weights_keep_the_total():
+    result = enumerate_scores(is_crib=True, policy="optimal")
+    assert result["total"] == TOTAL
+    assert sum(result["distribution"].values()) == pytest.approx(TOTAL)
@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pytest
+
+import export
+from cards import all_hands, starters_for
+from export import COLUMNS, export_rows, read_rows
+from scoring import score_batch
+
+HANDS = 1000
+
+
+@pytest.fixture
+def small(monkeypatch):
+    """Export only the first HANDS hands, over several chunks."""
+    hands = all_hands()[:HANDS]
+    monkeypatch.setattr(export, "all_hands", lambda: hands)
+    monkeypatch.setattr(export, "CHUNK_HANDS", 300)
+    return hands
+
+
+def _expected(hands: np.ndarray, is_crib: bool) -> dict:
+    starters = starters_for(hands).ravel()
+    rows = np.repeat(hands, 48, axis=0)
+    points = score_batch(rows, starters, is_crib)
+    columns = {f"hand{i}": rows[:, i] for i in range(4)}
+    columns["starter"] = starters
+    columns["total"] = points.sum(axis=1)
+    for i, name in enumerate(("fifteens", "pairs", "runs", "flush", "nobs")):
+        columns[name] = points[:, i]
+    return columns
+
+
+@pytest.mark.parametrize("is_crib", [False, True])
+def test_npy_round_trip(tmp_path, small, is_crib):
+    path = export_rows(tmp_path, "npy", is_crib)
+    assert path.name == export.export_name(is_crib)
+    schema = json.loads((path / "schema.json").read_text())
+    assert schema["rows"] == HANDS * 48 and schema["is_crib"] == is_crib
+    rows = read_rows(path)
+    assert list(rows) == list(COLUMNS)
+    expected = _expected(small, is_crib)
+    for name in COLUMNS:
+        assert isinstance(rows[name], np.memmap)
+        assert np.array_equal(rows[name], expected[name])
+
+
+def test_read_selected_columns(tmp_path, small):
+    path = export_rows(tmp_path, "npy")
+    rows = read_rows(path, ["total", "hand0"])
+    assert list(rows) == ["total", "hand0"]
+    with pytest.raises(ValueError):
+        read_rows(path, ["total", "score"])
+
+
+def test_parquet_round_trip(tmp_path, small):
+    pytest.importorskip("pyarrow")
+    path = export_rows(tmp_path, "parquet")
+    rows = read_rows(path)
+    expected = _expected(small, False)
+    for name in COLUMNS:
+        assert np.array_equal(rows[name], expected[name])
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+import pytest
+
+from game_sim import (
+    WIN_SCORE,
+    games_for_margin,
+    play_hand,
+    simulate_games,
+    wilson_interval,
+)
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert (low, high) == pytest.approx((0.4038, 0.5962), abs=1e-4)
+    low, high = wilson_interval(0, 20)
+    assert low == pytest.approx(0.0, abs=1e-12) and 0 < high < 0.2
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_games_for_margin():
+    n = games_for_margin(0.01)
+    low, high = wilson_interval(n // 2, n)
+    assert (high - low) / 2 <= 0.01
+    assert n == math.ceil((1.959964 * 0.5 / 0.01) ** 2)
+
+
+def test_hands_stop_once_a_player_reaches_121():
+    rng = np.random.default_rng(17)
+    start = np.full((2000, 2), WIN_SCORE - 3)
+    scores = play_hand(start, ("random", "random"), rng)
+    assert (scores >= start).all()
+    assert not (scores >= WIN_SCORE).all(axis=1).any()
+
+
+def test_results_depend_on_the_seed_not_the_workers():
+    one = simulate_games(3000, "random", "random", seed=5, workers=1)
+    two = simulate_games(3000, "random", "random", seed=5, workers=2)
+    assert one == two
+    assert simulate_games(3000, "random", "random", seed=6, workers=1) != one
+
+
+def test_match_counts_are_consistent():
+    result = simulate_games(3000, "random", "random", seed=5, workers=1)
+    assert result["a"]["win"]["rate"] + result["b"]["win"]["rate"] == pytest.approx(1)
+    for player in ("a", "b"):
+        entry = result[player]
+        assert entry["double_skunk"]["rate"] <= entry["skunk"]["rate"]
+        assert entry["skunk"]["rate"] <= entry["win"]["rate"]
+    # Alternating deals make a mirror match fair
+    assert result["a"]["win"]["low"] < 0.5 < result["a"]["win"]["high"]
+
+
+def test_optimal_beats_random():
+    result = simulate_games(400, "optimal", "random", seed=1, workers=1)
+    assert result["a"]["win"]["low"] > 0.9
+    with pytest.raises(ValueError):
+        simulate_games(10, "optimal", "unknown")
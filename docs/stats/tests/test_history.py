@@ -0,0 +1,123 @@
+import csv
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from history import (
+    BINS,
+    COLUMNS,
+    SOURCES,
+    PlayerHistograms,
+    aggregate,
+    compare,
+    open_export,
+    write_sample_export,
+)
+from scoring import MAX_SCORE
+
+
+@pytest.fixture(scope="module")
+def export(tmp_path_factory):
+    """The same synthetic export as SQLite, CSV and JSONL."""
+    root = tmp_path_factory.mktemp("history")
+    write_sample_export(root / "scores.sqlite", n_hands=400, n_players=5, seed=11)
+    connection = sqlite3.connect(root / "scores.sqlite")
+    rows = connection.execute(
+        f"SELECT {', '.join(COLUMNS)} FROM scores ORDER BY hand_id, rowid"
+    ).fetchall()
+    connection.close()
+    with open(root / "scores.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    with open(root / "scores.jsonl", "w") as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(COLUMNS, row))) + "\n")
+    return root, rows
+
+
+def _direct(rows) -> dict:
+    """Per-player (SOURCES, BINS) counts, one row at a time."""
+    counts, pegged, shown = {}, {}, set()
+    for hand_id, user, source, points in rows:
+        if source == "pegging":
+            pegged[hand_id, user] = pegged.get((hand_id, user), 0) + points
+            continue
+        if source == "hand":
+            shown.add((hand_id, user))
+        entry = counts.setdefault(user, np.zeros((len(SOURCES), BINS), np.int64))
+        entry[SOURCES.index(source), points] += 1
+    for hand_id, user in shown:
+        counts[user][2, pegged.get((hand_id, user), 0)] += 1
+    return counts
+
+
+def _assert_same(histograms: dict, expected: dict) -> None:
+    assert set(histograms) == set(expected)
+    for user, counts in expected.items():
+        assert np.array_equal(histograms[user], counts)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 7, 1000, 100_000])
+def test_chunked_aggregate_matches_direct_count(export, chunk_rows):
+    root, rows = export
+    result = aggregate(open_export(str(root / "scores.sqlite"), chunk_rows))
+    assert result.rows == len(rows)
+    _assert_same(result.histograms(), _direct(rows))
+
+
+@pytest.mark.parametrize("name", ["scores.csv", "scores.jsonl"])
+def test_readers_agree(export, name):
+    root, rows = export
+    result = aggregate(open_export(str(root / name), chunk_rows=50))
+    _assert_same(result.histograms(), _direct(rows))
+
+
+def test_merge_of_halves_matches_whole(export):
+    root, rows = export
+    hands = [row[0] for row in rows]
+    split = hands.index(hands[len(hands) // 2])  # a hand boundary
+    halves = [aggregate([chunk]) for chunk in _chunks(rows[:split], rows[split:])]
+    merged = halves[0].merge(halves[1])
+    whole = aggregate(open_export(str(root / "scores.sqlite")))
+    _assert_same(merged.histograms(), whole.histograms())
+    assert merged.joint.weight == whole.joint.weight
+
+
+def _chunks(*parts):
+    return [
+        {
+            "hand_id": np.array([r[0] for r in part], dtype=str),
+            "user_id": np.array([r[1] for r in part], dtype=str),
+            "source": np.array([r[2] for r in part], dtype=str),
+            "points": np.array([r[3] for r in part], dtype=np.int64),
+        }
+        for part in parts
+    ]
+
+
+def test_a_hand_without_pegging_rows_pegs_zero():
+    (chunk,) = _chunks([("h1", "a", "hand", 8), ("h1", "b", "hand", 4)])
+    result = aggregate([chunk])
+    assert result.histograms()["a"][2, 0] == 1
+    assert result.histograms()["b"][2, 0] == 1
+
+
+def test_unordered_export_is_rejected():
+    (chunk,) = _chunks([("h2", "a", "hand", 8), ("h1", "a", "hand", 4)])
+    with pytest.raises(ValueError):
+        PlayerHistograms().add(chunk)
+
+
+def test_compare_counts_impossible_scores():
+    theory = {"hand": np.zeros(MAX_SCORE + 1), "crib": np.zeros(MAX_SCORE + 1)}
+    theory["hand"][[0, 2]] = 0.5
+    counts = np.zeros((len(SOURCES), BINS), np.int64)
+    counts[0, [0, 2, 19]] = [5, 5, 1]
+    summary = compare(counts, theory)
+    assert summary["hand"]["hands"] == 11
+    assert summary["hand"]["impossible_scores"] == 1
+    assert summary["hand"]["mean"] == pytest.approx(29 / 11)
+    assert summary["crib"] == {"hands": 0}
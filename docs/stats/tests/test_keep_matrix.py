@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import cache
+from cache import artifact_path, engine_fingerprint, prune_artifacts
+from cards import DECK_SIZE
+from keep_matrix import (
+    NOT_A_STARTER,
+    SCORES_PATH,
+    STATS_PATH,
+    KeepMatrix,
+    keep_matrix,
+)
+from scoring import score_totals
+
+
+@pytest.fixture(scope="module")
+def matrix() -> KeepMatrix:
+    return keep_matrix()
+
+
+def test_files_are_named_by_the_scoring_fingerprint():
+    fingerprint = engine_fingerprint("keep_matrix")
+    assert SCORES_PATH.name == f"keep_matrix-{fingerprint}.scores"
+    assert STATS_PATH.name == f"keep_matrix-{fingerprint}.stats"
+
+
+def test_prune_keeps_only_the_current_build(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    current = artifact_path("keep_matrix", ".scores")
+    stale = tmp_path / "keep_matrix-0-000000000000.scores"
+    other = tmp_path / "keep_matrix-0-000000000000.stats"
+    for path in (current, stale, other):
+        path.write_bytes(b"")
+    assert prune_artifacts("keep_matrix", ".scores") == 1
+    assert current.exists() and other.exists() and not stale.exists()
+
+
+def test_profiles_match_direct_scores(matrix):
+    rng = np.random.default_rng(15)
+    for _ in range(200):
+        keep = np.sort(rng.choice(DECK_SIZE, 4, replace=False)).astype(np.uint8)
+        profile = matrix.profile(keep.tolist())
+        starters = np.setdiff1d(np.arange(DECK_SIZE), keep).astype(np.uint8)
+        expected = score_totals(np.tile(keep, (len(starters), 1)), starters)
+        assert np.array_equal(profile[starters], expected)
+        assert (profile[keep] == NOT_A_STARTER).all()
+        summary = matrix.summary(keep.tolist())
+        assert summary["mean"] == pytest.approx(expected.mean(), abs=1e-5)
+        assert summary["max"] == expected.max()
+        assert summary["percentiles"][50] == np.sort(expected)[23]
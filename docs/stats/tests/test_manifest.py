@@ -0,0 +1,58 @@
+import pytest
+
+import generate_charts
+from generate_charts import build_charts, select_charts
+from manifest import BuildManifest, dependency_hash
+from percentiles import Percentiles
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    monkeypatch.setattr(generate_charts, "BuildManifest", lambda: BuildManifest(path))
+    return path
+
+
+def test_stale_reasons(tmp_path):
+    manifest = BuildManifest(tmp_path / "manifest.json")
+    output = tmp_path / "chart.html"
+    fingerprint = {"data": "a", "source": "b"}
+    assert manifest.stale_reasons(output, fingerprint) == ["missing"]
+    output.write_text("")
+    assert manifest.stale_reasons(output, fingerprint) == ["not in manifest"]
+    manifest.record(output, fingerprint)
+    assert manifest.stale_reasons(output, fingerprint) == []
+    assert manifest.stale_reasons(output, {**fingerprint, "source": "c"}) == ["source"]
+
+    manifest.save()
+    reloaded = BuildManifest(tmp_path / "manifest.json")
+    assert reloaded.stale_reasons(output, fingerprint) == []
+
+
+def test_dependency_hash_follows_helpers_and_constants(monkeypatch):
+    before = dependency_hash(generate_charts.chart_cumulative)
+    assert dependency_hash(generate_charts.chart_cumulative) == before
+
+    monkeypatch.setattr(generate_charts, "CUMULATIVE_MILESTONES", (0, 29))
+    assert dependency_hash(generate_charts.chart_cumulative) != before
+    monkeypatch.undo()
+
+    monkeypatch.setattr(generate_charts, "milestone_text", generate_charts.score_color)
+    assert dependency_hash(generate_charts.chart_cumulative) != before
+    monkeypatch.undo()
+    assert dependency_hash(generate_charts.chart_cumulative) == before
+
+
+def test_build_rebuilds_only_stale_charts(tmp_path, manifest_path, monkeypatch):
+    pytest.importorskip("plotly")
+    stats = {"percentiles": Percentiles().tables}
+    charts = select_charts(["cumulative_probability"])
+    build = dict(workers=1, output_dir=tmp_path, charts=charts)
+    assert build_charts(stats, **build) == (1, 0)
+    assert build_charts(stats, **build) == (0, 1)
+
+    monkeypatch.setattr(generate_charts, "CUMULATIVE_MILESTONES", (0, 29))
+    assert build_charts(stats, **build) == (1, 0)
+    (tmp_path / "cumulative_probability.html").unlink()
+    assert build_charts(stats, **build) == (1, 0)
+    assert build_charts(stats, force=True, **build) == (1, 0)
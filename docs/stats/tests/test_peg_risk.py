@@ -0,0 +1,80 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from cards import PIP_VALUES
+from peg_risk import HAND_CARDS, MAX_PILE, PegRisk
+from pegging_sim import MAX_COUNT
+from test_pegging_sim import play_score
+
+
+@pytest.fixture(scope="module")
+def risk() -> PegRisk:
+    return PegRisk()
+
+
+def brute_force_conceded(
+    pile: list[int], rank: int, held: int, known: list[int]
+) -> float:
+    """Mean best reply over every hand the opponent could hold."""
+    played = pile + [rank]
+    count = sum(int(PIP_VALUES[r]) for r in played)
+    if held <= 0 or count == MAX_COUNT:
+        return 0.0
+    out = played + known
+    unseen = [r for r in range(13) for _ in range(4 - out.count(r))]
+    best = []
+    for hand in combinations(unseen, held):
+        replies = [
+            play_score(played + [r])
+            for r in hand
+            if count + int(PIP_VALUES[r]) <= MAX_COUNT
+        ]
+        best.append(max(replies, default=0))
+    return float(np.mean(best))
+
+
+def _random_plays(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    while n:
+        pile = rng.integers(0, 13, rng.integers(0, MAX_PILE)).tolist()
+        rank = int(rng.integers(0, 13))
+        held = int(rng.integers(0, HAND_CARDS + 1))
+        known = rng.integers(0, 13, rng.integers(0, 6)).tolist()
+        counts = np.bincount(pile + [rank] + known, minlength=13)
+        pips = sum(int(PIP_VALUES[r]) for r in pile)
+        if counts.max() <= 4 and pips + int(PIP_VALUES[rank]) <= MAX_COUNT:
+            n -= 1
+            yield pile, rank, held, known
+
+
+def test_play_matches_brute_force(risk):
+    for pile, rank, held, known in _random_plays(150, seed=22):
+        gained, conceded = risk.play(pile, rank, held, known)
+        assert gained == play_score(pile + [rank])
+        expected = brute_force_conceded(pile, rank, held, known)
+        assert conceded == pytest.approx(expected)
+
+
+def test_known_cards_change_the_risk(risk):
+    _, blind = risk.play([], 4, HAND_CARDS)
+    _, seen = risk.play([], 4, HAND_CARDS, known=[9, 10, 11, 12])
+    assert blind == pytest.approx(1.712, abs=1e-3)
+    assert seen < blind
+
+
+def test_impossible_plays_raise(risk):
+    with pytest.raises(ValueError):
+        risk.play([12, 11, 10], 1, 2)  # 32
+    with pytest.raises(ValueError):
+        risk.play([4, 4, 4], 4, 2, known=[4])  # a fifth five
+    with pytest.raises(ValueError):
+        risk.play([], 4, HAND_CARDS + 1)
+
+
+def test_hand_size_is_independent_of_the_pile(risk):
+    # After a Go the same pile can face an opponent with any number of cards
+    replies = [risk.play([9, 4], 0, held)[1] for held in range(HAND_CARDS + 1)]
+    assert replies[0] == 0.0
+    assert replies == sorted(replies) and len(set(replies)) == len(replies)
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from cards import PIP_VALUES
+from pegging_sim import (
+    DANGEROUS_COUNTS,
+    DANGER_PENALTY,
+    MAX_COUNT,
+    POLICIES,
+    deal_hands,
+    simulate,
+)
+
+
+def play_score(sequence: list[int]) -> int:
+    """scorePeggingPlay in src/engine/pegging.ts for ranks in play order."""
+    count = sum(int(PIP_VALUES[r]) for r in sequence)
+    points = 2 * (count == 15) + 2 * (count == MAX_COUNT)
+    matching = 1
+    while matching < len(sequence) and sequence[-1 - matching] == sequence[-1]:
+        matching += 1
+    points += matching * (matching - 1)
+    for n in range(len(sequence), 2, -1):
+        last = sequence[-n:]
+        if len(set(last)) == n and max(last) - min(last) == n - 1:
+            points += n
+            break
+    return points
+
+
+def greedy_choice(hand: list[int], sequence: list[int], count: int) -> int:
+    """Index of the card the greedy policy plays, ties to the lowest card."""
+    best, best_merit = -1, -np.inf
+    for i, rank in enumerate(hand):
+        value = int(PIP_VALUES[rank])
+        if count + value > MAX_COUNT:
+            continue
+        danger = DANGER_PENALTY * (count + value in DANGEROUS_COUNTS)
+        merit = (play_score(sequence + [rank]) - danger) * 100 - value
+        if merit > best_merit:
+            best, best_merit = i, merit
+    return best
+
+
+def scalar_pegging(hands: list[list[int]]) -> list[int]:
+    """
+    One deal pegged one play at a time, as handlePlayCard and handleDeclareGo
+    in src/engine/gameState.ts do it: seat 0 (pone) leads.
+    """
+    hands = [list(hand) for hand in hands]
+    scores = [0, 0]
+    sequence, count, turn, last = [], 0, 0, None
+
+    def can_play(seat: int) -> bool:
+        return any(count + int(PIP_VALUES[r]) <= MAX_COUNT for r in hands[seat])
+
+    while hands[0] or hands[1]:
+        if can_play(turn):
+            rank = hands[turn].pop(greedy_choice(hands[turn], sequence, count))
+            sequence.append(rank)
+            count += int(PIP_VALUES[rank])
+            scores[turn] += play_score(sequence)
+            last, other = turn, 1 - turn
+            if not (hands[0] or hands[1]):
+                scores[turn] += count != MAX_COUNT  # last card
+            elif count == MAX_COUNT:
+                sequence, count, turn = [], 0, other
+            elif can_play(other) or not hands[turn]:
+                turn = other
+        elif can_play(1 - turn):
+            turn = 1 - turn  # Go
+        else:
+            scores[last] += 1  # both stuck: Go point, the other player leads
+            sequence, count, turn = [], 0, 1 - last
+    return scores
+
+
+@pytest.mark.parametrize("keep", ["random", "optimal"])
+def test_simulate_matches_scalar_rules(keep):
+    rng = np.random.default_rng(12)
+    hands = deal_hands(3000, keep, rng)
+    greedy = POLICIES["greedy"]
+    points = simulate(hands, (greedy, greedy), rng)
+    ranks = (hands % 13).tolist()
+    for deal, row in zip(ranks, points):
+        assert scalar_pegging(deal) == row.tolist(), deal
+
+
+def test_play_score_examples():
+    assert play_score([4, 9]) == 2  # 5, 10: fifteen
+    assert play_score([2, 2, 2]) == 6  # pair royal
+    assert play_score([2, 4, 3]) == 3  # run of three out of order
+    assert play_score([9, 10, 11, 0]) == 2  # 10 J Q A: 31, no run
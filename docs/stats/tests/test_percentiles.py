@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import percentiles
+from enumeration import enumerate_scores
+from percentiles import TABLES, TS_OUTPUT, Percentiles, percentile_tables
+
+
+@pytest.fixture(scope="module")
+def saved():
+    return Percentiles()
+
+
+@pytest.mark.parametrize("is_crib", [False, True])
+def test_lookups_match_the_enumeration(saved, is_crib):
+    result = enumerate_scores(is_crib=is_crib)
+    table = "crib" if is_crib else "hand"
+    counts = np.zeros(30)
+    for score, count in result["distribution"].items():
+        counts[score] = count
+    for score in range(30):
+        at_least = counts[score:].sum() / result["total"]
+        at_most = counts[: score + 1].sum() / result["total"]
+        assert saved.at_least(score, table) == pytest.approx(at_least, abs=1e-10)
+        assert saved.at_most(score, table) == pytest.approx(at_most, abs=1e-10)
+
+
+def test_known_hand_lookups(saved):
+    assert saved.top_percent(16) == pytest.approx(0.6716, abs=1e-4)
+    assert saved.at_least(29) == pytest.approx(4 / 12_994_800, abs=1e-10)
+    # 19 is impossible
+    assert saved.at_least(19) == saved.at_least(20)
+    assert saved.at_most(18) == saved.at_most(19)
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_tables_are_monotone_and_consistent(saved, table):
+    at_least = np.array(saved.tables[table]["at_least"])
+    at_most = np.array(saved.tables[table]["at_most"])
+    assert at_least[0] == pytest.approx(1.0)
+    assert at_most[-1] == pytest.approx(1.0)
+    assert (np.diff(at_least) <= 0).all()
+    assert (np.diff(at_most) >= 0).all()
+    # P(>= s) + P(<= s - 1) = 1, and the survival curve sums to the mean
+    np.testing.assert_allclose(at_least[1:] + at_most[:-1], 1.0, atol=1e-9)
+    assert at_least[1:].sum() == pytest.approx(saved.tables[table]["mean"], abs=1e-3)
+
+
+def test_scores_outside_the_table_are_clamped(saved):
+    assert saved.at_least(0) == saved.at_least(-3, "crib") == 1.0
+    assert saved.at_least(30) == 0.0
+    assert saved.at_most(-1) == 0.0
+    assert saved.at_most(40) == pytest.approx(1.0)
+
+
+def test_percentile_tables_trim_and_normalize(monkeypatch):
+    shares = {name: np.array([2.0, 0.0, 1.0, 1.0, 0.0, 0.0]) for name in TABLES}
+    monkeypatch.setattr(percentiles, "distributions", lambda cache=None: shares)
+    tables = percentile_tables()
+    assert tables["hand"] == {
+        "mean": 1.25,
+        "at_most": [0.5, 0.5, 0.75, 1.0],
+        "at_least": [1.0, 0.5, 0.5, 0.25],
+    }
+    assert Percentiles(tables=tables).top_percent(3) == 25.0
+
+
+def test_typescript_table_matches_the_json(saved, tmp_path):
+    path = tmp_path / "hand-percentiles.ts"
+    percentiles.write_typescript(saved.tables, path)
+    assert path.read_text() == TS_OUTPUT.read_text()
@@ -0,0 +1,64 @@
+import json
+import os
+import pstats
+import time
+import tracemalloc
+
+import pytest
+
+from profiling import Profiler
+
+
+@pytest.fixture(autouse=True)
+def stop_tracing():
+    yield
+    tracemalloc.stop()
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.stage("a"), profiler.stage("b"):
+        pass
+    assert profiler.stages == []
+    assert profiler.stage("a") is profiler.stage("b")
+    assert not tracemalloc.is_tracing()
+
+
+def test_nested_stages_time_and_peak():
+    profiler = Profiler(enabled=True)
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            block = bytearray(8_000_000)
+            time.sleep(0.02)
+            del block
+        time.sleep(0.01)
+    outer, inner = profiler.stages
+    assert (outer["stage"], outer["depth"]) == ("outer", 0)
+    assert (inner["stage"], inner["depth"]) == ("inner", 1)
+    assert inner["wall_s"] >= 0.02 and outer["wall_s"] >= inner["wall_s"] + 0.01
+    assert inner["peak_mb"] >= 8
+    # A parent's peak includes its children's
+    assert outer["peak_mb"] >= inner["peak_mb"]
+    assert all(record["pid"] == os.getpid() for record in profiler.stages)
+
+
+def test_worker_records_nest_under_the_open_stage():
+    worker = Profiler(enabled=True)
+    with worker.stage("figure"):
+        pass
+    profiler = Profiler(enabled=True)
+    with profiler.stage("rendering"):
+        profiler.add(worker.stages)
+    assert [r["depth"] for r in profiler.stages] == [0, 1]
+    assert "figure" in profiler.report() and "Total" in profiler.report()
+
+
+def test_save_writes_stages_and_cprofile(tmp_path):
+    profiler = Profiler(enabled=True, cprofile=True)
+    with profiler.stage("work"):
+        sum(range(10_000))
+    profiler.save(tmp_path / "profile.json", tmp_path / "run.prof")
+    report = json.loads((tmp_path / "profile.json").read_text())
+    assert [record["stage"] for record in report["stages"]] == ["work"]
+    assert report["total_s"] >= report["stages"][0]["wall_s"]
+    assert pstats.Stats(str(tmp_path / "run.prof")).total_calls > 0
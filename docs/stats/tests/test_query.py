@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from cards import card_rank, card_suit
+from enumeration import combination_rows
+from query import ScoreIndex, predicate_cards, query, score_index
+from scoring import MAX_SCORE
+
+
+@pytest.fixture(scope="module")
+def index() -> ScoreIndex:
+    return score_index(False)
+
+
+@pytest.fixture(scope="module")
+def rows():
+    hands, starters, _ = combination_rows(False)
+    return hands, starters
+
+
+def _matches(cards: np.ndarray, token: str) -> np.ndarray:
+    return np.isin(cards, predicate_cards(token))
+
+
+def test_predicate_tokens():
+    assert predicate_cards("5h") == [4]
+    assert predicate_cards("10S") == [2 * 13 + 9]
+    assert predicate_cards("J") == [10, 23, 36, 49]
+    assert predicate_cards("D") == list(range(13, 26))
+    with pytest.raises(ValueError):
+        predicate_cards("1X")
+
+
+def test_scores_follow_enumeration_order(index):
+    assert index.total == len(combination_rows(False)[0])
+    assert np.bincount(index.scores, minlength=MAX_SCORE + 1)[29] == 4
+
+
+@pytest.mark.parametrize(
+    "token, at_least", [("5", 1), ("5", 2), ("5", 4), ("H", 3), ("JS", 1)]
+)
+def test_hand_counts_matching_cards(index, rows, token, at_least):
+    hands, _ = rows
+    expected = _matches(hands, token).sum(axis=1) >= at_least
+    selected = index.hand(token, at_least)
+    assert np.array_equal(index.rows(selected), np.flatnonzero(expected))
+    assert np.array_equal(
+        index.histogram(selected),
+        np.bincount(index.scores[expected], minlength=MAX_SCORE + 1),
+    )
+
+
+def test_combined_predicates_match_a_direct_scan(index, rows):
+    hands, starters = rows
+    result = query(hold=("5", "5", "J"), starter="5", without=("H",))
+    mask = (
+        (_matches(hands, "5").sum(axis=1) >= 2)
+        & _matches(hands, "J").any(axis=1)
+        & (card_rank(starters) == 4)
+        & ~(card_suit(hands) == 0).any(axis=1)
+    )
+    scores = index.scores[mask]
+    assert result["count"] == mask.sum()
+    assert result["mean"] == pytest.approx(scores.mean())
+    assert result["at_least"][12] == pytest.approx((scores >= 12).mean())
+    assert result["distribution"] == {
+        s: int(c) for s, c in enumerate(np.bincount(scores)) if c
+    }
+
+
+def test_complement_and_empty_selections(index):
+    with_five = index.histogram(index.hand("5")).sum()
+    without_five = index.histogram(~index.hand("5")).sum()
+    assert with_five + without_five == index.total
+    empty = index.hand("5", at_least=5)
+    assert index.describe(empty) == {"count": 0, "share": 0.0, "distribution": {}}
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from enumeration import enumerate_scores, summarize
+from sampling import estimate, strata
+
+SEEDS = 100
+SAMPLES = 1 << 14
+
+
+@pytest.fixture(scope="module")
+def exact():
+    return {
+        name: estimate(name, exact=True)["values"][name] for name in ("hand", "crib")
+    }
+
+
+def coverage(name: str, exact: dict, seeds: int) -> tuple[float, np.ndarray]:
+    """Share of seeds whose 95% intervals cover the exact mean, and each share."""
+    truth = np.array(exact["distribution"]["value"])
+    mean_hits, share_hits = 0, np.zeros(len(truth))
+    for seed in range(seeds):
+        values = estimate(name, max_samples=SAMPLES, seed=seed)["values"][name]
+        mean = values["mean"]
+        mean_hits += mean["low"] <= exact["mean"]["value"] <= mean["high"]
+        low, high = np.zeros(len(truth)), np.zeros(len(truth))
+        found = values["distribution"]
+        low[: len(found["low"])] = found["low"]
+        high[: len(found["high"])] = found["high"]
+        share_hits += (low <= truth + 1e-12) & (truth <= high + 1e-12)
+    return mean_hits / seeds, share_hits / seeds
+
+
+def test_strata_weights_are_exact():
+    for size in (4, 6):
+        _, weights = strata(size)
+        assert weights.sum() == pytest.approx(1.0)
+        assert (weights > 0).all()
+
+
+def test_exact_run_matches_the_enumeration(exact):
+    _, _, average = summarize(enumerate_scores())
+    mean = exact["hand"]["mean"]
+    assert mean["value"] == pytest.approx(average)
+    assert mean["low"] == mean["value"] == mean["high"]
+    assert sum(exact["hand"]["distribution"]["value"]) == pytest.approx(1.0)
+
+
+def test_hand_intervals_cover_the_exact_distribution(exact):
+    mean_rate, share_rates = coverage("hand", exact["hand"], SEEDS)
+    assert mean_rate >= 0.88
+    # Shares common enough for the normal approximation to hold
+    common = np.array(exact["hand"]["distribution"]["value"]) > 0.01
+    assert share_rates[common].min() >= 0.85
+
+
+def test_weighted_crib_intervals_cover_the_exact_mean(exact):
+    mean_rate, _ = coverage("crib", exact["crib"], 20)
+    assert mean_rate >= 0.8
+
+
+def test_seeded_estimates_repeat():
+    first = estimate("hand", max_samples=SAMPLES, seed=7)
+    second = estimate("hand", max_samples=SAMPLES, seed=7, workers=2)
+    assert first["values"] == second["values"]
+    assert first["samples"] == second["samples"] <= SAMPLES
+
+
+def test_precision_stops_sampling():
+    result = estimate("hand", precision=0.1, seed=3)
+    mean = result["values"]["hand"]["mean"]
+    assert (mean["high"] - mean["low"]) / 2 <= 0.1
+
+
+def test_estimate_needs_a_stopping_rule():
+    with pytest.raises(ValueError, match="unknown analysis"):
+        estimate("show", max_samples=SAMPLES)
+    with pytest.raises(ValueError, match="give a precision"):
+        estimate("hand")
+    with pytest.raises(ValueError, match="no exact enumeration"):
+        estimate("pegging", exact=True)
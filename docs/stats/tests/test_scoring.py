@@ -0,0 +1,95 @@
+from itertools import combinations
+
+import numpy as np
+
+from cards import JACK, PIP_VALUES, all_hands, starters_for
+from scoring import (
+    CACHE_DIR,
+    COMPONENTS,
+    RANK_TABLE_SOURCES,
+    build_rank_table,
+    rank_table,
+    score_batch,
+    source_digest,
+)
+
+
+def brute_force_score(hand: list[int], starter: int, is_crib: bool) -> list[int]:
+    """Component points of one hand, straight from the rules."""
+    cards = hand + [starter]
+    ranks = [card % 13 for card in cards]
+    fifteens = sum(
+        2
+        for size in range(2, 6)
+        for subset in combinations(ranks, size)
+        if sum(int(PIP_VALUES[r]) for r in subset) == 15
+    )
+    pairs = sum(2 for a, b in combinations(ranks, 2) if a == b)
+    runs = 0
+    for size in (5, 4, 3):
+        for subset in combinations(ranks, size):
+            ordered = sorted(subset)
+            if ordered == list(range(ordered[0], ordered[0] + size)):
+                runs += size
+        if runs:
+            break
+    suits = [card // 13 for card in hand]
+    flush = 0
+    if len(set(suits)) == 1:
+        if starter // 13 == suits[0]:
+            flush = 5
+        elif not is_crib:
+            flush = 4
+    nobs = int(any(c % 13 == JACK and c // 13 == starter // 13 for c in hand))
+    return [fifteens, pairs, runs, flush, nobs]
+
+
+def _random_rows(n: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    deals = np.argsort(rng.random((n, 52)), axis=1)[:, :5].astype(np.uint8)
+    return np.sort(deals[:, :4], axis=1), deals[:, 4]
+
+
+def test_score_batch_matches_brute_force():
+    hands, starters = _random_rows(3000, seed=1)
+    for is_crib in (False, True):
+        points = score_batch(hands, starters, is_crib)
+        for hand, starter, row in zip(hands, starters, points):
+            expected = brute_force_score(hand.tolist(), int(starter), is_crib)
+            assert row.tolist() == expected, (hand, starter, is_crib)
+
+
+def test_score_batch_matches_brute_force_on_flushes_and_jacks():
+    # Every hearts hand holding the jack, with every starter
+    hearts = all_hands(4)
+    hearts = hearts[(hearts < 13).all(axis=1) & (hearts == JACK).any(axis=1)]
+    starters = starters_for(hearts)
+    hands = np.repeat(hearts, starters.shape[1], axis=0)
+    starters = starters.ravel()
+    for is_crib in (False, True):
+        points = score_batch(hands, starters, is_crib)
+        for hand, starter, row in zip(hands, starters, points):
+            expected = brute_force_score(hand.tolist(), int(starter), is_crib)
+            assert row.tolist() == expected
+
+
+def test_best_hand_scores_29():
+    # 5H 5D 5S JC with the 5C starter
+    hand = np.array([[4, 17, 30, 13 * 3 + JACK]], dtype=np.uint8)
+    points = score_batch(hand, np.array([13 * 3 + 4], dtype=np.uint8))
+    assert dict(zip(COMPONENTS, points[0].tolist())) == {
+        "Fifteens": 16,
+        "Pairs": 12,
+        "Runs": 0,
+        "Flush": 0,
+        "Nobs": 1,
+    }
+
+
+def test_rank_table_file_is_keyed_by_scorer_sources():
+    table = rank_table()
+    path = CACHE_DIR / f"rank_table-{source_digest(RANK_TABLE_SOURCES)}.npy"
+    assert path.exists()
+    assert np.array_equal(np.load(path), build_rank_table())
+    assert np.array_equal(table, build_rank_table())
+    assert source_digest(RANK_TABLE_SOURCES) != source_digest(["cards.py"])
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+import variants
+from cards import DECK_SIZE
+from scoring import MAX_SCORE, SCORING_RULES, score_batch, score_totals
+from variants import (
+    EV_BIN,
+    canonical_deals,
+    discard_options,
+    hand_values,
+    solve_variant,
+    variant_config,
+)
+
+
+@pytest.fixture(scope="module")
+def four():
+    return solve_variant("four")
+
+
+@pytest.fixture(scope="module")
+def three():
+    return solve_variant("three")
+
+
+@pytest.mark.parametrize("size", sorted(SCORING_RULES["hand_flush"]))
+def test_hand_flush_follows_the_rule_table(size):
+    hand = np.arange(size)[None, :]  # one suit
+    off_suit, in_suit = np.array([13]), np.array([size])
+    flush = score_batch(np.repeat(hand, 2, axis=0), np.concatenate([off_suit, in_suit]))
+    assert flush[:, 3].tolist() == SCORING_RULES["hand_flush"][size]
+
+
+def test_hand_values_average_the_unseen_starters():
+    deals, _ = canonical_deals(5)
+    deals = deals[np.random.default_rng(21).choice(len(deals), 20, replace=False)]
+    values = hand_values(deals, 2)
+    _, keeps = discard_options(5, 2)
+    for deal, row in zip(deals, values):
+        unseen = np.setdiff1d(np.arange(DECK_SIZE), deal)
+        for keep, value in zip(keeps, row):
+            kept = np.repeat(deal[keep][None, :], len(unseen), axis=0)
+            assert value == pytest.approx(score_totals(kept, unseen).mean())
+
+
+@pytest.mark.parametrize("name", ["three", "four"])
+def test_distributions_are_normalized(name, three, four):
+    result = {"three": three, "four": four}[name]
+    for key in ("hand", "crib", "ev"):
+        assert result[key].sum() == pytest.approx(1.0)
+        assert (result[key] >= 0).all()
+    assert len(result["hand"]) == len(result["crib"]) == MAX_SCORE + 1
+    # The kept hand's score averages to its expected value, up to the EV bins
+    assert abs(result["hand_mean"] - result["ev_mean"]) < EV_BIN / 2
+
+
+def test_three_and_four_keep_the_same_hands(three, four):
+    # Both deal five and discard one without a crib term; only the crib differs
+    np.testing.assert_allclose(three["hand"], four["hand"])
+    assert three["crib_mean"] != pytest.approx(four["crib_mean"])
+
+
+def test_known_means(three, four):
+    assert four["hand_mean"] == pytest.approx(6.6473, abs=1e-4)
+    assert four["crib_mean"] == pytest.approx(4.0318, abs=1e-4)
+    assert three["crib_mean"] == pytest.approx(4.1961, abs=1e-4)
+
+
+def test_five_card_hand_distribution():
+    result = solve_variant("five_card")
+    assert result["hand"].sum() == pytest.approx(1.0)
+    assert result["hand_mean"] == pytest.approx(4.7853, abs=1e-4)
+    # A 3-card keep plus starter scores at most 20 (5-5-5 with the last 5)
+    assert result["hand"][21:].sum() == 0
+    assert result["hand"][20] > 0
+
+
+def test_uniform_discards_give_uniform_cribs():
+    config = variant_config("four")
+    discards = np.ones((1, 13))
+    weights = variants.crib_weights(config, discards)
+    np.testing.assert_allclose(weights, 1.0)
+
+
+def test_variant_config_checks_the_crib(monkeypatch):
+    with pytest.raises(ValueError, match="unknown variant"):
+        variant_config("six")
+    monkeypatch.setitem(
+        variants.VARIANTS,
+        "bad",
+        {"label": "Bad", "players": 2, "deal": 6, "discard": 1, "game": 121},
+    )
+    with pytest.raises(ValueError, match="crib holds 2 cards"):
+        variant_config("bad")
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from win_prob import (
+    WIN_SCORE,
+    advance,
+    advance_pegging,
+    read_typescript,
+    write_typescript,
+)
+
+
+def _distribution(rng, size: int) -> np.ndarray:
+    shares = rng.random(size)
+    return shares / shares.sum()
+
+
+def direct_advance(after, gain, axis, reached):
+    """before[s] = sum_g gain[g] * after[s + g] along the axis, by loops."""
+    moved = np.moveaxis(after, axis, 0)
+    before = np.zeros_like(moved)
+    for s in range(WIN_SCORE):
+        for g, share in enumerate(gain):
+            before[s] += share * (moved[s + g] if s + g < WIN_SCORE else reached)
+    return np.moveaxis(before, 0, axis)
+
+
+def direct_pegging(after, joint):
+    """Pegging by loops: the pone's points count first, then the dealer's."""
+    before = np.zeros_like(after)
+    for p_gain, row in enumerate(joint):
+        for d_gain, share in enumerate(row):
+            shifted = np.ones_like(after)
+            shifted[: WIN_SCORE - d_gain, :] = 1.0
+            shifted[: WIN_SCORE - d_gain, : WIN_SCORE - p_gain] = after[
+                d_gain:, p_gain:
+            ]
+            shifted[:, WIN_SCORE - p_gain :] = 0.0
+            before += share * shifted
+    return before
+
+
+@pytest.mark.parametrize("axis, reached", [(0, 1.0), (1, 0.0)])
+def test_advance_matches_direct_sum(axis, reached):
+    rng = np.random.default_rng(16)
+    after = rng.random((WIN_SCORE, WIN_SCORE))
+    gain = _distribution(rng, 30)
+    np.testing.assert_allclose(
+        advance(after, gain, axis, reached),
+        direct_advance(after, gain, axis, reached),
+        atol=1e-12,
+    )
+
+
+def test_advance_pegging_matches_direct_sum():
+    rng = np.random.default_rng(17)
+    after = rng.random((WIN_SCORE, WIN_SCORE))
+    joint = rng.random((12, 12))
+    joint /= joint.sum()
+    np.testing.assert_allclose(
+        advance_pegging(after, joint), direct_pegging(after, joint), atol=1e-12
+    )
+
+
+def test_typescript_round_trip(tmp_path):
+    table = np.random.default_rng(18).random((2, WIN_SCORE, WIN_SCORE))
+    path = tmp_path / "win-probability.ts"
+    write_typescript(table, path)
+    np.testing.assert_allclose(read_typescript(path), table, atol=0.5 / 0xFFFF)
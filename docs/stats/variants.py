@@ -0,0 +1,309 @@
+"""
+Hand, crib and discard-EV distributions for cribbage rule variants.
+
+src/engine/gameState.ts deals every game as two-player, six-card cribbage;
+the other common ways to play change the deal:
+
+    two        2 players, 6 dealt, 2 discarded, 4 kept (the standard game)
+    three      3 players, 5 dealt, 1 discarded, plus 1 card off the deck
+    four       4 players, 5 dealt, 1 discarded
+    five_card  2 players, 5 dealt, 2 discarded, 3 kept, played to 61
+
+Every crib holds four cards and scores under the usual crib flush rule. A
+3-card hand flush scores 3, or 4 with the starter (see scoring.py).
+
+For each variant every deal is solved over its suit-canonical representatives
+(canonical.py), weighted by orbit size. Each player discards to maximize the
+kept hand's expected show score over the unseen starters. In the two-player
+games (two, five_card) the discard also carries the crib: as in
+discard_table.py the dealer adds and the pone subtracts the exact crib EV of
+the discarded rank pair (crib_ev.py), and every deal is solved once for each
+seat. Three- and four-handed play leave the crib term out. That gives three
+results:
+
+  - discard EV: the distribution of the kept hand's expected score under the
+    chosen discard, per deal and seat, in EV_BIN-point bins
+  - hand: the exact show-score distribution of the kept hand, over every
+    deal and each unseen starter
+  - crib: the show-score distribution of the crib, with each 4-card crib
+    weighted by how likely the players' discards are to form it (the dealer's
+    and the pone's where they differ), treated as independent as in
+    crib_policy.py (cards off the deck are uniform)
+
+The deal sweep is sharded over a process pool (shards.run_sharded), and
+each variant is cached on its own in the result cache.
+
+Usage:
+    python docs/stats/variants.py [--variant NAME ...] [--workers N]
+"""
+
+import argparse
+import time
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from cache import ResultCache
+from canonical import canonical_combinations, canonical_hands
+from cards import DECK_SIZE, all_hands, card_rank, combination_index, starters_for
+from crib_policy import CRIB_SPLITS, PAIR_CLASSES, class_sizes, pair_class
+from discard_table import crib_ev_matrix, starter_sums
+from scoring import MAX_SCORE, score_totals
+from shards import DEFAULT_SHARDS, run_sharded
+
+VARIANTS = {
+    "two": {"label": "2 players", "players": 2, "deal": 6, "discard": 2, "game": 121},
+    "three": {
+        "label": "3 players",
+        "players": 3,
+        "deal": 5,
+        "discard": 1,
+        "from_deck": 1,
+        "game": 121,
+    },
+    "four": {"label": "4 players", "players": 4, "deal": 5, "discard": 1, "game": 121},
+    "five_card": {
+        "label": "Five-card",
+        "players": 2,
+        "deal": 5,
+        "discard": 2,
+        "game": 61,
+    },
+}
+CRIB_SIZE = 4
+
+# Width of the discard-EV histogram bins, in points
+EV_BIN = 0.1
+EV_BINS = round(MAX_SCORE / EV_BIN) + 1
+
+
+# ─── Deals ──────────────────────────────────────────────────────────────────
+def variant_config(name: str) -> dict:
+    """VARIANTS[name] with defaults filled in and the crib size checked."""
+    if name not in VARIANTS:
+        raise ValueError(f"unknown variant: {name}")
+    config = {"from_deck": 0, **VARIANTS[name]}
+    crib = config["players"] * config["discard"] + config["from_deck"]
+    if crib != CRIB_SIZE:
+        raise ValueError(f"{name}: crib holds {crib} cards, not {CRIB_SIZE}")
+    return config
+
+
+@lru_cache(maxsize=2)
+def canonical_deals(size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Canonical size-card deals and their orbit sizes."""
+    return canonical_hands(size)
+
+
+@lru_cache(maxsize=2)
+def hand_starter_sums(size: int) -> np.ndarray:
+    """Total score of each size-card hand summed over its starters, by colex rank."""
+    if size == CRIB_SIZE:
+        return starter_sums()
+    hands = all_hands(size)
+    starters = starters_for(hands)
+    rows = np.repeat(hands, starters.shape[1], axis=0)
+    totals = score_totals(rows, starters.ravel()).astype(np.int32)
+    table = np.empty(len(hands), dtype=np.int32)
+    table[combination_index(hands)] = totals.reshape(len(hands), -1).sum(axis=1)
+    return table
+
+
+@lru_cache(maxsize=4)
+def discard_options(deal: int, discard: int) -> tuple[np.ndarray, np.ndarray]:
+    """(discards, keeps): positions of every way to split a deal, in lex order."""
+    options = list(combinations(range(deal), discard))
+    keeps = [[i for i in range(deal) if i not in option] for option in options]
+    return np.array(options, dtype=np.intp), np.array(keeps, dtype=np.intp)
+
+
+def hand_values(deals: np.ndarray, discard: int) -> np.ndarray:
+    """(N, options) expected show score of each kept hand over unseen starters."""
+    options, keeps = discard_options(deals.shape[1], discard)
+    kept = deals[:, keeps].reshape(-1, keeps.shape[1])
+    total = hand_starter_sums(keeps.shape[1])[combination_index(kept)].astype(np.int64)
+    # The sums run over every other card; the discards cannot be the starter
+    discards = deals[:, options].reshape(-1, discard)
+    for side in range(discard):
+        total -= score_totals(kept, discards[:, side])
+    return total.reshape(len(deals), -1) / (DECK_SIZE - deals.shape[1])
+
+
+def seat_signs(config: dict) -> tuple[int, ...]:
+    """
+    Sign of the crib EV in each seat's discard choice: pone (-1) and dealer (+1)
+    in two-player games, a single seat without the crib term otherwise.
+    """
+    return (-1, 1) if config["players"] == 2 else (0,)
+
+
+def crib_values(deals: np.ndarray, options: np.ndarray) -> np.ndarray:
+    """(N, options) exact crib EV of each two-card discard (crib_ev.py)."""
+    ranks = card_rank(deals[:, options])
+    return crib_ev_matrix()[ranks[:, :, 0], ranks[:, :, 1]]
+
+
+def variant_shard(start: int, stop: int, name: str) -> dict:
+    """
+    Shard task: discard-EV, kept-hand and per-seat discard histograms for deals
+    [start, stop). Each seat's rows carry an equal share of the deal weight.
+    """
+    config = variant_config(name)
+    deals, weights = canonical_deals(config["deal"])
+    deals, weights = deals[start:stop], weights[start:stop]
+    options, keeps = discard_options(config["deal"], config["discard"])
+    values = hand_values(deals, config["discard"])
+    signs = seat_signs(config)
+    crib = crib_values(deals, options) if any(signs) else 0.0
+    rows = np.arange(len(deals))[:, None]
+    starters = starters_for(deals)
+    per_deal = starters.shape[1]
+    n_classes = 13 if config["discard"] == 1 else PAIR_CLASSES
+
+    ev = np.zeros(EV_BINS)
+    hand = np.zeros(MAX_SCORE + 1)
+    discards = np.zeros((len(signs), n_classes))
+    for seat, sign in enumerate(signs):
+        best = (values + sign * crib).argmax(axis=1)
+        share = weights / len(signs)
+
+        ev_bins = np.minimum(np.rint(values[rows[:, 0], best] / EV_BIN), EV_BINS - 1)
+        ev += np.bincount(ev_bins.astype(np.intp), weights=share, minlength=EV_BINS)
+
+        kept = deals[rows, keeps[best]]
+        scores = score_totals(np.repeat(kept, per_deal, axis=0), starters.ravel())
+        hand += np.bincount(
+            scores, weights=np.repeat(share, per_deal), minlength=MAX_SCORE + 1
+        )
+
+        discarded = deals[rows, options[best]]
+        if config["discard"] == 1:
+            classes = card_rank(discarded[:, 0]).astype(np.intp)
+        else:
+            classes = pair_class(discarded[:, 0], discarded[:, 1])
+        discards[seat] = np.bincount(classes, weights=weights, minlength=n_classes)
+    return {"ev": ev, "hand": hand, "discards": discards}
+
+
+# ─── Cribs ──────────────────────────────────────────────────────────────────
+def crib_weights(config: dict, discards: np.ndarray) -> np.ndarray:
+    """
+    Relative likelihood of each 4-card crib, by colex rank, from the
+    orbit-weighted counts of the discarded card (ranks) or pair (pair classes),
+    one row per seat (see seat_signs).
+    """
+    cribs = all_hands(CRIB_SIZE)
+    if config["discard"] == 2:
+        sizes = class_sizes()
+        per_pair = np.zeros(discards.shape)
+        per_pair[:, sizes > 0] = discards[:, sizes > 0] / sizes[sizes > 0]
+        first, second = per_pair[0], per_pair[-1]
+        weights = np.zeros(len(cribs))
+        for (x1, x2), (y1, y2) in CRIB_SPLITS:
+            x = pair_class(cribs[:, x1], cribs[:, x2])
+            y = pair_class(cribs[:, y1], cribs[:, y2])
+            weights += first[x] * second[y] + second[x] * first[y]
+    else:
+        # Single discards: each player's card, plus from_deck uniform cards
+        per_card = (discards[0] / 4)[card_rank(cribs).astype(np.intp)]
+        weights = np.zeros(len(cribs))
+        for dealt in combinations(range(CRIB_SIZE), config["players"]):
+            weights += per_card[:, list(dealt)].prod(axis=1)
+    table = np.empty_like(weights)
+    table[combination_index(cribs)] = weights / weights.mean()
+    return table
+
+
+def crib_shard(start: int, stop: int, weights: np.ndarray) -> dict:
+    """Shard task: weighted crib histogram over canonical (crib, starter) rows."""
+    cribs, starters, orbit = canonical_combinations()
+    chunk = slice(start, stop)
+    totals = score_totals(cribs[chunk], starters[chunk], is_crib=True)
+    row_weights = orbit[chunk] * weights[combination_index(cribs[chunk])]
+    return {
+        "histogram": np.bincount(totals, weights=row_weights, minlength=MAX_SCORE + 1)
+    }
+
+
+# ─── Variants ───────────────────────────────────────────────────────────────
+def solve_variant(
+    name: str, cache: ResultCache | None = None, workers: int | None = None
+) -> dict:
+    """
+    Distributions for one variant (see the module docstring): probability
+    vectors "hand" and "crib" over show scores, "ev" over EV_BIN bins, and
+    their means "hand_mean", "crib_mean" and "ev_mean".
+    """
+    config = variant_config(name)
+
+    def compute() -> dict:
+        deals, _ = canonical_deals(config["deal"])
+        merged = run_sharded(
+            variant_shard,
+            len(deals),
+            args=(name,),
+            n_shards=DEFAULT_SHARDS,
+            workers=workers,
+        )
+        weights = crib_weights(config, merged.pop("discards"))
+        merged["crib"] = run_sharded(
+            crib_shard,
+            len(canonical_combinations()[0]),
+            args=(weights,),
+            n_shards=DEFAULT_SHARDS,
+            workers=workers,
+        )["histogram"]
+        return merged
+
+    if cache is None:
+        merged = compute()
+    else:
+        merged = cache.fetch("variant", {"variant": name, **config}, compute)
+    result = {}
+    for key, width in (("hand", 1), ("crib", 1), ("ev", EV_BIN)):
+        shares = np.asarray(merged[key]) / np.sum(merged[key])
+        result[key] = shares
+        result[f"{key}_mean"] = float(shares @ (np.arange(len(shares)) * width))
+    assert round(np.sum(merged["ev"])) == comb(DECK_SIZE, config["deal"])
+    return result
+
+
+def variant_stats(
+    names=None, cache: ResultCache | None = None, workers: int | None = None
+) -> dict:
+    """{name: {"config", "hand", "crib", "ev" (shares as lists), and means}}."""
+    stats = {}
+    for name in names or VARIANTS:
+        result = solve_variant(name, cache, workers)
+        stats[name] = {
+            "config": variant_config(name),
+            **{
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in result.items()
+            },
+        }
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--variant", nargs="+", choices=VARIANTS, default=list(VARIANTS)
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="always recompute")
+    args = parser.parse_args()
+
+    cache = ResultCache(enabled=not args.no_cache)
+    print(f"\n  {'Variant':<12} {'Hand':>6} {'Crib':>6} {'Kept EV':>8} {'Time':>7}")
+    for name in args.variant:
+        start = time.perf_counter()
+        result = solve_variant(name, cache, args.workers)
+        print(
+            f"  {VARIANTS[name]['label']:<12} {result['hand_mean']:>6.3f} "
+            f"{result['crib_mean']:>6.3f} {result['ev_mean']:>8.3f} "
+            f"{time.perf_counter() - start:>6.1f}s"
+        )
+    print(f"\n  {cache.report()}\n")
@@ -0,0 +1,290 @@
+"""
+Win probability for every board position by dynamic programming.
+
+Solves P(win) for every (my score, opponent score, who deals) state on the
+121-hole board — 121 x 121 x 2 = 29,282 states — from per-hand score
+distributions. One hand moves the board through the scoring order of
+src/engine/gameState.ts, and the game ends the moment a player reaches 121:
+
+  1. cut: the dealer pegs 2 for his heels when the starter is a jack
+  2. pegging: the joint (pone, dealer) points from pegging_sim.py with
+     optimal keeps and greedy play; pone's points count first
+  3. the pone's hand, kept optimally (discard_table.py, keep_matrix.py)
+  4. the dealer's hand plus the crib, on the same starter, when both
+     players discard optimally from one deck (sampling.dealer_shows)
+
+The pone's kept-hand distribution is exact. The dealer's show is a
+4,194,304-deal stratified sample: crib_policy.py's enumeration treats the
+two players' discards as independent and runs about 0.2 points low.
+Pegging and the two shows are combined as independent. Every phase is a
+correlation of the value grid with a score distribution, done with FFTs
+over the whole grid at once. The deal passes
+to the other player after each hand, so the grid feeds back into itself,
+and value iteration repeats the hand until the grid stops changing.
+
+The result is written as a compact uint16 table to src/engine/win-probability.ts
+for the AI (see getPositionMode in src/engine/ai.ts).
+
+Usage:
+    python docs/stats/win_prob.py [--deals N] [--workers N]
+"""
+
+import argparse
+import base64
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cache import ResultCache
+from cards import DECK_SIZE, combination_index
+from discard_table import KEEPS, OPTIONS, canonical_deals, discard_table
+from keep_matrix import NOT_A_STARTER, keep_matrix
+from pegging_sim import DEALER, PONE, simulate_pegging
+from sampling import dealer_shows
+from scoring import MAX_SCORE
+
+ROOT = Path(__file__).resolve().parents[2]
+TS_OUTPUT = ROOT / "src" / "engine" / "win-probability.ts"
+
+WIN_SCORE = 121
+HEELS_POINTS = 2
+DEFAULT_DEALS = 1_000_000
+TOLERANCE = 1e-12
+MAX_ITERATIONS = 500
+CHUNK_DEALS = 1 << 17
+
+
+# ─── Hand Distributions ─────────────────────────────────────────────────────
+def kept_hand_distributions() -> np.ndarray:
+    """
+    (2, MAX_SCORE + 1) exact show-score distribution of the hand pone (row 0)
+    and dealer (row 1) keep under the optimal discard, over every deal and
+    each of its 46 unseen starters.
+    """
+    deals, weights = canonical_deals()
+    table, matrix = discard_table(), keep_matrix()
+    counts = np.zeros((2, NOT_A_STARTER + 1))
+    for lo in range(0, len(deals), CHUNK_DEALS):
+        chunk = slice(lo, lo + CHUNK_DEALS)
+        rows = np.arange(len(deals[chunk]))[:, None]
+        for seat, field in ((PONE, "best_pone"), (DEALER, "best_dealer")):
+            best = table.records[field][chunk].astype(np.intp)
+            keeps = deals[chunk][rows, KEEPS[best]]
+            discards = deals[chunk][rows, OPTIONS[best]]
+            scores = np.array(matrix.scores[combination_index(keeps)])
+            np.put_along_axis(scores, discards.astype(np.intp), NOT_A_STARTER, 1)
+            counts[seat] += np.bincount(
+                scores.ravel(),
+                weights=np.repeat(weights[chunk], DECK_SIZE),
+                minlength=NOT_A_STARTER + 1,
+            )
+    counts = counts[:, : MAX_SCORE + 1]
+    return counts / counts.sum(axis=1, keepdims=True)
+
+
+def kept_hands(cache: ResultCache | None = None) -> np.ndarray:
+    """kept_hand_distributions(), read from (or saved to) the result cache."""
+    if cache is None:
+        return kept_hand_distributions()
+    result = cache.fetch(
+        "kept_hands", {}, lambda: {"shares": kept_hand_distributions()}
+    )
+    return result["shares"]
+
+
+def hand_distributions(
+    cache: ResultCache | None = None,
+    deals: int = DEFAULT_DEALS,
+    workers: int | None = None,
+) -> dict:
+    """Probability vectors for each phase of a hand (see the module docstring)."""
+
+    def pegging() -> dict:
+        result = simulate_pegging(deals, keep="optimal", workers=workers)
+        return {"joint": np.array(result["joint"], dtype=np.int64)}
+
+    shares = kept_hands(cache)
+    if cache is None:
+        joint = pegging()["joint"]
+    else:
+        joint = cache.fetch("pegging_joint", {"deals": deals}, pegging)["joint"]
+
+    heels = np.zeros(HEELS_POINTS + 1)
+    heels[0], heels[HEELS_POINTS] = 1 - 4 / DECK_SIZE, 4 / DECK_SIZE
+    return {
+        "heels": heels,
+        "pegging": joint / joint.sum(),
+        "pone_show": np.asarray(shares[PONE]),
+        "dealer_show": dealer_shows(cache)["total"],
+    }
+
+
+# ─── Dynamic Programming ────────────────────────────────────────────────────
+def advance(after: np.ndarray, gain: np.ndarray, axis: int, reached: float):
+    """
+    Values before one player gains points drawn from `gain`.
+
+    after[d, p] is the dealer's win probability with dealer score d and pone
+    score p once the phase is over; the player on `axis` scores, and reaching
+    WIN_SCORE ends the game with value `reached`. Returns
+    before[s] = sum_g gain[g] * after[s + g] along the axis, by FFT.
+    """
+    extra = len(gain) - 1
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (0, extra)
+    extended = np.pad(after, pad, constant_values=reached)
+    size = extended.shape[axis] + extra
+    kernel = np.fft.rfft(gain[::-1], size)
+    kernel = kernel[:, None] if axis == 0 else kernel[None, :]
+    full = np.fft.irfft(np.fft.rfft(extended, size, axis=axis) * kernel, size, axis)
+    return np.take(full, np.arange(extra, extra + WIN_SCORE), axis=axis)
+
+
+def advance_pegging(after: np.ndarray, joint: np.ndarray) -> np.ndarray:
+    """Values before pegging, with joint[p, g] over (pone, dealer) points."""
+    extra = len(joint) - 1
+    extended = np.ones((WIN_SCORE + extra, WIN_SCORE + extra))
+    extended[:WIN_SCORE, :WIN_SCORE] = after
+    extended[:, WIN_SCORE:] = 0.0  # pone pegs out first
+    size = (len(extended) + extra,) * 2
+    kernel = np.fft.rfft2(joint.T[::-1, ::-1], size)
+    full = np.fft.irfft2(np.fft.rfft2(extended, size) * kernel, size)
+    return full[extra : extra + WIN_SCORE, extra : extra + WIN_SCORE]
+
+
+def solve(distributions: dict) -> tuple[np.ndarray, int]:
+    """
+    Dealer win probability at the start of a hand, by [dealer score, pone
+    score], and the number of value iterations it took.
+    """
+    dealer_wins = np.full((WIN_SCORE, WIN_SCORE), 0.5)
+    for iteration in range(1, MAX_ITERATIONS + 1):
+        # After the hand the pone deals: the old dealer wins when the new one loses
+        values = 1.0 - dealer_wins.T
+        values = advance(values, distributions["dealer_show"], axis=0, reached=1.0)
+        values = advance(values, distributions["pone_show"], axis=1, reached=0.0)
+        values = advance_pegging(values, distributions["pegging"])
+        values = advance(values, distributions["heels"], axis=0, reached=1.0)
+        values = np.clip(values, 0.0, 1.0)
+        change = np.abs(values - dealer_wins).max()
+        dealer_wins = values
+        if change < TOLERANCE:
+            return dealer_wins, iteration
+    raise RuntimeError(f"value iteration did not converge ({change:.2e})")
+
+
+def win_table(
+    cache: ResultCache | None = None,
+    deals: int = DEFAULT_DEALS,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    (2, 121, 121) probability of winning by [I deal, my score, opponent
+    score]; index 0 is the pone's view, 1 the dealer's.
+    """
+    dealer_wins, _ = solve(hand_distributions(cache, deals, workers))
+    return np.stack([1.0 - dealer_wins.T, dealer_wins])
+
+
+# ─── TypeScript Export ──────────────────────────────────────────────────────
+def write_typescript(table: np.ndarray, path: Path = TS_OUTPUT) -> None:
+    """Write the table as base64 little-endian uint16 (probability x 65535)."""
+    packed = np.rint(table * 0xFFFF).astype("<u2")
+    encoded = base64.b64encode(packed.tobytes()).decode()
+    rows = [f"  '{encoded[i : i + 76]}'," for i in range(0, len(encoded), 76)]
+    path.write_text(
+        "// Generated by docs/stats/win_prob.py — do not edit by hand.\n"
+        "\n"
+        "/**\n"
+        " * Probability of winning from the start of a hand for every\n"
+        f" * (my score, opponent score, who deals) state below {WIN_SCORE}, solved by\n"
+        " * dynamic programming over the pone's exact kept-hand distribution,\n"
+        " * the dealer's sampled hand plus crib and simulated pegging. Stored as\n"
+        " * uint16 (probability x 65535), little-endian and base64-encoded,\n"
+        " * laid out [isDealer][myScore][opponentScore].\n"
+        " */\n"
+        f"const BOARD = {WIN_SCORE};\n"
+        "const ENCODED = [\n" + "\n".join(rows) + "\n].join('');\n"
+        "\n"
+        "let table: Uint16Array | null = null;\n"
+        "\n"
+        "function decodeTable(): Uint16Array {\n"
+        "  const bytes = Uint8Array.from(atob(ENCODED), c => c.charCodeAt(0));\n"
+        "  const view = new DataView(bytes.buffer);\n"
+        "  const values = new Uint16Array(bytes.length / 2);\n"
+        "  for (let i = 0; i < values.length; i++) {\n"
+        "    values[i] = view.getUint16(i * 2, true);\n"
+        "  }\n"
+        "  return values;\n"
+        "}\n"
+        "\n"
+        "/**\n"
+        " * Probability that the player with myScore wins, at the start of a hand\n"
+        " * they deal (isDealer) or receive. A score of 121 or more has already won.\n"
+        " */\n"
+        "export function winProbability(\n"
+        "  myScore: number,\n"
+        "  opponentScore: number,\n"
+        "  isDealer: boolean,\n"
+        "): number {\n"
+        "  if (myScore >= BOARD) return 1;\n"
+        "  if (opponentScore >= BOARD) return 0;\n"
+        "  table ??= decodeTable();\n"
+        "  const index = ((isDealer ? BOARD : 0) + myScore) * BOARD + opponentScore;\n"
+        "  return table[index] / 0xffff;\n"
+        "}\n"
+    )
+
+
+def read_typescript(path: Path = TS_OUTPUT) -> np.ndarray:
+    """The (2, 121, 121) table back from a file written by write_typescript."""
+    encoded = "".join(re.findall(r"^  '([A-Za-z0-9+/=]+)',$", path.read_text(), re.M))
+    packed = np.frombuffer(base64.b64decode(encoded), dtype="<u2")
+    return (packed / 0xFFFF).reshape(2, WIN_SCORE, WIN_SCORE)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--deals", type=int, default=DEFAULT_DEALS)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    cache = ResultCache()
+    print(f"\nHand distributions ({args.deals:,} pegging deals)...")
+    start = time.perf_counter()
+    distributions = hand_distributions(cache, args.deals, args.workers)
+    print(f"  {time.perf_counter() - start:.1f}s — {cache.report()}")
+    for name in ("pone_show", "dealer_show"):
+        mean = distributions[name] @ np.arange(len(distributions[name]))
+        print(f"  {name:<12} mean {mean:.3f}")
+    pegging = distributions["pegging"]
+    print(
+        f"  {'pegging':<12} mean {pegging.sum(axis=1) @ np.arange(len(pegging)):.3f}"
+        f" pone, {pegging.sum(axis=0) @ np.arange(len(pegging)):.3f} dealer"
+    )
+
+    start = time.perf_counter()
+    dealer_wins, iterations = solve(distributions)
+    elapsed = time.perf_counter() - start
+    table = np.stack([1.0 - dealer_wins.T, dealer_wins])
+    print(
+        f"\nSolved {table.size:,} states in {elapsed * 1e3:.0f} ms "
+        f"({iterations} iterations)\n"
+    )
+    print(f"  {'Me':>4} {'Opp':>4} {'Dealing':>8} {'Receiving':>10}")
+    for mine, theirs in [
+        (0, 0),
+        (60, 60),
+        (90, 100),
+        (100, 90),
+        (111, 111),
+        (115, 119),
+    ]:
+        print(
+            f"  {mine:>4} {theirs:>4} {table[1, mine, theirs]:>8.1%} "
+            f"{table[0, mine, theirs]:>10.1%}"
+        )
+    write_typescript(table)
+    print(f"\nSaved {TS_OUTPUT.relative_to(ROOT)}\n")
@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest';
+import { RANKS } from '../types';
+import { EXACT_CRIB_EV_TABLE } from '../crib-ev-exact';
+
+// Expected values from docs/stats/crib_ev_exact.json (python crib_ev.py)
+describe('EXACT_CRIB_EV_TABLE', () => {
+  it('has one entry per rank pair, keyed low rank first', () => {
+    const keys = RANKS.flatMap((low, i) => RANKS.slice(i).map(high => `${low}-${high}`));
+    expect(Object.keys(EXACT_CRIB_EV_TABLE).sort()).toEqual(keys.sort());
+  });
+
+  it('matches the exact enumeration', () => {
+    expect(EXACT_CRIB_EV_TABLE['5-5']).toBeCloseTo(8.9927, 4);
+    expect(EXACT_CRIB_EV_TABLE['5-J']).toBeCloseTo(7.2638, 4);
+    expect(EXACT_CRIB_EV_TABLE['A-A']).toBeCloseTo(5.5318, 4);
+    expect(EXACT_CRIB_EV_TABLE['K-K']).toBeCloseTo(5.0322, 4);
+    expect(EXACT_CRIB_EV_TABLE['10-K']).toBeCloseTo(3.4183, 4);
+  });
+
+  it('rates a pair of fives as the best discard', () => {
+    const best = Math.max(...Object.values(EXACT_CRIB_EV_TABLE));
+    expect(EXACT_CRIB_EV_TABLE['5-5']).toBe(best);
+  });
+});
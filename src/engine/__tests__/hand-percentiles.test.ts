@@ -0,0 +1,48 @@
+import { describe, it, expect } from 'vitest';
+import type { PercentileTable } from '../hand-percentiles';
+import { SCORE_AT_LEAST, shareAtLeast, topPercent } from '../hand-percentiles';
+
+const TABLES = Object.keys(SCORE_AT_LEAST) as PercentileTable[];
+
+// Expected values from docs/stats/hand_percentiles.json (python percentiles.py)
+describe('hand percentiles', () => {
+  it('matches the enumerated hand distribution', () => {
+    expect(topPercent(16)).toBeCloseTo(0.6716, 4);
+    expect(shareAtLeast(29)).toBeCloseTo(4 / 12_994_800, 9);
+    // 19 is impossible, so no more hands reach it than reach 20
+    expect(shareAtLeast(19)).toBe(shareAtLeast(20));
+  });
+
+  it('has survival curves that start at 1 and never rise', () => {
+    for (const table of TABLES) {
+      const values: readonly number[] = SCORE_AT_LEAST[table];
+      expect(values[0]).toBeCloseTo(1, 6);
+      for (let s = 1; s < values.length; s++) {
+        expect(values[s]).toBeLessThanOrEqual(values[s - 1]);
+      }
+    }
+  });
+
+  it('sums each survival curve to the table mean', () => {
+    const means: Record<PercentileTable, number> = {
+      hand: 4.7692,
+      crib: 4.7348,
+      poneHand: 8.1586,
+      dealerHand: 8.0253,
+      dealerCrib: 4.7625,
+      dealerTotal: 12.7874,
+    };
+    for (const table of TABLES) {
+      const values: readonly number[] = SCORE_AT_LEAST[table];
+      const mean = values.slice(1).reduce((sum, p) => sum + p, 0);
+      expect(mean).toBeCloseTo(means[table], 3);
+    }
+  });
+
+  it('clamps scores outside the table', () => {
+    expect(shareAtLeast(0)).toBe(1);
+    expect(shareAtLeast(-3, 'crib')).toBe(1);
+    expect(shareAtLeast(30)).toBe(0);
+    expect(shareAtLeast(59, 'dealerTotal')).toBe(0);
+  });
+});
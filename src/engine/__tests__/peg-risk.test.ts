@@ -0,0 +1,50 @@
+import { describe, it, expect } from 'vitest';
+import type { Card } from '../types';
+import { createCard } from '../types';
+import { pegRisk } from '../peg-risk';
+
+/** Helper to create cards concisely */
+function card(rank: Card['rank'], suit: Card['suit'] = 'S'): Card {
+  return createCard(rank, suit);
+}
+
+// Expected values from docs/stats/peg_risk.py (python peg_risk.py [--pile] [--held] [--known])
+describe('pegRisk', () => {
+  it('matches the opening-lead risks with nothing else known', () => {
+    expect(pegRisk([], card('A'), 4).conceded).toBeCloseTo(0.443, 3);
+    expect(pegRisk([], card('5'), 4).conceded).toBeCloseTo(1.712, 3);
+    expect(pegRisk([], card('K'), 4).conceded).toBeCloseTo(0.914, 3);
+  });
+
+  it('scores the play and the reply onto a pile', () => {
+    expect(pegRisk([card('5')], card('5'), 3)).toMatchObject({ gained: 2 });
+    expect(pegRisk([card('5')], card('5'), 3).conceded).toBeCloseTo(0.94, 3);
+    expect(pegRisk([card('5')], card('K'), 3).gained).toBe(2);
+    expect(pegRisk([card('5')], card('K'), 3).conceded).toBeCloseTo(0.345, 3);
+    expect(pegRisk([card('5')], card('4'), 3).conceded).toBeCloseTo(1.933, 3);
+  });
+
+  it('removes the known cards from the opponent hands', () => {
+    const known = [card('5', 'H'), card('5', 'D'), card('5', 'C'), card('K', 'H')];
+    expect(pegRisk([], card('10'), 4, known).conceded).toBeCloseTo(0.616, 3);
+    expect(pegRisk([], card('K'), 4, known).conceded).toBeCloseTo(0.478, 3);
+    expect(pegRisk([], card('5', 'S'), 4, known).conceded).toBeCloseTo(1.597, 3);
+  });
+
+  it('takes the opponent hand size from the caller', () => {
+    // After a Go the pile no longer tells how many cards the opponent holds
+    expect(pegRisk([card('5')], card('4'), 2).conceded).toBeCloseTo(1.398, 3);
+    expect(pegRisk([card('5')], card('4'), 1).conceded).toBeCloseTo(0.76, 3);
+    expect(pegRisk([card('5')], card('4'), 0).conceded).toBe(0);
+  });
+
+  it('concedes nothing after 31', () => {
+    const pile = [card('K'), card('Q'), card('J')];
+    expect(pegRisk(pile, card('A'), 2)).toEqual({ gained: 2, conceded: 0 });
+  });
+
+  it('returns zeros for a play past 31', () => {
+    const pile = [card('K'), card('Q'), card('J')];
+    expect(pegRisk(pile, card('2'), 2)).toEqual({ gained: 0, conceded: 0 });
+  });
+});
@@ -0,0 +1,32 @@
+import { describe, it, expect } from 'vitest';
+import { winProbability } from '../win-probability';
+
+// Expected values from docs/stats/win_prob.py (read_typescript on the same table)
+describe('winProbability', () => {
+  it('decodes the opening position for each seat', () => {
+    expect(winProbability(0, 0, true)).toBeCloseTo(0.5539, 4);
+    expect(winProbability(0, 0, false)).toBeCloseTo(0.4461, 4);
+    expect(winProbability(90, 100, true)).toBeCloseTo(0.2854, 4);
+    expect(winProbability(100, 90, false)).toBeCloseTo(0.7146, 4);
+  });
+
+  it('gives the two players complementary chances', () => {
+    for (const [me, opponent] of [[0, 0], [60, 75], [118, 103], [120, 120]]) {
+      const total = winProbability(me, opponent, true) + winProbability(opponent, me, false);
+      expect(total).toBeCloseTo(1, 4);
+    }
+  });
+
+  it('rises with my score', () => {
+    for (let me = 1; me < 121; me++) {
+      expect(winProbability(me, 60, false)).toBeGreaterThanOrEqual(
+        winProbability(me - 1, 60, false) - 1 / 0xffff,
+      );
+    }
+  });
+
+  it('treats 121 as already won', () => {
+    expect(winProbability(121, 120, false)).toBe(1);
+    expect(winProbability(120, 121, true)).toBe(0);
+  });
+});
@@ -0,0 +1,101 @@
+// Generated by docs/stats/crib_ev.py — do not edit by hand.
+
+/**
+ * Exact expected crib score for each discard rank pair (91 entries),
+ * averaged over every opponent two-card contribution and every starter
+ * with the crib-only 5-card flush rule. Opponent discards are uniform,
+ * unlike the Schell table, which assumes strategic opponents.
+ */
+export const EXACT_CRIB_EV_TABLE: Readonly<Record<string, number>> = {
+  'A-A': 5.5318,
+  'A-2': 4.4454,
+  'A-3': 4.5654,
+  'A-4': 5.4742,
+  'A-5': 5.7370,
+  'A-6': 4.2635,
+  'A-7': 4.0853,
+  'A-8': 4.1287,
+  'A-9': 4.0446,
+  'A-10': 3.9626,
+  'A-J': 4.1953,
+  'A-Q': 3.8605,
+  'A-K': 3.7520,
+  '2-2': 5.8253,
+  '2-3': 6.8432,
+  '2-4': 4.8515,
+  '2-5': 5.7663,
+  '2-6': 4.3722,
+  '2-7': 4.2872,
+  '2-8': 4.2391,
+  '2-9': 4.1426,
+  '2-10': 4.0750,
+  '2-J': 4.3078,
+  '2-Q': 3.9730,
+  '2-K': 3.8644,
+  '3-3': 6.1612,
+  '3-4': 5.5026,
+  '3-5': 6.4318,
+  '3-6': 4.2786,
+  '3-7': 4.3597,
+  '3-8': 4.2948,
+  '3-9': 4.1206,
+  '3-10': 4.1503,
+  '3-J': 4.3831,
+  '3-Q': 4.0483,
+  '3-K': 3.9397,
+  '4-4': 6.1355,
+  '4-5': 7.0010,
+  '4-6': 4.9720,
+  '4-7': 4.1837,
+  '4-8': 4.3081,
+  '4-9': 4.2083,
+  '4-10': 4.1468,
+  '4-J': 4.3796,
+  '4-Q': 4.0448,
+  '4-K': 3.9362,
+  '5-5': 8.9927,
+  '5-6': 7.0959,
+  '5-7': 6.4184,
+  '5-8': 5.7608,
+  '5-9': 5.7406,
+  '5-10': 7.0310,
+  '5-J': 7.2638,
+  '5-Q': 6.9290,
+  '5-K': 6.8204,
+  '6-6': 6.2902,
+  '6-7': 5.5434,
+  '6-8': 4.9050,
+  '6-9': 5.5822,
+  '6-10': 3.8444,
+  '6-J': 4.0772,
+  '6-Q': 3.7424,
+  '6-K': 3.6338,
+  '7-7': 6.1082,
+  '7-8': 6.7695,
+  '7-9': 4.3581,
+  '7-10': 3.7307,
+  '7-J': 4.0239,
+  '7-Q': 3.6891,
+  '7-K': 3.5805,
+  '8-8': 5.6347,
+  '8-9': 4.9360,
+  '8-10': 4.3087,
+  '8-J': 3.9474,
+  '8-Q': 3.6730,
+  '8-K': 3.5644,
+  '9-9': 5.5298,
+  '9-10': 4.8503,
+  '9-J': 4.4890,
+  '9-Q': 3.5601,
+  '9-K': 3.5120,
+  '10-10': 5.4633,
+  '10-J': 5.0498,
+  '10-Q': 4.1209,
+  '10-K': 3.4183,
+  'J-J': 5.9286,
+  'J-Q': 5.0118,
+  'J-K': 4.3092,
+  'Q-Q': 5.2494,
+  'Q-K': 3.9744,
+  'K-K': 5.0322,
+};
@@ -0,0 +1,69 @@
+// Generated by docs/stats/percentiles.py — do not edit by hand.
+
+/**
+ * P(score >= s) for every show score s: any hand or crib (random
+ * discards) and the hands pone and dealer keep under optimal discards,
+ * exact over every hand and starter; the dealer's crib and hand plus
+ * crib when both discard optimally from one deck, stratified-sampled.
+ */
+export const SCORE_AT_LEAST = {
+  hand: [
+    1, 0.922353, 0.914674, 0.698141, 0.659279, 0.439524, 0.385848, 0.24731, 0.189493, 0.101978,
+    0.0741804, 0.0442654, 0.0402884, 0.0158679, 0.0143553, 0.00742174, 0.00671623, 0.00223382,
+    0.00137224, 0.00116385, 0.00116385, 0.000542986, 0.00035091, 0.000316742, 0.000289347,
+    6.1563e-06, 6.1563e-06, 6.1563e-06, 6.1563e-06, 3.078e-07
+  ],
+  crib: [
+    1, 0.921337, 0.913658, 0.695124, 0.655962, 0.435184, 0.381047, 0.243517, 0.185393,
+    0.0993323, 0.0717545, 0.0426475, 0.0392708, 0.0153415, 0.0140681, 0.00728599, 0.00658787,
+    0.00217933, 0.00131776, 0.00114353, 0.00114353, 0.00054114, 0.00035091, 0.000316742,
+    0.000289347, 6.1563e-06, 6.1563e-06, 6.1563e-06, 6.1563e-06, 3.078e-07
+  ],
+  poneHand: [
+    1, 0.996309, 0.995838, 0.954559, 0.940825, 0.82044, 0.784935, 0.630681, 0.562407, 0.37206,
+    0.305433, 0.219235, 0.203182, 0.0996327, 0.0909204, 0.0569243, 0.0520458, 0.0203105,
+    0.0134475, 0.0115738, 0.0115738, 0.00563784, 0.00379558, 0.00338816, 0.00312739,
+    7.11592e-05, 7.11592e-05, 7.11592e-05, 7.11592e-05, 4.3396e-06
+  ],
+  dealerHand: [
+    1, 0.993703, 0.99319, 0.933762, 0.91691, 0.802774, 0.765024, 0.60924, 0.544352, 0.370167,
+    0.306002, 0.216582, 0.201778, 0.0991937, 0.0915362, 0.0578872, 0.0527546, 0.0197052,
+    0.0129769, 0.0111336, 0.0111336, 0.00537539, 0.0036086, 0.00322211, 0.00300328, 6.8716e-05,
+    6.8716e-05, 6.8716e-05, 6.8716e-05, 2.8148e-06
+  ],
+  dealerCrib: [
+    1, 0.922904, 0.91705, 0.678193, 0.639704, 0.437671, 0.382006, 0.240304, 0.192046, 0.105283,
+    0.0833288, 0.0528726, 0.0501614, 0.0171609, 0.0159399, 0.00967447, 0.00874564, 0.00275126,
+    0.00183674, 0.00154754, 0.00154754, 0.000679897, 0.00035921, 0.000349994, 0.000345649,
+    2.217e-07, 2.217e-07, 2.217e-07, 2.217e-07
+  ],
+  dealerTotal: [
+    1, 0.999834, 0.999814, 0.995636, 0.994562, 0.97384, 0.964892, 0.917264, 0.892843, 0.809694,
+    0.762342, 0.651797, 0.591547, 0.477836, 0.421322, 0.317785, 0.270504, 0.191605, 0.159786,
+    0.108405, 0.0882296, 0.0571412, 0.0446157, 0.0288799, 0.0225918, 0.0137579, 0.010702,
+    0.00668109, 0.0052977, 0.0029098, 0.00212888, 0.00119861, 0.000853883, 0.000410699,
+    0.000274953, 0.000146075, 0.000120318, 4.59453e-05, 3.13103e-05, 1.86943e-05, 1.55468e-05,
+    5.0039e-06, 2.0801e-06, 1.6818e-06, 1.4601e-06, 1.2651e-06, 4.235e-07, 4.235e-07, 4.235e-07,
+    2.152e-07
+  ],
+} as const;
+
+export type PercentileTable = keyof typeof SCORE_AT_LEAST;
+
+/** Share of shows in `table` scoring at least `score` (0-1). */
+export function shareAtLeast(
+  score: number,
+  table: PercentileTable = 'hand',
+): number {
+  const values: readonly number[] = SCORE_AT_LEAST[table];
+  if (score <= 0) return 1;
+  return score < values.length ? values[score] : 0;
+}
+
+/** The "top X%" a score is in: 3.2 means the top 3.2% of shows. */
+export function topPercent(
+  score: number,
+  table: PercentileTable = 'hand',
+): number {
+  return 100 * shareAtLeast(score, table);
+}
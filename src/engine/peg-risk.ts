@@ -0,0 +1,65 @@
+import type { Card, Rank } from './types';
+import { RANKS, cardValue, createCard } from './types';
+import { scorePeggingPlay } from './pegging';
+
+const MAX_COUNT = 31;
+const HAND_CARDS = 4;
+
+export interface PegRisk {
+  readonly gained: number;
+  readonly conceded: number;
+}
+
+/**
+ * Expected pegging points gained by playing `card` onto `pile` (the cards of
+ * the current count, in play order) and conceded to the opponent's best
+ * immediate reply. The reply is exact over every hand of `opponentCards`
+ * cards (what they still hold, 0 once they have said Go) the opponent could
+ * hold from the unseen cards: the deck less the pile, the card played and
+ * `known` (the rest of the player's hand and the starter). The hand size is
+ * passed in because the pile restarts after a Go or 31 and a player can play
+ * several cards in a row after a Go.
+ * Making 31 concedes nothing; plays past 31 return zeros. Mirrors
+ * docs/stats/peg_risk.py, computed here with scorePeggingPlay instead of
+ * loading its signature table, which only covers the points of each play.
+ */
+export function pegRisk(
+  pile: readonly Card[],
+  card: Card,
+  opponentCards: number,
+  known: readonly Card[] = [],
+): PegRisk {
+  const count = pile.reduce((sum, c) => sum + cardValue(c.rank), 0) + cardValue(card.rank);
+  if (count > MAX_COUNT) return { gained: 0, conceded: 0 };
+
+  const played = [...pile, card];
+  const gained = scorePeggingPlay(played).total;
+  const held = Math.min(Math.max(opponentCards, 0), HAND_CARDS);
+  if (count === MAX_COUNT || held === 0) return { gained, conceded: 0 };
+
+  const unseen = new Map<Rank, number>(RANKS.map(rank => [rank, 4]));
+  for (const c of [...played, ...known]) {
+    unseen.set(c.rank, Math.max((unseen.get(c.rank) ?? 0) - 1, 0));
+  }
+  const replies = RANKS.map(rank =>
+    count + cardValue(rank) > MAX_COUNT
+      ? 0
+      : scorePeggingPlay([...played, createCard(rank, 'H')]).total,
+  );
+
+  // E[best reply] = sum over k >= 1 of P(some held card scores at least k)
+  const total = RANKS.reduce((sum, rank) => sum + (unseen.get(rank) ?? 0), 0);
+  let conceded = 0;
+  for (let k = 1; k <= Math.max(...replies); k++) {
+    const scoring = RANKS.reduce(
+      (sum, rank, i) => sum + (replies[i] >= k ? (unseen.get(rank) ?? 0) : 0),
+      0,
+    );
+    let missed = 1;
+    for (let i = 0; i < held; i++) {
+      missed *= Math.max(total - scoring - i, 0) / (total - i);
+    }
+    conceded += 1 - missed;
+  }
+  return { gained, conceded };
+}
@@ -0,0 +1,1069 @@
+// Generated by docs/stats/win_prob.py — do not edit by hand.
+
+/**
+ * Probability of winning from the start of a hand for every
+ * (my score, opponent score, who deals) state below 121, solved by
+ * dynamic programming over the pone's exact kept-hand distribution,
+ * the dealer's sampled hand plus crib and simulated pegging. Stored as
+ * uint16 (probability x 65535), little-endian and base64-encoded,
+ * laid out [isDealer][myScore][opponentScore].
+ */
+const BOARD = 121;
+const ENCODED = [
+  'NHKMbeZoRmSsXxxbllYeUrVNXUkZRetA1jzbOP40QDGkLSoq1iapI6QgyB0VG4wYLhb5E+4RCxBQ',
+  'DroMSAv5CcoIugfGBuwFKwV/BOcDYQPrAoQCKgLbAZYBWgEmAfkA0gCxAJQAewBmAFQARQA4AC0A',
+  'JAAdABcAEgAOAAsACAAGAAUAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAABBd45y220qaX1k1V81W6BWF1KdTTVJ4USkQIE8ejiRNMkwJS2mKU8mHyMa',
+  'IEAdkBoNGLQVhxODEakP9g1pDAALugmTCIoHnQbKBQ4FZwTTA1ED3gJ6AiEC1AGQAVUBIgH1AM4A',
+  'rQCQAHgAYwBRAEIANQArACIAGwAVABAADQAKAAcABQAEAAMAAgACAAEAAQABAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFZ8m3fdch1uXmmhZOhfOFuRVvZRa03zSI9EREAU',
+  'PAE4DzRAMJcsFCm7JY0iih+zHAoajRc8FRgTHRFMD6MNHwzACoIJYwhiB3wGrgX3BFQExANFA9QC',
+  'cQIaAs4BiwFQAR0B8QDKAKkAjQB0AGAATgA/ADMAKQAgABkAFAAPAAwACQAHAAUABAADAAIAAQAB',
+  'AAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAcIGwfOh3HHNMbnxprWTj',
+  'XyBbZ1a7UR9NlkgkRMw/kDt1N3wzqC/7K3goISX1IfceJxyFGREXyhSvEr8Q+A5ZDd8LiApSCTsI',
+  'QQdgBpgF5QRFBLgDOwPMAmoCFALIAYUBSwEYAewAxgClAIkAcABcAEsAPAAwACYAHgAXABIADgAK',
+  'AAgABgAEAAMAAgACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACK',
+  'hseB+XwieEVzZG6BaZ9kwl/sWiBWY1G3TCBIoUM+P/k61zbZMgMvVyvWJ4MkXSFnHp8bBxmdFmAU',
+  'UBJrEK8OGQ2oC1oKLAkcCCcHSwaHBdcEOgSvAzMDxQJkAg4CwgGAAUYBEwHnAMEAoACEAGwAWABH',
+  'ADkALQAjABwAFQAQAAwACQAHAAUABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAKKL3YYLgix9RHhUc19uaWl0ZINfm1q+VfBQNUySRwhDnT5SOiw2LTJYLq8q',
+  'MyfmI8kg3B0fG5IYMxYCFP0RIxBwDuQMfAs2Cg4JBAgTBzwGegXNBDIEpwMsA78CXgIIArwBegFA',
+  'AQ0B4QC7AJoAfwBnAFMAQwA1ACoAIQAZABMADwALAAgABgAFAAMAAgACAAEAAQABAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAspDvixuHN4JGfUp4RnM9bjNpKmQnXy1aQFVkUJ1L',
+  '70ZeQu09oDl5NX0xrC0IKpQmUSM+IFwdqxopGNcVsRO4EecPPw67DFsLGwr5CPIHBgcxBnEFxQQr',
+  'BKEDJgO4AlcCAQK1AXMBOAEGAdoAtACUAHkAYgBOAD4AMQAnAB4AFwASAA0ACgAHAAUABAADAAIA',
+  'AQABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC3lfiQJIw+h0eCQn0yeBlz',
+  '/G3eaMNjrl6lWapUwk/ySj1GqEE1Peg4xTTNMAMtaCn+JcYivx/qHEUa0BeJFW8TgBG6DxoOngxD',
+  'CwgK6gjnB/0GKQZqBb8EJASaAx8DsQJPAvkBrQFqATAB/QDSAK0AjQByAFwASQA6AC0AIwAbABUA',
+  'EAAMAAkABwAFAAMAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAK2a',
+  '9ZUlkT6MRIc5gh99+nfOcp1tbWhAYx1eBlkAVBBPOkqCRetAejwxOBQ0JDBkLNQodyVLIlEfiRzx',
+  'GYgXTRU9E1gRmQ8ADooMNAv9CeII4Af3BiMGZAW4BB0EkgMWA6cCRQLuAaIBYAEmAfQAyQCkAIUA',
+  'awBWAEQANQAqACAAGQATAA4ACgAIAAYABAADAAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAkZ/imhiWNJE6jCuHC4LdfKR3ZHIibeFnp2J2XVVYSFNTTntJw0QvQMM7gjdu',
+  'M4kv1CtRKAEl4yH2HjscrxlSFyEVGxM9EYYP8g2ADC0L9wndCNsH8gYdBl0FsAQUBIgDCwOcAjkC',
+  '4gGWAVQBGgHpAL8AmwB9AGQATwA+ADEAJgAdABYAEQAMAAkABwAFAAQAAwACAAEAAQABAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgpLyf+5odliaRF4z0hr+BfXwyd+Fxj2xBZ/phwVya',
+  'V4lSk028SAhEez8XO+A21zL/Llgr4yehJJEhsR4CHIIZLxcHFQgTMBF9D+wNfAwqC/UJ2gjXB+wG',
+  'FgZVBaYECAR7A/0CjQIqAtMBiAFGAQ0B3QC0AJEAdABcAEkAOQAsACIAGgAUAA8ACwAIAAYABAAD',
+  'AAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABapgaTLn/aaBJb5kNWLnoZX',
+  'gQN8p3ZIcelrkWZDYQVc21bKUddMBkhZQ9U+fTpSNlcyjS70Ko4nWSRWIYMe3xtoGR0X+xQBEy0R',
+  'fA/tDX0MKgvzCdYI0gfkBgwGSAWYBPkDagPsAnwCGQLCAXcBNgH/ANAAqACHAGsAVQBDADQAKAAf',
+  'ABcAEQANAAoABwAFAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsa0t',
+  'qYWkvJ/Tms6VrpB4iy+G1oBzewp2n3A4a9llh2BIWyBWFFEnTF5HvEJEPvk53TXwMTUuqypSJyok',
+  'MyFqHs8bXxkaF/0UBRMyEYEP8Q1/DCoL8AnQCMkH2Ab9BTcFhQTlA1YD1wJnAgUCrwFlASYB8ADC',
+  'AJwAfQBjAE4APAAvACQAGwAVABAADAAJAAYABQADAAMAAgABAAEAAQABAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAvsr6tJ6lspJCflJp8lUqQA4uqhUOA1Hphde9vgmohZdBflFpyVW1QikvNRjhC',
+  'zj2SOYQ1pzH6LX0qMScVJCchZh7RG2YZJBcIFRATPBGJD/UNgAwnC+kJxQi6B8YG6QUhBW0EzAM9',
+  'A74CTwLuAZoBUgEUAeAAtQCQAHIAWgBGADcAKgAgABgAEwAOAAoACAAGAAQAAwACAAIAAQABAAEA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI22MrKvrQapOaRKnzyaEpXRj3uKFYWkfy16tHQ+b9Fp',
+  'cmQmX/BZ11TdTwdLWEbSQXc9SjlMNXwx3S1sKionFyQvIXQe4ht5GTYXGBUeE0YRjw/2DXwMHgvb',
+  'CbMIpAeuBs4FBAVQBK4DIAOiAjQC1QGDAT0BAgHQAKcAhQBpAFIAQAAxACYAHQAWABEADQAJAAcA',
+  'BQAEAAMAAgACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAy7qHthqyhq3LqO2j7Z7PmZeU',
+  'SY/oiXmEAX+GeQt0l24tadRjkF5lWVhUbE+kSgRGjkFCPSQ5NDVxMdwtdSo7Jy0kSSGPHv0bkhlM',
+  'FysVKxNNEZAP8Q1xDA0LxgmZCIcHjgasBeIELQSMA/4CgwIXAroBawEoAe8AwACZAHkAXwBKADoA',
+  'LQAiABoAFAAPAAsACQAGAAUABAADAAIAAQABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADmvr26',
+  'abbrsUate6iNo3+eVZkSlLmOUYneg2R+6HhwcwFun2hPYxde+Vj6Ux1PZUrVRW5BMT0gOTs1gzH2',
+  'LZUqXydTJHAhtB4eHK4ZYhc6FTMTThGID+MNXAzyCqYJdghgB2UGgwW5BAQEZgPaAmEC+AGfAVMB',
+  'EgHdALEAjABvAFcARAA0ACgAHwAYABIADgAKAAgABgAEAAMAAwACAAEAAQABAAEAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAN3C0b6YujW2qLH0rBuoIaMIntOYiJMrjsCITIPTfVx463KFbS5o62LAXbJYw1P2',
+  'Tk1KzEVyQUI9PDlgNa8xJy7IKpInhCSdIdwePxzHGXMXQRUxE0MRdg/IDTsMzAp7CUgIMQc1BlMF',
+  'igTYAzwDswI+AtkBgwE6Af4AywCiAIAAZQBPAD0AMAAlABwAFgARAA0ACgAHAAYABAADAAIAAgAB',
+  'AAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAscbDwqi+YbrwtVaxlqyyp66ijZ1TmAWTpo08iMyCWn3r',
+  'd4RyKm3hZ61ikl2TWLRT9k5cSuhFmkF0PXU5nzXwMWguCCvOJ7okyyEAH1oc2Bl5FzwVIhMrEVUP',
+  'oA0MDJkKRQkQCPgG/QUdBVYEpwMPA4sCGQK5AWcBIwHqALsAlAB1AFwASAA4ACwAIgAaABQADwAM',
+  'AAkABwAFAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABgypLGl8Jwvhy6oLX7sDKsR6c9',
+  'ohid3ZePkjSN0Idngv58m3dBcvZsvGeYYo5dn1jPUx9PkUonRuJBwT3GOfA1PzK0Lk0rCyjtJPMh',
+  'HB9qHNsZbxcnFQMTAREjD2gN0AtZCgMJzge3Br4F4QQfBHUD4QJiAvUBmgFMAQwB1wCsAIgAbABV',
+  'AEIANAAoAB8AGAATAA8ACwAJAAcABQAEAAMAAgACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOrNP8pm',
+  'xl/CLb7QuUu1n7DQq+Gm1qGynHmXMZLcjIGHI4LIfHN3KXLtbMRnsGK1XdVYEVRtT+hKhEZDQiQ+',
+  'JzpNNpYyAS+QK0IoFiUOIikfaBzLGVMX/xTQEsYQ4Q4hDYULDQq3CIQHcAZ7BaIE5QNBA7MCOQLS',
+  'AXwBMwH4AMYAngB+AGMATgA+ADAAJgAeABcAEgAOAAsACAAGAAUABAADAAIAAQABAAEAAQAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAT9HIzRPKMMYhwue9g7n5tEmweauKpoGhYpwwl/CRpoxYhwiCvHx3dz1yEm35Z/Ri',
+  'Bl4xWXhU209bS/lGt0KTPpA6rTbrMkkvyStrKC8lFiIhH1EcpRkgF8EUiRJ4EI0OygwtC7UJYggy',
+  'ByMGMwVhBKsDDQOFAhICsQFgAR0B5QC4AJMAdQBdAEkAOgAuACQAHAAWABEADQAKAAgABgAFAAMA',
+  'AwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACQ1C7Rn83hyfjF48GjvT25sLQCsDOrSaZGoS+cCJfUkZiM',
+  'WYcZgt18qXd/cmNtWGhgY31esVn9VGJQ4kt9RzRDCD/5Ogg3NTODL/ArfygxJQYiAB8gHGYZ1RZs',
+  'FCwSFhApDmUMyQpVCQYI2wbTBesEIARxA9oCWgLuAZMBRwEJAdUAqwCJAG0AVwBFADcALAAiABsA',
+  'FQARAA0ACgAIAAYABAADAAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKzXcdQJ0XPNsMnDxavBar0EuXq0',
+  'z68HqyWmLKEhnAeX4pG2jIeHWIItfQh47nLfbd9o8GMUX0tal1X6UHRMBkixQ3Y/VztTN20zpi/+',
+  'K3koFiXZIcIe0xsNGXEWARS8EaMPtg30C1wK7QilB4IGggWiBOADOQOrAjICzQF4ATEB9wDIAKEA',
+  'gQBoAFMAQgA1ACoAIQAaABUAEAAMAAoABwAFAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAApdqS11HU',
+  '5NBLzYbJl8WAwUK94LhctLmv+6okpjmhPJwylx2SAo3jh8WCqX2TeIRzgG6HaZ1kwV/3Wj5WmFEG',
+  'TYpII0TVP6A7hzeJM6sv7StSKNskjCFlHmgbmBj1FYATOREhDzYNeQvoCYEIQgcoBjIFXASjAwYD',
+  'gAIOArABYQEfAekAvQCZAHsAYwBQAEAAMwApACAAGQAUAA8ADAAJAAcABQAEAAMAAgABAAEAAQAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAB73Y/aeNc11MbQLM1pyXzFacExvde4XLTFrxSrS6ZvoYOciZeGknuNbYhdg05+Qnk8',
+  'dD1vSGpcZXxgqlvmVjFSjk39SIFEG0DNO5o3gzOML7crBih9JB0h6B3hGgkYYhXrEqYQkg6uDPkK',
+  'cAkUCN8G0QXmBBoEbAPXAlkC7wGXAU0BEAHeALUAkwB3AGAATgA+ADIAKAAfABkAEwAPAAsACQAG',
+  'AAUAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAC3ga9192mXXItS00B3NXsl4xWzBPr3uuIC0969Vq5ym0aH2',
+  'nA2YGpMfjh6JGoQVfxB6DXUPcBZrI2Y5YVhcg1e6Uv9NVkm/RD1A1DuFN1UzRS9ZK5Qn+iOMIE0d',
+  'PxpkF7wUSBIIEPsNIAx2CvkIqAeBBn4FnwTeAzoDrgI5AtYBgwE+AQUB1gCvAI8AdABeAEwAPQAx',
+  'ACcAHwAYABMADgALAAgABgAEAAMAAgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAveIk4GHddNpe1x3UtNAjzWvJjsWO',
+  'wWu9KbnLtFGwwKsYp16ilJ27mNaT6I7xifWE9X/xeu116HDma+Zm62H2XAlYJlNQTopJ1UQ2QK87',
+  'RDf6MtIu0ir8JlQj3B+WHIYZqxYHFJkRYg9gDZIL9AmGCEMHKAYzBWAEqgMQA40CHgLBAXQBMwH9',
+  'ANAAqwCMAHIAXABLADwAMAAmAB4AFwASAA0ACgAHAAUABAADAAIAAQABAAEAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAs5bviI+Bi',
+  '3XnaZ9cs1MvQQ82VycTF0cG9vYu5PbXUsFSsvacTo1iejZmzlM6P3orkheOA23vPdr5xq2yYZ4Vi',
+  'dl1tWGxTd06QSbxE/j9aO9Q2cTI1LiMqPyaNIhAfyRu6GOQVSBPlELsOxgwHC3kJGQjlBtkF8QQp',
+  'BH4D7QJyAgoCsgFpASsB9wDMAKgAigBwAFsASQA7AC8AJQAdABYAEQANAAkABwAFAAMAAgACAAEA',
+  'AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAHnnMeXE4i/gc92P2oTXU9T70H/N3skbxjfCNL4TutW1frEOrYeo7KM8n3uaqZXIkNmL',
+  '3IbUgcF8pneCclltLGj9Ys9dpViDU2tOY0luRJI/0jozNrsxbS1OKWIlqyEtHuka4RcVFYYSMRAW',
+  'DjMMhAoHCbcHkwaVBbkE/QNcA9ICXgL7AagBYgEmAfQAygCmAIgAbwBaAEgAOQAtACMAGwAVABAA',
+  'DAAJAAYABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAApemG50Pl2uJL4Jbdutq615PUSNHazUjKlcbCws++v7qStkuy',
+  '6a1wqd+kOKB9m62WypHWjNCHuoKWfWV4KXPjbZdoRmP2XahYYlMoTv5I6kPxPhg6ZDXbMIEsWihq',
+  'JLQgOx0AGgMXRhTGEYMPeg2pCw0KoQhjB00GXAWNBNoDQgPAAlEC8gGiAV0BIwHyAMgApQCHAG0A',
+  'WABGADgALAAiABoAEwAOAAsACAAFAAQAAwACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACx67rpoOdj5QDjeuDO3f7aCdjw1LPR',
+  'VM7TyjDHbcOLv4u7brc0s9+ub6rlpUKhhpyzl8mSyI2ziImDTX4AeaVzPm7OaFlj411wWAZTqU1f',
+  'SC5DHD4uOWs01i91K0wnXyOwH0EcExknFnwTDxHhDuwMLwulCUsIHQcVBjEFbATCAzEDtAJJAu0B',
+  'nwFcASIB8QDHAKMAhQBsAFYARAA1ACkAIAAYABIADQAJAAcABQADAAIAAQABAAEAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJ7tzuvd6cnn',
+  'k+U6477gHt5a23PYadU80u3OfMvqxzfEZMByvGG4MrTlr3qr8qZNooydrpi2k6OOd4kzhNl+bHnt',
+  'c2FuymguY5Jd+ldtUu9MiUc/Qhk9HDhOM7QuUyouJkoipx5IGy0YVBW+EmgQTw5wDMcKUAkHCOcG',
+  '7AUTBVcEtAMnA64CRgLsAZ4BWwEhAfAAxQChAIMAaQBTAEEAMwAnAB0AFgAQAAwACAAGAAQAAwAC',
+  'AAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAa+/B7ffrDuoD6NflieMY4YXe0Nv32P3V4NKhz0DMvcgYxVPBbL1kuTu18bCGrPqnTaOA',
+  'npKZhZRajxGKroQxf555+HNEboZow2IAXUVXmFH+S4BGI0HvO+k2FzJ/LSQpCiU0IaQdWRpUF5MU',
+  'FRLWD9MNCgx0Cg4J1QfCBtIFAQVMBK4DJQOtAkYC7AGeAVsBIAHuAMMAngB/AGUAUAA+ADAAJAAb',
+  'ABQADgAKAAcABQADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAa8ZTv8e0w7E/qTugt5uzjiOEE313clNmp1pzTbNAZzaPJC8ZP',
+  'wnC+bLpFtvmxiK3yqDekV59TmiuV4Y93iu6ES3+QecFz5G3+ZxViMFxVVoxQ20pLReI/pjqfNdEw',
+  'QSzzJ+sjKSCvHHwZkBbpE4MRXQ9wDbsLNwriCLUHrQbFBfsESQSuAyYDsAJIAu0BngFaAR4B6wC/',
+  'AJoAewBhAEsAOgAsACEAGAARAAwACQAGAAQAAwACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKvySPHK7y/ud+yh6qzol+Zj5A7il9//',
+  '3Ebaaddq1EjRAc6WygbHUMNzv3C7RLfwsnOuzan9pAWg5JqclS+Qn4rvhCJ/PXlGc0FtNmcqYSZb',
+  'MFVRT5BJ9UOHPkw5SzSILwcrzSbbIjIf0hu6GOkVXBMQEQAPKQ2FCxIKyQimB6YGxAX9BE4EswMr',
+  'A7MCSgLuAZ0BVwEaAeYAugCUAHUAWwBGADUAKAAdABUADwALAAcABQADAAIAAQABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAH/Td8oLxDPB7',
+  '7s7sA+sa6RPn7OSl4j3gs90H2zjYRdUu0vDOjMsAyEvEbMBjvC24y7M8r4CqlqWAoD2b0ZU9kISK',
+  'q4S0fqd4iHJebDFmB2DqWeBT800pSItCID3uN/kySC7eKbwl5SFYHhUbGhhkFfESvBDCDv0MaQsC',
+  'CsIIpwerBswFBgVWBLoDMAO2AkoC7AGZAVIBFAHfALMAjQBuAFUAQQAwACQAGgASAA0ACQAGAAQA',
+  'AwACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAB19VP0GvPI8Vzw1e4z7XTrmOme54XlS+Px4HTe1NsQ2SbWFtPez3zM78g2xVDBO732uIC0',
+  '2a8Bq/ilv6BYm8SVB5AliiKEA37Od4txQWv4ZLdeh1hyUn5MtEYcQbs7mTa5MSAt0CjMJBIhpB1+',
+  'GqAXBRWqEooQog7sDGQLBQrMCLQHugbaBRIFYATBAzQDtwJIAucBkwFKAQsB1gCpAIUAZgBOADoA',
+  'KwAfABYAEAALAAcABQADAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAALH2rPWS9GHzGfK38Dvvpe3z6yPqNugp5vzjreE736Tc6NkF1/jT',
+  'wNBczcrJCMYVwu69lLkGtUKwSqsepr+gMJt0lY2PgolXgxN9vHZacPVplmNGXQ1X81ACS0BFtj9o',
+  'Olw1lzAbLOonBSRsIBwdFBpQF80UhxJ5EJ8O9AxzCxkK4gjKB80G6wUfBWkExgM0A7MCQgLfAYkB',
+  'PwEAAcsAnwB7AF0ARgA0ACYAGwATAA0ACQAGAAQAAgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0ffo9uz12vSz83TyHfGs7yHue+y36tXo',
+  '1Oax5GviAuBy3bra2dfL1JDRJc6IyrfGscJ1vgG6VbVxsFarBKZ9oMaa4ZTTjqGIUoLte3l1/26I',
+  'aBxixFuKVXZPkEneQ2k+NTlGNKAvRSs1J3Ej9x/FHNgZLBe9FIgShxC2DhANkws5Cv8I5AfjBvsF',
+  'KQVtBMUDLwOrAjcC0QF6ATAB8QC9AJIAcABUAD4ALQAgABcAEAALAAcABQADAAIAAQABAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADX+Aj4J/cz9ir1',
+  'DPTX8ovxJfCl7gntUOt46YDnZeUn48LgNd5+25vYiNVE0s3OIMs8xyDDyb43umq1Y7Aiq6ml+58d',
+  'mhGU3o2Khx2BnXoUdIptCWeZYENaEVQLTjhIn0JFPTA4YjPeLqYquCYUI7cfoBzKGTIX0hSoEq8Q',
+  '4Q49Db0LXwogCf0H9QYGBi4FawS+AyQDnAImAsABaAEeAeEArgCFAGQASgA2ACcAGwATAA0ACQAG',
+  'AAQAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAMT5DflG+G33gfaB9Wz0QfP+8aPwLO+a7errGuoo6BPm2eN24ejeLdxD2SfW1tJOz47Lksdb',
+  'w+a+NLpEtRiwsaoSpT6fO5kNk7qMS4bGfzR5nXINbIplH1/VWLRSxEwLR5BBWDxlN7syWy5FKncm',
+  '8CKuH60c6RleFwgV4xLrEBwPcw3sC4YKPgkSCAEHCQYqBWEErgMRA4cCDwKpAVIBCgHOAJ4AdwBY',
+  'AEEALgAhABcAEAAKAAcABQADAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAmvr5+Un5ifi399T23PXQ9K7zdPIh8bPvKe5/7LXqyOi15nrkFeKD',
+  '38HczNmi1kDTpM/Ly7XHYMPLvve547STrwiqRaRPniyY4ZF1i/GEXX7BdydxmWofZMNdjFeEUbFL',
+  'GUbBQK073zZZMhsuJSp0JgYj2R/nHC8aqxdXFTETNBFeD6sNGgyoClUJHggDBwIGGwVNBJYD9gJr',
+  'AvMBjgE5AfMAugCNAGkATQA3ACcAGwATAA0ACAAFAAQAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABZ+8z6MfqI+c/4Bfgp9zr2NvUc9OrynvE2',
+  '8LHuDO1F61npRecH5ZziAuA03THa9dZ/08vP2MulxzHDe76FuU+03K4vqU2jOp39lpyQIIqQg/V8',
+  'WXbFb0Np2mKVXHpWklDhSm1FO0BMO6M2PzIhLkYqrSZSIzIgSR2UGhAYuBWJE4IRnw/fDT8MwApf',
+  'CRwI9wbuBQAFLQR0A9MCSALSAXABHgHbAKYAfABbAEEALgAhABYADwAKAAcABAADAAIAAQABAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP8iPsB+2z6yvkX',
+  '+VX4gPeY9pv1h/Rb8xTysfAv74ztxOvW6b/neuUH42DghN1v2h/XkdPDz7XLZMfQwvq95LiOs/yt',
+  'M6g3og6cvpVQj8yIOYKiexB1i24daM9hp1uuVepPX0oSRQZAPDu0Nm8yay6lKhwnzCOyIMkdEBuE',
+  'GCAW4xPMEdgPBg5WDMcKWQkKCNsGywXZBAMESQOpAiACrQFPAQEBwwCRAGsATQA3ACcAGwASAAwA',
+  'CAAFAAMAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAmfwv/Ln7N/up+gz6YPmj+NX38vb79ez0xPOB8iDxn+/77THsPuof6NHlUeOc4K7dhdoe13jT',
+  'kM9ly/bGRcJRvR64rbICrSKnE6HcmoOUEI6NhwKBeHr4c4ttOmcMYQhbNVWYTzRKDkUlQHw7ETfk',
+  'MvMuOyu5J2skTSFdHpcb+xiFFjUUCRIAEBsOWQy7Cj8J5gevBpkFpATOAxYDeAL0AYYBLAHkAKoA',
+  'fQBbAEEALgAgABYADwAKAAYABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAe/cH8W/zq+2775fpN+qf57/gm+Ej3VPZJ9ST04vKA8f3vVu6G7Izq',
+  'Y+gJ5nvjtOCz3XXa99Y30zXP78plxpnBi7w/t7mx+6sNpvOftpldk/CMd4b9f4h5I3PWbKdmn2DD',
+  'WhhVok9kSmBFl0AJPLQ3lzOvL/srdygiJfch9h4dHGoZ3BZzFDASERAXDkQMlgoPCa0HcQZZBWQE',
+  'kAPcAkMCxQFdAQkBxwCTAGsATQA2ACYAGgASAAwACAAFAAQAAgACAAEAAQAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJH9Qv3q/Ij8G/yj+x/7jPrq+Tb5cfiW96X2',
+  'm/V29DPz0PFJ8JvuxOzA6ovoI+aE46vglt1C2q3W1dK6zlzKusXXwLW7V7bCsPmqBaXqnrCYYJIB',
+  'jJ2FO3/leKJyeWxxZpFg3VpaVQlQ7UoHRldB2zyTOHw0lDDZLEkp4iWiIogflBzFGRsXlxQ5EgMQ',
+  '9g0SDFgKyAhhByMGDAUaBEsDnQILApQBNAHnAKsAfQBaAEAALQAfABUADgAKAAcABAADAAIAAQAB',
+  'AAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA9f2x/WX9Ef2z/Ev8',
+  '1/tW+8b6KPp3+bT42/fr9uD1uvR08wzyf/DK7uns2eqX6CDmcOOE4Fvd8tlH1lrSKc62yQLFDsDe',
+  'una12a8PqhykCZ7cl56RV4sPhc5+m3h+cn5sn2boYFtb+1XLUMpL+kZZQuY9nzmENZAxxC0eKpwm',
+  'PiMFIPAcABo3F5YUHxLUD7UNwwsACmoIAgfGBbMEyAMBA1sC0gFkAQwBxwCSAGkASwA1ACUAGgAS',
+  'AAwACAAGAAQAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AABL/hH+0P2I/Tf93Px3/Ab8iPv7+l/6sPnu+BX4JPcY9u70pPM28qHw4+737NrqiugD5kLjReAJ',
+  '3Y3Zz9XP0Y7NDMlKxEy/FrqrtBCvTKllo2OdTJcokQCL24S/frR4wXLqbDRnomE3XPZW3lHwTCtI',
+  'j0MZP8k6nTaTMqsu5Co/J70jXiAkHRIaKRdsFN4Rfw9SDVcLjwn5B5MGXQVSBHADtAIYApsBNgHn',
+  'AKoAewBZAD8ALAAfABYADwAKAAcABQAEAAMAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAJX+ZP4s/u79qP1a/QL9n/wx/LX7KvuO+uD5HflD+FD3QfYS9cLzTfKw',
+  '8Ofu7+zG6mjo0uUB4/Pfp9wb2U/VQtH1zGnIosOhvmy5B7R3rsKo8KIGnQ2XC5EHiwmFF382eWxz',
+  'vG0qaLlia10/WDZTT06LSeZEYkD7O7I3hzN6L4srvCcPJIcgJx3yGesWFRRyEQUPzgzQCggJdgcY',
+  'BuwE7AMXA2cC2AFmAQsBxgCQAGgASwA1ACUAGgATAA0ACQAHAAUAAwACAAIAAQABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1P6q/nv+Rv4K/sb9ev0k/cP8Vvzb+1H7tfoG',
+  '+kL5Zvhv91v2KPXR81PyrfDa7tfsoeo26JLltOKZ30DcqdjS1L3Qa8zdxxfDHL7xuJqzHa6AqMmi',
+  'AJ0ql0+RdIufhdd/H3p7dO5ue2kjZOZexVm/VNRPAktKRqlBIT2wOFo0HjAALAMoKSR3IPEcmxl5',
+  'Fo4T3BBmDi0MMApvCOYGlQV2BIUDvwIdApsBNQHlAKgAewBZAEAALQAhABcAEQAMAAkABgAFAAMA',
+  'AgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJ/+b+vv6Q/l3+I/7h',
+  '/Zb9Qv3i/HX8+/tw+9T6I/pc+X34gvdp9i/10fNM8pzwv+6y7HHq++dM5WPiP9/e20DYZdRO0P7L',
+  'dse5wsu9srhxsw6ukKj8olidqpf4kUeMnYb8gGl75nV1cBhrzmWYYHVbZVZoUXtMoUfYQiM+gTn3',
+  'NIgwNiwIKAEkJiB+HAsZ0xXaEiAQqA1yC34JyAdPBg0FAAQgA2oC2AFkAQoBxQCQAGkATAA3ACgA',
+  'HQAVABAACwAIAAYABAADAAIAAgABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'ADb/GP/2/tD+pP5y/jn++P2u/Vr9+/yO/BP8iPvq+jf6bfmK+Ir3bPYr9cbzOfKB8Jzuhew86r3n',
+  'B+UY4u7eitvr1xPUAtC6yz7HksK6vbq4lrNUrvqojaMSno6YB5N/jfuHfoIJfZ93QHLtbKVnaGI2',
+  'XQ5Y8FLcTdRI2EPsPhI6TjWnMCEswSePI5AfyhtCGPwU+xFBD88MpAq+CBsHtAWHBI0DwQIdApoB',
+  'NAHmAKoAfQBcAEMAMgAlABsAFAAPAAsACAAGAAQAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAW/9C/yX/Bf/f/rT+g/5L/gv+wv1u/Q79ofwl/Jj7+PpC+nX5jviK92b2',
+  'IPW08yHyYvB27lnsCuqG58zk2+Gy3lDbt9fn0+LPqstCx67C8r0RuRC09K7CqX+kLp/UmXSUEY+u',
+  'iUyE7X6ReTh04m6PaT1k7V6fWVNUDE/KSZJEaD9QOlE1cTC3Kyon0iK1HtkaRBf4E/kQSA7kC8oJ',
+  '+QdsBh0FBgQiA2oC2AFlAQwByACVAG8AUwA+AC4AIwAaABQADwALAAgABgAEAAMAAgABAAEAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB6/2X/Tf8x/xH/7f7D/pL+W/4b/tH9ff0d/a/8',
+  'Mfyi+wD7R/p3+Yv4g/db9g/1n/MG8kPwUu4y7OHpXOej5LXhkt4526vX6tP4z9fLiscUw3i+vLni',
+  'tO+v5qrMpaSgcJszlu+QpItVhv+ApXtEdt1wb2v6ZX5g/Vp4VfFPbkrzRIY/LjrzNN0v9CpBJsoh',
+  'mB2xGRcW0BLdDzwN7QrsCDUHwgWNBJADwwIfAp4BOgHtALIAhgBlAE0AOgAsACIAGgAUAA8ACwAI',
+  'AAYABAADAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJP/gv9u/1b/O/8c//j+',
+  'zv6e/mf+J/7d/Yj9J/24/Dn8p/sC+0f6dPmF+Hn3Tfb/9Ivz8PEq8DjuGezJ6UjnleSv4ZfeTNvQ',
+  '1yXUS9BHzBnIxcNPv7q6CbY/sWCsbadpoladNJgFk8mNfogmg799SHjBciptg2fOYQ1cRFZ3UK1K',
+  '60Q6P6Q5MTTqLtopCCV+IEEcWBjHFI4Rrw4nDPUJEgh5BiQFCwQnA3AC4AFvARgB1gCjAH0AYABK',
+  'ADkALAAiABoAFAAPAAsACAAFAAQAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'qP+Z/4n/df9e/0T/Jf8B/9j+qP5w/jD+5f2Q/S79vfw8/Kn7AvtF+m/5fvhw90L28vR98+HxHfAu',
+  '7hLsyOlP56fkz+HH3pDbLNib1N/Q+8zxyMPEdcAIvH+33bIirlKpbKRxn2GaPJUAkK6KRIXCfyV6',
+  'cHSibrxow2K5XKRWjFB3Sm9EfT6tOAgzmi1sKIgj9h67Gt0WXRM9EHsNFAsECUMHzAWWBJkDzgIt',
+  'Aq8BTQEBAccAmgB4AF4ASQA5ACwAIgAaABMADgAKAAcABQADAAIAAQABAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAC5/63/n/+O/3v/Zf9L/yz/CP/f/q/+d/42/uv9lf0x/cD8Pvyp+wH7Qvpr',
+  '+Xn4avc89uz0efPg8SDwN+4j7OPpd+ff5BniJ98J3MDYTtW00fPND8oIxuHBnL04ubm0HrBpq5em',
+  'qqGgnHeXMJLHjDyHj4G/e811u2+MaUVj7FyIViJQxEl5Q0w9Szd/MfUrtybNIT8dExlLFekR6g5O',
+  'DA0KIwiHBjMFHAQ7A4gC+wGMATYB8wC/AJcAdwBeAEoAOgAtACIAGgATAA4ACQAGAAQAAwACAAEA',
+  'AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMf/vf+x/6P/k/+A/2r/UP8x/w7/5P60/nv+Ov7v',
+  '/Zj9NP3B/D78qfsA+0H6avl4+Gv3P/by9IPz8PE48FjuUOwf6sTnP+WQ4rjft9yN2TzWxtIrz23L',
+  'jMeKw2i/JbvDtj+ym63TqOej1Z6cmTiUqo7wiAmD+Hy+dl5w3mlEY5hc5FUzT5FICkKtO4U1ny8H',
+  'Ksck5h9rG1kXsxN3EKMNMQsbCVoH5QWzBLoD8wJVAtgBdgEpAe0AvQCXAHkAYABLADsALQAiABkA',
+  'EgANAAkABgAEAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0v/K/8D/tf+n/5f/hP9u',
+  '/1T/Nv8S/+j+t/5//j3+8v2a/Tb9w/xA/Kv7A/tF+m/5gPh19072B/Wf8xXyaPCV7p3sfeo36Mrl',
+  'NeN64Jfdj9pi1w/UmdD/zEHJYcVcwTO95LhutM+vBKsMpuSgipv9lTqQQooWhLl9LXd4cKJps2K1',
+  'W7VUv03iRitAqTlqM3kt4ieuIuUdiRmfFSQSFw9zDDAKSAiwBmAFTwRyA8ECNQLFAW0BJgHuAMAA',
+  'mwB8AGIATQA7AC0AIQAYABEACwAIAAUAAwACAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADb',
+  '/9T/zP/D/7j/qv+a/4f/cf9X/zn/Ff/r/rv+gv5A/vX9nv05/cf8Rfyx+wr7T/p8+ZH4jPdr9iz1',
+  'z/NR8rHw7+4J7f/q0eh+5gXkaeGn3sDbtdiG1TLSuM4Zy1LHZMNLvwW7kbbqsQ+t/aewoiedYZdd',
+  'kRyLoITtfQp3/W/PaI1hQ1r+Us5LwkTqPVM3DDEgK5slgyDeG68X9ROuENYNZQtUCZkHKgb9BAkE',
+  'RAOmAicCwQFuASsB9ADGAJ8AfwBkAE0AOwArAB8AFgAPAAoABgAEAAIAAQABAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAOP/3f/W/87/xf+6/6z/nf+K/3T/Wv88/xj/7v6+/oX+RP75/aL9P/3O/E78',
+  'vPsZ+2H6k/mu+LD3mPZk9RP0o/IU8WXvle2i647pVuf85H7i3d8X3S3aHdfm04jQ/8xLyWnFVcEN',
+  'vY240rPYrp2pHaRYnk2Y/JFoi5WEiX1LduZuZWfXX0lYy1BuSUNCWTu/NIEurChII1oe5xnuFW0S',
+  'YA/ADIQKowgTB8oFvATgAy4DngIoAscBdwE0AfwAzACkAIEAZABMADkAKQAdABQADQAIAAUAAwAC',
+  'AAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6P/k/97/2P/Q/8f/vP+u/5//jP92/13/Pv8b//H+',
+  'wf6J/kn+//2p/Uj92fxc/M77L/t8+rX52Pjj99b2r/Vs9A3zkfH37z3uZOxq6k/oEuaz4zDhiN66',
+  '28XYptVb0uHONctUxzrD4r5Jumy1RbDUqhWlCJ+tmAeSGovsg4V873Q3bWplml3VVS5OtUZ8P5M4',
+  'BzLlKzYmAiFLHBMYWRQWEUYO3wvXCSQIuwaRBZ0E1AMwA6cCNgLXAYYBQAEFAdIApgCCAGMASgA1',
+  'ACYAGgARAAsABwAEAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADt/+n/5f/g/9n/0f/I/73/',
+  'sP+h/47/ef9f/0H/Hv/1/sb+j/5Q/gf+tP1V/er8cPzn+037ofri+Q/5Jfgl9wz22vSN8yXyoPD+',
+  '7j7tX+tg6T/n++ST4gXgT91t2l7XHtSp0PrMD8nhxG3ArruhtkKxjquFpSafdZh1kSyKo4Lkevxy',
+  '+mruYula/lI/S71Dijy0NUkvUynaI+IebBp4FgAT/w9qDToLYgnXB48GfwWeBOIDRAO/Ak0C6wGW',
+  'AUwBDAHVAKcAfwBfAEUAMQAiABYADgAJAAUAAwABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPH/',
+  '7v/q/+b/4f/a/9P/yv+//7L/o/+R/3v/Yv9F/yL/+/7M/pf+Wf4T/sL9Z/3//Ir8B/x0+9H6G/pS',
+  '+XX4gvd59lj1H/TL8l3x0+8r7mXsf+p36Ezm+uOA4dreBdz92L3VQtKGzoPKNsaZwai8X7e7sbur',
+  'X6Wqnp6XQpCgiMCAsXiCcENoBmDfV+BPHUimQIw53TKkLOkmsiEAHdIYJRXyETAP1QzWCicJvgeP',
+  'BpEFugQEBGcD3wJoAgACpQFVARAB1QCjAHoAWQA/ACsAHQASAAsABwAEAAIAAQAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAA9P/y/+//6//n/+L/2//U/8v/wP+0/6X/k/9+/2b/Sf8o/wH/1P6h/mb+Iv7V',
+  '/X79G/2s/C/8pPsJ+176ofnR+O339Pbl9b/0gPMn8rPwIu9z7aPrsOmY51fl6uJM4HvdcNon15rT',
+  'xM+fyybHVMIlvZe3prFUq6GkkZ0rlneOgYZUfgF2mG0tZdJcnVSfTOtEkz2lNi0wNSrCJNYfcBuO',
+  'FykUOBGxDokMtAomCdUHtgbBBe0ENASSAwMDhAITArABWgEPAdAAnAByAFEAOAAlABgADwAJAAUA',
+  'AwABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAD2//T/8v/v/+z/6P/i/9z/1f/M/8L/tv+n/5b/gv9q',
+  '/0//L/8K/9/+rf51/jX+7P2Z/Tz90/xe/Nv7S/uq+vr5N/li+Hr3fPZo9T30+PKY8Rvwf+7B7N7q',
+  '0+ib5jPkluG+3qbbSdig1KXQUsyjx5PCHr1Ct/+wVqpLo+SbKJQjjOKDdXvtcl1q2WF1WUZRXknP',
+  'Qak6+DPHLRoo9yJcHkYarhaNE9gQhQ6GDNEKWgkWCP0GCAYuBW0EwAMlA5sCIAK0AVcBCAHGAJEA',
+  'ZwBHAC8AHgATAAsABgADAAIAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAPj/9//1//P/8P/s/+j/4//e',
+  '/9b/zv/E/7j/qv+a/4b/cP9W/zf/FP/r/r3+h/5L/gb+uf1i/QD9k/wZ/JL7/fpZ+qX53vgF+Bj3',
+  'Fvb79MjzefIN8X/vzu316+/puudP5ajiwd+T3BfZR9Ud0ZPMpcdPwo68YbbKr8uoaqGwmaiRXYnh',
+  'gER4mm/3Zm9eGFYETkdG7z4MOKYxxituJp8hVh2MGTsWVxPVEKoOyQwoC7sJeghcB10GdwWmBOoD',
+  'QQOpAiMCrwFNAfoAtwCDAFoAPAAnABgADgAIAAQAAgABAAAAAAAAAAAAAAAAAAAAAAAAAAAA+v/5',
+  '//f/9f/z//D/7f/p/+T/3//Y/9D/xv+7/67/nv+M/3b/Xv9B/yD/+v7O/pz+ZP4k/tz9i/0x/cz8',
+  'XPzf+1X7vfoV+l35kvi098D2tfWQ9E/z7vFq8L/u6ezj6qjoMeZ543ngKt2G2YbVJdFdzCrHicF5',
+  'u/u0EK7AphKfD5fGjkaGoH3ndC9sj2MaW+RSAUuBQ3E83jXOL0UqRSXLINAcTRk4FoYTKxEaD0oN',
+  'rgs/CvQIyAe3Br0F2QQKBFADqwIcAqEBOgHnAKQAcgBMADEAHgASAAoABQADAAEAAQAAAAAAAAAA',
+  'AAAAAAAAAAAAAAD7//r/+f/3//b/9P/x/+7/6v/m/+D/2v/S/8n/vv+y/6P/kv9+/2f/TP8t/wr/',
+  '4f60/oD+Rf4D/rj9Zf0I/aH8Lvyv+yL7hvra+Rz5S/hj92T2SfUR9LfyN/GM77Ptpetb6dHm/uPd',
+  '4Gbdktlc1b7Qsss3xkrA7Lkes+irTqRdnCCUp4sDg0d6iHHZaFFgBFgFUGVIMUF3Oj00iC5aKbAk',
+  'hSDQHIkZpBYVFNERzA/8DVkM2gp6CTYICgf3BfwEGQRPA54CBwKIASABzgCOAF8APQAmABcADQAH',
+  'AAMAAgABAAAAAAAAAAAAAAAAAAAAAAAAAPz/+//6//n/+P/2//T/8v/v/+v/5//i/9z/1f/M/8L/',
+  't/+p/5n/hv9x/1j/PP8b//b+zP6d/mf+K/7n/Zr9Rf3m/H38B/yE+/P6Ufqe+db4+PcB9+31uPRg',
+  '897xLvBK7i3szukp5zXk6+BF3TzZytTrz5rK18Sgvvi35LBqqZShb5kJkXOIwH8Fd1VuxmVsXVtV',
+  'pE1WRns/HjlCM+ktEim3JNEgVh08GnYX+hS7ErEQ0g4XDXsL/AmYCE0HHgYKBRQEPAOCAuYBZgEA',
+  'AbIAdwBNADAAHAAQAAkABAACAAEAAAAAAAAAAAAAAAAAAAAAAAAA/f/8//v/+//5//j/9//1//L/',
+  '8P/s/+j/5P/e/9f/0P/G/7z/r/+g/4//fP9l/0z/Lv8M/+b+u/6K/lP+Ff7Q/YL9Kv3J/Fz84ftZ',
+  '+7/6FPpT+Xv4iPd19kH15PNb8p/wq+537P3pNucb5KTgytyI2NnTuM4kyRzDory5tWiuuaa3nnCW',
+  '9I1Xhax8B3R9ayNjC1tHU+ZL9ER6Pn04/jL8LXQpXCWtIVseWxuhGCMW1xO1EbYP1w0UDG0K4gh2',
+  'BykG/wT4AxUDVgK5ATwB3ACUAGAAOwAjABQACwAFAAMAAQAAAAAAAAAAAAAAAAAAAAAAAAD9//3/',
+  '/P/8//v/+v/5//f/9f/z//H/7v/q/+b/4f/a/9P/y//B/7b/qP+Z/4f/c/9c/0H/I/8A/9n+rf57',
+  '/kP+A/67/Wv9EP2q/Db8tPsh+3r6vfnn+PT33/al9UD0qvLd8NPuhOzp6fzmteMN4P7bg9eX0jjN',
+  'ZscgwWy6TrPPq/uj35uLkxCLgoL1eXxxLWkaYVVZ61HqSltEQj6iOHozxS59KpgmDCPOH9McEBp7',
+  'Fw4VwxKWEIUOkgy9CgoJewcUBtYExAPcAh0ChQEPAbYAdgBKACwAGQANAAcAAwABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAP7//f/9//z//P/7//r/+f/4//b/9P/y/+//7P/o/+P/3v/X/9D/x/+9/7H/o/+T',
+  '/4H/bP9U/zn/Gv/3/s7+of5t/jP+8f2l/VD97/yA/AL8cvvO+hL6OvlD+Cj35PVy9Mry6PDD7lXs',
+  'lumA5gvjMt/u2jzWGNGCy3nFAb8guNywQalcoTuZ75CLiCKAyHeRb45n0l9qWGNRx0qZRN4+kzm1',
+  'ND0wIixbKNwkmiGMHqgb6BhHFsMTWhEQD+YM4goGCVkH3AWRBHoDkwLaAUsB3wCRAFoANgAfABEA',
+  'CAAEAAIAAQAAAAAAAAAAAAAAAAAAAAAA/v/+//3//f/9//z/+//7//r/+P/3//X/8//x/+7/6v/m',
+  '/+H/2//U/83/w/+5/63/n/+O/3z/Zv9O/zL/Ev/u/sT+lf5e/iD+2f2H/Sr9vvxC/LP7DftP+nL5',
+  'dPhP9/71evS+8sLwgO7x6wzpzeUr4iLertnK1HXPsMl9w+G847WMruimBp/2lsiOkYZifk92aW7B',
+  'ZmZfY1jCUYhLt0VOQEo7pDZUMk8ujCoAJ6EjZiBMHUwaZhebFO4RZQ8EDdEK0wgMB4IFMwQeAz8C',
+  'kgEQAbEAbwBCACYAFAAKAAUAAgABAAAAAAAAAAAAAAAAAAAAAAD+//7//v/+//3//f/8//z/+//6',
+  '//n/+P/2//T/8v/v/+z/6f/k/9//2f/S/8r/wf+2/6r/m/+L/3f/Yf9I/yv/Cv/j/rf+hP5J/gT+',
+  'tf1Z/e78cfzh+zj7dPqQ+Yj4Vvf19V30ivJz8BLuYetX6PDkJeHx3FLYRdPKzeTHlcHlutyzhazu',
+  'pCWdO5VBjUqFZ32rdSRu4GbsX09ZEFMwTa9HiUK3PTI58DTmMAstVim+JUAi2B6HG04YNBU+EnUP',
+  '3wyFCmwImAYJBb8DtQLlAUkB1wCHAFEALgAZAA0ABgADAAEAAAAAAAAAAAAAAAAAAAAAAP7//v/+',
+  '//7//v/9//3//f/8//v/+//6//n/9//2//T/8f/u/+v/5//j/97/2P/R/8j/v/+0/6f/mP+H/3P/',
+  'XP9B/yL//v7U/qP+av4m/tj9fP0Q/ZH8/ftP+4P6lvmB+ED3zPUg9DTyAvCE7bLqhuf74wzgtdv1',
+  '1srRNsw9xuS/MrkysvCqeqPfmy+UfIzXhE999XXUbvhnamEuW0dVs09wSnZFvkA9POw3vzOvL7Qr',
+  'yyfyIysgehznGHkVOxI3D3YM/wnXBwAGeQQ9A0YCiwEDAaMAYgA4AB8AEAAIAAMAAQABAAAAAAAA',
+  'AAAAAAAAAAAA//////7//v/+//7//v/9//3//P/8//v/+v/5//j/9//1//P/8f/u/+v/5//i/93/',
+  '1//P/8f/vf+y/6T/lf+C/23/VP83/xT/6/67/oP+QP7w/ZP9JP2i/Aj8U/t++oX5Y/gS94v1yvPH',
+  '8Xvv4ezy6anmAeP33ofasdV20NnK3sSMvuy3CrHxqbCiVpvzk5eMUIUtfjt3gnAMat1j9l1XWPtS',
+  '3U30SDdEnT8cO602STLuLZwpViUhIQodGBlaFdsRpw7HC0IJGQdOBdkDtgLYATYBwwB2AEQAJQAT',
+  'AAkABAACAAEAAAAAAAAAAAAAAAAAAAD///////////7//v/+//7//v/9//3//P/8//v/+v/5//j/',
+  '9v/1//P/8P/t/+r/5v/h/9z/1v/O/8X/u/+v/6D/j/97/2P/R/8l//3+zf6U/lD+//2f/Sz9pfwE',
+  '/Ef7aPpj+TP40vY69WXzTPHq7jnsNOnV5Rni/d2A2aPUZ8/RyebDrr00t4KwpamsoqObm5ShjcGG',
+  'B4B9eSlzD20xZ41hIFziVsxR1UzyRxxDSz56Oag01S8HK0YmnyEeHdQYzhQcEcgN2wpYCEAGiwQ1',
+  'AzACcAHpAI0AUQAtABcACwAFAAIAAQAAAAAAAAAAAAAAAAAAAP/////////////+//7//v/+//7/',
+  '/f/9//3//P/8//v/+v/5//j/9v/0//L/8P/t/+r/5f/h/9v/1P/M/8P/t/+q/5n/hv9v/1P/Mf8J',
+  '/9j+nv5Y/gX+of0q/Zz89fsv+0b6Nfn494j24PT68tHwXu6c64foHOVW4TXdudjj07fOOclww2a9',
+  'I7ezsCOqgKPWnDKWoI8pideCr3y1dulwSGvQZXhgOlsKVuJQtkuCRkFB8zuYNjwx5SulJoohqhwR',
+  'GNcTAxClDL0JTwdUBcUDlAK0ARQBqABhADUAHAANAAYAAwABAAAAAAAAAAAAAAAAAAAA////////',
+  '///////////+//7//v/+//7//f/9//3//P/7//v/+v/5//j/9v/0//L/8P/t/+n/5f/f/9n/0v/J',
+  '/77/sf+h/47/d/9b/zn/EP/e/qL+Wv4D/pv9H/2M/N37D/sd+gL5ufc+9on0l/Ji8OTtGuv/55Hk',
+  'zuC13EnYitN9zijJk8PGvcq3rLF1qzOl7560mIuSe4yJhreABXtwdfVvimooZcVfWVraVERPkUnE',
+  'Q9497Tf6MRksWybZIKUb1hZ5Ep8OSQt/CDUGaAQFAwACRQHGAHMAQAAhABAABwADAAEAAAAAAAAA',
+  'AAAAAAAAAAD////////////////////////+//7//v/+//7//f/9//3//P/7//v/+v/5//f/9v/0',
+  '//L/7//s/+j/4//d/9b/zf/D/7b/p/+T/3z/YP89/xP/4P6i/lf+/f2R/RD9d/zC++368/nQ+H/3',
+  '+/U/9EbyC/CL7cHqqudG5JLgkNxA2KjTy86vyVzE2r40uXGznq3Cp+ehFJxPlpuQ+4pshex/dXr+',
+  'dIBv72lEZHVeflhaUg1MmkUQP3s48zGKK18lhR8ZGikVyhD+DM4JLwcdBYMDVQJ9AekAiABMACcA',
+  'EwAJAAQAAgABAAAAAAAAAAAAAAAAAP/////////////////////////////+//7//v/+//7//f/9',
+  '//3//P/7//v/+v/5//f/9v/z//H/7v/q/+b/4P/Z/9H/xv+6/6r/l/9//2L/Pv8T/97+nv5Q/vP9',
+  'hP3//GH8p/vN+s75pvhR98n1C/QS8tnvX+2f6pjnSOSw4NHcrdhJ1KnP08rPxaXAW7v8tY+wGqul',
+  'pTOgx5pglf2PmoovhbR/IXppdIVua2gXYoVbulS5TZZGXD8pOA8xNSqtI5wdERgkE9oOPQtCCOUF',
+  'EAS1ArsBEQGfAFkALwAXAAsABQACAAEAAAAAAAAAAAAAAAAA////////////////////////////',
+  '///////+//7//v/+//7//f/9//3//P/7//r/+f/4//f/9f/z//D/7P/o/+L/3P/T/8n/vP+s/5j/',
+  'gP9i/z3/Ef/a/pj+Sf7p/Xf97/xP/JL7tfq0+Yv4Nfew9fXzA/LW72rtvurR56LkMuGC3ZfZc9Ub',
+  '0ZbM6scdwza+PLkztCGvCarrpMafl5pYlQOQjIrshBV//3igcvVr+WS0XSlWbU6ORq0+4TZSLxgo',
+  'XCEtG60V3BDLDG0JwAaqBB8DAQI9AboAaAA3ABwADQAGAAMAAQABAAAAAAAAAAAAAAD/////////',
+  '///////////////////////////////+//7//v/+//7//f/9//z//P/7//r/+f/4//b/9P/x/+3/',
+  '6f/k/93/1f/K/73/rf+Y/4D/Yf88/w7/1v6T/kL+4f1u/eX8Q/yG+6n6qvmE+DP3tfUG9CLyB/Cz',
+  '7SXrW+hX5RnipN762iDXGdPrzpvKLsapwRG9Z7its+OuBqoSpQCgyJpelbmPy4mNg/J893WZbt9m',
+  'zl5+VvxNcEXwPKw0vCxQJXoeYBgDE3gOsQquB1QFlANOAm4B2AB6AEEAIQAQAAcAAwABAAEAAAAA',
+  'AAAAAAAAAP/////////////////////////////////////////////+//7//v/+//7//f/9//z/',
+  '/P/7//r/+P/3//X/8v/u/+r/5f/e/9X/y/+9/63/mP9//2D/Ov8M/9T+kP4+/t39av3i/EL8h/uu',
+  '+rT5lvhP99/1QPRy8nHwPe7V6zjpaOZl4zLg0dxG2ZTVwNHNzb7JlsVXwf+8jbj+s0uvbapapQWg',
+  'ZZpqlAuOPof9f0Z4IHCRZ7JelFVgTC9DNjqQMXMp8iE5G0wVQhANDLAIDAYUBKMCpQH6AI8ATQAo',
+  'ABQACQAFAAIAAgABAAEAAAAAAAAA////////////////////////////////////////////////',
+  '///+//7//v/+//3//f/9//z/+//6//n/9//1//L/7//r/+X/3v/W/8v/vv+t/5j/f/9g/zr/C//T',
+  '/pD+P/7f/W796fxN/Jf7xvrV+cP4jPcu9qf09PIV8QjvzOxj6s3nCuUe4grf0dt12PnUX9GnzdHJ',
+  '3cXGwYi9HLl3tJCvWKrFpMeeU5hdkeKJ3YFWeVNw72Y9XWhTjEniP4g2ui2OJTUesxcnEoANxQnT',
+  'Bp8EAQPiASABpgBbADAAGQANAAcABAADAAIAAQAAAAAAAAD/////////////////////////////',
+  '/////////////////////////v/+//7//v/+//3//f/8//v/+v/5//j/9f/z/+//6//m/9//1v/L',
+  '/77/rf+Z/4D/Yf87/w3/1v6V/kb+6f17/fv8Zfy4+/H6DvoM+en3o/Y49abz7fEM8APu0ut66fvm',
+  'WOSR4anen9t12CvVv9EtznPKiMZlwv69Sbk3tLmuwahCojCbh5M/i2SC+Xgdb+FkdFr1T6FFmDsd',
+  'MkYpTCE1GiUUCA/sCqkHNwVoAycCTAHCAGwAOwAgABEACwAHAAUAAwADAAEAAQAAAP//////////',
+  '/////////////////////////////////////////////////v/+//7//v/9//3//P/8//v/+f/4',
+  '//b/8//w/+v/5v/f/9f/zP+//6//mv+C/2T/P/8T/97+n/5U/vv9k/0a/Y386/sy+1/6cPlk+Dr3',
+  '7/WC9PTyQvFu73ftXusj6cfmSuSt4e7eDdwG2dXVdtLezgfL4sZkwny9HLg0srWrk6THnEyUKotm',
+  'gR93ZmxvYVhWY0uzQI82Ei16JM4cOBalECQMjgjbBdkDdAJ+AeIAgQBJACkAGAAQAAsACQAGAAUA',
+  'AgACAAAA//////////////////////////////////////////////////////////////7//v/+',
+  '//7//v/9//3//P/7//r/+P/2//P/8P/s/+f/4P/Y/83/wf+x/53/hv9p/0b/HP/q/q7+aP4V/rT9',
+  'RP3C/C78hPvE+uz5+vju98b2gPUe9J3y/vBB72btbOtT6Rnnv+RA4prfxty+2XrW7tINz8nKEsbX',
+  'wAe7k7RsrYul6pyRk4SJ4X67c0hoplwcUc5FCzvtMLwnfR9iGFgScg2HCZAGWQTNArsBDQGeAF4A',
+  'OgAlABsAFAAQAAsACAADAAMAAAD/////////////////////////////////////////////////',
+  '//////////////////7//v/+//7//f/9//z/+//6//j/9v/0//H/7f/o/+H/2f/P/8P/tP+i/4v/',
+  'cP9Q/yn/+v7D/oP+N/7f/Xn9BP1+/Ob7O/t7+qX5uPiz95b2X/UO9KPyHPF677vt3eve6brnbeXx',
+  '4j3gSN0H2mrWY9LhzdDIIMPAvKC1uK0ApX+bOJFLhsl66m7MYrxW3EqEP800CCs6Ip0aHBTSDpAK',
+  'VAfmBDIDAgI/AcMAegBPADcAKgAhABwAFAAPAAcABgAAAP//////////////////////////////',
+  '///////////////////////////////////////+//7//v/+//3//f/8//v/+v/5//f/9P/x/+7/',
+  '6f/j/9v/0v/H/7n/qP+T/3r/Xf85/w//3f6j/l/+Ef62/U792fxT/L37Fvtc+o/5rfi296n2hfVK',
+  '9PXyhvH570zue+yA6lTo7+VG403g89wq2d/U/s91yjLEJL1BtX+s5qJ3mFGNhIFKdcJoOlzXT/VD',
+  'sDhfLgkl7Rz4FUgQrwstCIYFpwNXAn4B8gCeAG0ATwA/ADIAKwAfABgADQAKAAAA////////////',
+  '/////////////////////////////////////////////////////////////v/+//7//v/9//3/',
+  '/P/7//r/+f/3//X/8v/v/+r/5f/e/9X/y/++/6//nf+G/2z/TP8n//v+yP6M/kj++f2f/Tr9x/xH',
+  '/Lf7GPtp+qj51fju9/P24fW39HHzDfKF8NPu8ezU6nHou+Wj4hjfBdtX1vvQ3Mrpwxe8WrO4qTKf',
+  '45Pfh1x7e26NYbdUWUiSPL8x5ydSH+sX2BHoDB8JPQYyBL8CzwExAdIAmAB1AGEAUABFADQAKQAX',
+  'ABIAAAD/////////////////////////////////////////////////////////////////////',
+  '/////////v/+//7//v/9//z//P/7//n/+P/2//P/8P/s/+f/4f/Z/9D/xf+3/6f/lP98/2H/Qf8b',
+  '/+/+vP6C/j/+8/2d/Tz90PxX/NL7Pvub+uf5IvlJ+Fn3UfYr9ePzcvLQ8PTu0uxc6oLnMuRZ4OHb',
+  'tdbB0PLJO8KQufOvZqUBmteNH4H4c7Zmflm1THtAMTXiKtwhCRqXE1EOQQokB+sEVQNLApoBLAHp',
+  'ALwAogCJAHgAXQBIACoAIAAAAP//////////////////////////////////////////////////',
+  '//////////////////////////////7//v/+//7//f/9//z/+//6//n/9//0//L/7v/q/+T/3v/W',
+  '/8z/wf+z/6L/jv93/1z/PP8X/+z+vP6E/kX+/v2u/VT98PyA/AT8e/vi+jf6efmj+LL3ofZo9f/z',
+  'XfJ18DnumeuD6OLkoOCo2+TVQc+vxyG/l7URq6efaZOOhjR5sGsoXgNRY0SvOPEtgCRFHHQV2A9/',
+  'CyQIuQX6A9MCDAKOAT4BBwHmAMUArQCHAGoAPgAsAAAA////////////////////////////////',
+  '///////////////////////////////////////////////////+//7//v/+//3//f/8//z/+//5',
+  '//j/9v/z//D/7f/o/+P/3P/U/8r/vv+w/6D/jf92/1z/Pv8b//T+xv6T/ln+F/7O/Xv9Hv22/EH8',
+  'vPsm+3v6tvnS+Mj3kfYh9W3zZvH87hzssuin5OXfVtrk03/MGcSvukCw4aSimLeLQH6OcMtiXlVq',
+  'SFs8PTFrJ9EeqBe6ERsNgQnkBvwEtgPWAkUC5gGiAXcBSAEjAecAtgBuAE0AAAD/////////////',
+  '///////////////////////////////////////////////////////////////////////////+',
+  '//7//v/+//3//f/8//v/+v/5//f/9f/z//D/7P/n/+L/2//T/8r/vv+x/6L/kP97/2P/R/8n/wP/',
+  '2f6q/nX+Of70/ab9Tf3n/HH85/tG+4j6pvmY+FT3zfX2877xEe/c6wfofeMl3urXutCFyEe//bS5',
+  'qYudo5Ahg1Z1amfGWY9MM0DBNJcqoyEjGuIT+Q4cC0YILwbEBMYDHAOqAlUCGwLbAaUBUAEGAZ4A',
+  'awAAAP//////////////////////////////////////////////////////////////////////',
+  '/////////////////////v/+//7//v/+//3//f/8//v/+v/5//f/9f/y/+//7P/n/+L/3P/U/8v/',
+  'wf+1/6f/lv+D/23/VP83/xb/8f7F/pP+Wf4V/sf9av37/Hf82PsW+yz6Dfmu9wH29vN68Xju2eqI',
+  '5mrhbNt31H7Md8NguUmuPqJulfiHKnotbGleA1FsRLQ4PS72JCMdjxZXETINGwrNBzQGEQVHBLwD',
+  'TAP/AqYCWALbAW4B2gCWAAAA////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////v/+//7//v/9//3//P/8//v/+v/5//f/',
+  '9f/z//D/7P/o/+P/3v/X/8//xv+7/67/n/+O/3v/ZP9J/yr/Bf/a/qf+av4h/sf9Wv3T/C38YPth',
+  '+iX5nve99W7znvA17R7pPeSA3s7XGNBVx4C9pLLPpiua1YwZfyBxT2PNVQpJGD1cMscooiC4GS0U',
+  'uA9ZDMsJ/getBr8FEgWHBCAErANCA5gCAQI0AdQAAQD/////////////////////////////////',
+  '/////////////////////////////////////////////////////////////////////v/+//7/',
+  '/v/9//3//P/8//v/+v/5//f/9v/z//H/7v/q/+b/4f/b/9T/y//C/7b/qf+Z/4f/cP9W/zb/D//f',
+  '/qT+W/4A/o39/vxJ/GX7Sfrk+Cr3BvVn8jTvWOu45kHh2tpz0wDLfcHwtmerB5/tkWCEh3bGaENb',
+  'bU5XQmg3ki0iJeYdBhg9E44PuQyuCicJCQg0B4IG+gVaBb4EzgPvAsUBNwEBAP//////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////v/+//7//v/+//3//f/8//v/+v/5//j/9v/1//L/8P/t/+n/5P/f/9n/0f/I',
+  '/73/sP+h/43/df9X/zH/Av/F/nj+Fv6Y/fn8Lvwt++n5U/hZ9urz7vBQ7fXoyuO13afWkc5vxUO7',
+  'G7AUpE6XBopnfMxuXWGFVFlIQD0uM3Mq4iKnHIEXdxNPEPwNNQzeCtYJ9whACG4HmQZTBSAEhgK8',
+  'AQEA////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////v/+//7//v/+//3//f/8//z/+//6//n/+P/2',
+  '//T/8v/v/+z/6P/j/93/1f/M/8H/sv+g/4j/av9D/xD/z/56/gz+f/3J/OL7vPpK+Xn3O/V28hnv',
+  'COsw5nfgz9km0njJxL8WtYepNJ1VkBODwXWKaNBbqk99REI6SDFmKc4iRh3WGFEVqxKZEP0Otw2Z',
+  'DKcLjApbCZwH3wWZA3wCAgD/////////////////////////////////////////////////////',
+  '///////////////////////////////////////////////////////////////////+//7//v/+',
+  '//7//f/9//z//P/7//r/+f/3//b/8//x/+7/6v/k/97/1f/K/7z/qf+R/3D/Rv8O/8T+ZP7o/Ub9',
+  'd/xu+x/6efht9uPzyvAI7YvoOOMC3dTVrM2DxGa6Z6+ho0aXe4qMfaJwGWQLWNZMd0JAOQ0xFCoi',
+  'JEYfXRtcGPcVEBSBEiMR6w+ADusMlwozCB8FfwMFAP//////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////+//7//v/+//7//f/9//3//P/7//v/+v/4//f/9P/y/+7/6f/j/9r/z//A/6z/',
+  'kf9t/z3//f6p/jz+rf32/An83fph+Yj3O/Vq8v3u4ur/5Ujgp9kZ0pbJJ8DbtcuqH5/7kqOGPHoc',
+  'blpiUlcDTbxDYTspNO0tuih/JC0hfB5JHG0awxgtF00V/xLTD0IMzwc8BQsA////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////////////7//v/+//7//v/9//3//f/8//v/+v/4//b/',
+  '9P/w/+v/5f/c/8//v/+o/4r/Yf8r/+P+hP4I/mf9l/yP+z/6m/iO9gv0+fBJ7eDoteOw3c7WBM9a',
+  'xtm8lrKxp02cnpDMhB95sW3UYo1YKU+SRgU/Yzi/MhYuXipKJ7kkfSJ4IG4eCRwHGeIUIBBYCsgG',
+  'EAD/////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////////////v/+//7/',
+  '/v/+//3//f/8//v/+f/3//X/8f/s/+T/2//N/7r/of9+/1H/E//C/lj+zf0a/TX8Efuj+dj3pfXx',
+  '8rLvzOs359zhuNu91PTMXcQPux2xqabcm9uQ4IUJe5twoWZiXc9UJE1SRmZAejt5Nxs0QTGnLkws',
+  'wCm7Jp4iTx2qFssOvwk/AP//////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////+//7//v/+//3//P/7//r/+P/1//H/6//j/9j/yf+0/5j/cv8///z+o/4v',
+  '/pn92Pzi+6z6J/lH9/j0L/LU7uDqOubi4Mba7dNSzAjEGbuhsb2nkJ1Fk/qI6X4jdeprNmNIWxtU',
+  'xE1sSANEPUD9PPM5LzcWNGowTyvGJFwcuhIgDGEA////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////////////////+//7//v/9//z/+//6//j/9P/w/+r/4f/V',
+  '/8T/rv+P/2b/MP/o/on+Dv5x/af8qPtn+tr48Pag9NPxhO6d6hzm7+Ad25zUfM2/xX+9zbTJq5Ci',
+  'QpkLkACHWX4adndugGc+YfNbg1enUzpQ60zKSQ5Gf0HKOpgyOidYGgERpgD/////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////////v/+//7//f/8',
+  '//v/+v/3//T/7//o/9//0v/B/6r/iv9f/yf/3v59/gH+Yv2Z/Jr7X/rY+P32vfQR8ubuO+v85i/i',
+  'xdzN1kHQNMmuwcq5mbE5qcmgYpg0kEiI1YDueadzR262aahl+mFEXrxaOFa/UHVIlD5OMNggqxT2',
+  'AP//////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////7//v/+//3//P/7//n/9//z/+//6P/e/9H/wP+o/4j/Xv8n/97+gf4I/nD9rvy9+5L6',
+  'Jflp91j14fID8Kzs4OiP5MTfdNqv1HPO18fhwK25TrLhqomjWZx5lQ6PH4kIhKR/qHv8dwh0QXAY',
+  'a8RkolpIT5g9fCrjGt0B////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////+//7//v/9//z/+//6//f/9P/v/+n/4P/T/8P/rf+P/2n/',
+  'Nv/0/p/+M/6o/f38Jvwf+9z5W/iL9mz07fER78jrF+jw42DfW9r31C7PG8nHwk68zrVbrxypM6Oz',
+  'ne+YypTtkEyNL4k0hWd/QXiGbG9fSko+NMkgawP/////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////v/+//7//f/9//v/+v/4//X/',
+  '8P/q/+L/1//J/7X/m/95/03/E//K/m3++P1l/bL81PvL+on5EPhR9k/0+/Fa71/sE+lr5XXhLN2l',
+  '2OHT/s4JyhvFR8C1u2i3sbNnsDatCqoQpv2hn5ubk7+F0XYqXeZCJSoyBv//////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/v/+//7//f/8//v/+f/2//P/7v/n/97/0v/C/63/kv9v/0H/B/++/mL+8P1j/bn86fv0+s75ePjn',
+  '9h31DfO+8CTuSOsj6MXkK+Fu3ZbZttXi0TXOvMqwx/PELsJMv3G7ZLd9sM+nPZj5h7JqAU62MD8K',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////7//v/+//3//f/7//r/+P/1//H/7P/l/9z/0P/A/6v/kf9v/0T/Df/J',
+  '/nX+D/6R/fz8SPx2+336X/kT+J328/Qe8xXx5u6J7BfqjecC5X7iDuDS3cTb4dnL13jV6NE4zjTH',
+  'Tr7JreecP32kXrY8+hH/////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////////////////7//v/+//3//f/8//r/+P/2//L/7v/o',
+  '/+D/1f/I/7f/oP+E/2H/NP/+/rr+aP4D/oz9/PxU/Iz7p/qc+XD4G/en9Q70YPKc8NPuDO1M67Hp',
+  'IOir5vLk7eLF30ncP9VgzJC7a6o3iv9qTEafHP//////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////////////////v/+',
+  '//7//f/8//v/+v/4//X/8v/t/+f/3//V/8n/uP+k/4r/av9D/xP/2P6R/j7+2v1m/d78RfyW+9j6',
+  'Bfoq+UP4Xvd59pv1y/T88zDzFfKo8Pjt0Ooi5Hbb08oRueuX8XfNUKIm////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////v/+//7//v/9//z/+//6//j/9v/z//D/6//l/93/0//G/7f/o/+L/27/',
+  'S/8g/+3+sf5s/hv+wv1d/fP8gvwQ/J37Kfu/+k/65Pko+Tn45vUj8yztPuUO1ZLE8KPJhtdeETr/',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////v/+//7//f/9//z/+//6//j/',
+  '9f/y/+7/6f/i/9r/z//C/7L/oP+J/2//Uf8w/wv/5P67/pL+af4//hf+6v23/VL9rfwg+xP5evQw',
+  '7nThNtNguFWhmXtHYf//////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////7//v/+//7//f/9//z/+//6//n/9//1//P/8P/s/+j/4//d/9b/z//H/7//tv+t/6P/mP+I',
+  '/3L/K/+1/nH9rPvO90Tyq+bG2sDCTa8kjPJ1////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////v/+//7//v/9//z//P/7//n/+P/2//T/8v/v',
+  '/+3/6v/n/+T/4f/f/9j/0P+1/33/7P4U/gL8ifkk9KjvYeUP4YDGXcbLjb6IqYOPfnV5XXRNb0hq',
+  'UmVuYJ9b6VZOUtBNckk0RRlBIj1OOZ81FTKwLm8rUyhaJYQi0h9CHdMahhhaFk4UYRKUEOUOVA3g',
+  'C4oKTgkuCCgHOwZlBaYE/ANmA+ECbgIKArQBagErAfYAyQCkAIUAbABXAEYAOAAtACQAHAAXABIA',
+  'DgALAAkABwAFAAQAAwACAAIAAQABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHOS',
+  'cY1kiE+DOH4ieRB0B28Kah1lQ2B+W9JWQVLNTXhJQkUuQTw9bTnANTcy0S6OK20ocCWUItsfRB3O',
+  'GnkYRRYxFD4SaxC3DiINrAtTChcJ9wfyBgYGMwV3BNADPgO9Ak4C7gGbAVUBGQHnAL0AmgB9AGYA',
+  'UgBCADUAKwAiABsAFgARAA0ACwAIAAYABQAEAAMAAgACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAGZckkiKNF4gGg/R95Hjbc9pu52kEZTRgelvYVlBS5U2WSWdFV0FoPZk57DVg',
+  'MvYuriuHKIIlniLcHzsdvBpfGCIWCBQOEjUQfQ7lDG0LEwrYCLkHtgbOBf4ERgSkAxUDmgIvAtMB',
+  'hAFBAQkB2gCyAJEAdgBgAE4APwAzACkAIQAaABUAEAANAAoACAAGAAUABAADAAIAAgABAAEAAQAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC5m9WW4pHjjN2H04LIfcF4wXPLbuJpCWVDYJNb+VZ5',
+  'UhROykmeRY9BoD3POR42jDIbL8ormiiLJZ0i0B8lHZwaNhjxFc8T0BHzDzcOngwlC8wJkgh2B3cG',
+  'kwXIBBUEdwPuAncCEQK5AW8BLwH6AM4AqQCKAHEAXABKADwAMQAnAB8AGQAUABAADAAKAAgABgAE',
+  'AAMAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFOggpuhlrORuoy7h7mCuH27',
+  'eMVz2W77aSxlb2DGWzRXuVJXTg9K40XSQd49BzpPNrQyOS/dK6EohiWMIrQf/xxsGvwXsBWIE4QR',
+  'ow/mDUwM1Qp+CUgIMAc1BlYFkQTkA0wDyAJXAvUBogFbASAB7gDEAKEAhABsAFgARwA6AC8AJgAe',
+  'ABgAEwAPAAwACQAHAAYABAADAAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA46Qq',
+  'oF6bg5abkauMtYe9gsZ91HjocwZvMWprZbVgElyEVwtTqU5fSi9GGEIcPjw6eTbTMksv4iuYKHAl',
+  'aSKFH8UcKBqxF14VMRMqEUgPiw3zC34KKwn6B+gG8wUaBVwEtAMjA6UCOQLcAY0BSwESAeMAuwCa',
+  'AH8AaABVAEUAOAAuACUAHQAXABMADwALAAkABwAFAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAABpqcqkF6BSm36WoJG5jM2H4IL0fQt5KnRRb4Nqw2USYXJc5FdpUwRPtEp8RlxC',
+  'VD5oOpY24jJLL9MreyhFJTEiQR92HNIZUxf8FMwSxBDiDigNkwsjCtYIqgefBrIF4AQoBIgD/QKF',
+  'Ah4CxgF8ATwBBwHaALQAlQB7AGUAUwBDADcALAAkAB0AFwASAA4ACwAIAAYABQAEAAMAAgABAAEA',
+  'AQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOGtX6nHpBygYJuWlsKR5owFiCKDQH5heYd0tW/tajBm',
+  'gGHeXE1YzVNgTwZLwkaVQn8+gzqhNtwyNC+sK0UoASXhIeceExxoGeUWixRaElMQdA6+DC8LxQl/',
+  'CFwHWAZzBakE+QNgA9sCaQIHArQBbQExAf4A0wCvAJEAeABiAFEAQgA1ACsAIwAcABYAEQANAAoA',
+  'CAAGAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAASrLorW6p36Q9oIubzJYDkjGN',
+  'W4iCg6h+0Hn8dC5waGuqZvdhUV24WC9Utk9PS/tGvUKWPoc6lDa8MgQvbCv2J6UkeiF3Hpwb7Bhn',
+  'FgwU3hHaDwEOUQzJCmcJKggQBxUGOQV3BM4DPAO9AlEC9AGkAWEBJwH3AM4AqwCOAHUAYABPAEAA',
+  'NAAqACEAGwAVABAADQAKAAcABQAEAAMAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACitmKy',
+  'Ca6YqROlfKDVmyGXYpKbjc2I/IMpf1V6hHW2cO1rLGdyYsJdHlmGVP1PhUsfR85Ckz5xOmo2gDK3',
+  'Lg8rjCcvJPsg8R0TG2EY3BWEE1oRXA+LDeMLZAoNCdkHyQbXBQQFSgSpAx0DpQI9AuQBmAFXASAB',
+  '8QDJAKgAiwBzAF4ATQA/ADMAKQAgABkAFAAPAAwACQAHAAUABAADAAIAAQABAAEAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAOa6yraUskSu36lkpdigPJySl92SHo5YiYyEvH/qehd2RnF3bKxn52IpXnVZzFQw',
+  'UKNLKEfBQnE+OzohNiUyTC6WKggnoiNoIFodehrJF0gV9hLTEN4OFQ14CwQKtwiOB4gGoAXVBCQE',
+  'igMEA5ECLgLYAY8BUAEbAe0AxgClAIkAcQBcAEsAPQAxACcAHwAYABMADgALAAgABgAEAAMAAgAC',
+  'AAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFL8euwy34LKcrkGq0qVRob+cHphwk7eO9YkrhVuAhnuu',
+  'dtRx+mwiaE1jfl62WfhURlCjSxFHlEIuPuQ5tzWrMcMtAiprJgAjwh+0HNYZKhevFGUSTBBhDqQM',
+  'EwurCWkISwdPBnEFrgQEBHED8QKCAiICzwGIAUsBFwHqAMMAogCGAG4AWgBJADsALwAlAB0AFwAR',
+  'AA0ACgAHAAUABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAApw1u/cLtpt0izD6+/qlqm4qFY',
+  'nb6YFpRgj56K0oX+gCF8P3dZcnBthmidY7le2lkEVTpQf0vWRkJCyD1qOSw1EjEfLVYpuSVMIg4f',
+  'AxwrGYcWFRTWEckP6w07DLYKWgkkCBEHHwZKBY8E7ANeA+ICdwIaAskBhAFIARQB5wDBAKAAhABs',
+  'AFgARwA5AC0AIwAbABUAEAAMAAkABgAFAAMAAgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACTHfsO7',
+  'v9u737fKs5uvVav5pomiBZ5umceUEJBLi3mGm4GzfMN3y3LObc9o0GPTXttZ61QIUDRLdEbLQT09',
+  'zziDNF4wYyyWKPgkiyFSHk4bfxjlFYATThFOD34N2wtkChQJ6gfiBvkFKwV3BNoDUAPYAm8CFALF',
+  'AYABRAERAeQAvgCdAIEAaQBVAEQANgAqACEAGQATAA4ACwAIAAYABAADAAIAAQABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAcuFx+vDM8BevG24YrQ9sP+rqqc+o7yeJpp9lcGQ9IsXhyyCM30veCNzD273aN5j',
+  'xl60WapUrk/CSuxFMEGSPBU4vzOTL5UrxycrJMQglB2aGtcXShXzEtAQ3w4dDYkLHwrbCLwHvQbc',
+  'BRUFZwTOA0cD0QJqAhACwgF9AUEBDgHhALoAmQB9AGUAUQBBADMAKAAeABcAEQANAAkABwAFAAMA',
+  'AgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/zm7L/sdvxMHA97wQuQ2177C3rGWo+qN4n96aLpZokY+M',
+  'o4elgph9fnhZcytu+GjDY5BeY1k/VCtPKkpARXRAyDtCN+Yyty66Ku8mWyP9H9gc7Bk3F7oUcxJg',
+  'EH8OzAxFC+cJrwiZB6MGyAUHBV0ExgNCA84CZwINAr8BegE+AQoB3QC2AJUAeQBhAE0APQAvACUA',
+  'HAAVABAACwAIAAYABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFvSNs/wy4rIBsViwaG9wrnFtayx',
+  'dq0kqbekL6CNm9KW/pEUjRSIAYPcfad4Z3Mdbs1ofGMuXudYq1OBTm1JdESbP+c6XDb+MdEt2SkX',
+  'Jo0iPR8mHEoZphY7FAQSAhAvDosMEQu+CZAIggeSBr0F/wRYBMMDPwPLAmUCCgK7AXYBOQEEAdcA',
+  'sACPAHMAXABIADkALAAhABkAEwAOAAoABwAFAAQAAgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1dXa0r/P',
+  'g8woya3FEsJXvn26hLZssjWu36lrpdmgK5xgl3qSe41kiDeD932meElz4m12aAljoV1CWPFStE2R',
+  'SI1DrD70OWk1DzHpLPooRSXKIYkehRu6GCkWzhOpEbYP8w1bDO0KpAl9CHUHiga4Bf0EVgTBAz4D',
+  'yQJhAgYCtgFwATMB/gDQAKkAiQBtAFYAQwA0ACgAHgAWABEADAAJAAYABAADAAIAAQABAAEAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAp2VnWaNNX0CbN08lfxsrCFL88u0O3KLPrro2qD6ZvobCc0ZfVkr6NjIhDg+Z9eHj9',
+  'cnlt8mdrYuxceFcWUstMnkeTQrA9+ThzNCEwBywmKIEkFyHqHfgaQBjBFXkTZBGAD8kNPQzXCpYJ',
+  'dQhxB4gGuAX9BFYEwQM8A8YCXQIAAq8BaAErAfUAyAChAIEAZgBQAD4ALwAkABsAFAAOAAoABwAF',
+  'AAQAAgACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAFbcsNnr1gTU/NDSzYbKF8eFw9C/97v5t9izkq8oq5qm6KEU',
+  'nR6YCZPWjYiIIoOnfRx4hHLlbERnp2ETXI9WIFHNS5tGj0GvPP83gzM/LzQrZCfSI3wgYx2FGuAX',
+  'cxU7EzURXg+yDS4M0AqTCXUIdAeLBroF/gRWBL8DOAPAAlYC+AGmAV4BIAHrAL4AmAB5AF8ASQA4',
+  'ACsAIAAYABEADAAJAAYABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAW9/g3ETah9eo1KfRgs46y87HPMSE',
+  'wKa8obh1tCKwp6sGpz+iUp1DmBKTwo1WiNKCOn2Sd+BxKWxyZsNgIFuQVRpQxEqTRYxAtDsQN6My',
+  'by53KrwmPiP9H/gcLhqcFz8VFhMcEU8PrA0uDNQKmQl8CHoHkAa9Bf8EVAS6AzEDtwJLAuwBmQFS',
+  'ARQB3wCzAI4AcABXAEIAMgAmABwAFAAPAAsABwAFAAQAAgACAAEAAQABAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA34uXfct3e',
+  '2inYUNVT0jLP68t9yOjEKsFDvTK5+LSTsAWsTadtomedO5jtkoCN94dWgqJ84XYXcUxrhGXHXxpa',
+  'hVQOT7pJj0STP8k6NTbaMbst2CkzJssinx+uHPYZdBcmFQgTGBFSD7MNOQzfCqQJhgiBB5QGvgX8',
+  'BE4EsQMmA6oCPQLdAYoBQgEFAdIApwCDAGYATgA8AC0AIQAYABIADQAJAAYABAADAAIAAQABAAEA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAOrkv+J14ArefNvM2PfV/NLbz5HMH8mCxbvBx72nuVu14rA8rGyncaJPnQaYnJIRjWyH',
+  'sYHlew52MXBWaoJkvV4NWXlTBk67SJxDrz73OXc1MjEpLV0pziV7ImMfhBzcGWgXJRUQEyURYw/G',
+  'DUsM8AqyCY8IhgeVBroF9QRDBKMDFQOYAioCygF4ATEB9QDDAJoAeABcAEYANQAnAB0AFQAPAAsA',
+  'CAAFAAQAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAc+dv5UzjCOGi3hnca9mX1pvTdtAoza3JBsYxwi2++7matQmx',
+  'S6xgp0qiC52nlyCSe4y9huqACnshdTdvUml5Y7JdBVh3Ug9N0kfEQuo9SDnfNLEwvywKKZAlUSJL',
+  'H3sc3xl1FzkVKBNAEX4P3g1gDAALvQmVCIcHkAawBeYEMQSPAwADgQITArQBYwEeAeQAswCMAGwA',
+  'UgA+AC4AIgAZABIADQAJAAYABQADAAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADR6fLn9eXY45jhNt+u3AHaK9cr1ADR',
+  'qM0iym3GiMJxviq6srUJsTCsKqf5oZ+cIJd/kcOL74UKgBt6JnQ1bkxoc2KyXA1XjFE0TAlHEUJO',
+  'PcM4cTRbMIAs4Ch6JUwiVB+PHPwZlxdeFU0TYxGdD/kNdAwNC8MJlAh/B4MGngXQBBgEdQPkAmYC',
+  '+QGbAUsBCQHRAKMAfgBgAEkANwAoAB4AFQAPAAsACAAGAAQAAwACAAEAAQABAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAbsS+py6Hrm',
+  'YOQj4sHfOd2I2q7Xp9Ry0Q/Oe8q1xr3Ckb4zuqO14LDuq86mgqEPnHiWwpDyig6FHH8jeSlzNm1R',
+  'Z39hyFsyVsNQf0trRopB3zxtODQ0NDBuLOEoiiVpInsfvRwtGskXjhV6E4kRvA8PDoIMEwvACYoI',
+  'bgdsBoMFsgT4A1MDwwJGAtsBfwEzAfMAvgCTAHEAVQBAADAAIwAaABIADQAJAAcABQADAAIAAgAB',
+  'AAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAEe547MPq7uj45uDko+JA4LTd/toc2AvVytFYzrPK28bOwo2+F7putZKwh6tOpuugYpu3',
+  'lfCPEookhCt+L3g3cklsbWaoYAJbf1UmUPlK/kU2QaQ8SjgnNDwwhywIKb0lpCK6H/4cbRoEGMMV',
+  'phOtEdUPHg6GDA0LsQlzCFEHSgZeBYsE0AMsA50CIwK6AWIBGQHcAKsAgwBkAEsAOAApAB4AFgAQ',
+  'AAwACAAGAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAD073zu5+w162LpbedU5RXjruAc3l7bcdhU1QXSg87Lyt/GvcJl',
+  'vti5F7UksAKrtKU+oKOa6ZQXjzCJPoNFfUx3XHF6a6xl+l9pWv5UvU+qSshFGUGfPFo4SjRvMMgs',
+  'UikNJvYiDCBLHbMaQhj1Fc0TxxHiDx8OfAz4CpQJTwgnBx0GLgVbBKED/wJ0AvwBmAFEAf8AxgCZ',
+  'AHQAWABCADEAJAAaABMADgAKAAcABQAEAAMAAgABAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAK/xVvDi7lDtn+vM6dbnuuV24wnhbt6m',
+  '263YgtUi0o7OxMrDxovCHb57uaS0na9oqgilg5/cmRmUQY5ZiGmCdnyIdqVw1GobZX9fB1q1VI5P',
+  'lUrLRTRBzjybOJo0yjAqLbgpciZYI2YgnB34GnkYHhbmE9ER3w8PDmAM0wpnCRwI8AbkBfYEJARs',
+  'A84CRwLUAXUBJgHlALEAiABnAE0AOgArACAAFwARAAwACQAHAAUABAADAAIAAQABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARfMJ8rPwQO+v',
+  '7f3rKOov6A7mxONO4ane1dvO2JPVI9J8zp/KisY+wry9BrkdtAWvwalVpMaeGZlUk32Nmoeygcx7',
+  '7nUecGNqwmRAX+FZqVScT7tKCEaEQS89CTkQNUUxpS0wKuQmvyPAIOcdMxujGDYW7RPIEccP6g0w',
+  'DJsKKQnaB60GoQW0BOYDMwOaAhgCrAFSAQgBzQCeAHgAWwBEADMAJgAcABUADwALAAgABgAFAAMA',
+  'AgACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAC39JbzXPIH8ZTvAu5O7Hbqd+hQ5v3jfOHM3urb1diK1QnSUM5gyjnG28FIvYK4i7Nnrhmp',
+  'p6MUnmeYppLWjP+GJoFRe4h10G8uaqdkQF/7Wd1U508cS3pGBUK6PZo5ozXWMTAusCpWJyEkESEk',
+  'Hlwbtxg3FtwTpxGXD64N7AtQCtoIigdeBlUFbQSjA/cCZQLqAYQBMQHtALcAjABqAFAAPAAtACIA',
+  'GQATAA4ACgAIAAYABAADAAIAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAb2//Tg86byUPHc70fukOyy6q3ofeYg5JXh2N7o28TYatXY0Q/O',
+  'D8rYxWzBy7z5t/myzq18qAmjep3TlxySWoyThs6AEXtgdcJvO2rPZIJfVlpOVWxQsEsbR65CZj5F',
+  'Okk2cTK9Li0rvyd1JE0hSh5qG7AYHBavE2oRTg9cDZML8wl9CC4HBQYCBSAEXgO6Ai8CvAFeAREB',
+  '1ACjAH0AXwBIADYAKQAfABcAEgANAAoABwAGAAQAAwACAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANfdF9j/1IPTm8o/xGPB/7sLs3urQ6Jfm',
+  'MOSZ4dDe0tug2DfVl9HAzbLJb8X3wE68dbdxskWt9qeJogKdaJfBkRKMYYa0gBB7e3X4b4tqOWUE',
+  'YO1a91UjUXFM4Ud0Qyg//TrzNgozQi+aKxQoryRtIVAeWBuIGOAVYhMQEesO8gwlC4YJEgjIBqYF',
+  'qgTRAxkDfQL8AZIBOwH1AL4AkgBwAFUAQQAyACYAHQAWABEADQAKAAcABQAEAAMAAgABAAEAAQAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABF+Gz3ffZ39Vf0',
+  'G/PA8UXwp+7k7Pjq4uig5i7ki+G23qzbbdj31EvRac1SyQbFicDcuwK3ALLZrJKnMKK5nDGXnpEH',
+  'jG+G3YBUe9p1cnAea+JlwWC6W9BWA1JSTcBISkTxP7U7ljeUM7Ev7CtIKMYkaCEwHiAbOxiCFfYS',
+  'mhBuDnIMpwoLCZ0HWgZCBVAEggPVAkQCzAFqARwB3QCrAIQAZgBOADwALgAjABsAFQAQAAwACQAH',
+  'AAUABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAADn5dfic9632pfWD9ETz5fFm8MLu9+wE6+XomeYd5HDhj9572zHYstT+0BTN98ioxCrAfrup',
+  'tq+xk6xapwmippw1l7uRPozChkuB3Xt9dixx7mvEZrBhslzMV/1SRk6oSSFFs0BdPCI4ATT9Lxgs',
+  'VCizJDgh5h3AGsgXABVqEggQ2g3gCxoKhQghB+oF3QT4AzYDlAIOAqEBSAEBAcgAnAB5AF4ASQA5',
+  'ACwAIgAaABQAEAAMAAkABwAFAAQAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAE/pi+Z34xPfT9sn1pPRh8//xefDP7v7sAuvb6IbmAuRL4WLeRdv0',
+  '12/UttDKzKzIX8Tkv0C7dbaIsXysV6ccotGceZcbkrmMWIf8gah8XnchcvJs02fFYshd3VgEVD1P',
+  'iUrpRV5B6DyJOEU0HTAVLC8obyTYIG8dNRouF10UwhFfDzQNQAuDCfoHogZ5BXsEowPvAloC3wF7',
+  'ASsB6wC4AJAAcQBYAEUANgAqACEAGgAUAA8ADAAJAAYABQADAAIAAgABAAEAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADU+jX6g/m++OP38fbk9bz0dfMN8oLw0u76',
+  '7Pfqyeht5uHjI+E03hLbvdc21HzQksx4yDLEwr8qu2+2lLGdrI+nbaI8nQGYvpJ3jTGI7IKtfXV4',
+  'RXMebgJp8WPsXvJZBlUmUFRLk0bjQUY9wThVNAcw2ivTJ/YjRyDKHIEZcRabEwERog5/DJcK5wht',
+  'ByUGDAUeBFUDrwImArYBXAEUAdoArACIAGwAVQBDADUAKgAhABkAFAAPAAsACAAGAAQAAwACAAEA',
+  'AQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAID78fpR+p/52Pj7',
+  '9wb39/XL9H/zE/KD8M3u7+zn6rPoUebA4//gDN7p2pTXD9RZ0HbMZcgrxMm/Q7ucttex+awFqP+i',
+  '6p3JmKGTdI5DiRKE4n60eYp0Y29BaiNlDGD6WvBV71D4Sw5HNEJtPb04KDS0L2QrPydII4Uf+hup',
+  'GJUVwRIsENgNwgvpCUsI4wauBaYEyQMQA3gC+wGVAUQBAgHOAKQAgwBoAFMAQgA0ACkAIAAZABMA',
+  'DgALAAgABgAEAAMAAgABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAGPyY+wj7Z/q0+ez4DfgV9wL20vSD8xLyfvDD7uHs1Oqd6DjmpePj4PHd0NqA1wHUVNB8zHrI',
+  'UMQBwJG7AbdWspKtuqjPo9Wezpm+lKWPhopihTmADnvfda9wfGtJZhVh41uzVohRZUxNR0VCUT11',
+  'OLgzIC+xKnImaCKWHgMbsBegFNQRTA8HDQQLPwm0B2EGQAVLBH8D1QJKAtkBfAEyAfYAxgCfAIAA',
+  'ZwBSAEIANAApACAAGAASAA4ACgAHAAUAAwACAAEAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAACe/Cz8q/sa+3j6w/n5+Bj4HfcI9tX0gvMO8nbwue7U7MXqjOgn5pXj',
+  '1uDp3c7ahtcS1HPQqsy7yKXEbcAVvKC3ELNnrqqp2aT4nwebCpYAkeuLy4aigW98M3fvcaJsT2f2',
+  'YZpcPVfiUY5MRUcNQus85jcEM0suwylwJVghgR3tGZ8WmhPdEGcONwxKCpwIKQfrBd4E/QNBA6YC',
+  'JwK/AWsBJwHvAMIAnQB/AGcAUgBBADQAKAAfABcAEQANAAkABgAEAAMAAgABAAEAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABT9rvw7/Lr7KPuF+s75Avkf+CL3CvbV9IDz',
+  'CvJw8LLuzOy+6oboJOaX497g+d3p2q3XSNS60AXNK8ktxQ7B0bx2uAG0c6/PqhWmSKFpnHeXdZJi',
+  'jT6ICoPGfXJ4D3OfbSNonGIPXX9X8VFpTO5Gh0E6PA43DDI5LZ0oPyQiIEwcwBiAFYwS5A+GDW8L',
+  'mwkHCKwGhQWNBL0DEQODAg8CrwFhASEB7ADBAJ0AfwBnAFIAQQAzACcAHgAWABAADAAIAAYABAAC',
+  'AAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAe/0h/br8R/zF+zL7',
+  'jvrW+Qj5JPgl9wz21fR/8wnyb/Cx7s7sw+qQ6DTmruP/4CbeJNv516bULdGOzczJ58XjwcC9f7kk',
+  'ta6wH6x4p7mi4532mPKT2I6miV2E/X6Ief5zYW6zaPliNl1vV6tR70tDRrBAPDvwNdQw8CtKJ+gi',
+  'zx4EG4gXXBSAEfIOsAy2Cv4IhAdCBjEFTASOA+8CbAIAAqcBXQEfAewAwgCeAIAAZwBSAEAAMgAm',
+  'ABwAFQAPAAsABwAFAAMAAgABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AADV/YX9K/3E/FD8zfs6+5X63PkN+Sj4KfcP9tj0g/MO8nfwvO7d7NjqrOha5t/jPeFz3oLba9gt',
+  '1crRRM6bytHG5sLcvrS6b7YMso2t8qg7pGafdZpmlTqQ74qHhQKAYnqodNdu8mj/YgNdBVcLUR1L',
+  'RUWKP/c5kjRmL3kq0iV3IWwdsxlPFj4TgBARDu4LEgp3CBgH7QXyBB4EbgPbAmAC+gGlAV0BIQHu',
+  'AMMAnwCAAGYAUAA+ADAAJAAaABMADQAJAAYABAADAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAACT+3v2O/TP9zPxY/NT7QPub+uL5E/kt+C/3Fvbh9I7zHPKJ8NTu/OwA',
+  '69/omeYs5Jrh4t4F3APZ3NWS0iTPlMvjxxDEHcAKvNa3gbMMr3WqvKXgoOCbvJZ0kQeMd4bEgPB6',
+  '/3T0btVop2JyXD1WEFD2SfdDHj5zOAAzzS3iKEUk+h8FHGcYIRUxEpUPSA1HC4oJCwjFBrAFxwQC',
+  'BF0D0wJeAvwBqAFhASUB8QDFAJ8AfwBlAE4APAAtACEAGAARAAwACAAFAAMAAgABAAEAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAaf4r/uX9lf06/dP8Xvzb+0f7ovrp+Rv5Nvg6',
+  '9yT28vSj8zfyqvD+7i/tPusq6fLml+QX4nPfq9zA2bHWftMp0LHMFslZxXjBdL1Luf20ibDuqyqn',
+  'PKIlneKXdJLcjBqHMYEke/h0sG5VaO1hgFsZVcBOgEhjQnU8vjZHMRksOiewIn8eqBosFwoUQBHI',
+  'Dp8MvgogCbwHjQaLBbAE9wNaA9UCZAICAq8BZwEpAfMAxQCeAH0AYgBLADgAKgAeABUADwAKAAYA',
+  'BAADAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACl/m/+Mf7r/Zv9QP3Z',
+  '/GX84vtP+6r68/kn+UX4TPc59g31xPNf8tzwOe927ZPrjuln5x7lsuIj4HLdndql14rUS9HozWDK',
+  's8bfwuO+v7pvtvSxS61zqGqjMJ7FmCmTXY1kh0CB9nqLdAducWfRYDNan1MiTcdGl0CeOuY0dy9Z',
+  'KpIlJSEVHWQZEBYWE3MQIQ4bDFoK1wiLB28GfAWsBPsDYwPgAm4CDAK2AWwBKwH0AMQAmwB5AF0A',
+  'RgA0ACYAGwASAAwACAAFAAMAAgABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'ANn+qv50/jf+8f2h/Uf94Pxt/Ov7Wfu3+gL6Oflb+Gb3WfYz9fPzl/Ie8Yfv0+3+6wrq9ufA5Wnj',
+  '7+BU3pXbs9is1YDSLs+0yxHIRMRJwCG8x7c7s3uuhalYpPOeWJmGk4GNS4fogGB6uHP4bCtmW1+S',
+  'WN1RRkvaRKM+rTgAM6QtoSj6I7MfzBtFGBwVTBLRD6QNvwsbCrAIdwdpBoEFuAQKBHMD7wJ7AhYC',
+  'vQFvASwB8gDAAJYAdABXAEEALwAhABcADwAKAAYABAACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAAAABv/d/q/+ev49/vf9qP1O/en8d/z3+2f7yPoW+lH5ePiJ94T2ZvUv9N7y',
+  'cvHp70Puf+yd6pvoeeY25NLhS9+g3NHZ29a+03fQBs1myZfFlsFgvfS4TrRtr1Gq96Rgn46ZgZM+',
+  'jcmGKIBieYByi2uPZJZdrVbhTzxJzEKbPLQ2HjHhKwInhCJpHrAaVxdaFLURYA9VDY0LAQqpCH4H',
+  'egaXBdAEIgSIAwADiAIeAsEBbwEpAewAuQCPAGwAUAA6ACkAHAATAA0ACAAFAAMAAgABAAEAAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAt/wr/4v60/n/+Q/7+/bD9WP30/IT8Bvx6+976',
+  'Mfpx+Z/4t/e69qb1evQ189bxXPDG7hTtQ+tU6UXnFuXE4k/gtd312gzY+NS30UbOo8rKxrrCb77m',
+  'uR61FbDKqjylbp9gmRWTk4zghQN/BHjucMxpqWKTW5ZUwE0bR7RAljrKNFYvQiqPJUEhVx3OGaQW',
+  '0hNUESIPNQ2FCwoKvwicB5wGuQXwBD0EngMQA5ECIgLAAWoBIQHjAK8AhQBiAEgAMwAjABgAEAAK',
+  'AAYABAACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAE7/Mf8O/+f+uf6F/kr+',
+  'Bv66/WP9Av2V/Br8kvv7+lP6mvnO+O/3/Pby9dL0mvNJ8t7wWe+37fjrG+oe6P/lvuNY4cveFNwy',
+  '2SHW39Joz7nLz8enwz6/krqgtWew56oipRefy5hDkoSLloSBfVF2EG/LZ45gaFlkUpFL+kSqPqs4',
+  'BTO9LdgoWSQ+IIYcLhkxFogTLBEXD0ENogszCu0IzAfKBuIFEgVYBLADGgOVAiACuQFgARUB1gCi',
+  'AHkAWAA+ACsAHQATAAwACAAFAAMAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA',
+  'a/9S/zX/E//s/r/+jP5S/hH+xv1y/RP9qfwz/K/7Hft8+sr5B/kx+Ej3SvY29Qv0yfJt8ffvZu63',
+  '7Orq/Ojs5rfkW+LW3yTdQ9ov1+TTX9CdzJrIUsTEv+26y7VdsKWqpKRdntWXEZEZivaCs3tbdPps',
+  'nmVVXixXMFBuSfJCxTzwNnkxZSy2J2wjhh8BHNYYAhZ7EzwRPQ91Dd8LdAotCQcI/QYMBjIFbQS8',
+  'Ax0DkQIWAqsBUQEFAcYAkwBrAEwANQAkABgADwAJAAYAAwACAAEAAQAAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAACE/2//Vv85/xj/8v7H/pX+Xf4d/tX9g/0o/cL8UfzS+0b7rPoC+kj5e/id',
+  '96r2o/WG9FHzBPKd8Brvee2569jp0uem5VDjzeAa3jPbFdi61CHRRM0gybPE+b/xupu19q8Eqsij',
+  'Rp2EloqPYIgSgap5NnLDal9jGFz7VBVOckcdQR47fDU7MF8r6CbVIiIfyhvJGBYWqhN/EYwPyw01',
+  'DMUKdwlGCC8HMQZKBXkEvQMWA4QCBAKXATwB8ACzAIMAXQBBACwAHQATAAwABwAEAAIAAQABAAAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJn/h/9y/1r/Pv8e//n+z/6f/mn+LP7m/Zj9Qf3f',
+  '/HP8+/t1++L6QfqP+c34+fcS9xf2BvXf85/yRPHO7znug+yr6qvog+Yt5Kfh7d7628rYWdWk0abN',
+  'XMnDxNq/n7oStTSvCamUotyb55S/jW6GAH+Bd/9viGgqYfNZ8FItTLZFkj/JOWA0Wi+4KnkmmSIU',
+  'H+QbAxlpFg4U7RH9DzgOmgwfC8EJgAhZB0sGVgV4BLIDBANsAuoBfAEiAdgAngBxAE8ANQAjABcA',
+  'DgAJAAUAAwACAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAq/+c/4v/dv9f/0T/Jf8C',
+  '/9n+q/53/j3++v2w/V39Af2Z/Cf8qfse+4T63Pkk+Vr4fveP9on1bfQ58+nxfPDw7kHtbOtv6UXn',
+  '6uRb4pPfjtxH2brV5NHAzUvJg8Rov/i5NbQhrsCnGaExmhKTx4tahNl8UXXPbWNmG18CWCdRk0pR',
+  'RGY+2TitM+IueSptJroiWx9KHH8Z8xaeFHsShBCzDgUNdgsECq4IdAdVBlEFaASaA+UCSwLIAVwB',
+  'BAG+AIgAXwBBACsAHAARAAoABgADAAIAAQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC6',
+  '/67/n/+P/3v/Zf9L/y3/C//l/rn+iP5Q/hH+y/18/SX9w/xY/OD7XfvM+iz6ffm9+Ov3BvcL9vj0',
+  'zPOF8h7xl+/q7RbsFurl54Hl4+II4OvciNna1d7RkM3uyPbDqL4FuQ+zyaw6pmefWpgdkbuJQIK7',
+  'ejhzx2t1ZE9dYla6T15JV0OrPVw4bDPaLqMqwyY1I/If9BwyGqgXTRUeExURLg9oDcALNgrKCHsH',
+  'SwY5BUcEcgO7AiACoAE3AeQAowByAE4ANAAhABUADQAHAAQAAgABAAEAAAAAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAAAMf/vf+x/6P/k/+A/2v/Uv82/xb/8v7J/pr+Zf4q/uj9nv1M/fD8ivwa/J77',
+  'FPt9+tf5IPlX+Hn3hvZ79Vb0E/Ow8SnwfO6j7JvqX+jr5TrjSOAP3YvZudWU0RvNS8gkw6a91Lew',
+  'sUCriqSXnXCWIo+3hz2Aw3hVcQJq2GLiWytVvU6gSNpCbD1aOKIzQS81K3cnASTNINQdDxt5GA0W',
+  'xhOhEZ0PuQ30C08KzAhpByoGDgUUBD0DhgLuAXMBEAHDAIkAXQA+ACgAGQAPAAkABQADAAIAAQAA',
+  'AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0v/K/8D/tP+n/5j/hv9y/1v/QP8i/wD/2f6t/nz+',
+  'Rf4H/sH9dP0e/b78VPzf+137zfou+n75vPjm9/j28vXQ9I/zLPKi8O/uDu366q/oJ+Zf41Hg+dxS',
+  '2VrVDNFozGzHGcJwvHS2K7CaqcmiwpuQlD6N2oVwfg93xW+eaKdh6lpxVEROaEjhQrA91ThNNBQw',
+  'Jix8KBEl3SHaHgQcVhnLFmMUGxL0D+0NCgxKCrAIPAfxBc0E0QP7AkkCtwFDAegAowBvAEoAMAAe',
+  'ABIACwAGAAQAAgABAAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADb/9T/zP/D/7j/rP+d/43/',
+  'ev9k/0v/L/8P/+v+wv6U/mD+Jv7m/Z39TP3y/I78H/yj+xn7gfrX+Rr5SPhe91r2OPX184/y//BD',
+  '71XtMuvT6DXmUuMm4K3c49jE1FDQg8tgxubAGbv9tJeu8acSoQWa1ZKPi0CE9ny9daJusmf3YHpa',
+  'RFRZTr1IcUN2Psg5ZTVHMWgtwylRJg4j8x/+HCoaeBflFHQSJhD8DfkLIApzCPMGoAV7BIEDsQIG',
+  'An0BEwHBAIQAWAA5ACQAFgANAAgABAACAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOL/',
+  '3f/W/8//xv+8/7H/o/+U/4L/bv9X/z3/H//9/tf+rP58/kb+Cv7G/Xr9Jf3G/Fz85ftg+8z6Jvps',
+  '+Zz4tPev9ov1RPTW8j3xde947ULrzegW5hjjzd8z3EbYBNRrz3vKNsWdv7W5hLMPrWCmgZ98mF2R',
+  'MooHg+l743QDblJn2WCgWqtUAE+eSYZEtT8oO9s2xzLnLjUrrSdKJAgh5h3jGgAYPhWgEikQ3Q2/',
+  'C9EJFgiPBjsFGQQmA2ACwAFDAeQAnABpAEQAKwAbABAACQAFAAMAAgABAAEAAAAAAAAAAAAAAAAA',
+  'AAAAAAAAAAAAAAAA6P/k/9//2f/S/8r/wf+2/6n/m/+L/3j/Y/9K/y//EP/t/sX+mP5l/i3+7f2l',
+  '/VT9+fyT/CH8n/sO+2r6svni+Pj38fbI9Xr0AvNd8Ybvd+0t66Ho0OW24k3flNuI1ybTb85iyQTE',
+  'Vr5euCOyrKsCpTGeQ5dEkEGJRoJfe5d0+G2KZ1VhXlupVTVQBEsTRl9B4zyZOH00ijC6LAopeCUC',
+  'IqkebhtVGGAVlRL4D40NWAtcCZsHEwbEBKwDxQIMAnsBCwG4AHwAUQA0ACAAEwAMAAcABAACAAEA',
+  'AQABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADt/+r/5v/h/9z/1f/O/8X/u/+w/6P/lP+C/2//WP8/',
+  '/yL/Af/c/rP+g/5O/hH+zf1//Sj9xfxV/Nb7Rvuj+ur5GPkq+B337fWW9BPzYPF471ft9+pU6Gvl',
+  'NuKy3t3attY70mzNTcjewie9K7fzsIeq8qM8nXOWoY/SiBKCanvldIpuYWhuYrRcNFfvUeFMB0hd',
+  'Q98+hjpPNjUyNS5OKn8myiIxH7kbZxhBFUwSjg8LDccKxQgFB4QFQgQ4A2ICugE5AdgAkgBgAD0A',
+  'JgAXAA4ACAAFAAMAAgABAAEAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAPH/7//r/+j/4//e/9j/0v/K',
+  '/8H/tv+q/5z/jf96/2b/Tv80/xX/8/7M/p/+bP4y/vH9pv1R/e/8gfwC/HL7zvoT+j35Svg29/31',
+  'm/QL80nxUO8c7ajq7+fv5KLhCN4d2uHVVNF4zE/H3MEnvDW2DrC7qUajupwhloeP9Yh2ghN803W9',
+  'b9RpG2SVXj9ZF1QbT0ZKk0X+QII8GzjJM4kvXCtGJ0ojbR+3Gy4Y2hTCEeoOWQwQChEIWgbpBLgD',
+  'wwIBAmwB/ACrAHEASQAuABwAEQALAAcABAADAAIAAQABAAEAAAAAAAAAAAAAAAAAAAAAAAAA9P/y',
+  '//D/7f/q/+b/4f/c/9X/zv/G/7z/sf+l/5b/hv9z/13/RP8o/wf/4v64/of+T/4Q/sb9cv0S/aP8',
+  'JfyT++z6LfpS+Vn4Pff69Yz07/Ie8RTvzuxH6nvnaOQJ4V3dY9kb1YXQpct+xhPBbbuRtYivW6kT',
+  'o7ucXZYCkLSJeoNcfV93iHHXa09m7WCxW5VWl1GxTN9HHkNqPsI5JjWYMBwstidvI08fXRukFyoU',
+  '9xASDn0LOQlHB6MFSAQvA1ECpgEmAcgAhABWADcAIgAVAA0ACQAGAAQAAwACAAEAAQABAAAAAAAA',
+  'AAAAAAAAAAAAAAD3//X/8//x/+//7P/o/+T/3//Z/9P/y//D/7n/rf+g/5D/f/9r/1P/Of8a//b+',
+  'zv6e/mj+Kf7h/Y39Lf29/D38qPv++jr6WflY+DP35vVs9MLy4/DL7nbs3+kE5+Ljd+DB3MDYdNTh',
+  'zwjL7cWXwAy7UrVzr3epZ6NMnTCXGZEQixuFP39+edxzV27waKJja15GWTBUI08cShpFG0AhOy42',
+  'SDF1LL8nLiPNHqgaxxYzE/MPCw1/CkwIcAbnBKgDqwLoAVUB6QCbAGYAQgAqABsAEQALAAgABQAE',
+  'AAMAAgABAAEAAAAAAAAAAAAAAAAAAAAAAPn/+P/2//X/8//w/+3/6v/m/+L/3f/X/9D/yP+//7X/',
+  'qP+a/4r/d/9h/0f/Kv8I/+D+sv58/j7+9f2h/T/9zvxL/LP7BPs7+lT5S/gd98b1QvSM8qHwfe4c',
+  '7HrpleZr4/rfQtxD2P/Td8+xyq/FecAUu4i13a8bqkqkcp6amMiSA41Oh6uBHXyidjlx32uQZkhh',
+  'BFy+VnNRI0zNRnNBGTzGNoIxVyxSJ30i5h2XGZwV/BG9DuELaQlSB5YFLQQPAzECigEOAbYAeABP',
+  'ADMAIQAWAA8ACgAHAAUABAADAAIAAQABAAAAAAAAAAAAAAAAAAAA+v/6//j/9//2//T/8v/v/+z/',
+  '6f/l/+D/2//V/87/xf+7/7D/o/+T/4H/bP9U/zf/Fv/v/sH+i/5N/gT+rv1L/dj8Ufy2+wL7M/pF',
+  '+TX4APeg9RP0VPJg8DPuyusj6TrmD+Oh3/Db/NfJ01jPrsrRxcXAkLs7tsywSqu8pSiglZoFlX2P',
+  '/omKhB5/uXlYdPZuj2kgZKNeF1l6U81NE0hRQo881zY0MbYraCZbIZocMhgtFJEQYg2gCkkIVwbB',
+  'BH8DhALGAToB1QCPAF4APgAqABwAFAAOAAoABwAFAAQAAwACAAEAAQAAAAAAAAAAAAAAAAD8//v/',
+  '+v/5//j/9//1//P/8f/u/+v/6P/k/9//2f/S/8v/wv+3/6r/nP+K/3b/Xv9C/yH/+v7M/pb+V/4N',
+  '/rb9Uf3a/FH8sfv5+iX6Mvkb+N/2efXl8yDyJ/D27Yzr5Oj/5dvieN/W2/fX3tOOzwzLW8aCwYa8',
+  'brdAsgGttqdlohGdvJdnkhKNu4dfgvx8jHcLcnRsxGb5YBFbD1X1TstImUJsPFA2VjCMKgUlzR/1',
+  'GoUWiBIBD/ELVgkqB2QF+wPhAgsCbAH6AKkAcgBNADUAJQAaABMADgALAAgABgAEAAIAAQABAAAA',
+  'AAAAAAAAAAAAAP3//P/7//v/+v/5//j/9v/1//P/8P/u/+r/5//i/93/1//P/8f/vf+x/6L/kv9+',
+  '/2b/Sv8p/wL/1P6d/l3+Ev65/VL92fxM/Kn77foU+hz5AvjB9lf1wPP58f/vz+1o68jo7eXY4ojf',
+  '/ts+2EjUItDOy1LHs8L1vR25MbQ0ryqqFqX5n9KaopVlkBiLuIU/gKh673QQbwlp2mKFXA5WfU/c',
+  'SDlCozssNeQu3yguI+EdBBmhFL4QXA16ChEIGAaEBEkDWQKmASUByQCKAF8AQwAwACMAGwAUAA8A',
+  'CwAIAAUABAACAAEAAQAAAAAAAAAAAAAA/f/9//z//P/7//r/+v/4//f/9v/0//L/7//s/+n/5f/g',
+  '/9r/0//L/8H/tv+o/5f/hP9s/1D/L/8I/9n+ov5g/hP+uf1P/dT8Rfyf++D6BPoK+e33qvY/9anz',
+  '5PHu78btaevW6A3mDuPZ33Dc1dgL1RXR98y0yFLE1L89u5G20bEBrSCoLaMmngiZ0JN3jvqIU4N9',
+  'fXR3N3HEaiBkT11aVkxPNUglQTA6aTPmLLkm9SCnG9wWmRLjDrULDAndBh0FvgOyAuoBWAHwAKgA',
+  'dwBWAD8AMAAkABwAFQAQAAwACAAFAAMAAgABAAAAAAAAAAAAAAD+//3//f/9//z//P/7//r/+f/4',
+  '//f/9f/z//H/7v/r/+f/4//d/9f/z//F/7r/rP+c/4j/cP9U/zP/C//c/qP+Yf4T/rf9TP3P/D78',
+  'lvvW+vn5/vjh96D2OPWm8+jx/O/g7ZPrFOlk5oHjb+At3b7ZJdZl0oDOespWxhXCvL1KucC0H7Bi',
+  'q4qmkKFwnCaXqpH4iwqG3X9ueb5y0GupZFNd3FVTTstGWj8VOBQxayouJG4eOBmTFIUQCg0eCrYH',
+  'yAVDBBgDOAKVASABzgCVAG4AUwBAADIAJwAeABcAEAALAAcABAACAAEAAAAAAAAAAAAAAP7//v/+',
+  '//3//f/9//z//P/7//r/+f/4//b/9f/y//D/7f/p/+X/4P/Z/9H/yP+9/6//n/+L/3P/V/81/w3/',
+  '3f6k/mH+Ev61/Un9y/w5/JL70fr2+fz44/em9kT1u/MJ8ivwIe7q64bp9OY15ErhNd732pPXCtRg',
+  '0JXMrMimxIPAQrzit2Czua7nqeWkrp85moKUg443iJ2BtXqDcwxsXGR/XIpUjkykROI8ZDU/Loon',
+  'ViG1G6wWRBJ5DkgLpgiGBtkEjgOVAt4BWwH9ALwAjwBuAFcARQA2ACoAIAAXABAACgAGAAQAAgAB',
+  'AAAAAAAAAAAA/v/+//7//v/+//3//f/8//z/+//7//r/+f/3//b/9P/x/+7/6//n/+H/2//T/8r/',
+  'v/+x/6H/jf91/1n/N/8O/97+pP5h/hH+tf1I/cv8OvyU+9X6/fkI+fX3wPZp9e3zSvKA8I3ucews',
+  '6r3nJuVn4oHfd9xI2fjVhtLzzkDLbMd1w1m/FLuhtvuxG637p5Oi3JzSlm6QsImYgih7aHNkaylj',
+  'zFphUgNKyUHROTIyBitgJFIe5hgiFAYQjgyuCVwHhAUYBAQDOAKkAToB7wC5AJIAdQBeAEsAOwAt',
+  'ACEAFgAPAAkABQACAAEAAAAAAAAAAAD///7//v/+//7//v/+//3//f/8//z/+//6//n/+P/2//X/',
+  '8v/w/+z/6P/j/93/1f/M/8H/s/+j/4//d/9a/zj/D//f/qX+Yv4T/rf9TP3Q/EH8nvvk+hH6JPkZ',
+  '+PD2p/U89K3y+vAj7yXtA+u76E7mvuMJ4TLeONsd2N/UftH4zUvKc8ZswjC+uLn+tPqvpKr0pOWe',
+  'cZiWkVSKsIKvel5yzWkQYT1YcE/DRlY+QTagLoonESFAGyEWsxHyDdQKTQhJBrkEiAOlAv8BhwEw',
+  'AfEAwgCeAIEAZwBRAD4ALgAfABUADAAHAAMAAQABAAAAAAAAAP////////7//v/+//7//v/9//3/',
+  '/f/8//z/+//6//n/9//1//P/8P/t/+n/5P/e/9b/zf/C/7T/pP+Q/3j/XP86/xH/4f6o/mb+GP69',
+  '/VT92/xR/LL7//o0+lD5Uvg39//1qPQx85nx3+8E7gfs6Omn50TlwOIZ4FHdZNpT1xrUttAizVrJ',
+  'VsUQwX68mrdbsrisqqYtoD6Z25EKitKBPnlfcEtnGF7lVMxL7kJpOlgy1CryI78dRRiEE3oPHAxe',
+  'CS0HdwUnBCwDcgLpAYUBOwECAdQArgCNAHAAVQA/ACwAHQARAAoABQACAAEAAAAAAAAA////////',
+  '//////7//v/+//7//v/9//3//P/8//v/+v/5//j/9v/0//H/7v/q/+X/3//X/87/w/+2/6X/kv96',
+  '/17/PP8U/+X+rf5s/iD+yP1j/e78afzS+yb7ZvqO+Z74lfdw9i/10vNX8r7wBu8v7TjrIuns5pTk',
+  'GuJ837fcydms1lvT0s8HzPPHjsPOvqm5GbQUrpWnmaAfmSuRxIj4f9Z2dG3rY1pa3lCYR6g+LjZA',
+  'LvkmZSCSGn8VLBGNDZcKNwhZBukE0gMBA2cC8wGbAVYBHAHsAMAAmQB1AFcAPAAoABgADgAHAAMA',
+  'AQAAAAAAAAD////////////////+//7//v/+//7//f/9//3//P/7//v/+f/4//b/9P/y/+7/6v/m',
+  '/+D/2P/P/8T/t/+n/5P/fP9h/0D/Gf/r/rX+dv4u/tn9eP0J/Yv8/Ptb+6b63Pn9+Ab49/bP9Y30',
+  'MPO38SLwce6i7LTqpuh25iHkpeH93iXcFtnK1TjSWc4hyojFhMALuxW1nK6cpxOgB5h9j4KGKH2E',
+  'c7BpzF/2VVJMAEMiOtIxKio5Iw4dqxcOEy8PAAxuCWcH0wWfBLYDBgOAAhcCwwF7AT0BAwHPAKAA',
+  'dwBSADYAIQATAAkABAABAAAAAAAAAP/////////////////////+//7//v/+//7//f/9//z//P/7',
+  '//r/+P/3//X/8v/v/+v/5v/g/9n/0P/G/7n/qf+W/4D/Zf9F/yD/9P7A/oX+P/7w/ZT9LP22/DH8',
+  'm/vz+jn6bPmJ+JD3gfZb9Rv0w/JQ8cLvFu5M7GDqUOgY5rTjHeFN3j3b5dc51DHQwsvhxoXBpLs4',
+  'tT2usKaVnvOV1oxQg3Z5ZG84ZRRbHFFyRzk+jDWJLUEmwh8QGisVCxGiDd4KqwjyBp4FmgTRAzYD',
+  'uQJSAvcBpwFcARcB2AChAHAASgAtABoADQAFAAIAAAAAAAAA///////////////////////////+',
+  '//7//v/+//3//f/8//z/+//6//n/9//1//P/8P/s/+f/4f/a/9L/x/+7/6z/mv+E/2v/TP8p///+',
+  'z/6X/lb+DP63/Vb96fxv/OX7TPui+uf5Gfk3+EH3NfYS9djzhPIV8Yjv2+0K7BHq7OeT5f/iKeAI',
+  '3ZHZutV30b3Mgse9wWa7d7TvrNGkIpzwkkqJSH8EdZ9qOWD5VQFMd0J3OSExhSm3IrkcjhctE4oP',
+  'kgwyClEI2ga2BdIEHQSIAwkDmAIyAtABdgEhAdgAlgBkAD0AIwARAAcAAwABAAAAAAD/////////',
+  '/////////////////////v/+//7//v/+//3//f/8//v/+v/5//f/9f/z//D/7P/o/+L/3P/T/8r/',
+  'vv+v/57/iv9y/1b/NP8O/+H+rf5x/i3+3/2H/SP9tPw3/K37E/tq+rD55PgG+BP3Cvbr9LHzXPLo',
+  '8FHvku2m64fpLeeP5KPhYN662qXWFtIBzV3HIcFIus+yuKoJos6YFo/6hJN6AnBoZe1atFDjRpo9',
+  '+DQRLfglsh9EGqMVxhGZDgkM/glhCBsHFgZDBZEE9gNoA+UCZgLxAYIBIQHJAIYAUgAvABcACgAE',
+  'AAEAAAAAAP////////////////////////////////7//v/+//7//v/9//3//P/7//r/+f/4//b/',
+  '9P/x/+3/6f/k/93/1v/M/8H/tP+k/5H/ev9g/0L/Hv/1/sb+j/5S/gv+vP1i/f78j/wT/In78vpL',
+  '+pP5yvjt9/v28vXO9IzzKfKf8Onu/+za6nHoueWp4jTfT9vt1gPShcxsxrG/ULhMsKincp63lI+K',
+  'E4Bldadq/1+SVYhLAUIdOfIwlSkMI1wdfRhmFAMRQQ4JDEIK1QisB7UG4AUiBXAEygMnA44C/gF+',
+  'AQsBsgBtAD8AHwANAAUAAQAAAAAA//////////////////////////////////////7//v/+//7/',
+  '/f/9//z//P/7//r/+P/2//T/8v/u/+r/5f/f/9j/z//F/7n/qv+Z/4T/bf9R/zH/DP/h/rD+ef46',
+  '/vT9pP1L/ej8evz/+3j74vo9+ob5vPjc9+T2z/Wa9D/zufEA8A3u1utR6XPmL+N630jbi9Y60UrL',
+  'tcR2vY+1BK3foy+aCpCKhdB6/G83ZaVab1C2Rps9NjWcLdUm5yDNG3wX4xPuEIUOkQz5CqYJhgiG',
+  'B54GwAXuBB0EWAOdAvcBYAHsAJAAVAAqABIABwACAAAAAAD/////////////////////////////',
+  '///////////+//7//v/+//3//f/8//z/+//6//n/9//1//L/7//s/+f/4v/b/9P/yv++/7H/ov+P',
+  '/3r/Yf9F/yT//v7T/qL+a/4t/uf9mP1A/d/8cvz5+3L72/oz+nj5pfi396v2e/Ug9JXyz/DH7nLs',
+  'xOmy5i/jLt+j2oLVws9byUjCiboish2ph591lQGLS4BzdaFq+l+nVchLg0LtOR4yICv6JKYfHRtN',
+  'FyMUhxFhD5gNFQzECpIJdwhkB1wGUwVXBGYDjwLMATUBvgBuADcAGAAJAAIAAQAAAP//////////',
+  '/////////////////////////////////v/+//7//v/+//3//f/8//v/+v/5//j/9v/z//H/7f/p',
+  '/+T/3v/X/8//xf+5/6v/m/+I/3L/Wf88/xv/9v7L/pv+ZP4n/uL9lf0+/d38b/z0+2n7zPoa+k/5',
+  'Zvhc9yj2xfQq807xJ++o7Mfpduap4lLeZ9nd06vNzcZBvwu3M67FpNeaf5DehRN7RnCaZTpbRlHj',
+  'Ryg/LzcBMKgpHiRfH1gb+BcmFcoSyxARD4kNHAzECnEJJwjYBpgFZQRRA1cCkgH4AJAASAAgAAwA',
+  'AwABAAAA/////////////////////////////////////////////////v/+//7//v/9//3//P/8',
+  '//v/+v/4//b/9P/y/+//6//n/+L/2//U/8v/wf+1/6f/lv+D/27/Vf84/xj/8/7J/pn+ZP4n/uL9',
+  'lf08/dj8Zvzj+0z7n/rV+ez42/ed9in1dvN68Srveexb6cPlpOHz3KTXsNEPy8LDyLsqs/WpOqAQ',
+  'lpaL6oA0dpVrOGE+V8tN+ETfPIo1BC9KKVckGiCCHHcZ4RanFK8S5hA1D5UN9AtaCrgIJQegBUIE',
+  'AgMHAkEBuwBfACoADwAEAAEAAAD/////////////////////////////////////////////////',
+  '//7//v/+//7//f/9//3//P/7//r/+f/3//b/8//x/+7/6v/l/+D/2f/S/8n/vv+y/6T/lP+C/2z/',
+  'VP84/xj/9P7K/pv+Zf4n/uD9j/0x/cT8Rfyw+wL7NfpE+Sj42PZL9XnzVfHU7urrieik5DHgI9tz',
+  '1RnPE8hiwA24Ha+mpbubepEAh3J89HGsZ71dSlRsSz9DzTsjNT4vGyqpJdohlR7CG0cZChf3FPcS',
+  'AhEGDw4NBwsPCScHbQXZA5oCnQHyAHsANgAUAAUAAQAAAP//////////////////////////////',
+  '///////////////////////+//7//v/+//7//f/9//z//P/7//r/+P/3//X/8//w/+3/6f/k/9//',
+  '2P/R/8j/vv+y/6T/lP+C/23/Vf85/xr/9f7L/pr+Yf4f/tL9d/0M/Y389vtD+276cPlB+Nn2LvU2',
+  '8+XwLu4F617nLONl3v/Y9NJAzOPE47xJtCWriqGUl1+NDYPBeKJuz2RsW5NSX0rbQhY8DTa+MBss',
+  'FSiTJH8hvh41HM8ZdBcdFbYSTRDQDV8LAgnaBuAETQMPAjYBngBHABoABwACAAAA////////////',
+  '///////////////////////////////////////////////+//7//v/+//3//f/9//z/+//6//n/',
+  '+P/2//T/8v/v/+z/6P/k/97/2P/R/8j/vv+y/6X/lv+E/2//V/86/xn/8/7F/pD+UP4E/qr9Pv27',
+  '/B/8YvuA+nD5Kvil9tf0tfIz8ETt3Onv5XPhXtyp1lDQUsm0wX25u7CBp+idCpQIigKAHXZ4bDhj',
+  'dFpHUr5K6EPEPVA4gDNFL4grMSglJUoiiB/HHAAaHxczFCsRLA5CC5YIIwYrBJwCigHLAFsAIgAK',
+  'AAIAAAD//////////////////////////////////////////////////////////////v/+//7/',
+  '/v/+//3//f/8//z/+//6//n/+P/2//T/8v/v/+z/6P/k/97/2P/R/8n/v/+0/6b/l/+E/2//Vf83',
+  '/xL/5/6y/nP+J/7K/Vn90fwr/GH7bvpJ+en3RPZR9APyTu8o7IToV+SZ30HaS9S2zYXGvr5utqWt',
+  'eqQGm2aRuYcifsB0s2sVY/9agFOlTG9G3kDmO3o3gTPnL4wsWCkwJv0itx9KHMgYHxV7Ee4Npwqk',
+  'BzQFRgPwAQEBdQAsAA0AAwABAP//////////////////////////////////////////////////',
+  '/////////////////v/+//7//v/+//3//f/8//z/+//6//n/+P/2//T/8v/v/+z/6f/k/9//2f/S',
+  '/8r/wP+0/6b/lv+C/2r/Tf8p//7+yf6J/jr+2P1h/c/8HfxF+z76AvmF98D1pvMt8Uru8eoX57Pi',
+  'v9002BHSV8sMxDu88rNFq0uiIJnfj6mGm33VdG5sgGQZXUdWDFBoSlBFuECIPKo4/zRuMdktKypY',
+  'Jk8iIx7FGWIVGREeDXQJdgYWBG4CRQGVADkAEQAEAAEA////////////////////////////////',
+  '/////////////////////////////////////////v/+//7//v/+//3//f/8//z/+//6//n/+P/2',
+  '//X/8v/w/+3/6f/l/+D/2v/T/8r/v/+z/6P/kP95/1z/OP8M/9b+kv4+/tf9WP27/Pv7Evv3+aP4',
+  'C/cl9ejySfA87bjps+Un4Q3cY9Yq0GfJIcJlukay1qkxoW6YrI8Gh5l+e3bHbohnzWCZWu5Uv08C',
+  'S59Gf0KCPpA6hzZTMuYtMSlHJB0f4xnEFPwPkwvvBwsFAwOXAbwASAAWAAUAAQD/////////////',
+  '/////////////////////////////////////////////////////////////////v/+//7//v/+',
+  '//3//f/8//z/+//6//n/+P/3//X/8//w/+3/6v/l/+D/2v/S/8j/vP+s/5r/gv9l/0D/Ev/Z/pH+',
+  'OP7J/UD9mPzL+9H6ovk3+IX2hPQo8mnvPOyZ6Hjk1N+p2vjUw84SyO/AabmSsYGpTaEQmeKQ4Ige',
+  'gbR5rnIcbP5lWGAeW0ZWtlFbTQ9JvEQ7QHw7aTb7MEIrOSUQHwMZUxMSDq4JMQa3A/wB7ABcAB0A',
+  'BgABAP//////////////////////////////////////////////////////////////////////',
+  '/////////////v/+//7//v/+//3//f/9//z/+//6//r/+P/3//X/8//x/+3/6f/l/97/1//N/8H/',
+  'sv+f/4f/aP9C/xH/1P6I/ij+sv0g/W38kvuI+kj5yfcD9uvzevGl7mTrseeF497eudka1AXOhMej',
+  'wHG5A7JrqsKiHpuZk0SMNoV7fiB4KHKWbF1ndGLBXTBZmFTkT+lKmUXYP6U5CzMSLOIk0B0fF+4Q',
+  'sAuHB4kEcwInAXQAJQAIAAIA////////////////////////////////////////////////////',
+  '/////////////////////////////////////v/+//7//v/+//3//f/9//z/+//7//r/+f/3//X/',
+  '8//w/+z/6P/i/9r/0f/F/7X/of+I/2j/P/8L/8v+ef4U/pf9/Pw//Fn7Qvr1+Gf3kvVt8+/wEe7L',
+  '6hjn9eJg3lrZ5tMMztbHUsGPup+zl6yLpZCet5cVkbWKo4TgfnF5SHRcb5Fq1GX4YOtbeFaYUCRK',
+  'JkOiO60zYys6I3AbNxQEDhgJggUDA24BkQAwAAoAAwD/////////////////////////////////',
+  '/////////////////////////////////////////////////////////////v/+//7//v/+//7/',
+  '/f/9//z//P/7//r/+P/3//X/8v/u/+r/5P/c/9P/xv+2/6H/hv9k/zn/A/+//mn+//17/dr8Ffwm',
+  '+wj6svgd90L1GfOa8MHthurn5uHidd6k2XXU8M4eyQ/D0Lxztgqwp6lZozOdPZeEkQeMy4a/gd58',
+  'B3gqcxJusWjLYl5cNFVpTfBE9zuDMjIpOyDoF6UQ4gqgBqsDwQG0AD0ADAADAP//////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////+//7//v/+//7//f/9//z/+//7//n/+P/2//P/7//r/+X/3f/T/8b/tf+f/4P/YP8z',
+  '//r+s/5a/uz9ZP2+/PX7A/vh+Yn49fYd9fvyivDE7aXqK+dV4ybfoNrK1a3QU8vJxR3AXrqctOOu',
+  'Q6nFo3KeSZlPlHGPqYrVheaAn3v5dapvuWjgYE5Y4k7mREA6vi+LJQ8coBPyDOwHcwQlAt8ATQAP',
+  'AAQA////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////////+//7//v/+//7//f/9//z/+//6//j/9v/0//D/6//l',
+  '/93/0//F/7T/nf+A/1v/Lf/z/qr+T/7f/Vb9r/zm+/X61vmE+Pn2LvUg88jwJO4x6+7nWuR64FLc',
+  '59dD02/Od8lnxEy/MbojtSiwSKuBptehNJ2VmNKT3454iZiD7HyEdQRtsmNWWV5OgELLNlArnyDs',
+  'FkEPYglYBZkCEgFfABMABgD/////////////////////////////////////////////////////',
+  '///////////////////////////////////////////////////////////+//7//v/+//3//f/8',
+  '//v/+v/5//f/9P/w/+v/5f/d/9L/xP+y/5v/fv9Z/yr/7/6l/kv+3P1U/bD86/sA++v5pvgs93r1',
+  'ifNY8ePuKOwp6eblY+Kj3q/ajNZF0uLNcMn0xHvACrymt0qz/K6hqjmmlqGwnDmXM5E+inOCXHlh',
+  'byNkQlgyS1E+jDGkJZQa2xEMC2MGIQNOAXYAFwAHAP//////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////+//7//v/+//3//P/8//r/+f/3//T/8P/r/+X/3f/S/8T/sv+b/33/WP8q//D+qP5Q/uP9',
+  'Yf3D/Af8Kfsj+vP4k/cA9jj0N/L874bt1uru59LkheEN3nHaudbt0hLPMstPx23DhL+cu5W3cLP8',
+  'rjKqvKSinnWXXY/DhTN7JG9vYjZUNUYoOAgrih63FOEMjwe6A5MBkAAcAAkA////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////v/+//7//v/9//3//P/7//n/9//0//D/7P/l/93/0v/E/7P/',
+  'nP+A/1z/L//3/rL+Xv74/X396vw7/G77ffpn+Sj4vfYk9VrzYPE179vsUuqf58bkyuGz3oXbQ9j3',
+  '1KDRQM7OylDHpMPMv5O79baSsXqrL6Tmm+OR4IYferpsb11mTh4/0TDTItwX6g7kCGkE5AGuACIA',
+  'CwD/////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////v/+//7//f/9//z/+//5//f/',
+  '9P/x/+z/5v/e/9T/xv+1/6D/hf9j/zn/Bf/F/nf+Gf6p/SP9hfzM+/b6//nm+Kf3Qva29AHzJfEj',
+  '7/zss+pM6MrlMeOC4MXd9toY2B3VDtLCzj7LS8fnwqi9prdVsPSnpZ1OkvaEBXe9ZsZWUkbkNlon',
+  'OhsZEVgKJwU9As8AKQANAP//////////////////////////////////////////////////////',
+  '//////////////////////////////////////////////////////////////////////////7/',
+  '/v/+//3//f/8//v/+f/3//X/8f/t/+f/4P/W/8r/uv+m/43/bv9I/xj/3/6Z/kb+4v1s/eH8QPyG',
+  '+7H6v/mw+ID3MfbC9DTzh/G979jt2uvH6Z3nYuUS463gI95/25TYaNXC0aPNl8i/woK7KbOtqCud',
+  'ZI8WgfRvNl+xTTg9HizUHnYT8Qv6BaIC9AAwABAA////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////+//7//v/9//3//P/7//r/+P/2//L/7v/p/+L/2f/O/8D/rv+Y/3z/W/8x',
+  '///+w/56/iX+wP1K/cL8Jvx0+6v6yvnQ+L33kvZO9fLzf/L38Frvp+3j6wfqFOj25brjLuFc3gnb',
+  'ONdt0tHMvcWIvfyycqdemdyK/3idZx5VsUMBMZEi6BWfDdUGDAMbATgAEgD/////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////v/+//7//v/9//z/+//6//n/9v/0//D/6//l',
+  '/93/1P/H/7j/pf+N/3H/Tf8j//D+tP5t/hr+uf1J/cr8OvyX++L6Gvo/+VH4T/c69hP12/ON8i3x',
+  't+8n7mjsi+pX6Nzl3OJd393ajNW3zr/GQ7zWsJ2iFZSmgctvdlwxSvY1aSZyGGMPvAd9A0QBQAAV',
+  'AP//////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////////v/+//7//f/9',
+  '//z/+//5//f/9f/y/+7/6f/i/9r/0P/D/7P/oP+I/2v/Sf8g/+/+tv50/if+z/1r/fr8fPzv+1X7',
+  'q/rz+Sz5Vvhx93j2b/VQ9BfzrvEn8EXuHexw6UfmGeId3ZnW8s6exG25MKvJnOWJt3emY6RQ5DpJ',
+  'Kv0aLBGhCO8DbQFJABgA////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////7//v/+//7//f/8//v/+v/5//f/9P/x/+3/5//h/9j/zv/C/7L/n/+J/27/Tv8o//z+',
+  'yf6P/kv+//2q/Ur94Pxr/Ov7YPvI+iT6b/mr+NL34Pa+9YD05PIG8aju0uv551jjMd3r1dbL+sDb',
+  'srekiJEqf4Zq41a4Px0ugR3zEoYJYgSWAVIAGwD/////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////7//v/+//3//f/8//v/+v/4//b/9P/w/+z/5//h/9n/',
+  'z//E/7X/pf+Q/3j/XP88/xb/6/66/oL+RP7+/bH9XP3+/Jf8Jvym+xn7efrC+dv42/d+9uP0zfJH',
+  '8MLsfui54t3bEtKcx6255Kt/mBGG8XDMXEpEyjHxH7MUZArWBMABXAAeAP//////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////////////////////////////+//7//v/+//3//f/8//v/',
+  '+v/4//b/9P/x/+3/6P/j/9z/0//J/73/rv+d/4n/cv9X/zn/Fv/u/sL+kf5a/h3+2P2L/TL9zfxY',
+  '/M37FPtG+hv5uffk9abzcfCI7CnnueBF10DNmb87ssGeWIzgdkxil0hDNS0iThY0C0AF6AFnACAA',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///+//7//v/+//3//f/8//v/+v/5//f/9f/y/+//6//m/+D/2f/R/8f/u/+u/57/jP93/2D/Rf8n',
+  '/wX/3/6z/oH+RP79/aj9QP2q/AX8A/vQ+TL4NPZG87Dvruqi5IDb6dGFxJO3DKS4kfd7EGdOTE84',
+  'OyTfFwMMsAUVAncAJwD/////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////7//v/+//7//f/8//z/+//6//j/9v/0//L/7v/r/+b/4P/a',
+  '/9L/yv+//7P/pv+X/4X/cP9Z/z3/Hf/y/sD+gf4w/rT9LP1J/Dv7y/kB+FH1A/JU7aPn0t6h1YbI',
+  '/Lt8qEmWW4A1a5hPDDseJlQZzwwbBkgCjQAvAP//////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////////////////////////7//v/+//7//f/9//z//P/7',
+  '//r/+P/3//X/8v/v/+z/6P/j/97/2P/Q/8j/vv+y/6T/k/9+/2H/PP8N/87+Zf7z/Sn9Ofzu+lL5',
+  '2PbK82bvCOqD4bXY5MvCv1isV5pXhBJvyVLRPTQoDRvqDdcGrQLUAEoA////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////v/+//7//v/9//3//P/8//v/+v/5//f/9v/0//L/7//s/+j/4//e/9f/z//E/7b/of+F/2H/',
+  'Lf/T/nH+uv3j/Lj7QPr29yH1AvHv67bjRtu+zgLDxa8FngOIs3L1VbNAhyoSHVcPxgdSA0oBggD/',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////+//7//v/+//7//f/9//z//P/7//r/+f/4//b/9P/y/+//',
+  '6//m/9//1v/F/7D/kv9n/xb/wf4Z/lX9Q/zt+sv4KfZI8n7tkuWC3VjRDMYUs7uh94vQdu9ZjkQX',
+  'LjogBxIZCt8EjgITAf//////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////v/+//7//v/+//3/',
+  '/f/8//z/+//6//n/+P/2//L/7v/n/9r/yP+w/4r/Q//4/l3+qv2z/Hj7ffkI92bz3O4854ffs9PQ',
+  'yDW2Q6W+j8t6Al6bSMcxtiMvFdwM7AZTBOsB////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////7//v/+//7//v/9//3//P/8//r/+P/0/+//5P/V/8D/nv9d/xn/iP7k/QD93/sF',
+  '+r/3WPQU8NLokeE/1unL8bnHqeeUmIBgZIJPyzjAKt0b0xKFCzEI/QP/////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////////////////7//v/+//7//f/7//j/9P/r/97/zf+v',
+  '/3b/Ov+3/iT+Wf1T/KX6kfhz9X/xsur240TZlc+AvkCvO5u+h2RsMFixQZ8ziSTBGs8Ruw12Bv//',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////////////////////////////////////////////////////////7//v/9',
+  '//z/+v/2/+//4//U/7r/h/9S/9z+Wv6n/b38Qftm+aT2FPMA7fjmYd2w1DXFirddpXmTQHrCZzZS',
+  'b0QsNfEqix5UGdsL////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '//////////////////7//f/8//n/9P/r/+D/y/+i/3j/GP+v/iT+Z/0x/Kz6Y/ho9SzwHeuw4jnb',
+  'Z81rwbewkKAuiQZ4GGOUVe5GbTvJLDklVxD/////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////v/+//z/+v/3//D/5//W/7f/lf9J//n+kf7+/RD9',
+  '3/sg+sz3vfPf71Xpo+PF2LHPZ8K1tdWiTZXAgsh1FGgPXJ9HPz2eGv//////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '/////////////////////////////////////////////////////////////v/9//z/+P/y/+j/',
+  '1f/B/5H/Yf8l/8v+Ov55/Wb84Pow+Kf1NPFF7aflJ9+D1cHLGb3+sVuhAJUOiDZ5ql6yUPAe////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///+//3//P/5//X/7f/f/9P/sv+U/2n/K//I/kP+g/2A/MP6N/lA9t/z/u5U6xzlNt/a1UnPScOz',
+  'uTKvKKFmhNtzfzn/////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '////////////////////////////////////////////////////////////////////////////',
+  '///////////////////////////////////////////////////+//7//v/9//r/9P/v/8D/nv9Z',
+  '/wn/Iv6U/M35wPUF7mDjXdnuxbieDYqiOQ==',
+].join('');
+
+let table: Uint16Array | null = null;
+
+function decodeTable(): Uint16Array {
+  const bytes = Uint8Array.from(atob(ENCODED), c => c.charCodeAt(0));
+  const view = new DataView(bytes.buffer);
+  const values = new Uint16Array(bytes.length / 2);
+  for (let i = 0; i < values.length; i++) {
+    values[i] = view.getUint16(i * 2, true);
+  }
+  return values;
+}
+
+/**
+ * Probability that the player with myScore wins, at the start of a hand
+ * they deal (isDealer) or receive. A score of 121 or more has already won.
+ */
+export function winProbability(
+  myScore: number,
+  opponentScore: number,
+  isDealer: boolean,
+): number {
+  if (myScore >= BOARD) return 1;
+  if (opponentScore >= BOARD) return 0;
+  table ??= decodeTable();
+  const index = ((isDealer ? BOARD : 0) + myScore) * BOARD + opponentScore;
+  return table[index] / 0xffff;
+}